@@ -0,0 +1,38 @@
+"""add_meal_plan_templates
+
+Revision ID: 0174551072dd
+Revises: 3f1a32c3caf6
+Create Date: 2026-10-19 11:20:44.306517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0174551072dd'
+down_revision: Union[str, None] = '3f1a32c3caf6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('meal_plans', sa.Column('is_template', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+    op.add_column('meal_plans', sa.Column('source_plan_id', sa.String(), nullable=True))
+    op.create_foreign_key('meal_plans_source_plan_id_fkey', 'meal_plans', 'meal_plans', ['source_plan_id'], ['id'], ondelete='SET NULL')
+    op.create_index(op.f('ix_meal_plans_is_template'), 'meal_plans', ['is_template'], unique=False)
+    op.create_index(op.f('ix_meal_plans_source_plan_id'), 'meal_plans', ['source_plan_id'], unique=False)
+    op.alter_column('meal_plans', 'patient_id', existing_type=sa.VARCHAR(), nullable=True)
+    op.alter_column('meal_plans', 'assessment_id', existing_type=sa.VARCHAR(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM meal_plans WHERE is_template")
+    op.alter_column('meal_plans', 'assessment_id', existing_type=sa.VARCHAR(), nullable=False)
+    op.alter_column('meal_plans', 'patient_id', existing_type=sa.VARCHAR(), nullable=False)
+    op.drop_index(op.f('ix_meal_plans_source_plan_id'), table_name='meal_plans')
+    op.drop_index(op.f('ix_meal_plans_is_template'), table_name='meal_plans')
+    op.drop_constraint('meal_plans_source_plan_id_fkey', 'meal_plans', type_='foreignkey')
+    op.drop_column('meal_plans', 'source_plan_id')
+    op.drop_column('meal_plans', 'is_template')
@@ -0,0 +1,25 @@
+"""add_user_permissions_version
+
+Revision ID: 3d8b5f1a6c42
+Revises: 7c1e4d9a2b86
+Create Date: 2026-10-19 18:12:09.504117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3d8b5f1a6c42'
+down_revision: Union[str, None] = '7c1e4d9a2b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('permissions_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'permissions_version')
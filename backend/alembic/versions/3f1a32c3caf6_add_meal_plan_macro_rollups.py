@@ -0,0 +1,77 @@
+"""add_meal_plan_macro_rollups
+
+Revision ID: 3f1a32c3caf6
+Revises: b85762279a98
+Create Date: 2026-10-19 10:03:17.552910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f1a32c3caf6'
+down_revision: Union[str, None] = 'b85762279a98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DAY_ROLLUP_COLUMNS = ('meal_count', 'total_daily_calories', 'total_daily_protein', 'total_daily_carbs', 'total_daily_fats')
+PLAN_ROLLUP_COLUMNS = ('day_count', 'meal_count', 'total_calories', 'total_protein_grams', 'total_carbs_grams', 'total_fats_grams')
+
+
+def upgrade() -> None:
+    for column in DAY_ROLLUP_COLUMNS:
+        op.add_column('meal_plan_days', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+    for column in PLAN_ROLLUP_COLUMNS:
+        op.add_column('meal_plans', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill day totals from existing meals, then plan totals from days
+    op.execute("""
+        UPDATE meal_plan_days AS d SET
+            meal_count = agg.meal_count,
+            total_daily_calories = agg.calories,
+            total_daily_protein = agg.protein,
+            total_daily_carbs = agg.carbs,
+            total_daily_fats = agg.fats
+        FROM (
+            SELECT day_id,
+                   COUNT(*) AS meal_count,
+                   COALESCE(SUM(calories), 0) AS calories,
+                   COALESCE(SUM(protein_grams), 0) AS protein,
+                   COALESCE(SUM(carbs_grams), 0) AS carbs,
+                   COALESCE(SUM(fats_grams), 0) AS fats
+            FROM meal_plan_meals
+            GROUP BY day_id
+        ) AS agg
+        WHERE agg.day_id = d.id
+    """)
+    op.execute("""
+        UPDATE meal_plans AS p SET
+            day_count = agg.day_count,
+            meal_count = agg.meal_count,
+            total_calories = agg.calories,
+            total_protein_grams = agg.protein,
+            total_carbs_grams = agg.carbs,
+            total_fats_grams = agg.fats
+        FROM (
+            SELECT meal_plan_id,
+                   COUNT(*) AS day_count,
+                   SUM(meal_count) AS meal_count,
+                   SUM(total_daily_calories) AS calories,
+                   SUM(total_daily_protein) AS protein,
+                   SUM(total_daily_carbs) AS carbs,
+                   SUM(total_daily_fats) AS fats
+            FROM meal_plan_days
+            GROUP BY meal_plan_id
+        ) AS agg
+        WHERE agg.meal_plan_id = p.id
+    """)
+
+
+def downgrade() -> None:
+    for column in reversed(PLAN_ROLLUP_COLUMNS):
+        op.drop_column('meal_plans', column)
+    for column in reversed(DAY_ROLLUP_COLUMNS):
+        op.drop_column('meal_plan_days', column)
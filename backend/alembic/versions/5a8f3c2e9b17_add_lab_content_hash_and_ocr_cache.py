@@ -0,0 +1,34 @@
+"""add_lab_content_hash_and_ocr_cache
+
+Revision ID: 5a8f3c2e9b17
+Revises: 9e4b61c07d28
+Create Date: 2026-10-19 15:32:18.640271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5a8f3c2e9b17'
+down_revision: Union[str, None] = '9e4b61c07d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('lab_results', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_lab_results_system_content_hash', 'lab_results', ['system_id', 'content_hash'], unique=False)
+    op.create_table('lab_ocr_cache',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('raw_ocr_text', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('content_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('lab_ocr_cache')
+    op.drop_index('ix_lab_results_system_content_hash', table_name='lab_results')
+    op.drop_column('lab_results', 'content_hash')
@@ -0,0 +1,42 @@
+"""add_lab_order_status_counts
+
+Revision ID: 6b0e2d94c1a7
+Revises: 0174551072dd
+Create Date: 2026-10-19 12:41:09.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '6b0e2d94c1a7'
+down_revision: Union[str, None] = '0174551072dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('lab_order_status_counts',
+    sa.Column('system_id', sa.String(), nullable=False),
+    sa.Column('status', postgresql.ENUM('ORDERED', 'COLLECTED', 'PROCESSING', 'COMPLETED', 'CANCELLED', name='laborderstatus', create_type=False), nullable=False),
+    sa.Column('priority', postgresql.ENUM('ROUTINE', 'URGENT', 'STAT', name='laborderpriority', create_type=False), nullable=False),
+    sa.Column('order_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['system_id'], ['systems.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('system_id', 'status', 'priority')
+    )
+
+    # Seed the rollup from existing orders
+    op.execute("""
+        INSERT INTO lab_order_status_counts (system_id, status, priority, order_count)
+        SELECT system_id, status, priority, COUNT(*)
+        FROM lab_test_orders
+        GROUP BY system_id, status, priority
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('lab_order_status_counts')
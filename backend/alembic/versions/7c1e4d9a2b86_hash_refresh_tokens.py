@@ -0,0 +1,46 @@
+"""hash_refresh_tokens
+
+Revision ID: 7c1e4d9a2b86
+Revises: 5a8f3c2e9b17
+Create Date: 2026-10-19 17:05:41.218305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7c1e4d9a2b86'
+down_revision: Union[str, None] = '5a8f3c2e9b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expired tokens are dead weight; drop them before rewriting the rest
+    op.execute("DELETE FROM refresh_tokens WHERE expires_at < now()")
+
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+    op.alter_column('refresh_tokens', 'token_hash', nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+    op.drop_column('refresh_tokens', 'token')
+
+    op.drop_index(op.f('ix_refresh_tokens_user_id'), table_name='refresh_tokens')
+    op.create_index('ix_refresh_tokens_user_id_expires_at', 'refresh_tokens', ['user_id', 'expires_at'], unique=False)
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Plaintext tokens cannot be recovered from their hashes: everyone signs in again
+    op.execute("DELETE FROM refresh_tokens")
+
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
+    op.drop_index('ix_refresh_tokens_user_id_expires_at', table_name='refresh_tokens')
+    op.create_index(op.f('ix_refresh_tokens_user_id'), 'refresh_tokens', ['user_id'], unique=False)
+
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(), nullable=False))
+    op.create_unique_constraint('refresh_tokens_token_key', 'refresh_tokens', ['token'])
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
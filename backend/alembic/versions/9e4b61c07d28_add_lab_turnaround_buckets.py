@@ -0,0 +1,78 @@
+"""add_lab_turnaround_buckets
+
+Revision ID: 9e4b61c07d28
+Revises: c2d7a18e5f43
+Create Date: 2026-10-19 14:05:37.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9e4b61c07d28'
+down_revision: Union[str, None] = 'c2d7a18e5f43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same bucketing as app.domains.lab_orders.services.turnaround.bucket_for
+BUCKET_SQL = "CASE WHEN {m} <= 1 THEN 0 ELSE LEAST(CEIL(LN({m}) / LN(1.1)), 130)::int END"
+
+
+def _seed(samples_sql: str) -> None:
+    """Insert histogram rows from a query yielding (system_id, lab_name, priority, stage, minutes)"""
+    op.execute(f"""
+        INSERT INTO lab_turnaround_buckets (system_id, lab_name, priority, stage, bucket, sample_count, total_minutes)
+        SELECT system_id, lab_name, priority, stage, {BUCKET_SQL.format(m='minutes')}, COUNT(*), SUM(minutes)
+        FROM ({samples_sql}) AS samples
+        GROUP BY system_id, lab_name, priority, stage, {BUCKET_SQL.format(m='minutes')}
+        ON CONFLICT (system_id, lab_name, priority, stage, bucket) DO UPDATE
+        SET sample_count = lab_turnaround_buckets.sample_count + EXCLUDED.sample_count,
+            total_minutes = lab_turnaround_buckets.total_minutes + EXCLUDED.total_minutes
+    """)
+
+
+def upgrade() -> None:
+    op.create_table('lab_turnaround_buckets',
+    sa.Column('system_id', sa.String(), nullable=False),
+    sa.Column('lab_name', sa.String(), nullable=False),
+    sa.Column('priority', sa.String(), nullable=False),
+    sa.Column('stage', sa.String(), nullable=False),
+    sa.Column('bucket', sa.Integer(), nullable=False),
+    sa.Column('sample_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_minutes', sa.Float(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['system_id'], ['systems.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('system_id', 'lab_name', 'priority', 'stage', 'bucket')
+    )
+
+    # Seed the stages whose timestamps are stored; completion time is not, so
+    # the result stages start accumulating from now on.
+    _seed("""
+        SELECT system_id, COALESCE(external_lab_name, '') AS lab_name, LOWER(priority::text) AS priority,
+               'order_to_collection' AS stage,
+               GREATEST(EXTRACT(EPOCH FROM collection_date - order_date) / 60, 0) AS minutes
+        FROM lab_test_orders
+        WHERE collection_date IS NOT NULL
+    """)
+    _seed("""
+        SELECT r.system_id, COALESCE(o.external_lab_name, r.lab_name, '') AS lab_name,
+               COALESCE(LOWER(o.priority::text), 'unknown') AS priority,
+               'result_to_review' AS stage,
+               GREATEST(EXTRACT(EPOCH FROM r.reviewed_at - r.uploaded_at) / 60, 0) AS minutes
+        FROM lab_results r
+        LEFT JOIN LATERAL (
+            SELECT lo.external_lab_name, lo.priority
+            FROM lab_test_order_items i
+            JOIN lab_test_orders lo ON lo.id = i.lab_order_id
+            WHERE i.lab_result_id = r.id
+            LIMIT 1
+        ) o ON true
+        WHERE r.reviewed_at IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('lab_turnaround_buckets')
@@ -0,0 +1,37 @@
+"""add_lab_order_turnaround_stamps
+
+Revision ID: a6f2c9e1d053
+Revises: 3d8b5f1a6c42
+Create Date: 2026-10-19 19:02:41.318507
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a6f2c9e1d053'
+down_revision: Union[str, None] = '3d8b5f1a6c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('lab_test_orders', sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('lab_test_orders', sa.Column('collection_recorded_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Existing orders already have their samples in lab_turnaround_buckets (seeded
+    # or recorded on transition); stamp them so they are not sampled again.
+    # Completion time was not stored, so the last update stands in for it.
+    op.execute("""
+        UPDATE lab_test_orders
+        SET collection_recorded_at = COALESCE(collection_date, updated_at)
+        WHERE collection_date IS NOT NULL OR status IN ('COLLECTED', 'PROCESSING', 'COMPLETED')
+    """)
+    op.execute("UPDATE lab_test_orders SET completed_at = updated_at WHERE status = 'COMPLETED'")
+
+
+def downgrade() -> None:
+    op.drop_column('lab_test_orders', 'collection_recorded_at')
+    op.drop_column('lab_test_orders', 'completed_at')
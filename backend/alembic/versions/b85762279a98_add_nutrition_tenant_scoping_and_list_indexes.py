@@ -0,0 +1,54 @@
+"""add_nutrition_tenant_scoping_and_list_indexes
+
+Revision ID: b85762279a98
+Revises: 88f5ab88de5f
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b85762279a98'
+down_revision: Union[str, None] = '88f5ab88de5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NUTRITION_TABLES = ('nutrition_assessments', 'meal_plans', 'nutrition_feedback')
+
+
+def upgrade() -> None:
+    for table in NUTRITION_TABLES:
+        op.add_column(table, sa.Column('system_id', sa.String(), nullable=True))
+        # Backfill the tenant from the patient the record belongs to
+        op.execute(
+            f"UPDATE {table} SET system_id = users.system_id "
+            f"FROM users WHERE users.id = {table}.patient_id"
+        )
+        op.alter_column(table, 'system_id', existing_type=sa.String(), nullable=False)
+        op.create_foreign_key(f'{table}_system_id_fkey', table, 'systems', ['system_id'], ['id'], ondelete='CASCADE')
+        op.create_index(op.f(f'ix_{table}_system_id'), table, ['system_id'], unique=False)
+
+    op.create_index('ix_nutrition_assessments_system_patient_date', 'nutrition_assessments', ['system_id', 'patient_id', 'assessment_date'], unique=False)
+    op.create_index('ix_nutrition_assessments_system_nutritionist_date', 'nutrition_assessments', ['system_id', 'nutritionist_id', 'assessment_date'], unique=False)
+    op.create_index('ix_meal_plans_system_patient_start', 'meal_plans', ['system_id', 'patient_id', 'start_date'], unique=False)
+    op.create_index('ix_meal_plans_system_nutritionist_start', 'meal_plans', ['system_id', 'nutritionist_id', 'start_date'], unique=False)
+    op.create_index('ix_nutrition_feedback_system_patient_date', 'nutrition_feedback', ['system_id', 'patient_id', 'feedback_date'], unique=False)
+    op.create_index('ix_nutrition_feedback_system_nutritionist_date', 'nutrition_feedback', ['system_id', 'nutritionist_id', 'feedback_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_nutrition_feedback_system_nutritionist_date', table_name='nutrition_feedback')
+    op.drop_index('ix_nutrition_feedback_system_patient_date', table_name='nutrition_feedback')
+    op.drop_index('ix_meal_plans_system_nutritionist_start', table_name='meal_plans')
+    op.drop_index('ix_meal_plans_system_patient_start', table_name='meal_plans')
+    op.drop_index('ix_nutrition_assessments_system_nutritionist_date', table_name='nutrition_assessments')
+    op.drop_index('ix_nutrition_assessments_system_patient_date', table_name='nutrition_assessments')
+
+    for table in reversed(NUTRITION_TABLES):
+        op.drop_index(op.f(f'ix_{table}_system_id'), table_name=table)
+        op.drop_constraint(f'{table}_system_id_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'system_id')
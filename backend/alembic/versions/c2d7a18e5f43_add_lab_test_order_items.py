@@ -0,0 +1,122 @@
+"""add_lab_test_order_items
+
+Revision ID: c2d7a18e5f43
+Revises: 6b0e2d94c1a7
+Create Date: 2026-10-19 13:22:51.604117
+
+"""
+import json
+import re
+from typing import Sequence, Union
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'c2d7a18e5f43'
+down_revision: Union[str, None] = '6b0e2d94c1a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Items start with their order's status
+LAB_ORDER_STATUS = postgresql.ENUM('ORDERED', 'COLLECTED', 'PROCESSING', 'COMPLETED', 'CANCELLED', name='laborderstatus', create_type=False)
+
+
+def _split_test_types(value):
+    """Same rules as app.domains.lab_orders.services.test_types.split_test_types, frozen for this migration"""
+    if not value or not value.strip():
+        return []
+    names = None
+    if value.lstrip().startswith('['):
+        try:
+            parsed = json.loads(value)
+            if isinstance(parsed, list):
+                names = [str(item) for item in parsed if item is not None]
+        except ValueError:
+            names = None
+    if names is None:
+        names = re.split(r'[,;\n]', value)
+
+    tests = []
+    seen = set()
+    for name in (n.strip().strip('[]"\'').strip() for n in names):
+        key = ' '.join(name.lower().split())
+        if key and key not in seen:
+            seen.add(key)
+            tests.append((name, key))
+    return tests
+
+
+def upgrade() -> None:
+    op.create_table('lab_test_order_items',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('lab_order_id', sa.String(), nullable=False),
+    sa.Column('system_id', sa.String(), nullable=False),
+    sa.Column('position', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('test_name', sa.String(), nullable=False),
+    sa.Column('test_key', sa.String(), nullable=False),
+    sa.Column('status', LAB_ORDER_STATUS, nullable=False),
+    sa.Column('resulted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('lab_result_id', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['lab_order_id'], ['lab_test_orders.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['system_id'], ['systems.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['lab_result_id'], ['lab_results.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_lab_test_order_items_lab_order_id'), 'lab_test_order_items', ['lab_order_id'], unique=False)
+    op.create_index(op.f('ix_lab_test_order_items_status'), 'lab_test_order_items', ['status'], unique=False)
+    op.create_index(op.f('ix_lab_test_order_items_lab_result_id'), 'lab_test_order_items', ['lab_result_id'], unique=False)
+    op.create_index('ix_lab_test_order_items_system_test_key', 'lab_test_order_items', ['system_id', 'test_key'], unique=False)
+    op.create_index('ix_lab_test_order_items_order_test_key', 'lab_test_order_items', ['lab_order_id', 'test_key'], unique=True)
+
+    # Backfill one item per test parsed from the existing free-text column, in keyset batches
+    bind = op.get_bind()
+    items = sa.table(
+        'lab_test_order_items',
+        sa.column('id', sa.String), sa.column('lab_order_id', sa.String), sa.column('system_id', sa.String),
+        sa.column('position', sa.Integer), sa.column('test_name', sa.String), sa.column('test_key', sa.String),
+        sa.column('status', LAB_ORDER_STATUS), sa.column('resulted_at', sa.DateTime(timezone=True)),
+    )
+    last_id = ''
+    while True:
+        orders = bind.execute(
+            sa.text(
+                "SELECT id, system_id, test_types, status, updated_at FROM lab_test_orders "
+                "WHERE id > :last_id ORDER BY id LIMIT :batch"
+            ),
+            {'last_id': last_id, 'batch': BACKFILL_BATCH_SIZE}
+        ).all()
+        if not orders:
+            break
+        rows = [
+            {
+                'id': str(uuid4()),
+                'lab_order_id': order.id,
+                'system_id': order.system_id,
+                'position': position,
+                'test_name': name,
+                'test_key': key,
+                'status': order.status,
+                'resulted_at': order.updated_at if order.status == 'COMPLETED' else None,
+            }
+            for order in orders
+            for position, (name, key) in enumerate(_split_test_types(order.test_types))
+        ]
+        if rows:
+            bind.execute(items.insert(), rows)
+        last_id = orders[-1].id
+
+
+def downgrade() -> None:
+    op.drop_index('ix_lab_test_order_items_order_test_key', table_name='lab_test_order_items')
+    op.drop_index('ix_lab_test_order_items_system_test_key', table_name='lab_test_order_items')
+    op.drop_index(op.f('ix_lab_test_order_items_lab_result_id'), table_name='lab_test_order_items')
+    op.drop_index(op.f('ix_lab_test_order_items_status'), table_name='lab_test_order_items')
+    op.drop_index(op.f('ix_lab_test_order_items_lab_order_id'), table_name='lab_test_order_items')
+    op.drop_table('lab_test_order_items')
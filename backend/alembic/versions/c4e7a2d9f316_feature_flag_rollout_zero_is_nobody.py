@@ -0,0 +1,28 @@
+"""feature_flag_rollout_zero_is_nobody
+
+Revision ID: c4e7a2d9f316
+Revises: a6f2c9e1d053
+Create Date: 2026-10-19 21:14:07.529184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c4e7a2d9f316'
+down_revision: Union[str, None] = 'a6f2c9e1d053'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A rollout percentage of 0 used to mean everyone and now means nobody;
+    # existing flags keep reaching everyone.
+    op.execute("UPDATE feature_flags SET rollout_percentage = 100 WHERE rollout_percentage = 0")
+    op.alter_column('feature_flags', 'rollout_percentage', server_default=sa.text('100'))
+
+
+def downgrade() -> None:
+    op.alter_column('feature_flags', 'rollout_percentage', server_default=sa.text('0'))
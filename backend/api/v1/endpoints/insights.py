@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.dependencies import verify_tenant_access, CurrentUser
 from schemas.insights import HealthInsightResponse, InsightsSummaryResponse, BiomarkerTrendResponse
 from services.insights_service import InsightsService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 
 router = APIRouter()
 
@@ -33,7 +34,8 @@ async def get_insights_for_lab_result(
 async def get_biomarker_trends(
     testName: str,
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("labs"))
 ):
     service = InsightsService(db)
-    return await service.get_biomarker_trends(testName, current_user.userId, current_user.systemId)
+    return await cache.fetch(lambda: service.get_biomarker_trends(testName, current_user.userId, current_user.systemId))
@@ -5,14 +5,16 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.dependencies import get_current_user, verify_tenant_access, CurrentUser
 from schemas.lab_order import (
     LabTestOrderCreate, LabTestOrderUpdate, LabTestOrderResponse,
+    LabTestOrderBulkCreate, LabTestOrderBulkResponse,
     LabTestOrderWithDetails, LabTestOrderListFilter, LabTestOrderListResponse,
     LabStats, PatientLabSummary, PhysicianLabWorkload
 )
 from services.lab_orders_service import LabOrdersService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 
 router = APIRouter()
 
@@ -28,6 +30,17 @@ async def create_lab_order(
     return await lab_orders_service.create_lab_order(order_data)
 
 
+@router.post("/bulk", response_model=LabTestOrderBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_lab_orders_bulk(
+    bulk_data: LabTestOrderBulkCreate,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many lab orders at once (e.g. a panel for a clinic session); results are reported per order"""
+    lab_orders_service = LabOrdersService(db)
+    return await lab_orders_service.create_lab_orders_bulk(bulk_data, current_user.systemId)
+
+
 @router.get("/{order_id}", response_model=LabTestOrderWithDetails)
 async def get_lab_order(
     order_id: str,
@@ -129,30 +142,33 @@ async def mark_sample_collected(
 @router.get("/stats/overview", response_model=LabStats)
 async def get_lab_stats(
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("lab_orders", depends_on=("labs",)))
 ):
     """Get lab module statistics"""
     lab_orders_service = LabOrdersService(db)
-    return await lab_orders_service.get_lab_stats(current_user.systemId)
+    return await cache.fetch(lambda: lab_orders_service.get_lab_stats(current_user.systemId))
 
 
 @router.get("/patient/{patient_id}/summary", response_model=PatientLabSummary)
 async def get_patient_lab_summary(
     patient_id: str,
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("lab_orders", depends_on=("labs",)))
 ):
     """Get patient's lab test summary"""
     lab_orders_service = LabOrdersService(db)
-    return await lab_orders_service.get_patient_lab_summary(patient_id, current_user.systemId)
+    return await cache.fetch(lambda: lab_orders_service.get_patient_lab_summary(patient_id, current_user.systemId))
 
 
 @router.get("/physician/{physician_id}/workload", response_model=PhysicianLabWorkload)
 async def get_physician_workload(
     physician_id: str,
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("lab_orders", depends_on=("labs",)))
 ):
     """Get physician's lab review workload"""
     lab_orders_service = LabOrdersService(db)
-    return await lab_orders_service.get_physician_workload(physician_id, current_user.systemId)
+    return await cache.fetch(lambda: lab_orders_service.get_physician_workload(physician_id, current_user.systemId))
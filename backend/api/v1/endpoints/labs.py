@@ -2,9 +2,9 @@ from fastapi import APIRouter, Depends, UploadFile, File, Form, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.dependencies import get_current_user, verify_tenant_access, CurrentUser
-from schemas.lab import LabResultResponse, BiomarkerResponse
+from schemas.lab import LabResultResponse, BiomarkerResponse, LabUploadRequest, LabUploadTicket, DownloadUrlResponse
 from schemas.lab_order import (
     LabResultWithBiomarkers, LabResultWithDetails, LabResultListFilter,
     LabResultListResponse, LabResultReview, BiomarkerCreate, BiomarkerUpdate
@@ -25,10 +25,43 @@ async def upload_lab(
     return await labs_service.upload_lab(file, current_user.userId, current_user.systemId, ordered_by)
 
 
+@router.post("/uploads", response_model=LabUploadTicket, status_code=status.HTTP_201_CREATED)
+async def create_lab_upload(
+    upload_request: LabUploadRequest,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Start a direct-to-storage upload: returns a presigned POST for the file"""
+    labs_service = LabsService(db)
+    return await labs_service.create_upload(upload_request, current_user.userId, current_user.systemId)
+
+
+@router.post("/{id}/upload-complete", response_model=LabResultResponse)
+async def complete_lab_upload(
+    id: str,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Confirm a presigned upload finished; OCR runs in the background"""
+    labs_service = LabsService(db)
+    return await labs_service.complete_upload(id, current_user.userId, current_user.systemId)
+
+
+@router.get("/{id}/download-url", response_model=DownloadUrlResponse)
+async def get_lab_download_url(
+    id: str,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get a short-lived URL for downloading the lab report file"""
+    labs_service = LabsService(db)
+    return await labs_service.get_download_url(id, current_user.userId, current_user.systemId)
+
+
 @router.get("", response_model=List[LabResultResponse])
 async def get_lab_results(
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     labs_service = LabsService(db)
     return await labs_service.get_lab_results(current_user.userId, current_user.systemId)
@@ -178,7 +211,7 @@ async def update_biomarker(
 async def get_unreviewed_results(
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get unreviewed lab results for physician dashboard"""
     labs_service = LabsService(db)
@@ -189,7 +222,7 @@ async def get_unreviewed_results(
 async def get_critical_results(
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get lab results with critical biomarkers"""
     labs_service = LabsService(db)
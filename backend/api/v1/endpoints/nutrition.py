@@ -5,10 +5,11 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.dependencies import get_current_user, CurrentUser
 from core.permissions import require_permission
 from services.nutrition_service import NutritionService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 from schemas.nutrition import (
     NutritionAssessmentCreate,
     NutritionAssessmentUpdate,
@@ -27,6 +28,9 @@ from schemas.nutrition import (
     MealPlanDayWithMeals,
     MealPlanMealCreate,
     MealPlanMealResponse,
+    MealPlanTemplateCreate,
+    MealPlanCloneRequest,
+    MealPlanCloneResponse,
     NutritionFeedbackCreate,
     NutritionFeedbackUpdate,
     NutritionFeedbackResponse,
@@ -62,15 +66,7 @@ async def list_assessments(
     is_staff = current_user.role in ["admin", "physician", "nutritionist", "nurse"]
     
     try:
-        assessments, total = await service.list_assessments(filters, current_user.userId, is_staff)
-        
-        return NutritionAssessmentListResponse(
-            items=assessments,
-            total=total,
-            skip=filters.skip,
-            limit=filters.limit,
-            has_more=(filters.skip + filters.limit) < total
-        )
+        return await service.list_assessments(filters, current_user.userId, is_staff)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -178,15 +174,7 @@ async def list_meal_plans(
     is_staff = current_user.role in ["admin", "physician", "nutritionist", "nurse"]
     
     try:
-        plans, total = await service.list_meal_plans(filters, current_user.userId, is_staff)
-        
-        return MealPlanListResponse(
-            items=plans,
-            total=total,
-            skip=filters.skip,
-            limit=filters.limit,
-            has_more=(filters.skip + filters.limit) < total
-        )
+        return await service.list_meal_plans(filters, current_user.userId, is_staff)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -328,6 +316,73 @@ async def add_meal_to_day(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/meal-plans/{plan_id}/template", response_model=MealPlanResponse, status_code=status.HTTP_201_CREATED)
+@require_permission(ModuleCategory.NUTRITIONIST, "create")
+async def create_meal_plan_template(
+    plan_id: str,
+    template_data: MealPlanTemplateCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Save a meal plan, with its days and meals, as a reusable template
+    
+    **Permissions:** Only Nutritionists and Admins can create templates.
+    """
+    service = NutritionService(db)
+    
+    try:
+        return await service.create_template_from_plan(plan_id, template_data, current_user.systemId)
+    
+    except NotFoundError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/meal-plan-templates/", response_model=List[MealPlanResponse])
+@require_permission(ModuleCategory.NUTRITIONIST, "view")
+async def list_meal_plan_templates(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    List meal plan templates
+    
+    **Permissions:** Staff can view templates.
+    """
+    service = NutritionService(db)
+    
+    try:
+        return await service.list_meal_plan_templates(current_user.systemId)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/meal-plans/{plan_id}/clone", response_model=MealPlanCloneResponse, status_code=status.HTTP_201_CREATED)
+@require_permission(ModuleCategory.NUTRITIONIST, "create")
+async def clone_meal_plan(
+    plan_id: str,
+    clone_data: MealPlanCloneRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Copy a meal plan or template to many patients in one transaction
+    
+    **Permissions:** Only Nutritionists and Admins can assign meal plans.
+    """
+    service = NutritionService(db)
+    
+    try:
+        return await service.clone_meal_plan_to_patients(plan_id, clone_data, current_user.systemId)
+    
+    except (NotFoundError, ValidationError) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Nutrition Feedback Endpoints
 # ============================================================================
@@ -348,15 +403,7 @@ async def list_feedback(
     is_staff = current_user.role in ["admin", "physician", "nutritionist", "nurse"]
     
     try:
-        feedbacks, total = await service.list_feedback(filters, current_user.userId, is_staff)
-        
-        return NutritionFeedbackListResponse(
-            items=feedbacks,
-            total=total,
-            skip=filters.skip,
-            limit=filters.limit,
-            has_more=(filters.skip + filters.limit) < total
-        )
+        return await service.list_feedback(filters, current_user.userId, is_staff)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -452,8 +499,9 @@ async def update_feedback(
 @require_permission(ModuleCategory.NUTRITIONIST, "view")
 async def get_nutrition_stats(
     nutritionist_id: str = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    cache: CachedResponse = Depends(cache_response("nutrition"))
 ):
     """
     Get nutrition module statistics
@@ -462,20 +510,22 @@ async def get_nutrition_stats(
     """
     service = NutritionService(db)
     
-    # If not specified, get current user's stats
-    if not nutritionist_id:
-        from models.staff import Staff
-        from sqlalchemy import select
-        result = await db.execute(
-            select(Staff).where(Staff.user_id == current_user.userId)
-        )
-        staff = result.scalar_one_or_none()
-        if staff:
-            nutritionist_id = staff.id
+    async def get_stats():
+        # If not specified, get current user's stats
+        stats_nutritionist_id = nutritionist_id
+        if not stats_nutritionist_id:
+            from models.staff import Staff
+            from sqlalchemy import select
+            result = await db.execute(
+                select(Staff).where(Staff.user_id == current_user.userId)
+            )
+            staff = result.scalar_one_or_none()
+            if staff:
+                stats_nutritionist_id = staff.id
+        return await service.get_stats(stats_nutritionist_id)
     
     try:
-        stats = await service.get_stats(nutritionist_id)
-        return stats
+        return await cache.fetch(get_stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -484,7 +534,7 @@ async def get_nutrition_stats(
 @require_permission(ModuleCategory.NUTRITIONIST, "view")
 async def get_patient_progress(
     patient_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
     """
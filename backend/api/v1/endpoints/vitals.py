@@ -5,10 +5,11 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.dependencies import get_current_user, CurrentUser
 from core.permissions import require_permission
 from services.vitals_service import VitalsService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 from schemas.vitals import (
     VitalsRecordCreate,
     VitalsRecordUpdate,
@@ -31,7 +32,7 @@ router = APIRouter()
 @require_permission(ModuleCategory.NURSE, "view")
 async def list_vitals_records(
     filters: VitalsRecordListFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
     """
@@ -62,8 +63,9 @@ async def list_vitals_records(
 @require_permission(ModuleCategory.NURSE, "view")
 async def get_vitals_stats(
     nurse_id: str = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    cache: CachedResponse = Depends(cache_response("vitals"))
 ):
     """
     Get vitals statistics
@@ -72,20 +74,22 @@ async def get_vitals_stats(
     """
     service = VitalsService(db)
     
-    # If nurse_id not provided, use current user's nurse profile
-    if not nurse_id:
-        from models.staff import Staff
-        from sqlalchemy import select
-        result = await db.execute(
-            select(Staff).where(Staff.user_id == current_user.userId)
-        )
-        staff = result.scalar_one_or_none()
-        if staff:
-            nurse_id = staff.id
+    async def get_stats():
+        # If nurse_id not provided, use current user's nurse profile
+        stats_nurse_id = nurse_id
+        if not stats_nurse_id:
+            from models.staff import Staff
+            from sqlalchemy import select
+            result = await db.execute(
+                select(Staff).where(Staff.user_id == current_user.userId)
+            )
+            staff = result.scalar_one_or_none()
+            if staff:
+                stats_nurse_id = staff.id
+        return await service.get_stats(stats_nurse_id)
     
     try:
-        stats = await service.get_stats(nurse_id)
-        return stats
+        return await cache.fetch(get_stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -95,8 +99,9 @@ async def get_vitals_stats(
 async def get_patient_trends(
     patient_id: str,
     days: int = 30,
-    db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    cache: CachedResponse = Depends(cache_response("vitals"))
 ):
     """
     Get vital signs trends for a specific patient
@@ -114,8 +119,7 @@ async def get_patient_trends(
         )
     
     try:
-        trends = await service.get_patient_trends(patient_id, days)
-        return trends
+        return await cache.fetch(lambda: service.get_patient_trends(patient_id, days))
     except NotFoundError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
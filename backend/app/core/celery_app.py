@@ -6,7 +6,7 @@ celery_app = Celery(
     "health_platform",
     broker=settings.celery_broker,
     backend=settings.celery_backend,
-    include=["app.tasks.ocr_tasks"]
+    include=["app.workers.ocr_tasks", "app.workers.auth_tasks", "app.workers.cache_tasks"]
 )
 
 celery_app.conf.update(
@@ -18,4 +18,10 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,
     task_soft_time_limit=25 * 60,
+    beat_schedule={
+        "sweep-expired-refresh-tokens": {
+            "task": "auth.sweep_expired_refresh_tokens",
+            "schedule": 60 * 60,
+        },
+    },
 )
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -9,10 +9,40 @@ class Settings(BaseSettings):
     PORT: int = 8000
 
     DATABASE_URL: str
+    # Read replica for analytics/list/trend endpoints (get_read_db); None reads from DATABASE_URL
+    DATABASE_READ_URL: Optional[str] = None
+    # Connection pool (per process)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statements cached per connection; set 0 behind PgBouncer in transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Client-side timeout for one query, in seconds
+    DB_COMMAND_TIMEOUT: Optional[float] = 60.0
+    # Server-side statement_timeout and lock_timeout, in milliseconds (0 disables)
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_LOCK_TIMEOUT_MS: int = 10000
+    # Verify the server certificate (off by default for managed databases with private CAs)
+    DB_SSL_VERIFY: bool = False
+    DB_ECHO: bool = False
 
     JWT_SECRET: str
     JWT_EXPIRES_IN: str = "1h"
     JWT_ALGORITHM: str = "HS256"
+    # "kid" header of new access tokens (signed with JWT_SECRET)
+    JWT_KEY_ID: str = "k1"
+    # Retired signing keys (kid -> secret) still accepted until their tokens expire, as JSON
+    JWT_RETIRED_KEYS: Dict[str, str] = {}
+    # Decoded access-token claims kept in memory, keyed by token hash
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+    # Redis pub/sub channel broadcasting access-token revocations to every API process
+    TOKEN_REVOCATION_CHANNEL: str = "auth:revocations"
+    # Redis pub/sub channel announcing system config and feature flag changes
+    TENANT_CONFIG_CHANNEL: str = "config:changes"
+    # Longest a process serves a config/flag snapshot without reloading it
+    TENANT_CONFIG_MAX_AGE_SECONDS: int = 300
 
     REFRESH_TOKEN_SECRET: str
     REFRESH_TOKEN_EXPIRES_IN: str = "7d"
@@ -20,14 +50,60 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
 
+    # Response cache for heavy GET endpoints: "redis", or "memory" (one process only, e.g. tests)
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: str = "redis"
+    CACHE_DEFAULT_TTL_SECONDS: int = 60
+    CACHE_REDIS_MAX_CONNECTIONS: int = 50
+    # Cache calls slower than this count as errors and fall through to the database
+    CACHE_REDIS_TIMEOUT_SECONDS: float = 0.5
+    CACHE_MEMORY_MAX_ENTRIES: int = 10000
+    # With a read replica, invalidations repeat this long after the commit: a miss read from a
+    # lagging replica in between would otherwise cache the old rows again until the TTL
+    CACHE_REPLICA_LAG_SECONDS: float = 2.0
+
+    # Audit events queue in memory and are written in batches by a background task
+    AUDIT_QUEUE_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    # Longest an event waits for a batch to fill before it is written
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 0.5
+    # With the queue full, a request waits this long for room before spilling its event to disk
+    AUDIT_ENQUEUE_TIMEOUT_SECONDS: float = 0.05
+    AUDIT_WRITE_RETRIES: int = 3
+    AUDIT_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+    # Events that could not be written are kept here as JSON lines and replayed on startup
+    AUDIT_SPILL_DIR: str = "audit_spill"
+
     AWS_REGION: str
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
     S3_BUCKET_NAME: str
+    # S3-compatible endpoint (e.g. MinIO or a local stand-in); None uses AWS
+    S3_ENDPOINT_URL: Optional[str] = None
+    # Lifetime of presigned upload/download URLs
+    S3_PRESIGNED_URL_EXPIRES_SECONDS: int = 900
+    # Largest file accepted through presigned uploads
+    S3_MAX_UPLOAD_BYTES: int = 25 * 1024 * 1024
+
+    # Lab report OCR: rasterization DPI and preprocessing steps applied to each page
+    OCR_DPI: int = 300
+    OCR_GRAYSCALE: bool = True
+    OCR_BINARIZE: bool = True
+    OCR_DESKEW: bool = True
+    OCR_CROP_MARGINS: bool = True
+    # Pages OCR'd per PDF; None reads every page
+    OCR_MAX_PAGES: Optional[int] = 50
+    # Extra tesseract flags, e.g. "--psm 6"
+    OCR_TESSERACT_CONFIG: str = ""
+    # Use a PDF page's embedded text instead of OCR when it has a usable text layer
+    OCR_USE_TEXT_LAYER: bool = True
 
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
 
+    # Serve lab order counts from lab_order_status_counts instead of scanning orders
+    LAB_STATS_USE_ROLLUP: bool = False
+
     @property
     def redis_url(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}"
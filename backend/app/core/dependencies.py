@@ -1,15 +1,20 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from core.database import get_db
-from core.security import decode_access_token
+from core.request_context import request_actor
+from core.token_verifier import revocations, token_verifier
 from models.user import User
 
 security = HTTPBearer()
 
+STALE_TOKEN_DETAIL = "Token is out of date, refresh required"
+# Claims access tokens carry so CurrentUser can be built without a user lookup
+CLAIMS_USER_FIELDS = ("sub", "email", "username", "role", "system_id")
+
 
 class CurrentUser:
     def __init__(self, user_id: str, email: str, system_id: str, username: str, role: str = "user"):
@@ -20,38 +25,66 @@ class CurrentUser:
         self.role = role
 
 
+def _credentials_error(detail: str = "Could not validate credentials") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _verified_claims(token: str) -> Dict[str, Any]:
+    payload = token_verifier.verify(token)
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_error()
+    if revocations.is_stale(payload):
+        # Role or status changed since the token was issued; /auth/refresh issues a current one
+        raise _credentials_error(STALE_TOKEN_DETAIL)
+    return payload
+
+
+def current_user_from_claims(payload: Dict[str, Any]) -> Optional[CurrentUser]:
+    """CurrentUser built from token claims alone, or None for tokens issued without them"""
+    if not all(payload.get(claim) for claim in CLAIMS_USER_FIELDS):
+        return None
+    return CurrentUser(
+        user_id=payload["sub"],
+        email=payload["email"],
+        system_id=payload["system_id"],
+        username=payload["username"],
+        role=payload["role"]
+    )
+
+
+async def get_current_user_from_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> CurrentUser:
+    """Authenticate from the access token alone, without touching the database"""
+    current_user = current_user_from_claims(_verified_claims(credentials.credentials))
+    if current_user is None:
+        raise _credentials_error(STALE_TOKEN_DETAIL)
+    return current_user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> CurrentUser:
-    token = credentials.credentials
-
-    payload = decode_access_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    payload = _verified_claims(credentials.credentials)
 
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    current_user = current_user_from_claims(payload)
+    if current_user is not None:
+        request_actor.set(current_user.userId)
+        return current_user
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Tokens issued before role/system claims existed: look the user up
+    result = await db.execute(select(User).where(User.id == payload["sub"]))
     user = result.scalar_one_or_none()
 
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_error("User not found")
 
+    request_actor.set(user.id)
     return CurrentUser(
         user_id=user.id,
         email=user.email,
@@ -1,7 +1,8 @@
 """
 Permission checking and enforcement for API endpoints
 """
-from typing import Optional, List
+import time
+from typing import Optional, List, Dict, Tuple
 from functools import wraps
 from fastapi import HTTPException, Depends, status
 from sqlalchemy import select
@@ -24,6 +25,47 @@ NOT_AUTHENTICATED_MSG = "Not authenticated"
 # Permission Checking Functions
 # ============================================================================
 
+# Module permissions change rarely and are shared by every user of a role, so
+# each process caches them per role instead of querying on every request
+PERMISSION_CACHE_SECONDS = 60
+_role_permissions: Dict[UserRole, Tuple[float, Dict[ModuleCategory, Dict[str, bool]]]] = {}
+
+
+async def get_role_permissions(
+    db: AsyncSession,
+    user_role: UserRole
+) -> Dict[ModuleCategory, Dict[str, bool]]:
+    """
+    Action flags per module for a role, e.g. {ModuleCategory.PHYSICIAN: {"view": True, ...}}
+
+    Served from a per-process cache refreshed every PERMISSION_CACHE_SECONDS.
+    """
+    cached = _role_permissions.get(user_role)
+    if cached and time.monotonic() - cached[0] < PERMISSION_CACHE_SECONDS:
+        return cached[1]
+
+    result = await db.execute(
+        select(ModulePermission).where(ModulePermission.role == user_role)
+    )
+    permissions = {
+        permission.module_category: {
+            "view": permission.can_read,
+            "read": permission.can_read,
+            "create": permission.can_create,
+            "update": permission.can_update,
+            "delete": permission.can_delete,
+        }
+        for permission in result.scalars().all()
+    }
+    _role_permissions[user_role] = (time.monotonic(), permissions)
+    return permissions
+
+
+def clear_permission_cache() -> None:
+    """Drop cached module permissions (after editing them)"""
+    _role_permissions.clear()
+
+
 async def check_module_permission(
     db: AsyncSession,
     user_role: UserRole,
@@ -46,29 +88,11 @@ async def check_module_permission(
     if user_role == UserRole.ADMIN:
         return True
     
-    # Query permission
-    result = await db.execute(
-        select(ModulePermission).where(
-            ModulePermission.role == user_role,
-            ModulePermission.module_category == module_category
-        )
-    )
-    permission = result.scalar_one_or_none()
-    
+    permission = (await get_role_permissions(db, user_role)).get(module_category)
     if not permission:
         return False
     
-    # Check specific action
-    if action == "view" or action == "read":
-        return permission.can_read
-    elif action == "create":
-        return permission.can_create
-    elif action == "update":
-        return permission.can_update
-    elif action == "delete":
-        return permission.can_delete
-    else:
-        return False
+    return permission.get(action, False)
 
 
 async def check_multiple_permissions(
@@ -87,26 +111,11 @@ async def check_multiple_permissions(
     if user_role == UserRole.ADMIN:
         return dict.fromkeys(actions, True)
     
-    result = await db.execute(
-        select(ModulePermission).where(
-            ModulePermission.role == user_role,
-            ModulePermission.module_category == module_category
-        )
-    )
-    permission = result.scalar_one_or_none()
-    
+    permission = (await get_role_permissions(db, user_role)).get(module_category)
     if not permission:
         return dict.fromkeys(actions, False)
     
-    permission_map = {
-        "view": permission.can_read,
-        "read": permission.can_read,
-        "create": permission.can_create,
-        "update": permission.can_update,
-        "delete": permission.can_delete,
-    }
-    
-    return {action: permission_map.get(action, False) for action in actions}
+    return {action: permission.get(action, False) for action in actions}
 
 
 async def get_user_accessible_modules(
@@ -123,15 +132,8 @@ async def get_user_accessible_modules(
     if user_role == UserRole.ADMIN:
         return list(ModuleCategory)
     
-    result = await db.execute(
-        select(ModulePermission).where(
-            ModulePermission.role == user_role,
-            ModulePermission.can_read == True
-        )
-    )
-    permissions = result.scalars().all()
-    
-    return [perm.module_category for perm in permissions]
+    permissions = await get_role_permissions(db, user_role)
+    return [module for module, actions in permissions.items() if actions["read"]]
 
 
 async def has_any_permission(
@@ -146,23 +148,11 @@ async def has_any_permission(
     if user_role == UserRole.ADMIN:
         return True
     
-    result = await db.execute(
-        select(ModulePermission).where(
-            ModulePermission.role == user_role,
-            ModulePermission.module_category == module_category
-        )
-    )
-    permission = result.scalar_one_or_none()
-    
+    permission = (await get_role_permissions(db, user_role)).get(module_category)
     if not permission:
         return False
     
-    return (
-        permission.can_read or 
-        permission.can_create or 
-        permission.can_update or 
-        permission.can_delete
-    )
+    return any(permission.values())
 
 
 # ============================================================================
@@ -8,6 +8,7 @@ from app.shared.schemas.action_plan import (
     ActionPlanResponse, ActionItemResponse, CreateActionPlanRequest,
     UpdateActionPlanRequest, CreateActionItemRequest, UpdateActionItemRequest
 )
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 # Constants for error messages
 ACTION_PLAN_NOT_FOUND = "Action plan not found"
@@ -28,8 +29,8 @@ class ActionPlansService:
         )
         
         self.db.add(action_plan)
-        await self.db.commit()
-        await self.db.refresh(action_plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_plan_to_response(action_plan)
 
@@ -83,8 +84,8 @@ class ActionPlansService:
         if data.status is not None:
             action_plan.status = data.status.value
         
-        await self.db.commit()
-        await self.db.refresh(action_plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_plan_to_response(action_plan)
 
@@ -105,7 +106,7 @@ class ActionPlansService:
         
         # Delete action plan (cascade will handle action items)
         await self.db.delete(action_plan)
-        await self.db.commit()
+        invalidate_on_commit(self.db, "action_plans", system_id)
 
     # Action Items Methods
     async def create_action_item(self, plan_id: str, data: CreateActionItemRequest, user_id: str, system_id: str) -> ActionItemResponse:
@@ -122,8 +123,8 @@ class ActionPlansService:
         )
         
         self.db.add(action_item)
-        await self.db.commit()
-        await self.db.refresh(action_item)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_item_to_response(action_item)
 
@@ -185,8 +186,8 @@ class ActionPlansService:
         if data.due_date is not None:
             action_item.due_date = data.due_date
         
-        await self.db.commit()
-        await self.db.refresh(action_item)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_item_to_response(action_item)
 
@@ -207,7 +208,7 @@ class ActionPlansService:
             )
         
         await self.db.delete(action_item)
-        await self.db.commit()
+        invalidate_on_commit(self.db, "action_plans", system_id)
 
     # Helper methods
     def _action_plan_to_response(self, action_plan: ActionPlan) -> ActionPlanResponse:
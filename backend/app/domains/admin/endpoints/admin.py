@@ -2,7 +2,7 @@ from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import require_admin, CurrentUser
 from app.domains.admin.schemas.admin import (
     CreateUserRequest,
@@ -12,10 +12,14 @@ from app.domains.admin.schemas.admin import (
     SystemConfigResponse,
     UserAnalytics,
     LabAnalytics,
+    LabTurnaroundReport,
+    OverdueLabOrder,
     ActionPlanAnalytics
 )
 from app.shared.schemas.enums import UserRole
 from app.domains.admin.services.admin_service import AdminService
+from app.domains.lab_orders.services.lab_turnaround_service import LabTurnaroundService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 
 router = APIRouter()
 
@@ -27,7 +31,7 @@ router = APIRouter()
 @router.get("/users", response_model=List[AdminUserResponse])
 async def get_all_users(
     current_user: CurrentUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all users in the system"""
     admin_service = AdminService(db)
@@ -86,38 +90,67 @@ async def delete_user(
 @router.get("/analytics/users", response_model=UserAnalytics)
 async def get_user_analytics(
     current_user: CurrentUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("admin_analytics", depends_on=("users",), per_user=False))
 ):
     """Get user analytics for the system"""
     admin_service = AdminService(db)
-    return await admin_service.get_user_analytics(current_user.systemId)
+    return await cache.fetch(lambda: admin_service.get_user_analytics(current_user.systemId))
 
 
 @router.get("/analytics/labs", response_model=LabAnalytics)
 async def get_lab_analytics(
     current_user: CurrentUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("admin_analytics", depends_on=("labs", "lab_orders"), per_user=False))
 ):
     """Get lab analytics for the system"""
     admin_service = AdminService(db)
-    return await admin_service.get_lab_analytics(current_user.systemId)
+    return await cache.fetch(lambda: admin_service.get_lab_analytics(current_user.systemId))
+
+
+@router.get("/analytics/labs/turnaround", response_model=LabTurnaroundReport)
+async def get_lab_turnaround(
+    stage: Optional[str] = Query(None, description="Workflow stage, e.g. order_to_result"),
+    lab_name: Optional[str] = Query(None, description="External lab name"),
+    priority: Optional[str] = Query(None, description="Order priority"),
+    current_user: CurrentUser = Depends(require_admin),
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("admin_analytics", depends_on=("labs", "lab_orders"), per_user=False))
+):
+    """Get p50/p90/p99 lab turnaround per lab, priority and stage"""
+    turnaround_service = LabTurnaroundService(db)
+    return await cache.fetch(lambda: turnaround_service.get_turnaround_report(current_user.systemId, stage, lab_name, priority))
+
+
+@router.get("/analytics/labs/overdue", response_model=List[OverdueLabOrder])
+async def get_overdue_lab_orders(
+    limit: int = Query(100, ge=1, le=500),
+    current_user: CurrentUser = Depends(require_admin),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get open lab orders past their priority's turnaround target, STAT first"""
+    turnaround_service = LabTurnaroundService(db)
+    return await turnaround_service.get_overdue_orders(current_user.systemId, limit)
 
 
 @router.get("/analytics/action-plans", response_model=ActionPlanAnalytics)
 async def get_action_plan_analytics(
     current_user: CurrentUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("admin_analytics", depends_on=("action_plans",), per_user=False))
 ):
     """Get action plan analytics for the system"""
     admin_service = AdminService(db)
-    return await admin_service.get_action_plan_analytics(current_user.systemId)
+    return await cache.fetch(lambda: admin_service.get_action_plan_analytics(current_user.systemId))
 
 
 @router.get("/analytics/comprehensive", response_model=Dict[str, Any])
 async def get_comprehensive_analytics(
     current_user: CurrentUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("admin_analytics", depends_on=("users", "labs", "lab_orders", "action_plans"), per_user=False))
 ):
     """Get comprehensive system analytics for admin dashboard"""
     admin_service = AdminService(db)
-    return await admin_service.get_comprehensive_analytics(current_user.systemId)
+    return await cache.fetch(lambda: admin_service.get_comprehensive_analytics(current_user.systemId))
@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
-from app.shared.schemas.enums import UserRole, ProfileType, JourneyType
+from app.shared.schemas.enums import UserRole, ProfileType, JourneyType, LabOrderPriority, LabOrderStatus
 
 
 class CreateUserRequest(BaseModel):
@@ -105,6 +105,35 @@ class LabAnalytics(BaseModel):
     processing_rate: float = Field(..., ge=0, le=100, description="Lab processing success rate percentage")
 
 
+class LabTurnaroundStats(BaseModel):
+    """Turnaround percentiles for one lab, priority and workflow stage"""
+    lab_name: Optional[str] = Field(None, description="External lab name (None when unspecified)")
+    priority: str = Field(..., description="Order priority, or 'unknown' for results not linked to an order")
+    stage: str = Field(..., description="order_to_collection, collection_to_result, order_to_result or result_to_review")
+    sample_count: int = Field(..., ge=0, description="Number of measured transitions")
+    mean_minutes: Optional[float] = Field(None, description="Mean turnaround in minutes")
+    p50_minutes: Optional[float] = Field(None, description="Median turnaround in minutes")
+    p90_minutes: Optional[float] = Field(None, description="90th percentile turnaround in minutes")
+    p99_minutes: Optional[float] = Field(None, description="99th percentile turnaround in minutes")
+
+
+class LabTurnaroundReport(BaseModel):
+    """Lab turnaround analytics for a system"""
+    system_id: str = Field(..., description="ID of the system")
+    stats: List[LabTurnaroundStats] = Field(default_factory=list, description="One entry per lab, priority and stage")
+
+
+class OverdueLabOrder(BaseModel):
+    """An open lab order past its priority's turnaround target"""
+    order_id: str = Field(..., description="Lab order ID")
+    patient_id: str = Field(..., description="Patient ID")
+    priority: LabOrderPriority = Field(..., description="Order priority")
+    status: LabOrderStatus = Field(..., description="Current order status")
+    external_lab_name: Optional[str] = Field(None, description="External lab name")
+    order_date: datetime = Field(..., description="When the order was placed")
+    overdue_minutes: float = Field(..., ge=0, description="Minutes past the turnaround target")
+
+
 class ActionPlanAnalytics(BaseModel):
     """Analytics data for action plans"""
     total_plans: int = Field(..., ge=0, description="Total number of action plans")
@@ -18,6 +18,9 @@ from app.domains.admin.schemas.admin import (
     LabAnalytics, ActionPlanAnalytics
 )
 from app.shared.schemas.enums import UserRole, StaffType
+from app.core.permissions import clear_permission_cache
+from core.token_verifier import publish_permissions_version, revoke_user_tokens
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 
 class AdminService:
@@ -57,8 +60,8 @@ class AdminService:
         )
 
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "users", system_id)
 
         return self._user_to_admin_response(user)
 
@@ -76,6 +79,17 @@ class AdminService:
                 detail="User not found"
             )
 
+        # Access tokens carry these; a change must reach them
+        claims_changed = any(
+            value is not None and value != getattr(user, field)
+            for field, value in (
+                ("email", data.email),
+                ("username", data.username),
+                ("role", data.role),
+                ("is_active", data.is_active),
+            )
+        )
+        role_changed = data.role is not None and data.role != user.role
         if data.email is not None:
             user.email = data.email
         if data.username is not None:
@@ -91,8 +105,23 @@ class AdminService:
         if data.is_active is not None:
             user.is_active = data.is_active
 
+        if claims_changed:
+            user.permissions_version = User.permissions_version + 1
+
+        # Committed before broadcasting, so a refresh never reissues the old claims
         await self.db.commit()
-        await self.db.refresh(user)
+
+        if claims_changed:
+            # Outstanding access tokens carry the old claims; make clients refresh them
+            # (the increment ran in SQL, so load the new value first)
+            await self.db.refresh(user, ["permissions_version"])
+            await publish_permissions_version(user.id, user.permissions_version)
+        if role_changed:
+            # Permissions are cached per role; read the new role's grants fresh
+            clear_permission_cache()
+        if data.is_active is False:
+            await revoke_user_tokens(user.id)
+        invalidate_on_commit(self.db, "users", system_id)
 
         return self._user_to_admin_response(user)
 
@@ -111,7 +140,9 @@ class AdminService:
             )
 
         await self.db.delete(user)
-        await self.db.commit()
+        await self.db.commit()  # before revoking, as in update_user
+        await revoke_user_tokens(user_id)
+        invalidate_on_commit(self.db, "users", system_id)
 
         return {"message": "User deleted successfully"}
 
@@ -1,22 +1,26 @@
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import asyncio
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-import secrets
 
-from app.shared.models import User, RefreshToken
+from app.shared.models import User
 from app.shared.models import System
 from app.domains.auth.schemas.auth import RegisterRequest, LoginRequest, AuthResponse, UserResponse, SystemResponse
 from app.core.security import (
     verify_password, 
     get_password_hash, 
     create_access_token, 
-    create_refresh_token,
-    decode_refresh_token,
+    access_token_claims,
     parse_expires_in
 )
 from app.core.config import settings
+from app.domains.auth.services.refresh_tokens import RefreshTokenStore
+from app.shared.schemas.enums import AuditActionType
+from app.infrastructure.audit.writer import audit_committed
+from app.infrastructure.cache.response_cache import invalidate_on_commit
+from core.token_verifier import revoke_user_tokens
 
 
 class AuthService:
@@ -24,198 +28,122 @@ class AuthService:
         self.db = db
 
     async def register(self, data: RegisterRequest) -> AuthResponse:
-        # Check if user already exists
+        # Email, username and system checks in one round trip
         result = await self.db.execute(
-            select(User).where(User.email == data.email)
+            select(
+                exists().where(User.email == data.email).label("email_taken"),
+                exists().where(User.username == data.username).label("username_taken"),
+                select(System.id).where(System.slug == data.systemSlug).scalar_subquery().label("system_id"),
+                select(System.name).where(System.slug == data.systemSlug).scalar_subquery().label("system_name")
+            )
         )
-        if result.scalar_one_or_none():
+        checks = result.one()
+        if checks.email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
-
-        # Check if username already exists
-        result = await self.db.execute(
-            select(User).where(User.username == data.username)
-        )
-        if result.scalar_one_or_none():
+        if checks.username_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken"
             )
-
-        # Get system by slug
-        result = await self.db.execute(
-            select(System).where(System.slug == data.systemSlug)
-        )
-        system = result.scalar_one_or_none()
-        if not system:
+        if not checks.system_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid system"
             )
 
-        # Create new user
-        hashed_password = get_password_hash(data.password)
+        # Create new user (bcrypt is CPU-bound: keep it off the event loop)
+        hashed_password = await asyncio.to_thread(get_password_hash, data.password)
         user = User(
+            id=str(uuid4()),
             email=data.email,
             username=data.username,
             password=hashed_password,
+            role="patient",
+            permissions_version=1,
             profile_type=data.profileType,
             journey_type=data.journeyType,
-            system_id=system.id
+            system_id=checks.system_id
         )
-
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
 
-        # Create tokens
-        access_token = create_access_token(
-            {"sub": user.id, "email": user.email},
-            expires_delta=parse_expires_in(settings.JWT_EXPIRES_IN)
-        )
-        
-        refresh_token = create_refresh_token(
-            {"sub": user.id},
-            expires_delta=parse_expires_in(settings.REFRESH_TOKEN_EXPIRES_IN)
-        )
-
-        # Store refresh token
-        refresh_token_obj = RefreshToken(
-            user_id=user.id,
-            token=refresh_token,
-            expires_at=datetime.now(timezone.utc) + parse_expires_in(settings.REFRESH_TOKEN_EXPIRES_IN)
-        )
-        self.db.add(refresh_token_obj)
-        await self.db.commit()
+        # User and refresh token go in together in one transaction
+        refresh_token = await RefreshTokenStore(self.db).issue(user.id)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent registration for the same email or username
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email or username already registered"
+            )
+        invalidate_on_commit(self.db, "users", checks.system_id)
 
-        return AuthResponse(
-            user=UserResponse(
-                id=user.id,
-                email=user.email,
-                username=user.username,
-                role=user.role,
-                profile_type=user.profile_type,
-                journey_type=user.journey_type,
-                system=SystemResponse(
-                    id=system.id,
-                    name=system.name,
-                    slug=system.slug
-                )
-            ),
-            accessToken=access_token,
-            refreshToken=refresh_token
-        )
+        system = SystemResponse(id=checks.system_id, name=checks.system_name, slug=data.systemSlug)
+        return self._auth_response(user, system, refresh_token)
 
     async def login(self, data: LoginRequest) -> AuthResponse:
-        # Find user by email
+        # Find user by email, with its system
         result = await self.db.execute(
-            select(User).where(User.email == data.email)
+            select(User, System)
+            .join(System, System.id == User.system_id)
+            .where(User.email == data.email)
         )
-        user = result.scalar_one_or_none()
-        
-        if not user or not verify_password(data.password, user.password):
+        row = result.one_or_none()
+
+        if not row or not await asyncio.to_thread(verify_password, data.password, row.User.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
+        user, system = row
 
-        # Get system
-        result = await self.db.execute(
-            select(System).where(System.id == user.system_id)
-        )
-        system = result.scalar_one_or_none()
-        if not system:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="System not found"
-            )
-
-        # Create tokens
-        access_token = create_access_token(
-            {"sub": user.id, "email": user.email},
-            expires_delta=parse_expires_in(settings.JWT_EXPIRES_IN)
-        )
-        
-        refresh_token = create_refresh_token(
-            {"sub": user.id},
-            expires_delta=parse_expires_in(settings.REFRESH_TOKEN_EXPIRES_IN)
-        )
-
-        # Store refresh token
-        refresh_token_obj = RefreshToken(
-            user_id=user.id,
-            token=refresh_token,
-            expires_at=datetime.now(timezone.utc) + parse_expires_in(settings.REFRESH_TOKEN_EXPIRES_IN)
-        )
-        self.db.add(refresh_token_obj)
+        refresh_token = await RefreshTokenStore(self.db).issue(user.id)
         await self.db.commit()
+        await audit_committed(AuditActionType.LOGIN, "USER", user.id, user_id=user.id)
 
-        return AuthResponse(
-            user=UserResponse(
-                id=user.id,
-                email=user.email,
-                username=user.username,
-                role=user.role,
-                profile_type=user.profile_type,
-                journey_type=user.journey_type,
-                system=SystemResponse(
-                    id=system.id,
-                    name=system.name,
-                    slug=system.slug
-                )
-            ),
-            accessToken=access_token,
-            refreshToken=refresh_token
-        )
+        return self._auth_response(user, self._system_response(system), refresh_token)
 
     async def refresh(self, refresh_token: str) -> AuthResponse:
-        # Decode refresh token
-        payload = decode_refresh_token(refresh_token)
-        if not payload:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid refresh token"
-            )
-
-        # Check if refresh token exists in database
-        result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.token == refresh_token)
-        )
-        stored_token = result.scalar_one_or_none()
-        
-        if not stored_token or stored_token.expires_at < datetime.now(timezone.utc):
+        # Rotate: the presented token is swapped for a new one in a single statement
+        rotated = await RefreshTokenStore(self.db).rotate(refresh_token)
+        if not rotated:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired refresh token"
             )
+        user_id, new_refresh_token = rotated
 
-        # Get user
+        # Get user, with its system
         result = await self.db.execute(
-            select(User).where(User.id == stored_token.user_id)
+            select(User, System)
+            .join(System, System.id == User.system_id)
+            .where(User.id == user_id)
         )
-        user = result.scalar_one_or_none()
-        if not user:
+        row = result.one_or_none()
+        if not row or not row.User.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
+        user, system = row
+        await self.db.commit()
 
-        # Get system
-        result = await self.db.execute(
-            select(System).where(System.id == user.system_id)
+        return self._auth_response(user, self._system_response(system), new_refresh_token)
+
+    def _system_response(self, system: System) -> SystemResponse:
+        return SystemResponse(
+            id=system.id,
+            name=system.name,
+            slug=system.slug
         )
-        system = result.scalar_one_or_none()
-        if not system:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="System not found"
-            )
 
-        # Create new access token
+    def _auth_response(self, user: User, system: SystemResponse, refresh_token: str) -> AuthResponse:
         access_token = create_access_token(
-            {"sub": user.id, "email": user.email},
+            access_token_claims(user),
             expires_delta=parse_expires_in(settings.JWT_EXPIRES_IN)
         )
 
@@ -227,11 +155,7 @@ class AuthService:
                 role=user.role,
                 profile_type=user.profile_type,
                 journey_type=user.journey_type,
-                system=SystemResponse(
-                    id=system.id,
-                    name=system.name,
-                    slug=system.slug
-                )
+                system=system
             ),
             accessToken=access_token,
             refreshToken=refresh_token
@@ -239,14 +163,10 @@ class AuthService:
 
     async def logout(self, user_id: str) -> dict:
         # Remove all refresh tokens for the user
-        result = await self.db.execute(
-            select(RefreshToken).where(RefreshToken.user_id == user_id)
-        )
-        tokens = result.scalars().all()
-        
-        for token in tokens:
-            await self.db.delete(token)
-        
+        await RefreshTokenStore(self.db).revoke_all(user_id)
         await self.db.commit()
-        
+        await audit_committed(AuditActionType.LOGOUT, "USER", user_id, user_id=user_id)
+        # ...and void the access tokens already handed out
+        await revoke_user_tokens(user_id)
+
         return {"message": "Logged out successfully"}
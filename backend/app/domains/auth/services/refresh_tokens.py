@@ -0,0 +1,103 @@
+"""
+Refresh token store.
+
+Only a SHA-256 of each token is kept (fixed-width, and a leaked table holds
+no usable tokens). Rotation swaps the stored hash in one conditional UPDATE,
+so a token can be redeemed exactly once; logout is one DELETE; expired rows
+are removed in batches by ``sweep_expired_refresh_tokens``.
+"""
+import secrets
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import select, update, delete, and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.models import RefreshToken
+from app.core.security import create_refresh_token, decode_refresh_token, hash_token, parse_expires_in
+from app.core.config import settings
+
+SWEEP_BATCH_SIZE = 1000
+
+
+def new_refresh_token(user_id: str) -> Tuple[str, datetime]:
+    """Signed refresh token and its expiry; ``jti`` keeps tokens issued in the same second distinct"""
+    expires_delta = parse_expires_in(settings.REFRESH_TOKEN_EXPIRES_IN)
+    token = create_refresh_token({"sub": user_id, "jti": secrets.token_hex(16)}, expires_delta=expires_delta)
+    return token, datetime.now(timezone.utc) + expires_delta
+
+
+class RefreshTokenStore:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def issue(self, user_id: str) -> str:
+        """Create and store a refresh token (caller commits)"""
+        token, expires_at = new_refresh_token(user_id)
+        self.db.add(RefreshToken(user_id=user_id, token_hash=hash_token(token), expires_at=expires_at))
+        return token
+
+    async def rotate(self, refresh_token: str) -> Optional[Tuple[str, str]]:
+        """
+        Replace a valid refresh token with a new one (caller commits).
+
+        Returns (user_id, new token), or None if the token is invalid, expired
+        or was already rotated or revoked.
+        """
+        payload = decode_refresh_token(refresh_token)
+        user_id = payload.get("sub") if payload else None
+        if not user_id:
+            return None
+
+        token, expires_at = new_refresh_token(user_id)
+        result = await self.db.execute(
+            update(RefreshToken)
+            .where(
+                and_(
+                    RefreshToken.token_hash == hash_token(refresh_token),
+                    RefreshToken.user_id == user_id,
+                    RefreshToken.expires_at > func.now()
+                )
+            )
+            .values(token_hash=hash_token(token), expires_at=expires_at)
+            .returning(RefreshToken.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+        return user_id, token
+
+    async def revoke_all(self, user_id: str) -> int:
+        """Delete every refresh token of a user (caller commits)"""
+        result = await self.db.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+async def sweep_expired_refresh_tokens(db: AsyncSession, batch_size: int = SWEEP_BATCH_SIZE) -> int:
+    """
+    Delete expired refresh tokens, committing every ``batch_size`` rows.
+
+    Short transactions keep locks and WAL bursts small; SKIP LOCKED lets
+    concurrent sweeps (or a logout touching the same rows) proceed.
+    """
+    expired = (
+        select(RefreshToken.id)
+        .where(RefreshToken.expires_at < func.now())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    deleted = 0
+    while True:
+        result = await db.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
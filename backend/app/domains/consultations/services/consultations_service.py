@@ -67,8 +67,7 @@ class ConsultationsService:
         )
 
         self.db.add(consultation)
-        await self.db.commit()
-        await self.db.refresh(consultation)
+        await self.db.flush()
 
         return self._consultation_to_response(consultation)
 
@@ -113,8 +112,7 @@ class ConsultationsService:
         consultation.scheduled_at = data.newScheduledAt
         consultation.updated_at = datetime.now()
 
-        await self.db.commit()
-        await self.db.refresh(consultation)
+        await self.db.flush()
 
         return self._consultation_to_response(consultation)
 
@@ -142,8 +140,6 @@ class ConsultationsService:
         consultation.status = ConsultationStatus.CANCELLED
         consultation.updated_at = datetime.now()
 
-        await self.db.commit()
-
     async def get_available_slots(self, doctor_id: str, date: str) -> List[AvailableSlot]:
         # Parse date
         try:
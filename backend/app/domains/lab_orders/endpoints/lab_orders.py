@@ -3,16 +3,19 @@ Lab Orders API Endpoints - Complete medical workflow for lab test orders
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import List, Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user, verify_tenant_access, CurrentUser
 from app.shared.schemas.lab_order import (
     LabTestOrderCreate, LabTestOrderUpdate, LabTestOrderResponse,
+    LabTestOrderBulkCreate, LabTestOrderBulkResponse,
     LabTestOrderWithDetails, LabTestOrderListFilter, LabTestOrderListResponse,
+    LabTestOrderItemUpdate, LabTestOrderItemResponse,
     LabStats, PatientLabSummary, PhysicianLabWorkload
 )
 from app.domains.lab_orders.services.lab_orders_service import LabOrdersService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 
 router = APIRouter()
 
@@ -28,6 +31,17 @@ async def create_lab_order(
     return await lab_orders_service.create_lab_order(order_data)
 
 
+@router.post("/bulk", response_model=LabTestOrderBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_lab_orders_bulk(
+    bulk_data: LabTestOrderBulkCreate,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create many lab orders at once (e.g. a panel for a clinic session); results are reported per order"""
+    lab_orders_service = LabOrdersService(db)
+    return await lab_orders_service.create_lab_orders_bulk(bulk_data, current_user.systemId)
+
+
 @router.get("/{order_id}", response_model=LabTestOrderWithDetails)
 async def get_lab_order(
     order_id: str,
@@ -51,6 +65,29 @@ async def update_lab_order(
     return await lab_orders_service.update_lab_order(order_id, update_data, current_user.systemId)
 
 
+@router.get("/{order_id}/items", response_model=List[LabTestOrderItemResponse])
+async def list_lab_order_items(
+    order_id: str,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """List the individual tests on a lab order"""
+    lab_orders_service = LabOrdersService(db)
+    return await lab_orders_service.list_order_items(order_id, current_user.systemId)
+
+
+@router.patch("/items/{item_id}", response_model=LabTestOrderItemResponse)
+async def update_lab_order_item(
+    item_id: str,
+    update_data: LabTestOrderItemUpdate,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update one ordered test's status or link it to a lab result"""
+    lab_orders_service = LabOrdersService(db)
+    return await lab_orders_service.update_order_item(item_id, update_data, current_user.systemId)
+
+
 @router.delete("/{order_id}", status_code=status.HTTP_200_OK)
 async def delete_lab_order(
     order_id: str,
@@ -75,7 +112,7 @@ async def list_lab_orders(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List lab orders with filtering and pagination"""
     from datetime import date
@@ -119,33 +156,36 @@ async def list_lab_orders(
 @router.get("/stats/overview", response_model=LabStats)
 async def get_lab_stats(
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("lab_orders", depends_on=("labs",)))
 ):
     """Get lab statistics overview for the system"""
     lab_orders_service = LabOrdersService(db)
-    return await lab_orders_service.get_lab_stats(current_user.systemId)
+    return await cache.fetch(lambda: lab_orders_service.get_lab_stats(current_user.systemId))
 
 
 @router.get("/patient/{patient_id}/summary", response_model=PatientLabSummary)
 async def get_patient_lab_summary(
     patient_id: str,
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("lab_orders", depends_on=("labs",)))
 ):
     """Get lab summary for a specific patient"""
     lab_orders_service = LabOrdersService(db)
-    return await lab_orders_service.get_patient_lab_summary(patient_id, current_user.systemId)
+    return await cache.fetch(lambda: lab_orders_service.get_patient_lab_summary(patient_id, current_user.systemId))
 
 
 @router.get("/physician/{physician_id}/workload", response_model=PhysicianLabWorkload)
 async def get_physician_lab_workload(
     physician_id: str,
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("lab_orders", depends_on=("labs",)))
 ):
     """Get lab workload for a specific physician"""
     lab_orders_service = LabOrdersService(db)
-    return await lab_orders_service.get_physician_lab_workload(physician_id, current_user.systemId)
+    return await cache.fetch(lambda: lab_orders_service.get_physician_lab_workload(physician_id, current_user.systemId))
 
 
 @router.put("/{order_id}/status", response_model=LabTestOrderResponse)
@@ -3,18 +3,33 @@ Lab Orders Service - Complete medical workflow for lab test orders
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy import select, insert, update, and_, or_, func, desc, asc, exists, tuple_, true
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
+from uuid import uuid4
 
-from app.shared.models import LabTestOrder, LabResult, Biomarker, User, Staff, System
+from app.core.config import settings
+from app.shared.models import LabTestOrder, LabTestOrderItem, LabOrderStatusCount, LabResult, Biomarker, User, Staff, System
 from app.shared.schemas.lab_order import (
     LabTestOrderCreate, LabTestOrderUpdate, LabTestOrderResponse,
+    LabTestOrderBulkCreate, LabTestOrderBulkItemResult, LabTestOrderBulkResponse,
     LabTestOrderWithDetails, LabTestOrderListFilter, LabTestOrderListResponse,
+    LabTestOrderItemUpdate, LabTestOrderItemResponse,
     LabStats, PatientLabSummary, PhysicianLabWorkload
 )
-from app.shared.schemas.enums import LabOrderStatus, LabOrderPriority
+from app.shared.schemas.enums import AuditActionType, LabOrderStatus, LabOrderPriority
+from app.domains.lab_orders.services.lab_turnaround_service import LabTurnaroundService
+from app.domains.lab_orders.services.status_counts import (
+    PENDING_STATUSES,
+    AWAITING_RESULT_STATUSES,
+    status_change_statements,
+    status_count_delta,
+    summarize_status_counts,
+)
+from app.domains.lab_orders.services.test_types import split_test_types, normalize_test_key
+from app.infrastructure.cache.response_cache import invalidate_on_commit
+from app.infrastructure.audit.writer import audit_on_commit
 
 
 class LabOrdersService:
@@ -58,24 +73,119 @@ class LabOrdersService:
             patient_id=order_data.patient_id,
             ordering_physician_id=order_data.ordering_physician_id,
             system_id=order_data.system_id,
-            test_type=order_data.test_type,
-            test_name=order_data.test_name,
+            order_date=order_data.order_date,
             priority=order_data.priority,
-            status=LabOrderStatus.PENDING,
-            notes=order_data.notes,
-            clinical_notes=order_data.clinical_notes,
-            fasting_required=order_data.fasting_required,
+            test_types=order_data.test_types,
+            clinical_indication=order_data.clinical_indication,
             special_instructions=order_data.special_instructions,
-            expected_collection_date=order_data.expected_collection_date,
-            expected_result_date=order_data.expected_result_date
+            external_lab_name=order_data.external_lab_name,
+            external_lab_reference=order_data.external_lab_reference,
+            status=LabOrderStatus.ORDERED
         )
+        lab_order.items = self._build_order_items(order_data.system_id, order_data.test_types)
 
         self.db.add(lab_order)
-        await self.db.commit()
-        await self.db.refresh(lab_order)
+        for stmt in status_change_statements(lab_order.system_id, None, (lab_order.status, lab_order.priority)):
+            await self.db.execute(stmt)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", lab_order.system_id)
+        audit_on_commit(self.db, AuditActionType.CREATE, "LAB_ORDER", lab_order.id)
 
         return LabTestOrderResponse.model_validate(lab_order)
 
+    async def create_lab_orders_bulk(self, bulk_data: LabTestOrderBulkCreate, system_id: str) -> LabTestOrderBulkResponse:
+        """
+        Create many lab orders at once.
+
+        Patients and physicians are validated with one IN query each, valid
+        orders (and their items) are inserted with one executemany each and
+        the status rollup gets one update per priority. Invalid orders are
+        reported per row and do not block the rest of the batch. New orders
+        are ORDERED, which ends no turnaround stage, so there are no
+        turnaround samples to record.
+        """
+        orders = bulk_data.orders
+
+        patient_ids = {order.patient_id for order in orders}
+        known_patients = set((await self.db.execute(
+            select(User.id).where(and_(User.id.in_(patient_ids), User.system_id == system_id))
+        )).scalars().all())
+
+        physician_ids = {order.ordering_physician_id for order in orders}
+        known_physicians = set((await self.db.execute(
+            select(Staff.id).where(and_(Staff.id.in_(physician_ids), Staff.system_id == system_id))
+        )).scalars().all())
+
+        results: List[Optional[LabTestOrderBulkItemResult]] = [None] * len(orders)
+        order_rows = []
+        item_rows = []
+        row_index: Dict[str, int] = {}
+        priority_counts: Dict[LabOrderPriority, int] = {}
+        for index, order_data in enumerate(orders):
+            if order_data.system_id != system_id:
+                error = "System mismatch"
+            elif order_data.patient_id not in known_patients:
+                error = "Patient not found"
+            elif order_data.ordering_physician_id not in known_physicians:
+                error = "Ordering physician not found"
+            else:
+                error = None
+            if error:
+                results[index] = LabTestOrderBulkItemResult(index=index, success=False, error=error)
+                continue
+
+            order_id = str(uuid4())
+            row_index[order_id] = index
+            order_rows.append({
+                "id": order_id,
+                "patient_id": order_data.patient_id,
+                "ordering_physician_id": order_data.ordering_physician_id,
+                "system_id": system_id,
+                "order_date": order_data.order_date,
+                "priority": order_data.priority,
+                "test_types": order_data.test_types,
+                "clinical_indication": order_data.clinical_indication,
+                "special_instructions": order_data.special_instructions,
+                "external_lab_name": order_data.external_lab_name,
+                "external_lab_reference": order_data.external_lab_reference,
+                "status": LabOrderStatus.ORDERED,
+            })
+            item_rows.extend(
+                {
+                    "id": str(uuid4()),
+                    "lab_order_id": order_id,
+                    "system_id": system_id,
+                    "position": item.position,
+                    "test_name": item.test_name,
+                    "test_key": item.test_key,
+                    "status": LabOrderStatus.ORDERED,
+                }
+                for item in self._build_order_items(system_id, order_data.test_types)
+            )
+            priority_counts[order_data.priority] = priority_counts.get(order_data.priority, 0) + 1
+
+        if order_rows:
+            created = await self.db.scalars(insert(LabTestOrder).returning(LabTestOrder), order_rows)
+            for lab_order in created.all():
+                index = row_index[lab_order.id]
+                results[index] = LabTestOrderBulkItemResult(
+                    index=index,
+                    success=True,
+                    order=LabTestOrderResponse.model_validate(lab_order)
+                )
+                audit_on_commit(self.db, AuditActionType.CREATE, "LAB_ORDER", lab_order.id)
+            if item_rows:
+                await self.db.execute(insert(LabTestOrderItem), item_rows)
+            for priority, count in priority_counts.items():
+                await self.db.execute(status_count_delta(system_id, LabOrderStatus.ORDERED, priority, count))
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+
+        return LabTestOrderBulkResponse(
+            created=len(order_rows),
+            failed=len(orders) - len(order_rows),
+            results=results
+        )
+
     async def get_lab_order(self, order_id: str, system_id: str) -> LabTestOrderWithDetails:
         """Get a specific lab order with details"""
         result = await self.db.execute(
@@ -148,13 +258,24 @@ class LabOrdersService:
                 detail="Lab order not found"
             )
 
+        old_key = (lab_order.status, lab_order.priority)
+        changes = update_data.model_dump(exclude_unset=True)
+
         # Update fields
-        for field, value in update_data.model_dump(exclude_unset=True).items():
+        for field, value in changes.items():
             setattr(lab_order, field, value)
 
         lab_order.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(lab_order)
+        for stmt in status_change_statements(lab_order.system_id, old_key, (lab_order.status, lab_order.priority)):
+            await self.db.execute(stmt)
+        if "test_types" in changes:
+            await self._sync_order_items(lab_order)
+        if lab_order.status != old_key[0]:
+            await self._propagate_item_status(lab_order.id, lab_order.status)
+            await LabTurnaroundService(self.db).record_order_transition(lab_order, old_key[0])
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+        audit_on_commit(self.db, AuditActionType.UPDATE, "LAB_ORDER", lab_order.id, changes={"fields": sorted(changes)})
 
         return LabTestOrderResponse.model_validate(lab_order)
 
@@ -176,18 +297,18 @@ class LabOrdersService:
                 detail="Lab order not found"
             )
 
-        # Check if order can be deleted (not if results exist)
-        results_count = await self.db.execute(
-            select(func.count()).select_from(LabResult).where(LabResult.lab_order_id == order_id)
-        )
-        if results_count.scalar() > 0:
+        # Only allow deletion if order is not completed
+        if lab_order.status == LabOrderStatus.COMPLETED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot delete lab order with existing results"
+                detail="Cannot delete completed lab orders"
             )
 
+        for stmt in status_change_statements(lab_order.system_id, (lab_order.status, lab_order.priority), None):
+            await self.db.execute(stmt)
         await self.db.delete(lab_order)
-        await self.db.commit()
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+        audit_on_commit(self.db, AuditActionType.DELETE, "LAB_ORDER", order_id)
 
     async def list_lab_orders(self, filters: LabTestOrderListFilter, system_id: str) -> LabTestOrderListResponse:
         """List lab orders with filtering and pagination"""
@@ -202,7 +323,15 @@ class LabOrdersService:
         if filters.ordering_physician_id:
             query = query.where(LabTestOrder.ordering_physician_id == filters.ordering_physician_id)
         if filters.test_type:
-            query = query.where(LabTestOrder.test_type == filters.test_type)
+            query = query.where(
+                exists().where(
+                    and_(
+                        LabTestOrderItem.lab_order_id == LabTestOrder.id,
+                        LabTestOrderItem.system_id == system_id,
+                        LabTestOrderItem.test_key == normalize_test_key(filters.test_type)
+                    )
+                )
+            )
         if filters.priority:
             query = query.where(LabTestOrder.priority == filters.priority)
         if filters.status:
@@ -243,121 +372,335 @@ class LabOrdersService:
             has_more=(filters.skip + len(items)) < total
         )
 
-    async def get_lab_stats(self, system_id: str) -> LabStats:
-        """Get lab statistics for the system"""
-        # Total orders
-        total_orders = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(LabTestOrder.system_id == system_id)
+    async def list_order_items(self, order_id: str, system_id: str) -> List[LabTestOrderItemResponse]:
+        """List the individual tests on a lab order"""
+        result = await self.db.execute(
+            select(LabTestOrderItem)
+            .where(
+                and_(
+                    LabTestOrderItem.lab_order_id == order_id,
+                    LabTestOrderItem.system_id == system_id
+                )
+            )
+            .order_by(LabTestOrderItem.position)
         )
+        return [LabTestOrderItemResponse.model_validate(item) for item in result.scalars().all()]
 
-        # Orders by status
-        status_counts = await self.db.execute(
-            select(LabTestOrder.status, func.count())
-            .where(LabTestOrder.system_id == system_id)
-            .group_by(LabTestOrder.status)
+    async def update_order_item(self, item_id: str, update_data: LabTestOrderItemUpdate, system_id: str) -> LabTestOrderItemResponse:
+        """Update one ordered test's status or link it to the lab result that reports it"""
+        result = await self.db.execute(
+            select(LabTestOrderItem, LabTestOrder.patient_id)
+            .join(LabTestOrder, LabTestOrder.id == LabTestOrderItem.lab_order_id)
+            .where(
+                and_(
+                    LabTestOrderItem.id == item_id,
+                    LabTestOrderItem.system_id == system_id
+                )
+            )
         )
+        row = result.one_or_none()
 
-        # Orders by priority
-        priority_counts = await self.db.execute(
-            select(LabTestOrder.priority, func.count())
-            .where(LabTestOrder.system_id == system_id)
-            .group_by(LabTestOrder.priority)
-        )
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Lab order item not found"
+            )
+        item, patient_id = row
+
+        changes = update_data.model_dump(exclude_unset=True)
+        if changes.get("lab_result_id"):
+            lab_result = await self.db.execute(
+                select(LabResult.id).where(
+                    and_(
+                        LabResult.id == changes["lab_result_id"],
+                        LabResult.user_id == patient_id,
+                        LabResult.system_id == system_id
+                    )
+                )
+            )
+            if not lab_result.scalar_one_or_none():
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Lab result not found for this patient"
+                )
+
+        for field, value in changes.items():
+            setattr(item, field, value)
+        if item.status == LabOrderStatus.COMPLETED and item.resulted_at is None:
+            item.resulted_at = datetime.now(timezone.utc)
+
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+
+        return LabTestOrderItemResponse.model_validate(item)
+
+    async def get_lab_stats(self, system_id: str) -> LabStats:
+        """
+        Get lab statistics for the system in a single round-trip.
+
+        Order counts come from GROUPING SETS ((status), (priority)) over either
+        lab_test_orders or, when LAB_STATS_USE_ROLLUP is set, the per-system
+        lab_order_status_counts rollup. Result counts are one FILTER aggregate.
+        """
+        week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+
+        if settings.LAB_STATS_USE_ROLLUP:
+            order_counts = (
+                select(
+                    LabOrderStatusCount.status,
+                    LabOrderStatusCount.priority,
+                    func.sum(LabOrderStatusCount.order_count).label("order_count"),
+                )
+                .where(LabOrderStatusCount.system_id == system_id)
+                .group_by(func.grouping_sets(tuple_(LabOrderStatusCount.status), tuple_(LabOrderStatusCount.priority)))
+                .subquery()
+            )
+        else:
+            order_counts = (
+                select(
+                    LabTestOrder.status,
+                    LabTestOrder.priority,
+                    func.count().label("order_count"),
+                )
+                .where(LabTestOrder.system_id == system_id)
+                .group_by(func.grouping_sets(tuple_(LabTestOrder.status), tuple_(LabTestOrder.priority)))
+                .subquery()
+            )
 
-        # Orders by test type
-        test_type_counts = await self.db.execute(
-            select(LabTestOrder.test_type, func.count())
-            .where(LabTestOrder.system_id == system_id)
-            .group_by(LabTestOrder.test_type)
+        has_critical = exists().where(
+            and_(
+                Biomarker.lab_result_id == LabResult.id,
+                Biomarker.is_critical.is_(True)
+            )
+        )
+        orders_this_week = (
+            select(func.count())
+            .select_from(LabTestOrder)
+            .where(
+                and_(
+                    LabTestOrder.system_id == system_id,
+                    LabTestOrder.order_date >= week_ago
+                )
+            )
+            .scalar_subquery()
+        )
+        results = (
+            select(
+                func.count().label("total_results"),
+                func.count().filter(LabResult.is_reviewed.is_(False)).label("unreviewed_results"),
+                func.count().filter(has_critical).label("results_with_critical_values"),
+                orders_this_week.label("orders_this_week"),
+            )
+            .where(LabResult.system_id == system_id)
+            .subquery()
         )
 
+        # One row per grouping set (or a single row with NULL counts when there are no orders)
+        rows = (await self.db.execute(
+            select(results, order_counts.c.status, order_counts.c.priority, order_counts.c.order_count)
+            .select_from(results.outerjoin(order_counts, true()))
+        )).all()
+        first = rows[0]
+
         return LabStats(
-            total_orders=total_orders.scalar(),
-            status_counts=dict(status_counts.fetchall()),
-            priority_counts=dict(priority_counts.fetchall()),
-            test_type_counts=dict(test_type_counts.fetchall())
+            **summarize_status_counts(rows),
+            total_results=first.total_results,
+            unreviewed_results=first.unreviewed_results,
+            results_with_critical_values=first.results_with_critical_values,
+            orders_this_week=first.orders_this_week
         )
 
     async def get_patient_lab_summary(self, patient_id: str, system_id: str) -> PatientLabSummary:
-        """Get lab summary for a specific patient"""
-        # Get patient's lab orders
-        orders_result = await self.db.execute(
-            select(LabTestOrder)
+        """Get lab summary for a specific patient from one aggregate query"""
+        results = (
+            select(
+                func.count(func.distinct(LabResult.id)).label("total_results"),
+                func.count(Biomarker.id).filter(Biomarker.is_critical.is_(True)).label("critical_values_count"),
+                func.max(LabResult.uploaded_at).label("last_uploaded_at"),
+            )
+            .select_from(LabResult)
+            .outerjoin(Biomarker, Biomarker.lab_result_id == LabResult.id)
+            .where(
+                and_(
+                    LabResult.user_id == patient_id,
+                    LabResult.system_id == system_id
+                )
+            )
+            .subquery()
+        )
+        orders = (
+            select(
+                func.count().filter(LabTestOrder.status.in_(PENDING_STATUSES)).label("pending_orders"),
+            )
             .where(
                 and_(
                     LabTestOrder.patient_id == patient_id,
                     LabTestOrder.system_id == system_id
                 )
             )
-            .order_by(desc(LabTestOrder.created_at))
+            .subquery()
         )
-        lab_orders = orders_result.scalars().all()
 
-        # Get patient's lab results
-        results_result = await self.db.execute(
-            select(LabResult)
-            .options(selectinload(LabResult.biomarkers))
-            .join(LabTestOrder)
+        result = await self.db.execute(
+            select(User.username, results, orders)
+            .select_from(User)
+            .join(results, true())
+            .join(orders, true())
             .where(
                 and_(
-                    LabTestOrder.patient_id == patient_id,
-                    LabTestOrder.system_id == system_id
+                    User.id == patient_id,
+                    User.system_id == system_id
                 )
             )
-            .order_by(desc(LabResult.uploaded_at))
         )
-        lab_results = results_result.scalars().all()
+        row = result.one_or_none()
 
-        # Calculate statistics
-        total_orders = len(lab_orders)
-        completed_orders = sum(1 for order in lab_orders if order.status == LabOrderStatus.COMPLETED)
-        pending_orders = sum(1 for order in lab_orders if order.status == LabOrderStatus.PENDING)
-        total_results = len(lab_results)
-        critical_results = sum(1 for result in lab_results if any(b.is_critical for b in result.biomarkers))
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
+            )
 
         return PatientLabSummary(
             patient_id=patient_id,
-            total_orders=total_orders,
-            completed_orders=completed_orders,
-            pending_orders=pending_orders,
-            total_results=total_results,
-            critical_results=critical_results,
-            recent_orders=[LabTestOrderResponse.model_validate(order) for order in lab_orders[:5]],
-            recent_results=[LabResultResponse.model_validate(result) for result in lab_results[:5]]
+            patient_name=row.username,
+            total_results=row.total_results,
+            recent_results=[],
+            pending_orders=row.pending_orders,
+            last_test_date=row.last_uploaded_at.date() if row.last_uploaded_at else None,
+            critical_values_count=row.critical_values_count
         )
 
     async def get_physician_lab_workload(self, physician_id: str, system_id: str) -> PhysicianLabWorkload:
-        """Get lab workload for a specific physician"""
-        # Get physician's lab orders
-        orders_result = await self.db.execute(
-            select(LabTestOrder)
+        """Get lab review workload for a specific physician from one aggregate query"""
+        week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+
+        awaiting_review = and_(
+            LabResult.ordered_by == physician_id,
+            LabResult.is_reviewed.is_(False)
+        )
+        has_critical = exists().where(
+            and_(
+                Biomarker.lab_result_id == LabResult.id,
+                Biomarker.is_critical.is_(True)
+            )
+        )
+        results = (
+            select(
+                func.count().filter(awaiting_review).label("pending_reviews"),
+                func.count().filter(
+                    and_(
+                        LabResult.reviewed_by == physician_id,
+                        LabResult.reviewed_at >= week_ago
+                    )
+                ).label("reviewed_this_week"),
+                func.count().filter(and_(awaiting_review, has_critical)).label("critical_results_pending"),
+            )
+            .where(
+                and_(
+                    LabResult.system_id == system_id,
+                    or_(
+                        LabResult.ordered_by == physician_id,
+                        LabResult.reviewed_by == physician_id
+                    )
+                )
+            )
+            .subquery()
+        )
+        orders = (
+            select(
+                func.count().filter(LabTestOrder.status.in_(AWAITING_RESULT_STATUSES)).label("orders_pending_results"),
+            )
             .where(
                 and_(
                     LabTestOrder.ordering_physician_id == physician_id,
                     LabTestOrder.system_id == system_id
                 )
             )
-            .order_by(desc(LabTestOrder.created_at))
+            .subquery()
         )
-        lab_orders = orders_result.scalars().all()
 
-        # Calculate statistics
-        total_orders = len(lab_orders)
-        pending_orders = sum(1 for order in lab_orders if order.status == LabOrderStatus.PENDING)
-        completed_orders = sum(1 for order in lab_orders if order.status == LabOrderStatus.COMPLETED)
-        urgent_orders = sum(1 for order in lab_orders if order.priority == LabOrderPriority.URGENT)
+        result = await self.db.execute(
+            select(User.username, results, orders)
+            .select_from(Staff)
+            .join(User, User.id == Staff.user_id)
+            .join(results, true())
+            .join(orders, true())
+            .where(
+                and_(
+                    Staff.id == physician_id,
+                    Staff.system_id == system_id
+                )
+            )
+        )
+        row = result.one_or_none()
 
-        # Get orders by test type
-        test_type_counts = {}
-        for order in lab_orders:
-            test_type_counts[order.test_type] = test_type_counts.get(order.test_type, 0) + 1
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Physician not found"
+            )
 
         return PhysicianLabWorkload(
             physician_id=physician_id,
-            total_orders=total_orders,
-            pending_orders=pending_orders,
-            completed_orders=completed_orders,
-            urgent_orders=urgent_orders,
-            test_type_counts=test_type_counts,
-            recent_orders=[LabTestOrderResponse.model_validate(order) for order in lab_orders[:10]]
+            physician_name=row.username,
+            pending_reviews=row.pending_reviews,
+            reviewed_this_week=row.reviewed_this_week,
+            orders_pending_results=row.orders_pending_results,
+            critical_results_pending=row.critical_results_pending
+        )
+
+    @staticmethod
+    def _build_order_items(system_id: str, test_types: Optional[str]) -> List[LabTestOrderItem]:
+        return [
+            LabTestOrderItem(
+                system_id=system_id,
+                position=position,
+                test_name=name,
+                test_key=normalize_test_key(name)
+            )
+            for position, name in enumerate(split_test_types(test_types))
+        ]
+
+    async def _sync_order_items(self, lab_order: LabTestOrder) -> None:
+        """
+        Match an order's items to its (updated) test_types.
+
+        Tests still listed keep their row (and status/result link); removed
+        tests are deleted and new tests are added.
+        """
+        result = await self.db.execute(
+            select(LabTestOrderItem).where(LabTestOrderItem.lab_order_id == lab_order.id)
+        )
+        existing = {item.test_key: item for item in result.scalars().all()}
+
+        wanted = self._build_order_items(lab_order.system_id, lab_order.test_types)
+        wanted_keys = {item.test_key for item in wanted}
+
+        for key, item in existing.items():
+            if key not in wanted_keys:
+                await self.db.delete(item)
+        for new_item in wanted:
+            current = existing.get(new_item.test_key)
+            if current is not None:
+                current.position = new_item.position
+                current.test_name = new_item.test_name
+            else:
+                new_item.lab_order_id = lab_order.id
+                self.db.add(new_item)
+
+    async def _propagate_item_status(self, order_id: str, order_status: LabOrderStatus) -> None:
+        """Move items that are not finished yet along with their order's status"""
+        values = {"status": order_status}
+        if order_status == LabOrderStatus.COMPLETED:
+            values["resulted_at"] = func.coalesce(LabTestOrderItem.resulted_at, func.now())
+        await self.db.execute(
+            update(LabTestOrderItem)
+            .where(
+                and_(
+                    LabTestOrderItem.lab_order_id == order_id,
+                    LabTestOrderItem.status.notin_([LabOrderStatus.COMPLETED, LabOrderStatus.CANCELLED])
+                )
+            )
+            .values(**values)
         )
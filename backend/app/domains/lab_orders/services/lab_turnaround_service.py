@@ -0,0 +1,121 @@
+"""
+Lab Turnaround Service - turnaround percentiles and overdue order tracking
+"""
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, or_, case
+from datetime import datetime, timedelta, timezone
+
+from app.shared.models import LabTestOrder, LabTestOrderItem, LabResult, LabTurnaroundBucket
+from app.shared.schemas.enums import LabOrderStatus, LabOrderPriority
+from app.domains.admin.schemas.admin import LabTurnaroundStats, LabTurnaroundReport, OverdueLabOrder
+from app.domains.lab_orders.services.status_counts import PENDING_STATUSES
+from app.domains.lab_orders.services.turnaround import (
+    RESULT_TO_REVIEW,
+    minutes_between,
+    order_transition_samples,
+    record_sample,
+    summarize_buckets,
+)
+
+# Time from order to result after which an open order counts as overdue
+TURNAROUND_TARGETS = {
+    LabOrderPriority.STAT: timedelta(hours=4),
+    LabOrderPriority.URGENT: timedelta(hours=24),
+    LabOrderPriority.ROUTINE: timedelta(days=7),
+}
+
+
+class LabTurnaroundService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_order_transition(self, lab_order: LabTestOrder, old_status: LabOrderStatus) -> None:
+        """Add turnaround samples for an order status change (caller commits)"""
+        now = datetime.now(timezone.utc)
+        for stage, minutes in order_transition_samples(lab_order, old_status, lab_order.status, now):
+            await self.db.execute(
+                record_sample(lab_order.system_id, lab_order.external_lab_name, lab_order.priority.value, stage, minutes)
+            )
+
+    async def record_result_review(self, lab_result: LabResult) -> None:
+        """Add a result-to-review sample, attributed to the order the result was linked to if any (caller commits)"""
+        minutes = minutes_between(lab_result.uploaded_at, lab_result.reviewed_at)
+        if minutes is None:
+            return
+
+        result = await self.db.execute(
+            select(LabTestOrder.priority, LabTestOrder.external_lab_name)
+            .join(LabTestOrderItem, LabTestOrderItem.lab_order_id == LabTestOrder.id)
+            .where(LabTestOrderItem.lab_result_id == lab_result.id)
+            .limit(1)
+        )
+        order = result.one_or_none()
+        priority = order.priority.value if order else None
+        lab_name = (order.external_lab_name if order else None) or lab_result.lab_name
+
+        await self.db.execute(record_sample(lab_result.system_id, lab_name, priority, RESULT_TO_REVIEW, minutes))
+
+    async def get_turnaround_report(
+        self,
+        system_id: str,
+        stage: Optional[str] = None,
+        lab_name: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> LabTurnaroundReport:
+        """Turnaround percentiles per lab, priority and stage from the histogram rollup"""
+        query = select(LabTurnaroundBucket).where(LabTurnaroundBucket.system_id == system_id)
+        if stage:
+            query = query.where(LabTurnaroundBucket.stage == stage)
+        if lab_name is not None:
+            query = query.where(LabTurnaroundBucket.lab_name == lab_name)
+        if priority:
+            query = query.where(LabTurnaroundBucket.priority == priority)
+
+        result = await self.db.execute(query)
+        return LabTurnaroundReport(
+            system_id=system_id,
+            stats=[LabTurnaroundStats(**summary) for summary in summarize_buckets(result.scalars().all())]
+        )
+
+    async def get_overdue_orders(self, system_id: str, limit: int = 100) -> List[OverdueLabOrder]:
+        """Open orders older than their priority's turnaround target, most overdue first"""
+        now = datetime.now(timezone.utc)
+        overdue = or_(*[
+            and_(
+                LabTestOrder.priority == priority,
+                LabTestOrder.order_date < now - target
+            )
+            for priority, target in TURNAROUND_TARGETS.items()
+        ])
+
+        # STAT first, then by how far past target (earliest deadline first)
+        target = case(*[(LabTestOrder.priority == priority, target) for priority, target in TURNAROUND_TARGETS.items()])
+        deadline = LabTestOrder.order_date + target
+
+        result = await self.db.execute(
+            select(LabTestOrder)
+            .where(
+                and_(
+                    LabTestOrder.system_id == system_id,
+                    LabTestOrder.status.in_(PENDING_STATUSES),
+                    overdue
+                )
+            )
+            .order_by(LabTestOrder.priority != LabOrderPriority.STAT, deadline)
+            .limit(limit)
+        )
+        return [
+            OverdueLabOrder(
+                order_id=order.id,
+                patient_id=order.patient_id,
+                priority=order.priority,
+                status=order.status,
+                external_lab_name=order.external_lab_name,
+                order_date=order.order_date,
+                overdue_minutes=round(
+                    minutes_between(order.order_date, now) - TURNAROUND_TARGETS[order.priority].total_seconds() / 60, 1
+                )
+            )
+            for order in result.scalars().all()
+        ]
@@ -0,0 +1,88 @@
+"""
+Per-system lab order counts by status and priority.
+
+Every order write applies +1/-1 to the matching (system, status, priority) row
+of ``lab_order_status_counts`` in the same transaction, so the stats overview
+can aggregate a handful of rollup rows instead of scanning lab_test_orders.
+Reads from either source come back as GROUPING SETS ((status), (priority))
+rows and are summarized by ``summarize_status_counts``.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.shared.models import LabOrderStatusCount
+from app.shared.schemas.enums import LabOrderStatus, LabOrderPriority
+
+# Orders that have not produced results yet
+PENDING_STATUSES = (LabOrderStatus.ORDERED, LabOrderStatus.COLLECTED, LabOrderStatus.PROCESSING)
+
+# Orders whose sample is in the lab
+AWAITING_RESULT_STATUSES = (LabOrderStatus.COLLECTED, LabOrderStatus.PROCESSING)
+
+StatusKey = Tuple[LabOrderStatus, LabOrderPriority]
+
+
+def status_count_delta(system_id: str, order_status: LabOrderStatus, priority: LabOrderPriority, delta: int):
+    """Upsert that adds ``delta`` to one (system, status, priority) counter"""
+    stmt = insert(LabOrderStatusCount).values(
+        system_id=system_id,
+        status=order_status,
+        priority=priority,
+        order_count=delta,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[LabOrderStatusCount.system_id, LabOrderStatusCount.status, LabOrderStatusCount.priority],
+        set_={
+            "order_count": LabOrderStatusCount.order_count + stmt.excluded.order_count,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def status_change_statements(system_id: str, old: Optional[StatusKey], new: Optional[StatusKey]) -> List[Any]:
+    """
+    Counter updates for an order moving from ``old`` to ``new`` (status, priority).
+
+    Pass ``old=None`` for a new order and ``new=None`` for a deleted one.
+    Returns an empty list when the key did not change.
+    """
+    if old == new:
+        return []
+    statements = []
+    if old is not None:
+        statements.append(status_count_delta(system_id, old[0], old[1], -1))
+    if new is not None:
+        statements.append(status_count_delta(system_id, new[0], new[1], 1))
+    return statements
+
+
+def _key(value: Any) -> Optional[str]:
+    return getattr(value, "value", value)
+
+
+def summarize_status_counts(rows: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Fold GROUPING SETS ((status), (priority)) rows into totals.
+
+    Each row has ``status``, ``priority`` and ``order_count``; status rows have
+    priority None and vice versa. Rows with neither (an outer join against
+    no orders) are ignored.
+    """
+    status_counts: Dict[str, int] = {}
+    priority_counts: Dict[str, int] = {}
+    for row in rows:
+        count = int(row.order_count or 0)
+        if row.status is not None:
+            status_counts[_key(row.status)] = status_counts.get(_key(row.status), 0) + count
+        elif row.priority is not None:
+            priority_counts[_key(row.priority)] = priority_counts.get(_key(row.priority), 0) + count
+
+    return {
+        "total_orders": sum(status_counts.values()),
+        "pending_orders": sum(status_counts.get(s.value, 0) for s in PENDING_STATUSES),
+        "completed_orders": status_counts.get(LabOrderStatus.COMPLETED.value, 0),
+        "status_counts": status_counts,
+        "priority_counts": priority_counts,
+    }
@@ -0,0 +1,42 @@
+"""
+Parsing of lab order test_types into individual tests.
+
+An order's test_types is free text: a JSON array or a comma/semicolon/newline
+separated list. Each distinct test becomes a LabTestOrderItem, matched by its
+normalized key.
+"""
+import json
+import re
+from typing import Optional
+
+_TEST_TYPE_SEPARATORS = re.compile(r"[,;\n]")
+
+
+def split_test_types(value: Optional[str]) -> list[str]:
+    """Parse a test_types value (JSON array or comma-separated list) into distinct test names"""
+    if not value or not value.strip():
+        return []
+    names = None
+    if value.lstrip().startswith("["):
+        try:
+            parsed = json.loads(value)
+            if isinstance(parsed, list):
+                names = [str(item) for item in parsed if item is not None]
+        except ValueError:
+            names = None
+    if names is None:
+        names = _TEST_TYPE_SEPARATORS.split(value)
+
+    tests: list[str] = []
+    seen = set()
+    for name in (n.strip().strip('[]"\'').strip() for n in names):
+        key = normalize_test_key(name)
+        if key and key not in seen:
+            seen.add(key)
+            tests.append(name)
+    return tests
+
+
+def normalize_test_key(name: str) -> str:
+    """Lookup key for a test name: lowercase with whitespace collapsed"""
+    return " ".join(name.lower().split())
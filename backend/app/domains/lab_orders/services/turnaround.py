@@ -0,0 +1,171 @@
+"""
+Lab turnaround-time rollups.
+
+Each completed step of the lab workflow (order -> collection -> result ->
+review) adds one sample to a per-(system, lab, priority, stage) histogram in
+``lab_turnaround_buckets``. Buckets are log-spaced in minutes, so each write is
+a single counter upsert and p50/p90/p99 are read back from a few hundred
+bucket rows at most, with ~5% resolution, instead of being recomputed from
+raw orders.
+"""
+import math
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.shared.models import LabTurnaroundBucket
+from app.shared.schemas.enums import LabOrderStatus
+
+ORDER_TO_COLLECTION = "order_to_collection"
+COLLECTION_TO_RESULT = "collection_to_result"
+ORDER_TO_RESULT = "order_to_result"
+RESULT_TO_REVIEW = "result_to_review"
+STAGES = (ORDER_TO_COLLECTION, COLLECTION_TO_RESULT, ORDER_TO_RESULT, RESULT_TO_REVIEW)
+
+# Dimension values when the source row has none
+UNSPECIFIED_LAB = ""
+UNKNOWN_PRIORITY = "unknown"
+
+# Bucket b covers (BASE * RATIO**(b-1), BASE * RATIO**b] minutes; bucket 0 is <= BASE
+BUCKET_BASE_MINUTES = 1.0
+BUCKET_RATIO = 1.1
+MAX_BUCKET = 130  # ~ 240 days
+
+PERCENTILES = (50, 90, 99)
+
+# Statuses an order only reaches once its sample has been collected
+COLLECTED_STATUSES = (LabOrderStatus.COLLECTED, LabOrderStatus.PROCESSING, LabOrderStatus.COMPLETED)
+
+
+def minutes_between(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
+    """Elapsed minutes from ``start`` to ``end``; naive datetimes are taken as UTC"""
+    if start is None or end is None:
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return max((end - start).total_seconds() / 60.0, 0.0)
+
+
+def bucket_for(minutes: float) -> int:
+    if minutes <= BUCKET_BASE_MINUTES:
+        return 0
+    return min(math.ceil(math.log(minutes / BUCKET_BASE_MINUTES) / math.log(BUCKET_RATIO)), MAX_BUCKET)
+
+
+def bucket_upper_bound(bucket: int) -> float:
+    return BUCKET_BASE_MINUTES * BUCKET_RATIO ** bucket
+
+
+def percentile(histogram: Dict[int, int], pct: float) -> Optional[float]:
+    """
+    Approximate percentile (in minutes) of a bucket -> count histogram.
+
+    Interpolates geometrically inside the bucket that contains the rank.
+    """
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+
+    rank = pct / 100.0 * total
+    seen = 0
+    for bucket in sorted(histogram):
+        count = histogram[bucket]
+        if count and seen + count >= rank:
+            upper = bucket_upper_bound(bucket)
+            lower = 0.0 if bucket == 0 else upper / BUCKET_RATIO
+            fraction = (rank - seen) / count
+            if lower == 0.0:
+                return round(upper * fraction, 1)
+            return round(lower * (upper / lower) ** fraction, 1)
+        seen += count
+    return round(bucket_upper_bound(max(histogram)), 1)
+
+
+def record_sample(system_id: str, lab_name: Optional[str], priority: Optional[str], stage: str, minutes: float):
+    """Upsert that adds one turnaround sample to its histogram bucket"""
+    stmt = insert(LabTurnaroundBucket).values(
+        system_id=system_id,
+        lab_name=lab_name or UNSPECIFIED_LAB,
+        priority=priority or UNKNOWN_PRIORITY,
+        stage=stage,
+        bucket=bucket_for(minutes),
+        sample_count=1,
+        total_minutes=minutes,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            LabTurnaroundBucket.system_id,
+            LabTurnaroundBucket.lab_name,
+            LabTurnaroundBucket.priority,
+            LabTurnaroundBucket.stage,
+            LabTurnaroundBucket.bucket,
+        ],
+        set_={
+            "sample_count": LabTurnaroundBucket.sample_count + 1,
+            "total_minutes": LabTurnaroundBucket.total_minutes + stmt.excluded.total_minutes,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def order_transition_samples(order, old_status, new_status, now: datetime) -> List[Tuple[str, float]]:
+    """
+    Turnaround samples produced by an order moving from ``old_status`` to ``new_status``.
+
+    Collection is measured the first time the order reaches a collected
+    status; the result stages the first time it becomes COMPLETED. Each is
+    stamped on the order (``collection_recorded_at``, ``completed_at``), so a
+    status that is reverted and applied again adds no second sample.
+    """
+    samples = []
+    if old_status == new_status:
+        return samples
+
+    if order.collection_recorded_at is None and new_status in COLLECTED_STATUSES:
+        order.collection_recorded_at = order.collection_date or now
+        elapsed = minutes_between(order.order_date, order.collection_recorded_at)
+        if elapsed is not None:
+            samples.append((ORDER_TO_COLLECTION, elapsed))
+
+    if order.completed_at is None and new_status == LabOrderStatus.COMPLETED:
+        order.completed_at = now
+        if order.collection_date is not None:
+            elapsed = minutes_between(order.collection_date, now)
+            if elapsed is not None:
+                samples.append((COLLECTION_TO_RESULT, elapsed))
+        elapsed = minutes_between(order.order_date, now)
+        if elapsed is not None:
+            samples.append((ORDER_TO_RESULT, elapsed))
+    return samples
+
+
+def summarize_buckets(rows: Iterable) -> List[Dict]:
+    """
+    Fold bucket rows (lab_name, priority, stage, bucket, sample_count,
+    total_minutes) into one summary per (lab, priority, stage).
+    """
+    groups: Dict[Tuple[str, str, str], Dict] = {}
+    for row in rows:
+        key = (row.lab_name, row.priority, row.stage)
+        group = groups.setdefault(key, {"histogram": {}, "count": 0, "total": 0.0})
+        group["histogram"][row.bucket] = group["histogram"].get(row.bucket, 0) + row.sample_count
+        group["count"] += row.sample_count
+        group["total"] += float(row.total_minutes or 0)
+
+    summaries = []
+    for (lab_name, priority, stage), group in sorted(groups.items()):
+        summary = {
+            "lab_name": lab_name or None,
+            "priority": priority,
+            "stage": stage,
+            "sample_count": group["count"],
+            "mean_minutes": round(group["total"] / group["count"], 1) if group["count"] else None,
+        }
+        for pct in PERCENTILES:
+            summary[f"p{pct}_minutes"] = percentile(group["histogram"], pct)
+        summaries.append(summary)
+    return summaries
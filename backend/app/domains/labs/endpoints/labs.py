@@ -2,9 +2,11 @@ from fastapi import APIRouter, Depends, UploadFile, File, Form, status, Query, H
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user, verify_tenant_access, CurrentUser
-from app.domains.labs.schemas.lab import LabResultResponse, BiomarkerResponse
+from app.domains.labs.schemas.lab import (
+    LabResultResponse, BiomarkerResponse, LabUploadRequest, LabUploadTicket, DownloadUrlResponse
+)
 from app.shared.schemas.lab_order import (
     LabResultWithBiomarkers, LabResultWithDetails, LabResultListFilter,
     LabResultListResponse, LabResultReview, BiomarkerCreate, BiomarkerUpdate
@@ -25,10 +27,43 @@ async def upload_lab(
     return await labs_service.upload_lab(file, current_user.userId, current_user.systemId, ordered_by)
 
 
+@router.post("/uploads", response_model=LabUploadTicket, status_code=status.HTTP_201_CREATED)
+async def create_lab_upload(
+    upload_request: LabUploadRequest,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Start a direct-to-storage upload: returns a presigned POST for the file"""
+    labs_service = LabsService(db)
+    return await labs_service.create_upload(upload_request, current_user.userId, current_user.systemId)
+
+
+@router.post("/{id}/upload-complete", response_model=LabResultResponse)
+async def complete_lab_upload(
+    id: str,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Confirm a presigned upload finished; OCR runs in the background"""
+    labs_service = LabsService(db)
+    return await labs_service.complete_upload(id, current_user.userId, current_user.systemId)
+
+
+@router.get("/{id}/download-url", response_model=DownloadUrlResponse)
+async def get_lab_download_url(
+    id: str,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a short-lived URL for downloading the lab report file"""
+    labs_service = LabsService(db)
+    return await labs_service.get_download_url(id, current_user.userId, current_user.systemId)
+
+
 @router.get("", response_model=List[LabResultResponse])
 async def get_lab_results(
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     labs_service = LabsService(db)
     return await labs_service.get_lab_results(current_user.userId, current_user.systemId)
@@ -80,7 +115,7 @@ async def list_lab_results(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List lab results with filtering and pagination"""
     from datetime import date
@@ -160,6 +195,17 @@ async def create_biomarker(
     return await labs_service.create_biomarker(biomarker_data, current_user.systemId)
 
 
+@router.post("/{id}/biomarkers/extract", response_model=List[BiomarkerResponse])
+async def extract_biomarkers(
+    id: str,
+    current_user: CurrentUser = Depends(verify_tenant_access),
+    db: AsyncSession = Depends(get_db)
+):
+    """Re-parse biomarkers from the lab result's OCR text, replacing existing ones"""
+    labs_service = LabsService(db)
+    return await labs_service.reextract_biomarkers(id, current_user.systemId)
+
+
 @router.put("/biomarkers/{biomarker_id}", response_model=BiomarkerResponse)
 async def update_biomarker(
     biomarker_id: str,
@@ -176,7 +222,7 @@ async def update_biomarker(
 async def get_unreviewed_results(
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get unreviewed lab results for physician dashboard"""
     labs_service = LabsService(db)
@@ -187,7 +233,7 @@ async def get_unreviewed_results(
 async def get_critical_results(
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     current_user: CurrentUser = Depends(verify_tenant_access),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get lab results with critical biomarkers"""
     labs_service = LabsService(db)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Optional, Dict
 from datetime import datetime
 
 from app.shared.schemas.enums import ProcessingStatus
@@ -45,3 +45,48 @@ class LabResultResponse(BaseModel):
     class Config:
         from_attributes = True
         populate_by_name = True
+
+
+class LabUploadRequest(BaseModel):
+    """Request for a presigned direct-to-storage lab report upload"""
+    fileName: str = Field(..., alias="file_name", min_length=1, max_length=255, description="Original filename of the lab report")
+    contentType: str = Field(..., alias="content_type", description="MIME type of the file (PDF or image)")
+    orderedBy: Optional[str] = Field(None, alias="ordered_by", description="Physician who ordered the test")
+
+    class Config:
+        populate_by_name = True
+
+    @field_validator('contentType')
+    @classmethod
+    def validate_content_type(cls, v):
+        if v != "application/pdf" and not v.startswith("image/"):
+            raise ValueError('Only PDF and image files are supported')
+        return v
+
+
+class PresignedUpload(BaseModel):
+    """Presigned POST: send ``fields`` plus a ``file`` part to ``url``"""
+    url: str = Field(..., description="Upload URL")
+    fields: Dict[str, str] = Field(..., description="Form fields to include with the file")
+    expiresIn: int = Field(..., alias="expires_in", description="Seconds until the upload URL expires")
+
+    class Config:
+        populate_by_name = True
+
+
+class LabUploadTicket(BaseModel):
+    """A pending lab result and where to upload its file"""
+    labResultId: str = Field(..., alias="lab_result_id", description="ID of the pending lab result")
+    upload: PresignedUpload = Field(..., description="Presigned upload; call upload-complete afterwards")
+
+    class Config:
+        populate_by_name = True
+
+
+class DownloadUrlResponse(BaseModel):
+    """Short-lived download URL for a stored file"""
+    url: str = Field(..., description="Presigned download URL")
+    expiresIn: int = Field(..., alias="expires_in", description="Seconds until the URL expires")
+
+    class Config:
+        populate_by_name = True
@@ -0,0 +1,119 @@
+"""
+Biomarker extraction from lab report OCR text.
+
+Each line of ``LabResult.raw_ocr_text`` is matched against a table of
+precompiled patterns for the common result-line layouts::
+
+    Hemoglobin          13.5   g/dL     12.0 - 16.0
+    Glucose, Fasting:   105 H  mg/dL    (70-99)
+    LDL Cholesterol ... 130    mg/dL    <100
+    HDL Cholesterol     38 L   mg/dL    >40
+    TSH                 2.10   mIU/L
+
+The first matching layout wins. Parsing is pure CPU work with no I/O, so it
+can run inside request handlers or in worker processes alike.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+NUMBER = r"\d+(?:[.,]\d+)?"
+
+_NAME = r"(?P<name>[A-Za-z0-9(][A-Za-z0-9 ,()/%+'#\-.]*?[A-Za-z0-9)%#])"
+_SEP = r"(?:\s*[:=]\s*|\s*\.{2,}\s*|\s+)"
+_VALUE = rf"(?P<value>[<>]?\s?{NUMBER})"
+_FLAG_WORDS = r"HH|LL|H|L|HIGH|LOW|A|ABN|CRIT(?:ICAL)?|\*+"
+_FLAG = rf"(?:\s+(?P<flag>{_FLAG_WORDS})(?![\w/]))?"
+_UNIT = r"(?:\s+(?P<unit>(?:[a-zA-Z%µμ][\w/%µμ^*.]*|10\^\d+/[a-zA-Z]+)))?"
+_FLAG_AFTER_UNIT = rf"(?:\s+(?P<flag2>{_FLAG_WORDS})(?![\w/]))?"
+_RESULT = _NAME + _SEP + _VALUE + _FLAG + _UNIT + _FLAG_AFTER_UNIT
+
+# (layout, pattern) in match order; ranges are tried before the bare layout
+BIOMARKER_PATTERNS = [
+    ("range", re.compile(
+        rf"^{_RESULT}\s+\(?\s*(?:ref\.?\s*)?(?P<low>{NUMBER})\s*(?:-|–|to)\s*(?P<high>{NUMBER})\s*\)?$",
+        re.IGNORECASE,
+    )),
+    ("upper_limit", re.compile(
+        rf"^{_RESULT}\s+\(?\s*(?:<=?|≤|less than|up to)\s*(?P<high>{NUMBER})\s*\)?$",
+        re.IGNORECASE,
+    )),
+    ("lower_limit", re.compile(
+        rf"^{_RESULT}\s+\(?\s*(?:>=?|≥|greater than)\s*(?P<low>{NUMBER})\s*\)?$",
+        re.IGNORECASE,
+    )),
+    ("bare", re.compile(rf"^{_RESULT}$", re.IGNORECASE)),
+]
+
+# Words marking header/footer lines that look like "<words> <number>" but are not results
+_NON_RESULT_NAMES = {
+    "age", "dob", "date", "page", "phone", "tel", "fax", "id", "mrn", "account", "acct",
+    "patient", "specimen", "collected", "received", "reported", "report", "order", "room", "zip",
+}
+
+_CRITICAL_FLAGS = {"HH", "LL", "CRIT", "CRITICAL"}
+_FLAG_NOTES = {"H": "high", "HIGH": "high", "HH": "critical high", "L": "low", "LOW": "low",
+               "LL": "critical low", "A": "abnormal", "ABN": "abnormal", "CRIT": "critical",
+               "CRITICAL": "critical"}
+
+MAX_NAME_LENGTH = 100
+
+
+def _clean_number(value: Optional[str]) -> Optional[str]:
+    return value.replace(",", ".").replace(" ", "") if value else None
+
+
+def parse_biomarker_line(line: str) -> Optional[Dict[str, Any]]:
+    """Parse one report line into biomarker fields, or None if it is not a result line"""
+    line = " ".join(line.split())
+    if not line or not any(ch.isdigit() for ch in line):
+        return None
+
+    for _, pattern in BIOMARKER_PATTERNS:
+        match = pattern.match(line)
+        if not match:
+            continue
+
+        name = match.group("name").strip(" .:-")
+        if (
+            not any(ch.isalpha() for ch in name)
+            or len(name) > MAX_NAME_LENGTH
+            or any(word.lower().strip(".:,") in _NON_RESULT_NAMES for word in name.split())
+        ):
+            return None
+
+        groups = match.groupdict()
+        flag = (groups.get("flag") or groups.get("flag2") or "").upper()
+        note = "critical" if flag.startswith("*") else _FLAG_NOTES.get(flag)
+        return {
+            "test_name": name,
+            "value": _clean_number(match.group("value")),
+            "unit": groups.get("unit"),
+            "reference_range_low": _clean_number(groups.get("low")),
+            "reference_range_high": _clean_number(groups.get("high")),
+            "is_critical": flag in _CRITICAL_FLAGS or flag.startswith("*"),
+            "notes": note,
+        }
+    return None
+
+
+def parse_biomarkers(text: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Extract biomarkers from OCR text, one per distinct test name in report order.
+
+    Returns dicts with test_name, value, unit, reference_range_low,
+    reference_range_high, is_critical and notes (the report's H/L flag).
+    """
+    if not text:
+        return []
+
+    biomarkers = []
+    seen = set()
+    for line in text.splitlines():
+        parsed = parse_biomarker_line(line)
+        if parsed is None:
+            continue
+        key = parsed["test_name"].lower()
+        if key not in seen:
+            seen.add(key)
+            biomarkers.append(parsed)
+    return biomarkers
@@ -0,0 +1,32 @@
+"""
+Content-addressed storage for lab report files.
+
+Uploads are hashed (SHA-256) in the same chunked pass that reads them into
+memory for OCR, and stored under a key derived from the hash, scoped per
+system. Identical files map to the
+same object, so re-uploads skip the S3 write and same-named files no longer
+overwrite each other.
+"""
+import hashlib
+import os
+from typing import Tuple
+
+from fastapi import UploadFile
+
+CHUNK_SIZE = 1024 * 1024
+
+
+async def read_upload(file: UploadFile) -> Tuple[bytes, str]:
+    """Contents and SHA-256 hex digest of an upload, hashed chunk by chunk as it is read"""
+    digest = hashlib.sha256()
+    chunks = []
+    while chunk := await file.read(CHUNK_SIZE):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+def content_addressed_key(system_id: str, content_hash: str, file_name: str) -> str:
+    """S3 key for a file's content; the extension is kept for content-type detection"""
+    extension = os.path.splitext(file_name or "")[1].lower()
+    return f"lab-results/{system_id}/sha256/{content_hash[:2]}/{content_hash}{extension}"
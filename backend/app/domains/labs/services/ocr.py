@@ -0,0 +1,90 @@
+"""
+OCR for uploaded lab report files.
+
+Module-level functions only, so they can be shipped to a process pool.
+Pages are preprocessed per ``OCROptions`` (see ocr_preprocess) and PDFs are
+rasterized and OCR'd one page at a time. PDF pages with a usable embedded
+text layer (see pdf_text) skip OCR altogether.
+"""
+import io
+import logging
+import mimetypes
+from typing import Iterator, Optional
+
+import pytesseract
+from PIL import Image
+
+from app.domains.labs.services.ocr_preprocess import (
+    OCROptions,
+    iter_pdf_pages,
+    normalize_resolution,
+    preprocess,
+    rasterize_pdf_page,
+)
+from app.domains.labs.services.pdf_text import open_pdf, page_text
+
+logger = logging.getLogger(__name__)
+
+# Prefix the upload path used to store OCR errors as text; such rows are re-OCR candidates
+LEGACY_OCR_ERROR_PREFIX = "OCR processing failed:"
+LEGACY_UNSUPPORTED_TEXT = "Unsupported file type for OCR"
+
+
+class OCRError(Exception):
+    """The file could not be turned into text"""
+
+
+def guess_content_type(file_name: Optional[str], content_type: Optional[str] = None) -> Optional[str]:
+    """Stored/declared content type, falling back to the file extension"""
+    if content_type and content_type != "application/octet-stream":
+        return content_type
+    guessed, _ = mimetypes.guess_type(file_name or "")
+    return guessed or content_type
+
+
+def _ocr_page(image: Image.Image, options: OCROptions) -> str:
+    return pytesseract.image_to_string(preprocess(image, options), config=options.tesseract_config)
+
+
+def _pdf_page_texts(file_content: bytes, options: OCROptions) -> Iterator[str]:
+    """Text of each PDF page: the embedded text layer where usable, OCR otherwise"""
+    reader = open_pdf(file_content) if options.use_text_layer else None
+    if reader is None:
+        for image in iter_pdf_pages(file_content, options):
+            yield _ocr_page(image, options)
+            image.close()
+        return
+
+    page_count = len(reader.pages)
+    if options.max_pages:
+        page_count = min(page_count, options.max_pages)
+    ocr_pages = 0
+    for page_index in range(page_count):
+        text = page_text(reader, page_index)
+        if text is None:
+            image = rasterize_pdf_page(file_content, page_index + 1, options)
+            if image is None:
+                continue
+            text = _ocr_page(image, options)
+            image.close()
+            ocr_pages += 1
+        yield text
+    logger.debug("PDF text: %s of %s pages from the text layer", page_count - ocr_pages, page_count)
+
+
+def extract_text(file_content: bytes, content_type: Optional[str], options: Optional[OCROptions] = None) -> str:
+    """
+    Extract text from a PDF or image; raises OCRError for unsupported or unreadable files.
+
+    ``options`` defaults to the OCR_* settings.
+    """
+    options = options or OCROptions.from_settings()
+    try:
+        if content_type == "application/pdf":
+            return "".join(text + "\n" for text in _pdf_page_texts(file_content, options))
+        if content_type and content_type.startswith("image/"):
+            with Image.open(io.BytesIO(file_content)) as image:
+                return _ocr_page(normalize_resolution(image, options.dpi), options)
+    except Exception as e:
+        raise OCRError(str(e)) from e
+    raise OCRError(f"Unsupported file type for OCR: {content_type}")
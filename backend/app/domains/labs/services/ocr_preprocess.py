@@ -0,0 +1,184 @@
+"""
+Image preprocessing for lab report OCR.
+
+Tesseract is faster and more accurate on clean, upright, single-channel
+images at ~300 DPI than on full-color scans at whatever resolution they
+arrived in. Each page goes through (all steps optional)::
+
+    resolution normalization -> grayscale -> crop margins -> deskew -> binarize
+
+PDFs are rasterized one page at a time (``first_page``/``last_page``), so only
+the page being OCR'd is ever held in memory.
+"""
+from typing import Iterator, Optional
+
+import numpy as np
+from PIL import Image, ImageOps
+from pdf2image import convert_from_bytes, pdfinfo_from_bytes
+
+from app.core.config import settings
+
+# Skew search: +/- MAX_SKEW_DEGREES in SKEW_STEP_DEGREES steps, on a copy at most SKEW_SAMPLE_WIDTH wide
+MAX_SKEW_DEGREES = 5.0
+SKEW_STEP_DEGREES = 0.25
+SKEW_SAMPLE_WIDTH = 800
+
+# Never upscale low-resolution images by more than this
+MAX_UPSCALE = 2.0
+
+
+class OCROptions:
+    """OCR rasterization and preprocessing settings (picklable, for process pools)"""
+
+    def __init__(
+        self,
+        dpi: int = 300,
+        grayscale: bool = True,
+        binarize: bool = True,
+        deskew: bool = True,
+        crop_margins: bool = True,
+        max_pages: Optional[int] = None,
+        tesseract_config: str = "",
+        use_text_layer: bool = True,
+    ):
+        self.dpi = dpi
+        self.grayscale = grayscale
+        self.binarize = binarize
+        self.deskew = deskew
+        self.crop_margins = crop_margins
+        self.max_pages = max_pages
+        self.tesseract_config = tesseract_config
+        self.use_text_layer = use_text_layer
+
+    @classmethod
+    def from_settings(cls) -> "OCROptions":
+        return cls(
+            dpi=settings.OCR_DPI,
+            grayscale=settings.OCR_GRAYSCALE,
+            binarize=settings.OCR_BINARIZE,
+            deskew=settings.OCR_DESKEW,
+            crop_margins=settings.OCR_CROP_MARGINS,
+            max_pages=settings.OCR_MAX_PAGES,
+            tesseract_config=settings.OCR_TESSERACT_CONFIG,
+            use_text_layer=settings.OCR_USE_TEXT_LAYER,
+        )
+
+    @classmethod
+    def raw(cls, dpi: int = 200) -> "OCROptions":
+        """No preprocessing or text layer: every page OCR'd at pdf2image's default DPI as rasterized"""
+        return cls(dpi=dpi, grayscale=False, binarize=False, deskew=False, crop_margins=False, use_text_layer=False)
+
+
+def otsu_threshold(gray: Image.Image) -> int:
+    """Gray level that best separates ink from paper (Otsu's method)"""
+    histogram = np.bincount(np.asarray(gray, dtype=np.uint8).ravel(), minlength=256).astype(float)
+    total = histogram.sum()
+    if total == 0:
+        return 128
+    levels = np.arange(256)
+    weight_dark = np.cumsum(histogram)
+    weight_light = total - weight_dark
+    cumulative_mean = np.cumsum(histogram * levels)
+    mean_dark = cumulative_mean / np.maximum(weight_dark, 1)
+    mean_light = (cumulative_mean[-1] - cumulative_mean) / np.maximum(weight_light, 1)
+    between_variance = weight_dark * weight_light * (mean_dark - mean_light) ** 2
+    return int(np.argmax(between_variance))
+
+
+def binarize(gray: Image.Image, threshold: Optional[int] = None) -> Image.Image:
+    """Black ink on white paper, as a 1-bit image"""
+    threshold = otsu_threshold(gray) if threshold is None else threshold
+    return gray.point(lambda p: 255 if p > threshold else 0, mode="1")
+
+
+def crop_margins(gray: Image.Image, padding: int = 20) -> Image.Image:
+    """Crop to the bounding box of the ink, plus ``padding`` pixels"""
+    threshold = otsu_threshold(gray)
+    ink = gray.point(lambda p: 255 if p <= threshold else 0)
+    bbox = ink.getbbox()
+    if not bbox:
+        return gray
+    left, top, right, bottom = bbox
+    return gray.crop((
+        max(left - padding, 0),
+        max(top - padding, 0),
+        min(right + padding, gray.width),
+        min(bottom + padding, gray.height),
+    ))
+
+
+def skew_correction_angle(gray: Image.Image) -> float:
+    """
+    Rotation (degrees, counter-clockwise) that makes text lines horizontal.
+
+    Projection-profile search: the angle whose row sums of ink change most
+    sharply from row to row is the one where text lines are level.
+    """
+    sample = gray
+    if sample.width > SKEW_SAMPLE_WIDTH:
+        scale = SKEW_SAMPLE_WIDTH / sample.width
+        sample = sample.resize((SKEW_SAMPLE_WIDTH, max(int(sample.height * scale), 1)))
+    threshold = otsu_threshold(sample)
+    ink = sample.point(lambda p: 255 if p <= threshold else 0)
+
+    best_angle, best_score = 0.0, -1.0
+    for angle in np.arange(-MAX_SKEW_DEGREES, MAX_SKEW_DEGREES + SKEW_STEP_DEGREES / 2, SKEW_STEP_DEGREES):
+        rows = np.asarray(ink.rotate(float(angle), resample=Image.NEAREST), dtype=np.float64).sum(axis=1)
+        score = float(np.sum(np.diff(rows) ** 2))
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    return round(best_angle, 2)
+
+
+def deskew(gray: Image.Image) -> Image.Image:
+    angle = skew_correction_angle(gray)
+    if abs(angle) < SKEW_STEP_DEGREES:
+        return gray
+    return gray.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+
+
+def normalize_resolution(image: Image.Image, target_dpi: int) -> Image.Image:
+    """Rescale an image whose embedded DPI differs from ``target_dpi`` by more than 10%"""
+    dpi = image.info.get("dpi")
+    if not dpi or not dpi[0]:
+        return image
+    scale = min(target_dpi / float(dpi[0]), MAX_UPSCALE)
+    if abs(scale - 1.0) <= 0.1:
+        return image
+    return image.resize((max(int(image.width * scale), 1), max(int(image.height * scale), 1)), Image.LANCZOS)
+
+
+def preprocess(image: Image.Image, options: OCROptions) -> Image.Image:
+    """Apply the enabled preprocessing steps to one page"""
+    if options.grayscale or options.binarize or options.deskew or options.crop_margins:
+        image = ImageOps.exif_transpose(image).convert("L")
+    if options.crop_margins:
+        image = crop_margins(image)
+    if options.deskew:
+        image = deskew(image)
+    if options.binarize:
+        image = binarize(image)
+    return image
+
+
+def rasterize_pdf_page(file_content: bytes, page_number: int, options: OCROptions) -> Optional[Image.Image]:
+    """Rasterize one PDF page (1-based) at ``options.dpi``"""
+    pages = convert_from_bytes(
+        file_content,
+        dpi=options.dpi,
+        first_page=page_number,
+        last_page=page_number,
+        grayscale=options.grayscale,
+    )
+    return pages[0] if pages else None
+
+
+def iter_pdf_pages(file_content: bytes, options: OCROptions) -> Iterator[Image.Image]:
+    """Rasterize a PDF one page at a time at ``options.dpi``"""
+    page_count = int(pdfinfo_from_bytes(file_content)["Pages"])
+    if options.max_pages:
+        page_count = min(page_count, options.max_pages)
+    for page_number in range(1, page_count + 1):
+        page = rasterize_pdf_page(file_content, page_number, options)
+        if page is not None:
+            yield page
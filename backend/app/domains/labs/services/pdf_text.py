@@ -0,0 +1,60 @@
+"""
+Embedded text layer extraction for digitally generated lab report PDFs.
+
+Reading a page's text layer takes milliseconds against seconds for
+rasterizing and OCR'ing it. A page's text is only trusted when there is
+enough of it and it is not the garbage produced by fonts without a Unicode
+mapping; anything else (scans, image-only pages) falls back to OCR.
+"""
+import io
+import logging
+from typing import Optional
+
+from pypdf import PdfReader
+
+logger = logging.getLogger(__name__)
+
+# Fewer non-space characters than this is a scanned page (or a page number)
+MIN_TEXT_LAYER_CHARS = 40
+# Share of non-space characters that must be letters, digits or ordinary punctuation
+MIN_TEXT_LAYER_QUALITY = 0.9
+
+_ORDINARY_PUNCTUATION = set(".,:;()[]<>=+-*/%#'\"&@!?_~^|µμ–≤≥°")
+
+
+def open_pdf(file_content: bytes) -> Optional[PdfReader]:
+    """Parsed PDF, or None if pypdf cannot read it (the caller OCRs every page instead)"""
+    try:
+        reader = PdfReader(io.BytesIO(file_content))
+        if reader.is_encrypted:
+            reader.decrypt("")
+        len(reader.pages)
+        return reader
+    except Exception as e:
+        logger.debug("PDF text layer unavailable: %s", e)
+        return None
+
+
+def is_usable_text(text: Optional[str]) -> bool:
+    """Whether extracted text looks like real content rather than an empty or broken text layer"""
+    if not text or "(cid:" in text:
+        return False
+    chars = [ch for ch in text if not ch.isspace()]
+    if len(chars) < MIN_TEXT_LAYER_CHARS:
+        return False
+    ordinary = sum(1 for ch in chars if ch.isalnum() or ch in _ORDINARY_PUNCTUATION)
+    return ordinary / len(chars) >= MIN_TEXT_LAYER_QUALITY
+
+
+def page_text(reader: PdfReader, page_index: int) -> Optional[str]:
+    """
+    Text layer of one page (0-based), or None if the page needs OCR.
+
+    Layout mode keeps each report row on one line, as the biomarker parser expects.
+    """
+    try:
+        text = reader.pages[page_index].extract_text(extraction_mode="layout")
+    except Exception as e:
+        logger.debug("Text extraction failed for page %s: %s", page_index + 1, e)
+        return None
+    return text if is_usable_text(text) else None
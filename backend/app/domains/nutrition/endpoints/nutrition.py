@@ -1,11 +1,12 @@
 """
 API endpoints for Nutrition Management (Nutritionist data capture)
 """
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from datetime import date, datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user, CurrentUser
 from app.shared.schemas.nutrition import (
     NutritionAssessmentCreate,
@@ -24,7 +25,12 @@ from app.shared.schemas.nutrition import (
     MealPlanDayCreate,
     MealPlanDayWithMeals,
     MealPlanMealCreate,
+    MealPlanMealUpdate,
     MealPlanMealResponse,
+    CaseloadMacroComplianceReport,
+    MealPlanTemplateCreate,
+    MealPlanCloneRequest,
+    MealPlanCloneResponse,
     NutritionFeedbackCreate,
     NutritionFeedbackUpdate,
     NutritionFeedbackResponse,
@@ -34,7 +40,9 @@ from app.shared.schemas.nutrition import (
     NutritionStats,
     PatientNutritionProgress
 )
+from app.shared.schemas.enums import MealPlanStatus, ComplianceLevel
 from app.domains.nutrition.services.nutrition_service import NutritionService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 
 router = APIRouter()
 
@@ -45,24 +53,30 @@ router = APIRouter()
 
 @router.get("/assessments/", response_model=NutritionAssessmentListResponse)
 async def list_nutrition_assessments(
-    patient_id: str = None,
-    nutritionist_id: str = None,
-    skip: int = 0,
-    limit: int = 100,
+    patient_id: Optional[str] = None,
+    nutritionist_id: Optional[str] = None,
+    assessment_status: Optional[str] = Query(None, alias="status"),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List nutrition assessments with filtering"""
-    # Simplified implementation - would need proper filtering logic
-    service = NutritionService(db)
-    # For now, return empty list - full implementation would use filters
-    return NutritionAssessmentListResponse(
-        items=[],
-        total=0,
+    filters = NutritionAssessmentListFilter(
+        patient_id=patient_id,
+        nutritionist_id=nutritionist_id,
+        status=assessment_status,
+        start_date=start_date,
+        end_date=end_date,
         skip=skip,
         limit=limit,
-        has_more=False
+        cursor=cursor
     )
+    service = NutritionService(db)
+    return await service.list_nutrition_assessments(filters, current_user.systemId)
 
 
 @router.post("/assessments/", response_model=NutritionAssessmentResponse, status_code=status.HTTP_201_CREATED)
@@ -105,22 +119,30 @@ async def update_nutrition_assessment(
 
 @router.get("/meal-plans/", response_model=MealPlanListResponse)
 async def list_meal_plans(
-    patient_id: str = None,
-    nutritionist_id: str = None,
-    skip: int = 0,
-    limit: int = 100,
+    patient_id: Optional[str] = None,
+    nutritionist_id: Optional[str] = None,
+    plan_status: Optional[MealPlanStatus] = Query(None, alias="status"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List meal plans with filtering"""
-    # Simplified implementation
-    return MealPlanListResponse(
-        items=[],
-        total=0,
+    filters = MealPlanListFilter(
+        patient_id=patient_id,
+        nutritionist_id=nutritionist_id,
+        status=plan_status,
+        start_date=start_date,
+        end_date=end_date,
         skip=skip,
         limit=limit,
-        has_more=False
+        cursor=cursor
     )
+    service = NutritionService(db)
+    return await service.list_meal_plans(filters, current_user.systemId)
 
 
 @router.post("/meal-plans/", response_model=MealPlanResponse, status_code=status.HTTP_201_CREATED)
@@ -173,28 +195,132 @@ async def update_meal_plan(
     )
 
 
+@router.post("/meal-plans/{meal_plan_id}/days", response_model=MealPlanDayWithMeals, status_code=status.HTTP_201_CREATED)
+async def add_day_to_plan(
+    meal_plan_id: str,
+    day_data: MealPlanDayCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Add a day to a meal plan"""
+    service = NutritionService(db)
+    return await service.add_day_to_plan(meal_plan_id, day_data, current_user.systemId)
+
+
+@router.post("/meal-plan-days/{day_id}/meals", response_model=MealPlanMealResponse, status_code=status.HTTP_201_CREATED)
+async def add_meal_to_day(
+    day_id: str,
+    meal_data: MealPlanMealCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Add a meal to a meal plan day (updates day and plan macro totals)"""
+    service = NutritionService(db)
+    return await service.add_meal_to_day(day_id, meal_data, current_user.systemId)
+
+
+@router.put("/meal-plan-meals/{meal_id}", response_model=MealPlanMealResponse)
+async def update_meal(
+    meal_id: str,
+    update_data: MealPlanMealUpdate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update a meal (updates day and plan macro totals)"""
+    service = NutritionService(db)
+    return await service.update_meal(meal_id, update_data, current_user.systemId)
+
+
+@router.delete("/meal-plan-meals/{meal_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_meal(
+    meal_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a meal (updates day and plan macro totals)"""
+    service = NutritionService(db)
+    await service.delete_meal(meal_id, current_user.systemId)
+
+
+@router.get("/caseload/macro-compliance", response_model=CaseloadMacroComplianceReport)
+async def get_caseload_macro_compliance(
+    nutritionist_id: Optional[str] = None,
+    plan_status: Optional[MealPlanStatus] = Query(MealPlanStatus.ACTIVE, alias="status"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("nutrition"))
+):
+    """Compare a caseload's meal plans to their macro targets"""
+    service = NutritionService(db)
+    return await cache.fetch(lambda: service.get_caseload_macro_compliance(current_user.systemId, nutritionist_id, plan_status))
+
+
+@router.post("/meal-plans/{meal_plan_id}/template", response_model=MealPlanResponse, status_code=status.HTTP_201_CREATED)
+async def create_meal_plan_template(
+    meal_plan_id: str,
+    template_data: MealPlanTemplateCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Save a meal plan, with its days and meals, as a reusable template"""
+    service = NutritionService(db)
+    return await service.create_template_from_plan(meal_plan_id, template_data, current_user.systemId)
+
+
+@router.get("/meal-plan-templates/", response_model=List[MealPlanResponse])
+async def list_meal_plan_templates(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """List meal plan templates"""
+    service = NutritionService(db)
+    return await service.list_meal_plan_templates(current_user.systemId)
+
+
+@router.post("/meal-plans/{meal_plan_id}/clone", response_model=MealPlanCloneResponse, status_code=status.HTTP_201_CREATED)
+async def clone_meal_plan(
+    meal_plan_id: str,
+    clone_data: MealPlanCloneRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Copy a meal plan or template to many patients in one transaction"""
+    service = NutritionService(db)
+    return await service.clone_meal_plan_to_patients(meal_plan_id, clone_data, current_user.systemId)
+
+
 # ============================================================================
 # Nutrition Feedback Endpoints
 # ============================================================================
 
 @router.get("/feedback/", response_model=NutritionFeedbackListResponse)
 async def list_nutrition_feedback(
-    patient_id: str = None,
-    nutritionist_id: str = None,
-    skip: int = 0,
-    limit: int = 100,
+    patient_id: Optional[str] = None,
+    nutritionist_id: Optional[str] = None,
+    meal_plan_id: Optional[str] = None,
+    compliance_level: Optional[ComplianceLevel] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List nutrition feedback with filtering"""
-    # Simplified implementation
-    return NutritionFeedbackListResponse(
-        items=[],
-        total=0,
+    filters = NutritionFeedbackListFilter(
+        patient_id=patient_id,
+        nutritionist_id=nutritionist_id,
+        meal_plan_id=meal_plan_id,
+        compliance_level=compliance_level,
+        start_date=start_date,
+        end_date=end_date,
         skip=skip,
         limit=limit,
-        has_more=False
+        cursor=cursor
     )
+    service = NutritionService(db)
+    return await service.list_nutrition_feedback(filters, current_user.systemId)
 
 
 @router.post("/feedback/", response_model=NutritionFeedbackResponse, status_code=status.HTTP_201_CREATED)
@@ -237,19 +363,21 @@ async def update_nutrition_feedback(
 
 @router.get("/stats", response_model=NutritionStats)
 async def get_nutrition_stats(
+    nutritionist_id: Optional[str] = None,
     current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cache: CachedResponse = Depends(cache_response("nutrition"))
 ):
-    """Get nutrition statistics for the system"""
+    """Get nutrition statistics for the system, optionally for one nutritionist"""
     service = NutritionService(db)
-    return await service.get_nutrition_stats(current_user.systemId)
+    return await cache.fetch(lambda: service.get_nutrition_stats(current_user.systemId, nutritionist_id))
 
 
 @router.get("/patients/{patient_id}/progress", response_model=PatientNutritionProgress)
 async def get_patient_nutrition_progress(
     patient_id: str,
     current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get nutrition progress for a specific patient"""
     service = NutritionService(db)
@@ -0,0 +1,128 @@
+"""
+Incremental macro rollups for meal plans.
+
+Each MealPlanDay keeps running totals of its meals' calories/protein/carbs/fats,
+and each MealPlan keeps running totals across all of its days. Writes apply a
+delta (new meal values minus old meal values) with a single atomic
+``SET col = col + :delta`` UPDATE per level, so totals never need to be
+recomputed by walking the MealPlan -> days -> meals tree.
+
+Meal macro columns are whole numbers while the API accepts fractional grams,
+so values are rounded half up once, with ``whole``, both when a meal is
+stored and when its rollup delta is computed; the totals then always equal
+the sum of the stored meals.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import update
+
+# (calories, protein_grams, carbs_grams, fats_grams)
+Macros = Tuple[int, int, int, int]
+
+ZERO_MACROS: Macros = (0, 0, 0, 0)
+
+MACRO_FIELDS = ("calories", "protein_grams", "carbs_grams", "fats_grams")
+
+# Plan target column for each macro, in MACRO_FIELDS order
+TARGET_FIELDS = ("daily_calorie_target", "protein_target_grams", "carbs_target_grams", "fats_target_grams")
+
+
+def whole(value: Any) -> Optional[int]:
+    """A macro value as stored in the Integer meal columns: rounded half up"""
+    if value is None:
+        return None
+    return int(Decimal(str(value)).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def stored_macros(values: Dict[str, Any]) -> Dict[str, Any]:
+    """``values`` with any macro fields rounded the way they are stored"""
+    return {field: whole(value) if field in MACRO_FIELDS else value for field, value in values.items()}
+
+
+def meal_macros(meal: Any) -> Macros:
+    """Read the macro values of a meal (model instance, schema or dict); missing values count as 0"""
+    if isinstance(meal, dict):
+        values = [meal.get(field) for field in MACRO_FIELDS]
+    else:
+        values = [getattr(meal, field, None) for field in MACRO_FIELDS]
+    return tuple(whole(value) or 0 for value in values)
+
+
+def macro_delta(new: Macros, old: Macros = ZERO_MACROS) -> Macros:
+    """Difference to apply to the rollups when a meal changes from ``old`` to ``new``"""
+    return tuple(n - o for n, o in zip(new, old))
+
+
+def build_rollup_updates(day_model, plan_model, day_id: str, plan_id: str, delta: Macros, meal_count_delta: int = 0):
+    """
+    UPDATE statements that apply ``delta`` to a day's and its plan's totals.
+
+    Returns an empty list when nothing changed so callers can skip the round-trips.
+    """
+    if delta == ZERO_MACROS and meal_count_delta == 0:
+        return []
+
+    calories, protein, carbs, fats = delta
+    day_stmt = (
+        update(day_model)
+        .where(day_model.id == day_id)
+        .values(
+            total_daily_calories=day_model.total_daily_calories + calories,
+            total_daily_protein=day_model.total_daily_protein + protein,
+            total_daily_carbs=day_model.total_daily_carbs + carbs,
+            total_daily_fats=day_model.total_daily_fats + fats,
+            meal_count=day_model.meal_count + meal_count_delta,
+        )
+    )
+    plan_stmt = (
+        update(plan_model)
+        .where(plan_model.id == plan_id)
+        .values(
+            total_calories=plan_model.total_calories + calories,
+            total_protein_grams=plan_model.total_protein_grams + protein,
+            total_carbs_grams=plan_model.total_carbs_grams + carbs,
+            total_fats_grams=plan_model.total_fats_grams + fats,
+            meal_count=plan_model.meal_count + meal_count_delta,
+        )
+    )
+    return [day_stmt, plan_stmt]
+
+
+def deviation_pct(actual: Optional[float], target: Optional[float]) -> Optional[float]:
+    """Signed percentage deviation of ``actual`` from ``target``; None when there is no target"""
+    if not target or actual is None:
+        return None
+    return round((float(actual) - float(target)) / float(target) * 100, 1)
+
+
+def plan_macro_deviation(plan: Any) -> Dict[str, Optional[float]]:
+    """
+    Compare a plan's average daily totals against its daily targets.
+
+    Reads only the plan's precomputed totals and day_count. The overall
+    ``macro_deviation_score`` is the mean absolute deviation across the macros
+    that have a target (0 means the plan hits every target exactly).
+    """
+    day_count = getattr(plan, "day_count", 0) or 0
+    totals = (
+        plan.total_calories or 0,
+        plan.total_protein_grams or 0,
+        plan.total_carbs_grams or 0,
+        plan.total_fats_grams or 0,
+    )
+    averages = [total / day_count if day_count else None for total in totals]
+    deviations = [
+        deviation_pct(average, getattr(plan, target_field, None))
+        for average, target_field in zip(averages, TARGET_FIELDS)
+    ]
+    scored = [abs(value) for value in deviations if value is not None]
+
+    return {
+        "avg_daily_calories": round(averages[0], 1) if averages[0] is not None else None,
+        "calorie_deviation_pct": deviations[0],
+        "protein_deviation_pct": deviations[1],
+        "carbs_deviation_pct": deviations[2],
+        "fats_deviation_pct": deviations[3],
+        "macro_deviation_score": round(sum(scored) / len(scored), 1) if scored else None,
+    }
@@ -1,11 +1,12 @@
 """
 Service layer for Nutrition Management (Nutritionist data capture)
 """
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any
 from datetime import datetime, timedelta, date
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, insert, update, and_, or_, func, case, true
+from sqlalchemy.orm import joinedload, selectinload, aliased
 from decimal import Decimal
 
 from app.shared.models import (
@@ -30,18 +31,93 @@ from app.shared.schemas.nutrition import (
     MealPlanDayCreate,
     MealPlanDayWithMeals,
     MealPlanMealCreate,
+    MealPlanMealUpdate,
     MealPlanMealResponse,
+    MealPlanMacroDeviation,
+    MealPlanMacroCompliance,
+    CaseloadMacroComplianceReport,
+    MealPlanTemplateCreate,
+    MealPlanCloneRequest,
+    MealPlanCloneResponse,
+    ClonedMealPlan,
     NutritionFeedbackCreate,
     NutritionFeedbackUpdate,
     NutritionFeedbackResponse,
     NutritionFeedbackWithDetails,
     NutritionAssessmentListFilter,
+    NutritionAssessmentListResponse,
     MealPlanListFilter,
+    MealPlanListResponse,
     NutritionFeedbackListFilter,
+    NutritionFeedbackListResponse,
     NutritionStats,
     PatientNutritionProgress
 )
-from app.shared.schemas.enums import MealPlanStatus
+from app.shared.schemas.enums import MealPlanStatus, ComplianceLevel, UserRole
+from app.shared.pagination import encode_cursor, keyset_before
+from app.core.exceptions import NotFoundError, ValidationError
+from app.domains.nutrition.services.macro_rollup import (
+    whole,
+    stored_macros,
+    meal_macros,
+    macro_delta,
+    build_rollup_updates,
+    plan_macro_deviation,
+)
+from app.infrastructure.cache.response_cache import invalidate_on_commit
+
+
+# Roles of accounts that can be assigned a meal plan (staff and admins cannot)
+PATIENT_ROLES = (UserRole.PATIENT.value, UserRole.USER.value)
+
+# Numeric scale used to average and trend feedback compliance levels
+COMPLIANCE_SCORES = {
+    ComplianceLevel.POOR: 1,
+    ComplianceLevel.FAIR: 2,
+    ComplianceLevel.GOOD: 3,
+    ComplianceLevel.EXCELLENT: 4,
+}
+
+
+def _meal_plan_response(plan: MealPlan) -> MealPlanResponse:
+    """Response for a stored plan; its macro targets are the ``*_target_grams`` columns"""
+    return MealPlanResponse(
+        id=plan.id,
+        patient_id=plan.patient_id,
+        nutritionist_id=plan.nutritionist_id,
+        assessment_id=plan.assessment_id,
+        status=plan.status,
+        is_template=plan.is_template,
+        source_plan_id=plan.source_plan_id,
+        plan_name=plan.plan_name,
+        start_date=plan.start_date,
+        end_date=plan.end_date,
+        daily_calorie_target=plan.daily_calorie_target,
+        daily_protein_target=plan.protein_target_grams,
+        daily_carbs_target=plan.carbs_target_grams,
+        daily_fats_target=plan.fats_target_grams,
+        special_instructions=plan.special_instructions,
+        day_count=plan.day_count,
+        meal_count=plan.meal_count,
+        total_calories=plan.total_calories,
+        total_protein_grams=plan.total_protein_grams,
+        total_carbs_grams=plan.total_carbs_grams,
+        total_fats_grams=plan.total_fats_grams,
+        created_at=plan.created_at,
+        updated_at=plan.updated_at
+    )
+
+
+def _compliance_trend(levels: List[Optional[ComplianceLevel]]) -> Optional[str]:
+    """Trend of compliance levels ordered newest first; None with fewer than two rated entries"""
+    scores = [COMPLIANCE_SCORES[level] for level in levels if level is not None]
+    if len(scores) < 2:
+        return None
+    if scores[0] > scores[-1]:
+        return "improving"
+    if scores[0] < scores[-1]:
+        return "declining"
+    return "stable"
 
 
 class NutritionService:
@@ -73,8 +149,8 @@ class NutritionService:
         )
 
         self.db.add(assessment)
-        await self.db.commit()
-        await self.db.refresh(assessment)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
 
         return NutritionAssessmentResponse.model_validate(assessment)
 
@@ -104,6 +180,54 @@ class NutritionService:
             nutritionist_name=f"{assessment.nutritionist.first_name} {assessment.nutritionist.last_name}"
         )
 
+    async def list_nutrition_assessments(self, filters: NutritionAssessmentListFilter, system_id: str) -> NutritionAssessmentListResponse:
+        """List nutrition assessments with patient/nutritionist names resolved in the same query"""
+        conditions = [NutritionAssessment.system_id == system_id]
+        if filters.patient_id:
+            conditions.append(NutritionAssessment.patient_id == filters.patient_id)
+        if filters.nutritionist_id:
+            conditions.append(NutritionAssessment.nutritionist_id == filters.nutritionist_id)
+        if filters.status:
+            conditions.append(NutritionAssessment.status == filters.status)
+        if filters.start_date:
+            conditions.append(NutritionAssessment.assessment_date >= filters.start_date)
+        if filters.end_date:
+            conditions.append(NutritionAssessment.assessment_date <= filters.end_date)
+
+        patient = aliased(User)
+        nutritionist_user = aliased(User)
+        query = (
+            select(NutritionAssessment, patient.username, nutritionist_user.username, Staff.credentials)
+            .join(patient, patient.id == NutritionAssessment.patient_id)
+            .join(Staff, Staff.id == NutritionAssessment.nutritionist_id)
+            .join(nutritionist_user, nutritionist_user.id == Staff.user_id)
+            .where(and_(*conditions))
+        )
+        count_query = select(func.count()).select_from(NutritionAssessment).where(and_(*conditions))
+
+        rows, total, has_more = await self._fetch_page(
+            query, count_query, NutritionAssessment.assessment_date, NutritionAssessment.id, filters
+        )
+
+        items = [
+            NutritionAssessmentWithDetails(
+                **assessment.__dict__,
+                patient_name=patient_name,
+                nutritionist_name=nutritionist_name,
+                nutritionist_credentials=credentials
+            )
+            for assessment, patient_name, nutritionist_name, credentials in rows
+        ]
+
+        return NutritionAssessmentListResponse(
+            items=items,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=self._next_cursor(rows, "assessment_date") if has_more else None
+        )
+
     async def update_nutrition_assessment(self, assessment_id: str, update_data: NutritionAssessmentUpdate, system_id: str) -> NutritionAssessmentResponse:
         """Update a nutrition assessment"""
         result = await self.db.execute(
@@ -124,8 +248,8 @@ class NutritionService:
             setattr(assessment, field, value)
 
         assessment.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(assessment)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
 
         return NutritionAssessmentResponse.model_validate(assessment)
 
@@ -148,19 +272,19 @@ class NutritionService:
         )
 
         self.db.add(meal_plan)
-        await self.db.commit()
-        await self.db.refresh(meal_plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
 
         return MealPlanResponse.model_validate(meal_plan)
 
     async def get_meal_plan(self, meal_plan_id: str, system_id: str) -> MealPlanWithDetails:
-        """Get a meal plan with details"""
+        """Get a meal plan with details and per-day macro totals (meals are not loaded)"""
         result = await self.db.execute(
             select(MealPlan)
             .options(
                 joinedload(MealPlan.patient),
-                joinedload(MealPlan.nutritionist),
-                joinedload(MealPlan.days)
+                joinedload(MealPlan.nutritionist).joinedload(Staff.user),
+                selectinload(MealPlan.days)
             )
             .where(
                 and_(
@@ -172,13 +296,327 @@ class NutritionService:
         meal_plan = result.scalar_one_or_none()
 
         if not meal_plan:
-            raise NotFoundError("Meal plan not found")
+            raise NotFoundError("Meal plan", meal_plan_id)
+
+        # Day totals are precomputed columns, so the meal rows never need loading here
+        days = [
+            MealPlanDayWithMeals(**day.__dict__)
+            for day in sorted(meal_plan.days, key=lambda d: d.day_number)
+        ]
+        nutritionist = meal_plan.nutritionist
 
         return MealPlanWithDetails(
-            **meal_plan.__dict__,
-            patient_name=f"{meal_plan.patient.first_name} {meal_plan.patient.last_name}",
-            nutritionist_name=f"{meal_plan.nutritionist.first_name} {meal_plan.nutritionist.last_name}",
-            days_count=len(meal_plan.days)
+            **{k: v for k, v in meal_plan.__dict__.items() if k != "days"},
+            patient_name=meal_plan.patient.username,
+            nutritionist_name=nutritionist.user.username if nutritionist.user else "Unknown",
+            nutritionist_credentials=nutritionist.credentials,
+            total_days=meal_plan.day_count,
+            days=days,
+            macro_deviation=MealPlanMacroDeviation(**plan_macro_deviation(meal_plan))
+        )
+
+    async def list_meal_plans(self, filters: MealPlanListFilter, system_id: str) -> MealPlanListResponse:
+        """List meal plans with names resolved in the same query; totals come from the rollup columns"""
+        conditions = [MealPlan.system_id == system_id, MealPlan.is_template.is_(False)]
+        if filters.patient_id:
+            conditions.append(MealPlan.patient_id == filters.patient_id)
+        if filters.nutritionist_id:
+            conditions.append(MealPlan.nutritionist_id == filters.nutritionist_id)
+        if filters.status:
+            conditions.append(MealPlan.status == filters.status)
+        if filters.start_date:
+            conditions.append(MealPlan.start_date >= filters.start_date)
+        if filters.end_date:
+            conditions.append(MealPlan.start_date <= filters.end_date)
+
+        patient = aliased(User)
+        nutritionist_user = aliased(User)
+        query = (
+            select(MealPlan, patient.username, nutritionist_user.username, Staff.credentials)
+            .join(patient, patient.id == MealPlan.patient_id)
+            .join(Staff, Staff.id == MealPlan.nutritionist_id)
+            .join(nutritionist_user, nutritionist_user.id == Staff.user_id)
+            .where(and_(*conditions))
+        )
+        count_query = select(func.count()).select_from(MealPlan).where(and_(*conditions))
+
+        rows, total, has_more = await self._fetch_page(
+            query, count_query, MealPlan.start_date, MealPlan.id, filters
+        )
+
+        items = [
+            MealPlanWithDetails(
+                **meal_plan.__dict__,
+                patient_name=patient_name,
+                nutritionist_name=nutritionist_name,
+                nutritionist_credentials=credentials,
+                total_days=meal_plan.day_count,
+                days=[],
+                macro_deviation=MealPlanMacroDeviation(**plan_macro_deviation(meal_plan))
+            )
+            for meal_plan, patient_name, nutritionist_name, credentials in rows
+        ]
+
+        return MealPlanListResponse(
+            items=items,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=self._next_cursor(rows, "start_date") if has_more else None
+        )
+
+    async def add_day_to_plan(self, meal_plan_id: str, day_data: MealPlanDayCreate, system_id: str) -> MealPlanDayWithMeals:
+        """Add a day to a meal plan and bump the plan's day count"""
+        meal_plan = await self._get_meal_plan(meal_plan_id, system_id)
+
+        day = MealPlanDay(
+            meal_plan_id=meal_plan.id,
+            day_number=day_data.day_number,
+            day_of_week=day_data.day_of_week,
+            notes=day_data.notes
+        )
+        self.db.add(day)
+        await self.db.execute(
+            update(MealPlan)
+            .where(MealPlan.id == meal_plan.id)
+            .values(day_count=MealPlan.day_count + 1)
+        )
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+        return MealPlanDayWithMeals(**day.__dict__)
+
+    async def add_meal_to_day(self, day_id: str, meal_data: MealPlanMealCreate, system_id: str) -> MealPlanMealResponse:
+        """Add a meal to a day, applying its macros to the day and plan rollups"""
+        day = await self._get_meal_plan_day(day_id, system_id)
+
+        meal = MealPlanMeal(
+            day_id=day.id,
+            meal_type=meal_data.meal_type,
+            time_suggestion=meal_data.time_suggestion,
+            meal_name=meal_data.meal_description,
+            meal_description=meal_data.meal_description,
+            ingredients=meal_data.ingredients,
+            preparation_notes=meal_data.preparation_notes,
+            calories=whole(meal_data.calories),
+            protein_grams=whole(meal_data.protein_grams),
+            carbs_grams=whole(meal_data.carbs_grams),
+            fats_grams=whole(meal_data.fats_grams)
+        )
+        self.db.add(meal)
+
+        # Rollups are updated in the same transaction as the meal insert
+        for stmt in build_rollup_updates(MealPlanDay, MealPlan, day.id, day.meal_plan_id, meal_macros(meal_data), meal_count_delta=1):
+            await self.db.execute(stmt)
+
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+        return MealPlanMealResponse.model_validate(meal)
+
+    async def update_meal(self, meal_id: str, update_data: MealPlanMealUpdate, system_id: str) -> MealPlanMealResponse:
+        """Update a meal, applying only the macro difference to the day and plan rollups"""
+        result = await self.db.execute(
+            select(MealPlanMeal, MealPlanDay.meal_plan_id)
+            .join(MealPlanDay, MealPlanDay.id == MealPlanMeal.day_id)
+            .join(MealPlan, MealPlan.id == MealPlanDay.meal_plan_id)
+            .where(
+                and_(
+                    MealPlanMeal.id == meal_id,
+                    MealPlan.system_id == system_id
+                )
+            )
+        )
+        row = result.one_or_none()
+        if not row:
+            raise NotFoundError("Meal", meal_id)
+        meal, meal_plan_id = row
+
+        old_macros = meal_macros(meal)
+        for field, value in stored_macros(update_data.model_dump(exclude_unset=True)).items():
+            setattr(meal, field, value)
+
+        delta = macro_delta(meal_macros(meal), old_macros)
+        for stmt in build_rollup_updates(MealPlanDay, MealPlan, meal.day_id, meal_plan_id, delta):
+            await self.db.execute(stmt)
+
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+        return MealPlanMealResponse.model_validate(meal)
+
+    async def delete_meal(self, meal_id: str, system_id: str) -> None:
+        """Delete a meal, removing its macros from the day and plan rollups"""
+        result = await self.db.execute(
+            select(MealPlanMeal, MealPlanDay.meal_plan_id)
+            .join(MealPlanDay, MealPlanDay.id == MealPlanMeal.day_id)
+            .join(MealPlan, MealPlan.id == MealPlanDay.meal_plan_id)
+            .where(
+                and_(
+                    MealPlanMeal.id == meal_id,
+                    MealPlan.system_id == system_id
+                )
+            )
+        )
+        row = result.one_or_none()
+        if not row:
+            raise NotFoundError("Meal", meal_id)
+        meal, meal_plan_id = row
+
+        delta = macro_delta((0, 0, 0, 0), meal_macros(meal))
+        for stmt in build_rollup_updates(MealPlanDay, MealPlan, meal.day_id, meal_plan_id, delta, meal_count_delta=-1):
+            await self.db.execute(stmt)
+
+        await self.db.delete(meal)
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+    async def get_caseload_macro_compliance(
+        self,
+        system_id: str,
+        nutritionist_id: Optional[str] = None,
+        status: Optional[MealPlanStatus] = MealPlanStatus.ACTIVE
+    ) -> CaseloadMacroComplianceReport:
+        """Compare every plan in a caseload to its targets using only the plan-level rollups"""
+        conditions = [MealPlan.system_id == system_id, MealPlan.is_template.is_(False)]
+        if nutritionist_id:
+            conditions.append(MealPlan.nutritionist_id == nutritionist_id)
+        if status:
+            conditions.append(MealPlan.status == status)
+
+        result = await self.db.execute(
+            select(MealPlan, User.username)
+            .join(User, User.id == MealPlan.patient_id)
+            .where(and_(*conditions))
+            .order_by(MealPlan.start_date.desc())
+        )
+
+        plans = []
+        for meal_plan, patient_name in result.all():
+            plans.append(MealPlanMacroCompliance(
+                meal_plan_id=meal_plan.id,
+                plan_name=meal_plan.plan_name,
+                patient_id=meal_plan.patient_id,
+                patient_name=patient_name,
+                status=meal_plan.status,
+                day_count=meal_plan.day_count,
+                meal_count=meal_plan.meal_count,
+                daily_calorie_target=meal_plan.daily_calorie_target,
+                **plan_macro_deviation(meal_plan)
+            ))
+
+        scores = [plan.macro_deviation_score for plan in plans if plan.macro_deviation_score is not None]
+        return CaseloadMacroComplianceReport(
+            nutritionist_id=nutritionist_id,
+            total_plans=len(plans),
+            avg_macro_deviation_score=round(sum(scores) / len(scores), 1) if scores else None,
+            plans=plans
+        )
+
+    # Meal Plan Template Methods
+    async def create_template_from_plan(self, meal_plan_id: str, template_data: MealPlanTemplateCreate, system_id: str) -> MealPlanResponse:
+        """Save a copy of a plan's days and meals as a reusable template"""
+        source = await self._get_meal_plan(meal_plan_id, system_id)
+
+        template_row = self._copy_row(source, MealPlan)
+        template_row.update(
+            id=str(uuid4()),
+            patient_id=None,
+            assessment_id=None,
+            plan_name=template_data.plan_name,
+            status=MealPlanStatus.ACTIVE,
+            is_template=True,
+            source_plan_id=source.id,
+        )
+        await self._insert_plan_tree(source.id, [template_row])
+
+        template = await self._get_meal_plan(template_row["id"], system_id)
+        invalidate_on_commit(self.db, "nutrition", system_id)
+        return _meal_plan_response(template)
+
+    async def list_meal_plan_templates(self, system_id: str) -> List[MealPlanResponse]:
+        """List the meal plan templates of a system"""
+        result = await self.db.execute(
+            select(MealPlan)
+            .where(
+                and_(
+                    MealPlan.system_id == system_id,
+                    MealPlan.is_template.is_(True)
+                )
+            )
+            .order_by(MealPlan.plan_name)
+        )
+        return [_meal_plan_response(template) for template in result.scalars().all()]
+
+    async def clone_meal_plan_to_patients(self, meal_plan_id: str, clone_data: MealPlanCloneRequest, system_id: str) -> MealPlanCloneResponse:
+        """
+        Copy a plan (or template) with all of its days and meals to many patients.
+
+        Patients are validated with a single IN query, and the whole tree is
+        written with one multi-row INSERT per table in a single transaction.
+        """
+        source = await self._get_meal_plan(meal_plan_id, system_id)
+
+        patient_ids = list(dict.fromkeys(clone_data.patient_ids))
+        result = await self.db.execute(
+            select(User.id).where(
+                and_(
+                    User.id.in_(patient_ids),
+                    User.system_id == system_id,
+                    User.role.in_(PATIENT_ROLES)
+                )
+            )
+        )
+        found = set(result.scalars().all())
+        missing = [patient_id for patient_id in patient_ids if patient_id not in found]
+        if missing:
+            raise ValidationError("Some patients were not found", {"patient_ids": missing})
+
+        nutritionist_id = clone_data.nutritionist_id or source.nutritionist_id
+        if clone_data.nutritionist_id:
+            result = await self.db.execute(
+                select(Staff.id).where(
+                    and_(
+                        Staff.id == clone_data.nutritionist_id,
+                        Staff.system_id == system_id
+                    )
+                )
+            )
+            if result.scalar_one_or_none() is None:
+                raise NotFoundError("Nutritionist", clone_data.nutritionist_id)
+
+        # Keep the source plan's duration
+        end_date = None
+        if source.end_date:
+            end_date = clone_data.start_date + (source.end_date - source.start_date)
+
+        base_row = self._copy_row(source, MealPlan)
+        base_row.update(
+            assessment_id=None,
+            nutritionist_id=nutritionist_id,
+            plan_name=clone_data.plan_name or source.plan_name,
+            start_date=clone_data.start_date,
+            end_date=end_date,
+            status=MealPlanStatus.ACTIVE,
+            is_template=False,
+            source_plan_id=source.id,
+        )
+        plan_rows = [
+            {**base_row, "id": str(uuid4()), "patient_id": patient_id}
+            for patient_id in patient_ids
+        ]
+        await self._insert_plan_tree(source.id, plan_rows)
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+        return MealPlanCloneResponse(
+            source_plan_id=source.id,
+            plans_created=len(plan_rows),
+            days_per_plan=source.day_count,
+            meals_per_plan=source.meal_count,
+            plans=[
+                ClonedMealPlan(patient_id=row["patient_id"], meal_plan_id=row["id"])
+                for row in plan_rows
+            ]
         )
 
     # Nutrition Feedback Methods
@@ -201,8 +639,8 @@ class NutritionService:
         )
 
         self.db.add(feedback)
-        await self.db.commit()
-        await self.db.refresh(feedback)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
 
         return NutritionFeedbackResponse.model_validate(feedback)
 
@@ -234,6 +672,57 @@ class NutritionService:
             meal_plan_name=feedback.meal_plan.name if feedback.meal_plan else None
         )
 
+    async def list_nutrition_feedback(self, filters: NutritionFeedbackListFilter, system_id: str) -> NutritionFeedbackListResponse:
+        """List nutrition feedback with names and meal plan resolved in the same query"""
+        conditions = [NutritionFeedback.system_id == system_id]
+        if filters.patient_id:
+            conditions.append(NutritionFeedback.patient_id == filters.patient_id)
+        if filters.nutritionist_id:
+            conditions.append(NutritionFeedback.nutritionist_id == filters.nutritionist_id)
+        if filters.meal_plan_id:
+            conditions.append(NutritionFeedback.meal_plan_id == filters.meal_plan_id)
+        if filters.compliance_level:
+            conditions.append(NutritionFeedback.compliance_level == filters.compliance_level)
+        if filters.start_date:
+            conditions.append(NutritionFeedback.feedback_date >= filters.start_date)
+        if filters.end_date:
+            conditions.append(NutritionFeedback.feedback_date <= filters.end_date)
+
+        patient = aliased(User)
+        nutritionist_user = aliased(User)
+        query = (
+            select(NutritionFeedback, patient.username, nutritionist_user.username, MealPlan.plan_name)
+            .join(patient, patient.id == NutritionFeedback.patient_id)
+            .join(Staff, Staff.id == NutritionFeedback.nutritionist_id)
+            .join(nutritionist_user, nutritionist_user.id == Staff.user_id)
+            .outerjoin(MealPlan, MealPlan.id == NutritionFeedback.meal_plan_id)
+            .where(and_(*conditions))
+        )
+        count_query = select(func.count()).select_from(NutritionFeedback).where(and_(*conditions))
+
+        rows, total, has_more = await self._fetch_page(
+            query, count_query, NutritionFeedback.feedback_date, NutritionFeedback.id, filters
+        )
+
+        items = [
+            NutritionFeedbackWithDetails(
+                **feedback.__dict__,
+                patient_name=patient_name,
+                nutritionist_name=nutritionist_name,
+                meal_plan_name=meal_plan_name
+            )
+            for feedback, patient_name, nutritionist_name, meal_plan_name in rows
+        ]
+
+        return NutritionFeedbackListResponse(
+            items=items,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=self._next_cursor(rows, "feedback_date") if has_more else None
+        )
+
     async def update_nutrition_feedback(self, feedback_id: str, update_data: NutritionFeedbackUpdate, system_id: str) -> NutritionFeedbackResponse:
         """Update nutrition feedback"""
         result = await self.db.execute(
@@ -254,84 +743,261 @@ class NutritionService:
             setattr(feedback, field, value)
 
         feedback.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(feedback)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
 
         return NutritionFeedbackResponse.model_validate(feedback)
 
     # Statistics and Analytics
-    async def get_nutrition_stats(self, system_id: str) -> NutritionStats:
-        """Get nutrition statistics for the system"""
-        # Total assessments
-        total_assessments = await self.db.execute(
-            select(func.count()).select_from(NutritionAssessment).where(NutritionAssessment.system_id == system_id)
+    async def get_nutrition_stats(self, system_id: str, nutritionist_id: Optional[str] = None) -> NutritionStats:
+        """
+        Get nutrition statistics for the system in a single round-trip.
+
+        Each table is aggregated once with FILTER clauses (one row per table)
+        and the three rows are joined together.
+        """
+        assessment_conditions = [NutritionAssessment.system_id == system_id]
+        plan_conditions = [MealPlan.system_id == system_id, MealPlan.is_template.is_(False)]
+        feedback_conditions = [NutritionFeedback.system_id == system_id]
+        if nutritionist_id:
+            assessment_conditions.append(NutritionAssessment.nutritionist_id == nutritionist_id)
+            plan_conditions.append(MealPlan.nutritionist_id == nutritionist_id)
+            feedback_conditions.append(NutritionFeedback.nutritionist_id == nutritionist_id)
+
+        assessments = (
+            select(func.count().label("total_assessments"))
+            .where(and_(*assessment_conditions))
+            .subquery()
         )
-
-        # Total meal plans
-        total_meal_plans = await self.db.execute(
-            select(func.count()).select_from(MealPlan).where(MealPlan.system_id == system_id)
+        plans = (
+            select(
+                func.count().label("total_meal_plans"),
+                func.count().filter(MealPlan.status == MealPlanStatus.ACTIVE).label("active_meal_plans"),
+                func.count().filter(MealPlan.status == MealPlanStatus.COMPLETED).label("completed_meal_plans"),
+                func.count(func.distinct(MealPlan.patient_id)).label("patients_with_plans"),
+            )
+            .where(and_(*plan_conditions))
+            .subquery()
+        )
+        compliance_score = case(
+            *[(NutritionFeedback.compliance_level == level, score) for level, score in COMPLIANCE_SCORES.items()]
+        )
+        feedback = (
+            select(
+                func.count().label("feedback_entries"),
+                func.avg(compliance_score).label("avg_compliance_score"),
+                *[
+                    func.count().filter(NutritionFeedback.compliance_level == level).label(level.value)
+                    for level in ComplianceLevel
+                ],
+            )
+            .where(and_(*feedback_conditions))
+            .subquery()
         )
 
-        # Total feedback entries
-        total_feedback = await self.db.execute(
-            select(func.count()).select_from(NutritionFeedback).where(NutritionFeedback.system_id == system_id)
+        result = await self.db.execute(
+            select(assessments, plans, feedback)
+            .select_from(assessments.join(plans, true()).join(feedback, true()))
         )
+        row = result.one()._mapping
 
+        avg_score = row["avg_compliance_score"]
         return NutritionStats(
-            total_assessments=total_assessments.scalar(),
-            total_meal_plans=total_meal_plans.scalar(),
-            total_feedback_entries=total_feedback.scalar(),
-            active_meal_plans=0,  # Would need additional query
-            avg_compliance_rating=0.0  # Would need additional calculation
+            total_assessments=row["total_assessments"],
+            total_meal_plans=row["total_meal_plans"],
+            active_meal_plans=row["active_meal_plans"],
+            completed_meal_plans=row["completed_meal_plans"],
+            feedback_entries=row["feedback_entries"],
+            patients_with_plans=row["patients_with_plans"],
+            compliance_distribution={level.value: row[level.value] for level in ComplianceLevel},
+            avg_compliance_score=round(float(avg_score), 2) if avg_score is not None else None
         )
 
     async def get_patient_nutrition_progress(self, patient_id: str, system_id: str) -> PatientNutritionProgress:
-        """Get nutrition progress for a specific patient"""
-        # Get patient's assessments
-        assessments_result = await self.db.execute(
-            select(NutritionAssessment)
-            .where(
+        """
+        Get nutrition progress for a specific patient.
+
+        Each history list is fetched newest first with LIMIT 3 and a
+        ``COUNT(*) OVER ()`` column for the total, so the cost does not grow
+        with the length of the patient's history.
+        """
+        result = await self.db.execute(
+            select(User.username).where(
                 and_(
-                    NutritionAssessment.patient_id == patient_id,
-                    NutritionAssessment.system_id == system_id
+                    User.id == patient_id,
+                    User.system_id == system_id
                 )
             )
-            .order_by(NutritionAssessment.assessment_date.desc())
         )
-        assessments = assessments_result.scalars().all()
+        patient_name = result.scalar_one_or_none()
+        if patient_name is None:
+            raise NotFoundError("Patient", patient_id)
 
-        # Get patient's meal plans
-        meal_plans_result = await self.db.execute(
-            select(MealPlan)
+        assessments, total_assessments = await self._recent_with_total(
+            NutritionAssessment, NutritionAssessment.assessment_date, patient_id, system_id
+        )
+        meal_plans, total_meal_plans = await self._recent_with_total(
+            MealPlan, MealPlan.created_at, patient_id, system_id
+        )
+        feedback_entries, total_feedback = await self._recent_with_total(
+            NutritionFeedback, NutritionFeedback.feedback_date, patient_id, system_id
+        )
+
+        active_plan = next((plan for plan in meal_plans if plan.status == MealPlanStatus.ACTIVE), None)
+        if active_plan is None and total_meal_plans > len(meal_plans):
+            result = await self.db.execute(
+                select(MealPlan)
+                .where(
+                    and_(
+                        MealPlan.patient_id == patient_id,
+                        MealPlan.system_id == system_id,
+                        MealPlan.status == MealPlanStatus.ACTIVE
+                    )
+                )
+                .order_by(MealPlan.created_at.desc())
+                .limit(1)
+            )
+            active_plan = result.scalar_one_or_none()
+
+        weights = [a.current_weight for a in assessments if a.current_weight is not None]
+
+        return PatientNutritionProgress(
+            patient_id=patient_id,
+            patient_name=patient_name,
+            current_weight=weights[0] if weights else None,
+            target_weight=None,
+            weight_change=weights[0] - weights[-1] if len(weights) > 1 else None,
+            active_meal_plan=_meal_plan_response(active_plan) if active_plan else None,
+            latest_feedback=NutritionFeedbackResponse.model_validate(feedback_entries[0]) if feedback_entries else None,
+            compliance_trend=_compliance_trend([f.compliance_level for f in feedback_entries]),
+            total_assessments=total_assessments,
+            total_meal_plans=total_meal_plans,
+            total_feedback_entries=total_feedback,
+            recent_assessments=[NutritionAssessmentResponse.model_validate(a) for a in assessments],
+            recent_meal_plans=[_meal_plan_response(mp) for mp in meal_plans],
+            recent_feedback=[NutritionFeedbackResponse.model_validate(f) for f in feedback_entries]
+        )
+
+    # Helper methods
+    async def _recent_with_total(self, model, sort_column, patient_id: str, system_id: str, limit: int = 3) -> Tuple[list, int]:
+        """Newest ``limit`` rows of a patient's history plus the total row count, in one query"""
+        result = await self.db.execute(
+            select(model, func.count().over().label("total"))
             .where(
                 and_(
-                    MealPlan.patient_id == patient_id,
-                    MealPlan.system_id == system_id
+                    model.patient_id == patient_id,
+                    model.system_id == system_id
                 )
             )
-            .order_by(MealPlan.created_at.desc())
+            .order_by(sort_column.desc())
+            .limit(limit)
         )
-        meal_plans = meal_plans_result.scalars().all()
+        rows = result.all()
+        return [row[0] for row in rows], (rows[0].total if rows else 0)
+
+    async def _fetch_page(self, query, count_query, sort_column, id_column, filters) -> Tuple[list, int, bool]:
+        """
+        Run the count and page queries for a list endpoint.
+
+        Pages are ordered newest first on (sort_column, id). When a cursor is
+        supplied the page seeks past it (keyset paging) instead of using OFFSET,
+        so deep pages cost the same as the first one.
+        """
+        total = (await self.db.execute(count_query)).scalar()
+
+        query = query.order_by(sort_column.desc(), id_column.desc())
+        if filters.cursor:
+            query = query.where(keyset_before(sort_column, id_column, filters.cursor))
+        else:
+            query = query.offset(filters.skip)
+
+        # Fetch one extra row to know whether another page exists
+        rows = (await self.db.execute(query.limit(filters.limit + 1))).all()
+        has_more = len(rows) > filters.limit
+        return rows[:filters.limit], total, has_more
+
+    @staticmethod
+    def _next_cursor(rows: list, sort_attr: str) -> Optional[str]:
+        if not rows:
+            return None
+        last = rows[-1][0]
+        return encode_cursor(getattr(last, sort_attr), last.id)
+
+    @staticmethod
+    def _copy_row(obj, model) -> Dict[str, Any]:
+        """Column values of ``obj`` without its id and timestamps, ready for a bulk insert"""
+        return {
+            column.key: getattr(obj, column.key)
+            for column in model.__table__.columns
+            if column.key not in ("id", "created_at", "updated_at")
+        }
+
+    async def _insert_plan_tree(self, source_plan_id: str, plan_rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert ``plan_rows`` plus a copy of the source plan's days and meals under each.
+
+        The source tree is read with two queries; rollup columns are copied as-is
+        since the copied days and meals are identical. Does not commit.
+        """
+        days = (await self.db.execute(
+            select(MealPlanDay)
+            .where(MealPlanDay.meal_plan_id == source_plan_id)
+            .order_by(MealPlanDay.day_number)
+        )).scalars().all()
+        meals = (await self.db.execute(
+            select(MealPlanMeal)
+            .join(MealPlanDay, MealPlanDay.id == MealPlanMeal.day_id)
+            .where(MealPlanDay.meal_plan_id == source_plan_id)
+        )).scalars().all()
+
+        day_templates = [self._copy_row(day, MealPlanDay) for day in days]
+        meals_by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for meal in meals:
+            meals_by_day.setdefault(meal.day_id, []).append(self._copy_row(meal, MealPlanMeal))
+
+        day_rows = []
+        meal_rows = []
+        for plan_row in plan_rows:
+            for day, day_template in zip(days, day_templates):
+                day_id = str(uuid4())
+                day_rows.append({**day_template, "id": day_id, "meal_plan_id": plan_row["id"]})
+                meal_rows.extend(
+                    {**meal_template, "id": str(uuid4()), "day_id": day_id}
+                    for meal_template in meals_by_day.get(day.id, [])
+                )
 
-        # Get patient's feedback
-        feedback_result = await self.db.execute(
-            select(NutritionFeedback)
-            .where(
+        await self.db.execute(insert(MealPlan), plan_rows)
+        if day_rows:
+            await self.db.execute(insert(MealPlanDay), day_rows)
+        if meal_rows:
+            await self.db.execute(insert(MealPlanMeal), meal_rows)
+
+    async def _get_meal_plan(self, meal_plan_id: str, system_id: str) -> MealPlan:
+        result = await self.db.execute(
+            select(MealPlan).where(
                 and_(
-                    NutritionFeedback.patient_id == patient_id,
-                    NutritionFeedback.system_id == system_id
+                    MealPlan.id == meal_plan_id,
+                    MealPlan.system_id == system_id
                 )
             )
-            .order_by(NutritionFeedback.feedback_date.desc())
         )
-        feedback_entries = feedback_result.scalars().all()
+        meal_plan = result.scalar_one_or_none()
+        if not meal_plan:
+            raise NotFoundError("Meal plan", meal_plan_id)
+        return meal_plan
 
-        return PatientNutritionProgress(
-            patient_id=patient_id,
-            total_assessments=len(assessments),
-            total_meal_plans=len(meal_plans),
-            total_feedback_entries=len(feedback_entries),
-            recent_assessments=[NutritionAssessmentResponse.model_validate(a) for a in assessments[:3]],
-            recent_meal_plans=[MealPlanResponse.model_validate(mp) for mp in meal_plans[:3]],
-            recent_feedback=[NutritionFeedbackResponse.model_validate(f) for f in feedback_entries[:3]]
+    async def _get_meal_plan_day(self, day_id: str, system_id: str) -> MealPlanDay:
+        result = await self.db.execute(
+            select(MealPlanDay)
+            .join(MealPlan, MealPlan.id == MealPlanDay.meal_plan_id)
+            .where(
+                and_(
+                    MealPlanDay.id == day_id,
+                    MealPlan.system_id == system_id
+                )
+            )
         )
+        day = result.scalar_one_or_none()
+        if not day:
+            raise NotFoundError("Meal plan day", day_id)
+        return day
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user, CurrentUser
 from app.core.permissions import require_permission, require_resource_ownership
 from app.domains.soap_notes.services.soap_notes_service import SOAPNotesService
@@ -20,7 +20,10 @@ from app.domains.soap_notes.schemas.soap_note import (
     SOAPNoteListResponse,
     SOAPNoteStats,
     SOAPNoteAttachmentCreate,
-    SOAPNoteAttachmentResponse
+    SOAPNoteAttachmentResponse,
+    SOAPNoteAttachmentUploadRequest,
+    SOAPNoteAttachmentUploadTicket,
+    AttachmentDownloadUrl
 )
 from app.shared.schemas.enums import ModuleCategory
 from app.core.exceptions import NotFoundError, AuthorizationError, ValidationError
@@ -32,7 +35,7 @@ router = APIRouter()
 @require_permission(ModuleCategory.PHYSICIAN, "view")
 async def list_soap_notes(
     filters: SOAPNoteListFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
     """
@@ -63,7 +66,7 @@ async def list_soap_notes(
 @require_permission(ModuleCategory.PHYSICIAN, "view")
 async def get_soap_notes_stats(
     physician_id: str = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
     """
@@ -202,6 +205,32 @@ async def sign_soap_note(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/{note_id}/attachments/uploads", response_model=SOAPNoteAttachmentUploadTicket, status_code=status.HTTP_201_CREATED)
+@require_permission(ModuleCategory.PHYSICIAN, "create")
+async def create_attachment_upload(
+    note_id: str,
+    upload_request: SOAPNoteAttachmentUploadRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get a presigned URL for uploading an attachment file directly to storage
+    
+    Upload the file, then create the attachment with the returned `s3_key`.
+    
+    **Permissions:** Only the creating Physician can add attachments.
+    """
+    service = SOAPNotesService(db)
+    
+    try:
+        return await service.create_attachment_upload(note_id, upload_request, current_user.userId)
+    
+    except (NotFoundError, AuthorizationError) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{note_id}/attachments", response_model=SOAPNoteWithAttachments, status_code=status.HTTP_201_CREATED)
 @require_permission(ModuleCategory.PHYSICIAN, "create")
 async def add_attachment(
@@ -224,7 +253,31 @@ async def add_attachment(
         note = await service.add_attachment(note_id, attachment_data, current_user.userId)
         return note
     
-    except (NotFoundError, AuthorizationError) as e:
+    except (NotFoundError, AuthorizationError, ValidationError) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{note_id}/attachments/{attachment_id}/download-url", response_model=AttachmentDownloadUrl)
+@require_permission(ModuleCategory.PHYSICIAN, "view")
+async def get_attachment_download_url(
+    note_id: str,
+    attachment_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get a short-lived URL for downloading an attachment
+    
+    **Permissions:** Physicians of the note's system
+    """
+    service = SOAPNotesService(db)
+    
+    try:
+        return await service.get_attachment_download_url(note_id, attachment_id, current_user.systemId)
+    
+    except NotFoundError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,14 +2,13 @@
 Service layer for SOAP Notes (Physician clinical documentation)
 """
 from typing import Optional, List
+from uuid import uuid4
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
 from sqlalchemy.orm import joinedload
 
-from app.domains.soap_notes.models.soap_note import SOAPNote, SOAPNoteAttachment
-from app.domains.user.models.user import User
-from app.domains.staff.models.staff import Staff
+from app.shared.models import SOAPNote, SOAPNoteAttachment, User, Staff
 from app.domains.soap_notes.schemas.soap_note import (
     SOAPNoteCreate,
     SOAPNoteUpdate,
@@ -19,10 +18,15 @@ from app.domains.soap_notes.schemas.soap_note import (
     SOAPNoteWithDetails,
     SOAPNoteListFilter,
     SOAPNoteStats,
-    SOAPNoteAttachmentCreate
+    SOAPNoteAttachmentCreate,
+    SOAPNoteAttachmentUploadRequest,
+    SOAPNoteAttachmentUploadTicket,
+    AttachmentDownloadUrl
 )
-from app.shared.schemas.enums import SOAPNoteStatus
+from app.shared.schemas.enums import AuditActionType, SOAPNoteStatus
 from app.core.exceptions import NotFoundError, AuthorizationError, ValidationError
+from app.infrastructure.storage.s3 import get_storage, upload_key, format_file_size
+from app.infrastructure.audit.writer import audit_on_commit
 
 
 class SOAPNotesService:
@@ -65,8 +69,8 @@ class SOAPNotesService:
         )
         
         self.db.add(soap_note)
-        await self.db.commit()
-        await self.db.refresh(soap_note)
+        await self.db.flush()
+        audit_on_commit(self.db, AuditActionType.CREATE, "SOAP_NOTE", soap_note.id)
         
         return SOAPNoteResponse.model_validate(soap_note)
     
@@ -221,8 +225,9 @@ class SOAPNotesService:
         
         note.updated_at = datetime.utcnow()
         
-        await self.db.commit()
-        await self.db.refresh(note)
+        await self.db.flush()
+        # Field names only: the values are clinical content
+        audit_on_commit(self.db, AuditActionType.UPDATE, "SOAP_NOTE", note.id, changes={"fields": sorted(update_data)})
         
         return SOAPNoteResponse.model_validate(note)
     
@@ -254,8 +259,8 @@ class SOAPNotesService:
         note.signed_at = datetime.utcnow()
         note.updated_at = datetime.utcnow()
         
-        await self.db.commit()
-        await self.db.refresh(note)
+        await self.db.flush()
+        audit_on_commit(self.db, AuditActionType.UPDATE, "SOAP_NOTE", note.id, description="Signed")
         
         return SOAPNoteResponse.model_validate(note)
     
@@ -271,43 +276,91 @@ class SOAPNotesService:
             raise NotFoundError("SOAP Note", note_id)
         
         await self.db.delete(note)
-        await self.db.commit()
+        audit_on_commit(self.db, AuditActionType.DELETE, "SOAP_NOTE", note_id)
         
         return True
     
+    async def create_attachment_upload(
+        self,
+        note_id: str,
+        upload_request: SOAPNoteAttachmentUploadRequest,
+        current_user_id: str
+    ) -> SOAPNoteAttachmentUploadTicket:
+        """Reserve a storage key for an attachment and presign its direct upload"""
+        
+        await self._get_owned_note(note_id, current_user_id)
+        
+        storage = get_storage()
+        s3_key = upload_key(f"soap-notes/{note_id}/attachments", str(uuid4()), upload_request.file_name)
+        upload = storage.presigned_upload(s3_key, upload_request.content_type)
+        
+        return SOAPNoteAttachmentUploadTicket(
+            s3_key=s3_key,
+            upload_url=upload["url"],
+            upload_fields=upload["fields"],
+            expires_in=storage.expires_in
+        )
+    
     async def add_attachment(
         self,
         note_id: str,
         attachment_data: SOAPNoteAttachmentCreate,
         current_user_id: str
     ) -> SOAPNoteWithAttachments:
-        """Add an attachment to a SOAP note"""
+        """Add an attachment to a SOAP note once its file has been uploaded"""
         
-        note = await self._get_note(note_id)
-        if not note:
-            raise NotFoundError("SOAP Note", note_id)
+        await self._get_owned_note(note_id, current_user_id)
         
-        # Verify ownership
-        physician = await self._get_staff_by_user_id(current_user_id)
-        if not physician or note.physician_id != physician.id:
-            raise AuthorizationError("Only the creating physician can add attachments")
+        if not attachment_data.s3_key.startswith(f"soap-notes/{note_id}/"):
+            raise ValidationError("Attachment file does not belong to this SOAP note")
+        
+        storage = get_storage()
+        stored = storage.head(attachment_data.s3_key)
+        if stored is None:
+            raise ValidationError("Attachment file has not been uploaded")
         
         # Create attachment
         attachment = SOAPNoteAttachment(
             soap_note_id=note_id,
             file_type=attachment_data.file_type,
-            file_url=attachment_data.file_url,
             file_name=attachment_data.file_name,
+            s3_key=attachment_data.s3_key,
+            s3_url=storage.object_url(attachment_data.s3_key),
+            file_size=format_file_size(stored["ContentLength"]),
             description=attachment_data.description
         )
         
         self.db.add(attachment)
-        await self.db.commit()
-        await self.db.refresh(attachment)
+        await self.db.flush()
         
         # Return note with attachments
         return await self.get_soap_note(note_id, include_attachments=True)
     
+    async def get_attachment_download_url(self, note_id: str, attachment_id: str, system_id: str) -> AttachmentDownloadUrl:
+        """Short-lived presigned URL for downloading an attachment of a note written in ``system_id``"""
+        
+        result = await self.db.execute(
+            select(SOAPNoteAttachment)
+            .join(SOAPNote, SOAPNote.id == SOAPNoteAttachment.soap_note_id)
+            .join(Staff, Staff.id == SOAPNote.physician_id)
+            .where(
+                and_(
+                    SOAPNoteAttachment.id == attachment_id,
+                    SOAPNoteAttachment.soap_note_id == note_id,
+                    Staff.system_id == system_id
+                )
+            )
+        )
+        attachment = result.scalar_one_or_none()
+        if not attachment:
+            raise NotFoundError("Attachment", attachment_id)
+        
+        storage = get_storage()
+        return AttachmentDownloadUrl(
+            url=storage.presigned_download(attachment.s3_key, attachment.file_name),
+            expires_in=storage.expires_in
+        )
+    
     async def get_stats(self, physician_id: Optional[str] = None) -> SOAPNoteStats:
         """Get SOAP notes statistics"""
         
@@ -368,6 +421,17 @@ class SOAPNotesService:
     
     # Helper methods
     
+    async def _get_owned_note(self, note_id: str, current_user_id: str) -> SOAPNote:
+        """Get a SOAP note the current user authored; only its physician may attach files"""
+        note = await self._get_note(note_id)
+        if not note:
+            raise NotFoundError("SOAP Note", note_id)
+        
+        physician = await self._get_staff_by_user_id(current_user_id)
+        if not physician or note.physician_id != physician.id:
+            raise AuthorizationError("Only the creating physician can add attachments")
+        return note
+    
     async def _get_note(self, note_id: str) -> Optional[SOAPNote]:
         """Get SOAP note by ID"""
         result = await self.db.execute(
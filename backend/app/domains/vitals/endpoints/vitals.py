@@ -1,11 +1,12 @@
 """
 API endpoints for Vitals Recording (Nurse data capture)
 """
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_user, CurrentUser
 from app.shared.schemas.vitals import (
     VitalsRecordCreate,
@@ -17,9 +18,11 @@ from app.shared.schemas.vitals import (
     VitalsRecordListFilter,
     VitalsRecordListResponse,
     VitalsStats,
-    PatientVitalsTrends
+    PatientVitalsTrends,
+    PatientAnthropometricSeries
 )
 from app.domains.vitals.services.vitals_service import VitalsService
+from app.infrastructure.cache.response_cache import CachedResponse, cache_response
 
 router = APIRouter()
 
@@ -27,7 +30,7 @@ router = APIRouter()
 @router.get("/", response_model=VitalsRecordListResponse)
 async def list_vitals_records(
     filters: VitalsRecordListFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user)
 ):
     """
@@ -116,8 +119,9 @@ async def update_vitals_record(
 async def get_patient_vitals_trends(
     patient_id: str,
     days: int = 30,
-    db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    cache: CachedResponse = Depends(cache_response("vitals"))
 ):
     """
     Get vitals trends for a specific patient
@@ -136,15 +140,45 @@ async def get_patient_vitals_trends(
         )
     
     try:
-        return await service.get_patient_vitals_trends(patient_id, days, current_user.systemId)
+        return await cache.fetch(lambda: service.get_patient_vitals_trends(patient_id, days, current_user.systemId))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.get("/patients/{patient_id}/anthropometrics", response_model=PatientAnthropometricSeries)
+async def get_patient_anthropometric_series(
+    patient_id: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    max_points: int = Query(200, ge=10, le=2000, description="Longer histories are averaged into this many time buckets"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    cache: CachedResponse = Depends(cache_response("vitals", depends_on=("nutrition",)))
+):
+    """
+    Get a patient's weight/BMI series merged from vitals and nutrition records
+    
+    **Permissions:** Staff can view any patient. Patients see only their own.
+    """
+    is_staff = current_user.role in ["admin", "physician", "nutritionist", "nurse"]
+    
+    if not is_staff and current_user.userId != patient_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: You can only view your own measurements"
+        )
+    
+    service = VitalsService(db)
+    return await cache.fetch(lambda: service.get_patient_anthropometric_series(
+        patient_id, current_user.systemId, start_date, end_date, max_points
+    ))
+
+
 @router.get("/stats", response_model=VitalsStats)
 async def get_vitals_stats(
-    db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    cache: CachedResponse = Depends(cache_response("vitals"))
 ):
     """
     Get vitals statistics for the system
@@ -163,7 +197,7 @@ async def get_vitals_stats(
     service = VitalsService(db)
     
     try:
-        return await service.get_vitals_stats(current_user.systemId)
+        return await cache.fetch(lambda: service.get_vitals_stats(current_user.systemId))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -0,0 +1,130 @@
+"""
+Weight/BMI time-series math for the unified anthropometric series.
+
+Rows arrive from SQL already merged across vitals, nutrition assessments and
+nutrition feedback and ordered by time; this module turns them into NumPy
+arrays, downsamples long histories into equal-width time buckets and computes
+point-to-point deltas and rates of change.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+SECONDS_PER_WEEK = 7 * 24 * 60 * 60
+
+# Source label used for points that average several raw readings
+AGGREGATE_SOURCE = "aggregate"
+
+
+def _to_array(values: Sequence[Any]) -> np.ndarray:
+    """Float array with NaN for missing values (Decimal/None safe)"""
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=float)
+
+
+def _epoch_seconds(moment: datetime) -> float:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _round(value: float, digits: int = 2) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def downsample(rows: Sequence[Any], max_points: int) -> List[Dict[str, Any]]:
+    """
+    Reduce ``rows`` (objects with recorded_at, source, weight, bmi) to at most
+    ``max_points`` points.
+
+    The time range is split into ``max_points`` equal-width buckets; each
+    non-empty bucket becomes one point at the mean timestamp of its readings
+    with the mean of its non-missing weights and BMIs. Series that already
+    fit are returned unchanged, one point per row.
+    """
+    if len(rows) <= max_points:
+        return [
+            {
+                "recorded_at": row.recorded_at,
+                "source": row.source,
+                "weight": _round(_to_array([row.weight])[0]),
+                "bmi": _round(_to_array([row.bmi])[0]),
+                "sample_count": 1,
+            }
+            for row in rows
+        ]
+
+    times = np.array([_epoch_seconds(row.recorded_at) for row in rows], dtype=float)
+    weights = _to_array([row.weight for row in rows])
+    bmis = _to_array([row.bmi for row in rows])
+
+    edges = np.linspace(times[0], times[-1], max_points + 1)
+    # Bucket index per reading; the last edge is inclusive
+    buckets = np.clip(np.searchsorted(edges, times, side="right") - 1, 0, max_points - 1)
+
+    counts = np.bincount(buckets, minlength=max_points)
+    time_sums = np.bincount(buckets, weights=times, minlength=max_points)
+
+    def bucket_mean(values: np.ndarray) -> np.ndarray:
+        present = ~np.isnan(values)
+        sums = np.bincount(buckets[present], weights=values[present], minlength=max_points)
+        present_counts = np.bincount(buckets[present], minlength=max_points)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(present_counts > 0, sums / present_counts, np.nan)
+
+    weight_means = bucket_mean(weights)
+    bmi_means = bucket_mean(bmis)
+
+    points = []
+    for index in np.flatnonzero(counts):
+        points.append({
+            "recorded_at": datetime.fromtimestamp(time_sums[index] / counts[index], tz=timezone.utc),
+            "source": AGGREGATE_SOURCE if counts[index] > 1 else rows[int(np.argmax(buckets == index))].source,
+            "weight": _round(weight_means[index]),
+            "bmi": _round(bmi_means[index]),
+            "sample_count": int(counts[index]),
+        })
+    return points
+
+
+def add_weight_deltas(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Set ``weight_delta`` (kg since the previous point with a weight) and
+    ``weight_rate_per_week`` (that delta per elapsed week) on each point.
+    Points without a weight, and the first weighed point, get None.
+    """
+    weights = _to_array([point["weight"] for point in points])
+    times = np.array([_epoch_seconds(point["recorded_at"]) for point in points], dtype=float)
+
+    for point in points:
+        point["weight_delta"] = None
+        point["weight_rate_per_week"] = None
+
+    weighed = np.flatnonzero(~np.isnan(weights))
+    if len(weighed) < 2:
+        return points
+
+    deltas = np.diff(weights[weighed])
+    weeks = np.diff(times[weighed]) / SECONDS_PER_WEEK
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rates = np.where(weeks > 0, deltas / weeks, np.nan)
+
+    for index, delta, rate in zip(weighed[1:], deltas, rates):
+        points[index]["weight_delta"] = _round(delta)
+        points[index]["weight_rate_per_week"] = _round(rate, 3)
+    return points
+
+
+def weight_trend_per_week(rows: Sequence[Any]) -> Optional[float]:
+    """Least-squares slope of weight over time in kg/week; None with fewer than two weights"""
+    weights = _to_array([row.weight for row in rows])
+    present = ~np.isnan(weights)
+    if present.sum() < 2:
+        return None
+
+    times = np.array([_epoch_seconds(row.recorded_at) for row in rows], dtype=float)[present]
+    weeks = (times - times[0]) / SECONDS_PER_WEEK
+    if np.ptp(weeks) == 0:
+        return None
+    slope, _ = np.polyfit(weeks, weights[present], 1)
+    return round(float(slope), 3)
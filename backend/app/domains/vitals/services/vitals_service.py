@@ -4,11 +4,11 @@ Service layer for Vitals Recording (Nurse data capture)
 from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, and_, or_, func, literal, null, cast, Numeric, union_all
 from sqlalchemy.orm import joinedload
 from decimal import Decimal
 
-from app.shared.models import VitalsRecord, VitalsAlert, User, Staff
+from app.shared.models import VitalsRecord, VitalsAlert, User, Staff, NutritionAssessment, NutritionFeedback
 from app.shared.schemas.vitals import (
     VitalsRecordCreate,
     VitalsRecordUpdate,
@@ -21,9 +21,19 @@ from app.shared.schemas.vitals import (
     VitalsRecordListFilter,
     VitalsStats,
     PatientVitalsTrends,
+    PatientAnthropometricSeries,
+    AnthropometricPoint,
     VitalsRange
 )
-from app.shared.schemas.enums import VitalsStatus, AlertSeverity
+from app.shared.schemas.enums import AuditActionType, VitalsStatus, AlertSeverity
+from app.core.exceptions import NotFoundError
+from app.domains.vitals.services.anthropometrics import (
+    downsample,
+    add_weight_deltas,
+    weight_trend_per_week,
+)
+from app.infrastructure.cache.response_cache import invalidate_on_commit
+from app.infrastructure.audit.writer import audit_on_commit
 
 
 class VitalsService:
@@ -68,11 +78,12 @@ class VitalsService:
         )
 
         self.db.add(vitals_record)
-        await self.db.commit()
-        await self.db.refresh(vitals_record)
+        await self.db.flush()
 
         # Check for vitals alerts
         await self._check_vitals_alerts(vitals_record)
+        invalidate_on_commit(self.db, "vitals", nurse.system_id)
+        audit_on_commit(self.db, AuditActionType.CREATE, "VITALS", vitals_record.id)
 
         return VitalsRecordResponse.model_validate(vitals_record)
 
@@ -123,15 +134,17 @@ class VitalsService:
             raise NotFoundError("Vitals record not found")
 
         # Update fields
-        for field, value in update_data.model_dump(exclude_unset=True).items():
+        changes = update_data.model_dump(exclude_unset=True)
+        for field, value in changes.items():
             setattr(record, field, value)
 
         record.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(record)
+        await self.db.flush()
 
         # Check for new vitals alerts
         await self._check_vitals_alerts(record)
+        invalidate_on_commit(self.db, "vitals", system_id)
+        audit_on_commit(self.db, AuditActionType.UPDATE, "VITALS", record.id, changes={"fields": sorted(changes)})
 
         return VitalsRecordResponse.model_validate(record)
 
@@ -215,6 +228,93 @@ class VitalsService:
             records=[VitalsRecordResponse.model_validate(record) for record in records]
         )
 
+    async def get_patient_anthropometric_series(
+        self,
+        patient_id: str,
+        system_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_points: int = 200
+    ) -> PatientAnthropometricSeries:
+        """
+        Get a patient's weight/BMI history from every source as one time series.
+
+        Vitals records, nutrition assessments and nutrition feedback are merged
+        in SQL with UNION ALL and ordered by time; deltas, rates and bucket
+        averages for long histories are computed with NumPy.
+        """
+        result = await self.db.execute(
+            select(User.id).where(
+                and_(
+                    User.id == patient_id,
+                    User.system_id == system_id
+                )
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError("Patient", patient_id)
+
+        vitals = select(
+            literal("vitals").label("source"),
+            VitalsRecord.recorded_at.label("recorded_at"),
+            VitalsRecord.weight.label("weight"),
+            VitalsRecord.bmi.label("bmi"),
+        ).where(
+            and_(
+                VitalsRecord.patient_id == patient_id,
+                or_(VitalsRecord.weight.isnot(None), VitalsRecord.bmi.isnot(None))
+            )
+        )
+        assessments = select(
+            literal("nutrition_assessment").label("source"),
+            NutritionAssessment.assessment_date.label("recorded_at"),
+            NutritionAssessment.current_weight.label("weight"),
+            NutritionAssessment.bmi.label("bmi"),
+        ).where(
+            and_(
+                NutritionAssessment.patient_id == patient_id,
+                NutritionAssessment.system_id == system_id,
+                or_(NutritionAssessment.current_weight.isnot(None), NutritionAssessment.bmi.isnot(None))
+            )
+        )
+        feedback = select(
+            literal("nutrition_feedback").label("source"),
+            NutritionFeedback.feedback_date.label("recorded_at"),
+            NutritionFeedback.current_weight.label("weight"),
+            cast(null(), Numeric(4, 2)).label("bmi"),
+        ).where(
+            and_(
+                NutritionFeedback.patient_id == patient_id,
+                NutritionFeedback.system_id == system_id,
+                NutritionFeedback.current_weight.isnot(None)
+            )
+        )
+
+        series = union_all(vitals, assessments, feedback).subquery()
+        query = select(series)
+        if start_date:
+            query = query.where(series.c.recorded_at >= start_date)
+        if end_date:
+            query = query.where(series.c.recorded_at <= end_date)
+        rows = (await self.db.execute(query.order_by(series.c.recorded_at, series.c.source))).all()
+
+        weights = [row.weight for row in rows if row.weight is not None]
+        bmis = [row.bmi for row in rows if row.bmi is not None]
+        points = add_weight_deltas(downsample(rows, max_points))
+
+        return PatientAnthropometricSeries(
+            patient_id=patient_id,
+            start_date=start_date,
+            end_date=end_date,
+            total_readings=len(rows),
+            downsampled=len(rows) > max_points,
+            current_weight=float(weights[-1]) if weights else None,
+            current_bmi=float(bmis[-1]) if bmis else None,
+            weight_change=round(float(weights[-1] - weights[0]), 2) if len(weights) > 1 else None,
+            weight_trend_per_week=weight_trend_per_week(rows),
+            points=[AnthropometricPoint(**point) for point in points]
+        )
+
     async def get_vitals_stats(self, system_id: str) -> VitalsStats:
         """Get vitals statistics for the system"""
         # Total records
@@ -277,8 +377,8 @@ class VitalsService:
         alert.acknowledged_at = datetime.now()
         alert.acknowledgment_notes = acknowledge_data.notes
 
-        await self.db.commit()
-        await self.db.refresh(alert)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "vitals", system_id)
 
         return VitalsAlertResponse.model_validate(alert)
 
@@ -366,4 +466,3 @@ class VitalsService:
         # Add alerts to database
         if alerts:
             self.db.add_all(alerts)
-            await self.db.commit()
@@ -0,0 +1,360 @@
+"""
+Asynchronous, batched audit log writer.
+
+Services record audit events without writing to the database themselves:
+
+    audit_on_commit(self.db, AuditActionType.UPDATE, "VITALS", record.id)
+
+The event is captured at once (id, timestamp, and the actor and client
+from the request context) and queued when the request's transaction
+commits, so rolled-back work is never audited (a service that commits
+itself calls ``audit_committed`` after its commit instead). Queueing is a
+``put_nowait`` on a bounded in-process queue; one background task per
+process drains it and writes up to ``AUDIT_BATCH_SIZE`` events with a
+single multi-row INSERT.
+
+Backpressure: while the queue is full (the database is slow or down) a
+request waits up to ``AUDIT_ENQUEUE_TIMEOUT_SECONDS`` for room, then
+spills its event to disk instead of dropping it. Batches still failing
+after ``AUDIT_WRITE_RETRIES`` attempts, and whatever is queued at
+shutdown, are spilled too. Spill files are fsynced JSON lines under
+``AUDIT_SPILL_DIR``, written on the next startup; inserts skip ids that
+already exist, so writing a spilled event twice is harmless.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.core.database import on_commit
+from app.shared.models.audit_log import AuditLog
+from core.request_context import request_actor, request_client
+from schemas.enums import AuditActionType
+
+logger = logging.getLogger(__name__)
+
+SPILL_PREFIX = "audit-"
+SPILL_SUFFIX = ".jsonl"
+RETRY_BACKOFF_SECONDS = 0.5
+
+AuditEvent = Dict[str, Any]
+
+
+def audit_event(
+    action_type: AuditActionType,
+    entity_type: str,
+    entity_id: Optional[str] = None,
+    description: Optional[str] = None,
+    changes: Optional[Any] = None,
+    user_id: Optional[str] = None,
+) -> AuditEvent:
+    """An audit_logs row, attributed to the current request's user and client unless ``user_id`` is given"""
+    ip_address, user_agent = request_client.get()
+    return {
+        "id": str(uuid4()),
+        "user_id": user_id or request_actor.get(),
+        "action_type": action_type,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "description": description,
+        "changes": changes,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def _row(event: AuditEvent) -> AuditEvent:
+    # Serialization is left to the writer task, off the request path
+    changes = event["changes"]
+    if changes is not None and not isinstance(changes, str):
+        changes = json.dumps(changes, default=str)
+    return {**event, "action_type": AuditActionType(event["action_type"]), "changes": changes}
+
+
+def _dump(row: AuditEvent) -> str:
+    return json.dumps({
+        **row,
+        "action_type": row["action_type"].value,
+        "created_at": row["created_at"].isoformat(),
+    })
+
+
+def _load(line: str) -> AuditEvent:
+    row = json.loads(line)
+    row["action_type"] = AuditActionType(row["action_type"])
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class AuditMetrics:
+    """Audit pipeline counters for this process"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+        self.write_failures = 0  # failed batch attempts, retried or spilled
+        self.backpressure_waits = 0  # requests that found the queue full
+        self.spilled = 0
+        self.replayed = 0
+
+
+class AuditLogWriter:
+    def __init__(
+        self,
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        enqueue_timeout: float,
+        retries: int,
+        shutdown_timeout: float,
+        spill_dir: str,
+        db_engine: Optional[AsyncEngine] = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.retries = retries
+        self.shutdown_timeout = shutdown_timeout
+        self.spill_dir = spill_dir
+        self.engine = db_engine
+        self.metrics = AuditMetrics()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._inflight: List[AuditEvent] = []  # taken off the queue, not yet written
+        self._task: Optional[asyncio.Task] = None
+        self._replay_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def enqueue(self, event: AuditEvent) -> None:
+        """Queue an event for the writer task; never raises"""
+        if self._closed:
+            self.spill([event])
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.metrics.backpressure_waits += 1
+            try:
+                await asyncio.wait_for(self.queue.put(event), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.spill([event])
+                return
+        self.metrics.enqueued += 1
+
+    async def run(self) -> None:
+        """Write queued events in batches; run as a task for the app's lifetime"""
+        queue = self.queue
+        while True:
+            batch = self._inflight = [await queue.get()]
+            if queue.qsize() < self.batch_size - 1:
+                # Let a batch build up rather than write a row per request
+                await asyncio.sleep(self.flush_interval)
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            await self.write(batch)
+            self._inflight = []
+            for _ in batch:
+                queue.task_done()
+
+    async def write(self, events: Sequence[AuditEvent]) -> bool:
+        """Insert events in one statement, retrying; spills them if every attempt fails"""
+        rows = [_row(event) for event in events]
+        statement = insert(AuditLog.__table__).on_conflict_do_nothing(index_elements=["id"])
+        for attempt in range(1, self.retries + 1):
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(statement, rows)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.write_failures += 1
+                logger.warning(
+                    "Audit batch of %d events failed (attempt %d/%d): %s",
+                    len(rows), attempt, self.retries, e,
+                )
+                if attempt < self.retries:
+                    await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            else:
+                self.metrics.written += len(rows)
+                self.metrics.batches += 1
+                return True
+        self.spill(rows)
+        return False
+
+    def spill(self, events: Sequence[AuditEvent]) -> None:
+        """Save events to a new spill file, synced to disk, for the next startup to write"""
+        if not events:
+            return
+        lines = [_dump(_row(event)) for event in events]
+        path = os.path.join(self.spill_dir, f"{SPILL_PREFIX}{os.getpid()}-{time.time_ns()}{SPILL_SUFFIX}")
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            # Written under a temporary name so a replay never reads half a file
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            # Last resort: the events are at least in the logs
+            logger.error("Could not spill %d audit events (%s): %s", len(lines), e, "\n".join(lines))
+            return
+        self.metrics.spilled += len(lines)
+        logger.warning("Spilled %d audit events to %s", len(lines), path)
+
+    async def replay_spilled(self) -> None:
+        """Write events spilled by earlier runs; a file is removed once its events are written or spilled again"""
+        try:
+            names = sorted(os.listdir(self.spill_dir))
+        except FileNotFoundError:
+            return
+        for name in names:
+            if not (name.startswith(SPILL_PREFIX) and name.endswith(SPILL_SUFFIX)):
+                continue
+            path = os.path.join(self.spill_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    lines = [line for line in f if line.strip()]
+            except FileNotFoundError:
+                continue  # replayed by another process starting alongside this one
+            rows = []
+            for line in lines:
+                try:
+                    rows.append(_load(line))
+                except (ValueError, KeyError) as e:
+                    logger.error("Skipping unreadable spilled audit event (%s): %s", e, line.strip())
+            for start in range(0, len(rows), self.batch_size):
+                await self.write(rows[start:start + self.batch_size])
+            self.metrics.replayed += len(rows)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def start(self, db_engine: Optional[AsyncEngine] = None) -> None:
+        """
+        Start the writer task and replay spill files (app startup). The app
+        passes its own engine, so audit writes share the pool it reports on.
+        """
+        if db_engine is not None:
+            self.engine = db_engine
+        self._closed = False
+        self._task = asyncio.create_task(self.run())
+        self._replay_task = asyncio.create_task(self.replay_spilled())
+
+    async def stop(self) -> None:
+        """Write what is queued, for up to ``shutdown_timeout`` seconds, and spill the rest (app shutdown)"""
+        self._closed = True
+        if self._replay_task is not None:
+            # A file it had not finished is replayed again next time
+            self._replay_task.cancel()
+            await asyncio.gather(self._replay_task, return_exceptions=True)
+            self._replay_task = None
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self.queue.join(), self.shutdown_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Audit queue not drained within %ss", self.shutdown_timeout)
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        leftover = self._inflight
+        self._inflight = []
+        while not self.queue.empty():
+            leftover.append(self.queue.get_nowait())
+            self.queue.task_done()
+        self.spill(leftover)
+
+    def snapshot(self) -> Dict[str, Any]:
+        metrics = self.metrics
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queued": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "enqueued": metrics.enqueued,
+            "written": metrics.written,
+            "batches": metrics.batches,
+            "write_failures": metrics.write_failures,
+            "backpressure_waits": metrics.backpressure_waits,
+            "spilled": metrics.spilled,
+            "replayed": metrics.replayed,
+        }
+
+
+class AuditContextMiddleware:
+    """ASGI middleware noting each request's client address and user agent for its audit events"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            client = scope.get("client")
+            user_agent = next(
+                (value.decode("latin-1") for name, value in scope["headers"] if name == b"user-agent"),
+                None,
+            )
+            request_client.set((client[0] if client else None, user_agent))
+        await self.app(scope, receive, send)
+
+
+audit_log = AuditLogWriter(
+    queue_size=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    enqueue_timeout=settings.AUDIT_ENQUEUE_TIMEOUT_SECONDS,
+    retries=settings.AUDIT_WRITE_RETRIES,
+    shutdown_timeout=settings.AUDIT_SHUTDOWN_TIMEOUT_SECONDS,
+    spill_dir=settings.AUDIT_SPILL_DIR,
+)
+
+
+def audit_on_commit(
+    db: AsyncSession,
+    action_type: AuditActionType,
+    entity_type: str,
+    entity_id: Optional[str] = None,
+    description: Optional[str] = None,
+    changes: Optional[Any] = None,
+    user_id: Optional[str] = None,
+) -> None:
+    """Record an audit event once the request's transaction commits (nothing if it rolls back)"""
+    event = audit_event(action_type, entity_type, entity_id, description, changes, user_id)
+    pending = db.info.get("audit_events")
+    if pending is None:
+        pending = db.info["audit_events"] = []
+
+        async def enqueue_events() -> None:
+            for queued in db.info.pop("audit_events", ()):
+                await audit_log.enqueue(queued)
+
+        on_commit(db, enqueue_events)
+    pending.append(event)
+
+
+async def audit_committed(
+    action_type: AuditActionType,
+    entity_type: str,
+    entity_id: Optional[str] = None,
+    description: Optional[str] = None,
+    changes: Optional[Any] = None,
+    user_id: Optional[str] = None,
+) -> None:
+    """
+    Record an audit event for work the service has already committed itself.
+    Queued at once: a hook registered after an explicit commit would wait for
+    the request's closing commit and be lost if the request then failed.
+    """
+    await audit_log.enqueue(audit_event(action_type, entity_type, entity_id, description, changes, user_id))
@@ -0,0 +1,141 @@
+"""
+Cache backends for the response cache.
+
+``RedisCacheBackend`` is shared by every API process: entries are plain keys
+with a TTL, and each tag is a Redis set of the keys stored under it, so
+invalidating a tag deletes exactly those entries. ``MemoryCacheBackend``
+keeps the same contract inside one process, for tests and local
+development without Redis.
+
+The backend is created in the app's lifespan (``init_cache``) with one
+connection pool per process, or lazily on first use when no lifespan ran.
+"""
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+TAG_PREFIX = "cache:tag:"
+
+
+class MemoryCacheBackend:
+    """Process-local LRU with TTLs and tags"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, float, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = defaultdict(set)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        self._discard(key)
+        tags = tuple(tags)
+        self._entries[key] = (value, time.monotonic() + ttl, tags)
+        for tag in tags:
+            self._tags[tag].add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        keys = set()
+        for tag in tags:
+            keys |= self._tags.pop(tag, set())
+        for key in keys:
+            self._discard(key)
+        return len(keys)
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend:
+    def __init__(self, client: redis.Redis):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ttl)
+            for tag in tags:
+                tag_key = TAG_PREFIX + tag
+                pipe.sadd(tag_key, key)
+                # A tag lives as long as its longest-lived entry
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        tag_keys = [TAG_PREFIX + tag for tag in tags]
+        if not tag_keys:
+            return 0
+        keys = await self.client.sunion(tag_keys)
+        await self.client.unlink(*keys, *tag_keys)
+        return len(keys)
+
+    async def close(self) -> None:
+        await self.client.aclose(close_connection_pool=True)
+
+
+CacheBackend = Union[MemoryCacheBackend, RedisCacheBackend]
+
+_backend: Optional[CacheBackend] = None
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(settings.CACHE_MEMORY_MAX_ENTRIES)
+    pool = redis.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.CACHE_REDIS_MAX_CONNECTIONS,
+        timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+        socket_timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+    )
+    return RedisCacheBackend(redis.Redis(connection_pool=pool))
+
+
+def get_cache() -> CacheBackend:
+    global _backend
+    if _backend is None:
+        _backend = create_cache_backend()
+    return _backend
+
+
+async def init_cache() -> None:
+    """Create this process's cache backend and its connection pool (app startup)"""
+    global _backend
+    await close_cache()
+    _backend = create_cache_backend()
+
+
+async def close_cache() -> None:
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
@@ -0,0 +1,221 @@
+"""
+Caching of GET endpoint responses.
+
+An endpoint opts in with a dependency and hands its work to ``fetch``:
+
+    @router.get("/stats", response_model=VitalsStats)
+    async def get_vitals_stats(
+        ...,
+        cache: CachedResponse = Depends(cache_response("vitals")),
+    ):
+        return await cache.fetch(lambda: service.get_vitals_stats(system_id))
+
+Entries are keyed by tenant, user (unless ``per_user=False``), path and
+query string, and stored as the serialized JSON body. Each entry is tagged
+with its namespaces per tenant; services call ``invalidate_on_commit`` on
+writes, which drops the tenant's entries in those namespaces once the
+request's transaction commits. Cached endpoints read from the replica, which
+may lag the commit, so when one is configured the invalidation is repeated
+``CACHE_REPLICA_LAG_SECONDS`` later. Celery tasks, which have no request,
+use ``app.workers.cache_tasks``. Cache failures never fail a request: they
+are counted and the response is computed from the database.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Set
+from urllib.parse import urlencode
+
+from fastapi import Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import on_commit
+from app.core.dependencies import CurrentUser, get_current_user
+from app.infrastructure.cache.backends import get_cache
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_KEY_PREFIX = "cache:resp:"
+
+
+class CacheMetrics:
+    """Hit, miss and error counts per cache namespace, for this process"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.invalidated = 0  # entries dropped by tag invalidation
+
+    def snapshot(self) -> Dict[str, Any]:
+        namespaces = {}
+        for namespace in sorted(set(self.hits) | set(self.misses) | set(self.errors)):
+            hits, misses = self.hits[namespace], self.misses[namespace]
+            namespaces[namespace] = {
+                "hits": hits,
+                "misses": misses,
+                "errors": self.errors[namespace],
+                "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            }
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            "backend": settings.CACHE_BACKEND if settings.CACHE_ENABLED else "disabled",
+            "hits": hits,
+            "misses": misses,
+            "errors": sum(self.errors.values()),
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "invalidated": self.invalidated,
+            "namespaces": namespaces,
+        }
+
+
+cache_metrics = CacheMetrics()
+
+
+def tenant_tag(namespace: str, system_id: str) -> str:
+    return f"{namespace}:{system_id}"
+
+
+def _json_body(content: Any) -> bytes:
+    # Same encoding as FastAPI's JSONResponse
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class CachedResponse:
+    def __init__(self, namespace: str, key: str, tags: Sequence[str], ttl: int):
+        self.namespace = namespace
+        self.key = key
+        self.tags = tags
+        self.ttl = ttl
+
+    async def fetch(self, produce: Callable[[], Awaitable[Any]]) -> Any:
+        """The cached response body, or ``produce()``'s result, cached on the way out"""
+        if not settings.CACHE_ENABLED:
+            return await produce()
+
+        cache = get_cache()
+        try:
+            body = await cache.get(self.key)
+        except Exception as e:
+            cache_metrics.errors[self.namespace] += 1
+            logger.warning("Response cache read failed: %s", e)
+            body = None
+        if body is not None:
+            cache_metrics.hits[self.namespace] += 1
+            return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+        cache_metrics.misses[self.namespace] += 1
+        body = _json_body(await produce())
+        try:
+            await cache.set(self.key, body, self.ttl, self.tags)
+        except Exception as e:
+            cache_metrics.errors[self.namespace] += 1
+            logger.warning("Response cache write failed: %s", e)
+        return Response(body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+
+def cache_response(
+    namespace: str,
+    depends_on: Sequence[str] = (),
+    ttl: Optional[int] = None,
+    per_user: bool = True,
+):
+    """
+    Dependency caching an endpoint's response in ``namespace``.
+
+    ``depends_on`` lists other namespaces whose writes must also drop the
+    entry (e.g. analytics over labs and users). ``per_user=False`` shares
+    entries between the users of a tenant; only use it for responses that
+    do not depend on who asks.
+    """
+    async def dependency(
+        request: Request,
+        current_user: CurrentUser = Depends(get_current_user),
+    ) -> CachedResponse:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        digest = hashlib.sha256(f"{request.url.path}?{query}".encode()).hexdigest()[:32]
+        user_part = current_user.userId if per_user else "*"
+        key = f"{RESPONSE_KEY_PREFIX}{namespace}:{current_user.systemId}:{user_part}:{digest}"
+        tags = [tenant_tag(tagged, current_user.systemId) for tagged in (namespace, *depends_on)]
+        return CachedResponse(namespace, key, tags, ttl or settings.CACHE_DEFAULT_TTL_SECONDS)
+
+    return dependency
+
+
+async def invalidate(namespaces: Sequence[str], system_id: str) -> None:
+    """Drop a tenant's cached responses in ``namespaces`` now"""
+    if not settings.CACHE_ENABLED:
+        return
+    try:
+        cache_metrics.invalidated += await get_cache().invalidate(
+            [tenant_tag(namespace, system_id) for namespace in namespaces]
+        )
+    except Exception as e:
+        # Entries expire on their own; until then readers may see the old data
+        for namespace in namespaces:
+            cache_metrics.errors[namespace] += 1
+        logger.warning("Response cache invalidation failed: %s", e)
+
+
+async def invalidate_tenants(by_tenant: Dict[str, Sequence[str]]) -> None:
+    """Drop cached responses in the given namespaces of each tenant now"""
+    for system_id, namespaces in by_tenant.items():
+        await invalidate(namespaces, system_id)
+
+
+def replica_lag() -> float:
+    """Seconds after a commit the replica may still serve the old rows; 0 without a replica"""
+    return settings.CACHE_REPLICA_LAG_SECONDS if settings.DATABASE_READ_URL else 0.0
+
+
+# Keeps the delayed invalidations referenced until they have run
+_repeats: Set[asyncio.Task] = set()
+
+
+def repeat_after_replica_lag(by_tenant: Dict[str, Sequence[str]]) -> None:
+    """Invalidate again once the replica has caught up, dropping entries cached from it meanwhile"""
+    lag = replica_lag()
+    if lag <= 0:
+        return
+
+    async def repeat() -> None:
+        await asyncio.sleep(lag)
+        await invalidate_tenants(by_tenant)
+
+    task = asyncio.create_task(repeat())
+    _repeats.add(task)
+    task.add_done_callback(_repeats.discard)
+
+
+def invalidate_on_commit(db: AsyncSession, namespace: str, system_id: str) -> None:
+    """
+    Drop a tenant's cached responses in ``namespace`` once the request's
+    transaction commits (invalidating earlier would let a concurrent read
+    cache the old rows again). Repeated calls in one request invalidate once.
+    """
+    pending = db.info.get("cache_invalidations")
+    if pending is None:
+        pending = db.info["cache_invalidations"] = set()
+
+        async def flush_invalidations() -> None:
+            by_tenant: Dict[str, list] = {}
+            for tagged_namespace, tagged_system_id in db.info.pop("cache_invalidations", ()):
+                by_tenant.setdefault(tagged_system_id, []).append(tagged_namespace)
+            await invalidate_tenants(by_tenant)
+            repeat_after_replica_lag(by_tenant)
+
+        on_commit(db, flush_invalidations)
+    pending.add((namespace, system_id))
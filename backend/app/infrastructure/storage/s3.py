@@ -0,0 +1,109 @@
+"""
+S3 object storage with presigned URLs.
+
+Clients upload and download file bytes directly against S3 using short-lived
+presigned URLs, so API workers only ever handle keys and metadata.
+``S3_ENDPOINT_URL`` points the client at any S3-compatible store (MinIO, a
+local stand-in in tests).
+"""
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from urllib.parse import quote
+
+import boto3
+from botocore.exceptions import ClientError
+
+from app.core.config import settings
+
+
+class S3Storage:
+    def __init__(self, client, bucket: str, expires_in: int, max_upload_bytes: int):
+        self.client = client
+        self.bucket = bucket
+        self.expires_in = expires_in
+        self.max_upload_bytes = max_upload_bytes
+
+    def object_url(self, key: str) -> str:
+        """Stable, non-public reference to an object (download through presigned URLs)"""
+        return f"s3://{self.bucket}/{key}"
+
+    def presigned_upload(self, key: str, content_type: str, max_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Presigned POST for uploading one object.
+
+        Returns ``url`` and form ``fields``; the client posts the fields plus a
+        ``file`` part. S3 rejects other keys, other content types and bodies
+        over ``max_bytes``.
+        """
+        max_bytes = max_bytes or self.max_upload_bytes
+        return self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_bytes],
+            ],
+            ExpiresIn=self.expires_in,
+        )
+
+    def presigned_download(self, key: str, file_name: Optional[str] = None) -> str:
+        """Presigned GET URL; ``file_name`` is offered as the download name"""
+        params = {"Bucket": self.bucket, "Key": key}
+        if file_name:
+            params["ResponseContentDisposition"] = f"attachment; filename*=UTF-8''{quote(file_name)}"
+        return self.client.generate_presigned_url("get_object", Params=params, ExpiresIn=self.expires_in)
+
+    def head(self, key: str) -> Optional[Dict[str, Any]]:
+        """Object metadata (ContentLength, ContentType, ...), or None if it does not exist"""
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def get_bytes(self, key: str) -> Dict[str, Any]:
+        """Object body and content type"""
+        obj = self.client.get_object(Bucket=self.bucket, Key=key)
+        return {"body": obj["Body"].read(), "content_type": obj.get("ContentType")}
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+
+def upload_key(prefix: str, object_id: str, file_name: str) -> str:
+    """Key for a client upload; the extension is kept for content-type detection"""
+    extension = os.path.splitext(file_name or "")[1].lower()
+    return f"{prefix}/{object_id}{extension}"
+
+
+def format_file_size(size: int) -> str:
+    """Human-readable size, e.g. "1.5 MB" """
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+@lru_cache
+def get_s3_client():
+    return boto3.client(
+        's3',
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        endpoint_url=settings.S3_ENDPOINT_URL
+    )
+
+
+@lru_cache
+def get_storage() -> S3Storage:
+    return S3Storage(
+        get_s3_client(),
+        settings.S3_BUCKET_NAME,
+        settings.S3_PRESIGNED_URL_EXPIRES_SECONDS,
+        settings.S3_MAX_UPLOAD_BYTES,
+    )
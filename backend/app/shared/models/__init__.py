@@ -1,7 +1,7 @@
 from .system import System
 from .user import User, RefreshToken
 from .system_config import SystemConfig, FeatureFlag
-from .lab_result import LabResult, Biomarker
+from .lab_result import LabResult, Biomarker, LabOcrCache
 from .action_plan import ActionPlan, ActionItem
 from .consultation import Doctor, AvailabilitySlot, Consultation, ConsultationType, ConsultationStatus
 from .staff import Staff, Department
@@ -14,7 +14,7 @@ from .nutrition import (
     MealPlanMeal,
     NutritionFeedback
 )
-from .lab_order import LabTestOrder
+from .lab_order import LabTestOrder, LabTestOrderItem, LabOrderStatusCount, LabTurnaroundBucket
 from .medical_history import MedicalHistory, Medication
 from .audit_log import AuditLog
 from .permissions import ModulePermission, ApplicationAccess
@@ -27,6 +27,7 @@ __all__ = [
     "FeatureFlag",
     "LabResult",
     "Biomarker",
+    "LabOcrCache",
     "ActionPlan",
     "ActionItem",
     "Doctor",
@@ -46,6 +47,9 @@ __all__ = [
     "MealPlanMeal",
     "NutritionFeedback",
     "LabTestOrder",
+    "LabTestOrderItem",
+    "LabOrderStatusCount",
+    "LabTurnaroundBucket",
     "MedicalHistory",
     "Medication",
     "AuditLog",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum as SQLEnum, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum as SQLEnum, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -9,6 +9,9 @@ from schemas.enums import LabTestCategory
 
 class LabResult(Base):
     __tablename__ = "lab_results"
+    __table_args__ = (
+        Index('ix_lab_results_system_content_hash', 'system_id', 'content_hash'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -24,6 +27,7 @@ class LabResult(Base):
     file_name = Column(String, nullable=False)
     s3_key = Column(String, nullable=False)
     s3_url = Column(String, nullable=False)
+    content_hash = Column(String(64), nullable=True)  # SHA-256 of the file; the S3 key is derived from it
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     processing_status = Column(String, default="pending", nullable=False)
     raw_ocr_text = Column(Text, nullable=True)
@@ -68,3 +72,12 @@ class Biomarker(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     lab_result = relationship("LabResult", back_populates="biomarkers")
+
+
+class LabOcrCache(Base):
+    """OCR text per file content hash, so duplicate uploads skip OCR"""
+    __tablename__ = "lab_ocr_cache"
+
+    content_hash = Column(String(64), primary_key=True)
+    raw_ocr_text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
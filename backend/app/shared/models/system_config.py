@@ -33,7 +33,7 @@ class FeatureFlag(Base):
     system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), nullable=False, index=True)
     flag_name = Column(String, nullable=False)
     is_enabled = Column(Boolean, default=False, nullable=False)
-    rollout_percentage = Column(Integer, default=0, nullable=False)
+    rollout_percentage = Column(Integer, default=100, server_default="100", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
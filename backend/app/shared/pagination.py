@@ -0,0 +1,49 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Tuple
+
+from sqlalchemy import tuple_
+
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(sort_value: Any, row_id: str) -> str:
+    """Encode the (sort value, id) of the last row on a page into an opaque cursor"""
+    if isinstance(sort_value, datetime):
+        payload = {"t": "datetime", "v": sort_value.isoformat(), "id": row_id}
+    elif isinstance(sort_value, date):
+        payload = {"t": "date", "v": sort_value.isoformat(), "id": row_id}
+    else:
+        payload = {"t": "raw", "v": sort_value, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor produced by encode_cursor back into (sort value, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value_type, value, row_id = payload["t"], payload["v"], payload["id"]
+        if value_type == "datetime":
+            value = datetime.fromisoformat(value)
+        elif value_type == "date":
+            value = date.fromisoformat(value)
+        return value, row_id
+    except (ValueError, KeyError, TypeError):
+        raise ValidationError("Invalid pagination cursor", {"cursor": cursor})
+
+
+def keyset_before(sort_column, id_column, cursor: str):
+    """
+    WHERE clause selecting rows after the cursor for a (sort DESC, id DESC) ordering.
+
+    Uses a row-value comparison so the planner can seek directly into a
+    composite index ending in the sort column instead of scanning skipped rows.
+    """
+    sort_value, row_id = decode_cursor(cursor)
+    return tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
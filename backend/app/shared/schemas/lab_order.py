@@ -57,6 +57,29 @@ class LabTestOrderResponse(LabTestOrderBase):
     status: LabOrderStatus
     collection_date: Optional[datetime]
     collected_by: Optional[str]
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LabTestOrderItemUpdate(BaseModel):
+    """Schema for updating a single ordered test"""
+    status: Optional[LabOrderStatus] = None
+    lab_result_id: Optional[str] = Field(None, description="Lab result that reports this test")
+
+
+class LabTestOrderItemResponse(BaseModel):
+    """Schema for one ordered test on a lab order"""
+    id: str
+    lab_order_id: str
+    position: int
+    test_name: str
+    test_key: str
+    status: LabOrderStatus
+    resulted_at: Optional[datetime]
+    lab_result_id: Optional[str]
     created_at: datetime
     updated_at: datetime
 
@@ -74,6 +97,26 @@ class LabTestOrderWithDetails(LabTestOrderResponse):
     model_config = ConfigDict(from_attributes=True)
 
 
+class LabTestOrderBulkCreate(BaseModel):
+    """Schema for creating many lab orders in one request"""
+    orders: list[LabTestOrderCreate] = Field(..., min_length=1, max_length=200, description="Orders to create")
+
+
+class LabTestOrderBulkItemResult(BaseModel):
+    """Outcome for one order of a bulk create, in request order"""
+    index: int = Field(..., description="Position of the order in the request")
+    success: bool
+    order: Optional[LabTestOrderResponse] = None
+    error: Optional[str] = None
+
+
+class LabTestOrderBulkResponse(BaseModel):
+    """Schema for bulk create results"""
+    created: int
+    failed: int
+    results: list[LabTestOrderBulkItemResult]
+
+
 # ============================================================================
 # Enhanced Lab Result Schemas (with review tracking)
 # ============================================================================
@@ -205,6 +248,7 @@ class LabTestOrderListFilter(BaseModel):
     """Filter for lab test orders"""
     patient_id: Optional[str] = Field(None, description="Filter by patient")
     ordering_physician_id: Optional[str] = Field(None, description="Filter by physician")
+    test_type: Optional[str] = Field(None, description="Filter by ordered test name")
     status: Optional[LabOrderStatus] = Field(None, description="Filter by status")
     priority: Optional[LabOrderPriority] = Field(None, description="Filter by priority")
     
@@ -267,6 +311,8 @@ class LabStats(BaseModel):
     unreviewed_results: int
     results_with_critical_values: int
     orders_this_week: int
+    status_counts: dict[str, int] = {}
+    priority_counts: dict[str, int] = {}
 
 
 class PatientLabSummary(BaseModel):
@@ -84,6 +84,7 @@ class NutritionAssessmentListResponse(BaseModel):
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset paging)")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -130,7 +131,6 @@ class MealPlanMealResponse(MealPlanMealBase):
     id: str
     day_id: str
     created_at: datetime
-    updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -214,16 +214,43 @@ class MealPlanUpdate(BaseModel):
 class MealPlanResponse(MealPlanBase):
     """Schema for meal plan response"""
     id: str
-    patient_id: str
+    patient_id: Optional[str]  # None for templates
     nutritionist_id: str
     assessment_id: Optional[str]
     status: MealPlanStatus
+    is_template: bool = False
+    source_plan_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
+    # Nullable on stored plans (templates, open-ended plans)
+    end_date: Optional[date] = None
+    daily_calorie_target: Optional[int] = None
+    daily_protein_target: Optional[Decimal] = None
+    daily_carbs_target: Optional[Decimal] = None
+    daily_fats_target: Optional[Decimal] = None
+
+    # Precomputed macro rollups across all days
+    day_count: int = 0
+    meal_count: int = 0
+    total_calories: int = 0
+    total_protein_grams: int = 0
+    total_carbs_grams: int = 0
+    total_fats_grams: int = 0
+
     model_config = ConfigDict(from_attributes=True)
 
 
+class MealPlanMacroDeviation(BaseModel):
+    """Average daily macros of a plan compared to its daily targets"""
+    avg_daily_calories: Optional[float] = None
+    calorie_deviation_pct: Optional[float] = Field(None, description="Signed % deviation from daily calorie target")
+    protein_deviation_pct: Optional[float] = None
+    carbs_deviation_pct: Optional[float] = None
+    fats_deviation_pct: Optional[float] = None
+    macro_deviation_score: Optional[float] = Field(None, description="Mean absolute % deviation across targeted macros")
+
+
 class MealPlanWithDays(MealPlanResponse):
     """Schema for meal plan with all days and meals"""
     days: list[MealPlanDayWithMeals] = []
@@ -238,6 +265,7 @@ class MealPlanWithDetails(MealPlanResponse):
     nutritionist_credentials: Optional[str]
     total_days: int
     days: list[MealPlanDayWithMeals] = []
+    macro_deviation: Optional[MealPlanMacroDeviation] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -249,10 +277,43 @@ class MealPlanListResponse(BaseModel):
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset paging)")
 
     model_config = ConfigDict(from_attributes=True)
 
 
+# ============================================================================
+# Meal Plan Template / Cloning Schemas
+# ============================================================================
+
+class MealPlanTemplateCreate(BaseModel):
+    """Schema for saving an existing meal plan (days and meals) as a template"""
+    plan_name: str = Field(..., min_length=1, max_length=200, description="Template name")
+
+
+class MealPlanCloneRequest(BaseModel):
+    """Schema for copying a plan or template to many patients at once"""
+    patient_ids: list[str] = Field(..., min_length=1, max_length=500, description="Patients to assign the plan to")
+    start_date: date = Field(..., description="Start date of the new plans")
+    nutritionist_id: Optional[str] = Field(None, description="Defaults to the source plan's nutritionist")
+    plan_name: Optional[str] = Field(None, min_length=1, max_length=200, description="Defaults to the source plan's name")
+
+
+class ClonedMealPlan(BaseModel):
+    """A plan created by a clone operation"""
+    patient_id: str
+    meal_plan_id: str
+
+
+class MealPlanCloneResponse(BaseModel):
+    """Result of cloning a plan to patients"""
+    source_plan_id: str
+    plans_created: int
+    days_per_plan: int
+    meals_per_plan: int
+    plans: list[ClonedMealPlan] = []
+
+
 # ============================================================================
 # Nutrition Feedback Schemas
 # ============================================================================
@@ -324,6 +385,7 @@ class NutritionFeedbackListResponse(BaseModel):
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset paging)")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -337,8 +399,11 @@ class NutritionAssessmentListFilter(BaseModel):
     patient_id: Optional[str] = None
     nutritionist_id: Optional[str] = None
     status: Optional[str] = None
+    start_date: Optional[datetime] = Field(None, description="Filter from this date (inclusive)")
+    end_date: Optional[datetime] = Field(None, description="Filter up to this date (inclusive)")
     skip: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page; takes precedence over skip")
 
 
 class MealPlanListFilter(BaseModel):
@@ -346,8 +411,11 @@ class MealPlanListFilter(BaseModel):
     patient_id: Optional[str] = None
     nutritionist_id: Optional[str] = None
     status: Optional[MealPlanStatus] = None
+    start_date: Optional[date] = Field(None, description="Plans starting on or after this date")
+    end_date: Optional[date] = Field(None, description="Plans starting on or before this date")
     skip: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page; takes precedence over skip")
 
 
 class NutritionFeedbackListFilter(BaseModel):
@@ -356,8 +424,11 @@ class NutritionFeedbackListFilter(BaseModel):
     nutritionist_id: Optional[str] = None
     meal_plan_id: Optional[str] = None
     compliance_level: Optional[ComplianceLevel] = None
+    start_date: Optional[datetime] = Field(None, description="Filter from this date (inclusive)")
+    end_date: Optional[datetime] = Field(None, description="Filter up to this date (inclusive)")
     skip: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page; takes precedence over skip")
 
 
 # ============================================================================
@@ -367,10 +438,33 @@ class NutritionFeedbackListFilter(BaseModel):
 class NutritionStats(BaseModel):
     """Nutrition module statistics"""
     total_assessments: int
+    total_meal_plans: int = 0
     active_meal_plans: int
     completed_meal_plans: int
     feedback_entries: int
     patients_with_plans: int
+    compliance_distribution: dict[str, int] = {}  # feedback count per ComplianceLevel
+    avg_compliance_score: Optional[float] = None  # 1 (poor) - 4 (excellent)
+
+
+class MealPlanMacroCompliance(MealPlanMacroDeviation):
+    """One plan's row in a caseload macro compliance report"""
+    meal_plan_id: str
+    plan_name: str
+    patient_id: str
+    patient_name: str
+    status: MealPlanStatus
+    day_count: int
+    meal_count: int
+    daily_calorie_target: Optional[int]
+
+
+class CaseloadMacroComplianceReport(BaseModel):
+    """Macro compliance of a nutritionist's meal plans against their targets"""
+    nutritionist_id: Optional[str]
+    total_plans: int
+    avg_macro_deviation_score: Optional[float]
+    plans: list[MealPlanMacroCompliance] = []
 
 
 class PatientNutritionProgress(BaseModel):
@@ -383,4 +477,10 @@ class PatientNutritionProgress(BaseModel):
     active_meal_plan: Optional[MealPlanResponse]
     latest_feedback: Optional[NutritionFeedbackResponse]
     compliance_trend: Optional[str]  # "improving", "stable", "declining"
+    total_assessments: int = 0
+    total_meal_plans: int = 0
+    total_feedback_entries: int = 0
+    recent_assessments: list[NutritionAssessmentResponse] = []
+    recent_meal_plans: list[MealPlanResponse] = []
+    recent_feedback: list[NutritionFeedbackResponse] = []
 
@@ -0,0 +1,27 @@
+"""
+Celery tasks for authentication housekeeping.
+
+``sweep_expired_refresh_tokens`` runs hourly from the beat schedule in
+``app.core.celery_app``.
+"""
+import asyncio
+import logging
+
+from app.core.celery_app import celery_app
+from app.domains.auth.services.refresh_tokens import SWEEP_BATCH_SIZE, sweep_expired_refresh_tokens
+from app.workers.session import worker_session
+
+logger = logging.getLogger(__name__)
+
+
+async def _sweep_expired_refresh_tokens(batch_size: int) -> int:
+    async with worker_session() as db:
+        return await sweep_expired_refresh_tokens(db, batch_size)
+
+
+@celery_app.task(name="auth.sweep_expired_refresh_tokens")
+def sweep_expired_refresh_tokens_task(batch_size: int = SWEEP_BATCH_SIZE) -> int:
+    """Delete expired refresh tokens in batches; returns the number deleted"""
+    deleted = asyncio.run(_sweep_expired_refresh_tokens(batch_size))
+    logger.info("Swept %s expired refresh tokens", deleted)
+    return deleted
@@ -0,0 +1,50 @@
+"""
+Response cache invalidation from Celery tasks.
+
+Tasks that write outside a request (OCR, biomarker extraction, backfills)
+call ``invalidate_after_task_commit`` once their transaction has committed.
+It drops the tenants' cached responses at once and, when reads go to a
+replica, queues ``invalidate_cached_responses`` to repeat the invalidation
+after ``CACHE_REPLICA_LAG_SECONDS``: the task's own event loop ends with
+the task, so the repeat cannot wait in-process as it does in the API.
+"""
+import asyncio
+import logging
+from typing import Iterable, List, Sequence
+
+from app.core.celery_app import celery_app
+from app.infrastructure.cache.backends import close_cache, init_cache
+from app.infrastructure.cache.response_cache import invalidate_tenants, replica_lag
+
+logger = logging.getLogger(__name__)
+
+
+async def _invalidate(namespaces: Sequence[str], system_ids: Iterable[str]) -> None:
+    # A cache client bound to this task's event loop (see app.workers.session)
+    await init_cache()
+    try:
+        await invalidate_tenants({system_id: namespaces for system_id in system_ids})
+    finally:
+        await close_cache()
+
+
+async def invalidate_after_task_commit(namespaces: Sequence[str], system_ids: Iterable[str]) -> None:
+    """Drop the tenants' cached responses in ``namespaces`` after a task's commit"""
+    tenants = sorted(set(system_ids))
+    if not tenants:
+        return
+    await _invalidate(namespaces, tenants)
+
+    lag = replica_lag()
+    if lag > 0:
+        try:
+            invalidate_cached_responses.apply_async((list(namespaces), tenants), countdown=lag)
+        except Exception as e:
+            # Entries expire on their own; until then readers may see the old data
+            logger.warning("Could not queue the delayed cache invalidation: %s", e)
+
+
+@celery_app.task(name="cache.invalidate_cached_responses")
+def invalidate_cached_responses(namespaces: List[str], system_ids: List[str]) -> None:
+    """Drop the tenants' cached responses in ``namespaces``"""
+    asyncio.run(_invalidate(namespaces, system_ids))
@@ -0,0 +1,237 @@
+"""
+Re-OCR backfill for lab results whose OCR failed.
+
+Candidates are results with ``processing_status="failed"`` or whose
+``raw_ocr_text`` holds an error message stored by the old upload path. They
+are read in keyset batches (ordered by id), their files are fetched from S3
+with bounded concurrency, OCR runs on a process pool, and each batch is
+written back with one UPDATE ... FROM (VALUES ...) statement before the
+next batch is read.
+
+Running against a live database is safe: transactions last one batch, and
+a row is only overwritten if its ``updated_at`` still matches what the
+batch read (so concurrent edits, re-uploads and deletions win). Rows whose
+file cannot be fetched are left untouched and counted as skipped. After
+each batch the keyset cursor is saved to an optional checkpoint file, so an
+interrupted run resumes where it stopped; ``limit`` caps the rows of one
+run, not the checkpointed total. Cached "labs" responses of the tenants a
+batch wrote to are dropped after its commit.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update, and_, or_, values, column, func, String, Text, DateTime
+
+from app.shared.models import LabResult
+from app.domains.labs.services.labs_service import LabsService
+from app.domains.labs.services.ocr import (
+    LEGACY_OCR_ERROR_PREFIX,
+    LEGACY_UNSUPPORTED_TEXT,
+    OCRError,
+    extract_text,
+    guess_content_type,
+)
+from app.infrastructure.storage.s3 import get_storage
+from app.workers.cache_tasks import invalidate_after_task_commit
+from app.workers.session import worker_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_S3_CONCURRENCY = 8
+
+
+def needs_reocr():
+    """Filter for lab results whose OCR failed or stored an error message as text"""
+    return or_(
+        LabResult.processing_status == "failed",
+        LabResult.raw_ocr_text.startswith(LEGACY_OCR_ERROR_PREFIX, autoescape=True),
+        LabResult.raw_ocr_text == LEGACY_UNSUPPORTED_TEXT,
+    )
+
+
+def _result_rows(batch, outcomes) -> List[Tuple[str, Any, Optional[str], str]]:
+    """(id, seen_updated_at, raw_ocr_text, processing_status) to write; rows whose file was not fetched are left out"""
+    rows = []
+    for row, outcome in zip(batch, outcomes):
+        if outcome is None:
+            continue
+        text, error = outcome
+        if error:
+            logger.warning("OCR backfill: lab result %s still failing: %s", row.id, error)
+        rows.append((row.id, row.updated_at, text, "completed" if text is not None else "failed"))
+    return rows
+
+
+def _ocr_file(file_content: bytes, content_type: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """(text, None) on success or (None, error) on failure; runs in the process pool"""
+    try:
+        return extract_text(file_content, content_type), None
+    except OCRError as e:
+        return None, str(e)
+
+
+class BackfillProgress:
+    """Counters for a backfill run, persisted with the keyset cursor"""
+
+    def __init__(self, last_id: Optional[str] = None, counts: Optional[Dict[str, int]] = None):
+        self.last_id = last_id
+        self.counts = {"processed": 0, "recovered": 0, "failed": 0, "skipped": 0, **(counts or {})}
+        self.started = time.monotonic()
+        self.started_processed = self.counts["processed"]
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> "BackfillProgress":
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path) as f:
+            data = json.load(f)
+        return cls(last_id=data.get("last_id"), counts=data.get("counts"))
+
+    def save(self, path: Optional[str]) -> None:
+        if not path:
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"last_id": self.last_id, "counts": self.counts}, f)
+        os.replace(tmp_path, path)
+
+    def processed_this_run(self) -> int:
+        return self.counts["processed"] - self.started_processed
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.processed_this_run() / elapsed if elapsed > 0 else 0.0
+
+    def report(self) -> str:
+        c = self.counts
+        return (
+            f"processed={c['processed']} recovered={c['recovered']} failed={c['failed']} "
+            f"skipped={c['skipped']} rate={self.rate():.2f}/s cursor={self.last_id}"
+        )
+
+
+class OCRBackfill:
+    def __init__(
+        self,
+        executor: Executor,
+        system_id: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        s3_concurrency: int = DEFAULT_S3_CONCURRENCY,
+        checkpoint_path: Optional[str] = None,
+        extract_biomarkers: bool = True,
+        limit: Optional[int] = None,
+    ):
+        self.executor = executor
+        self.system_id = system_id
+        self.batch_size = batch_size
+        self.checkpoint_path = checkpoint_path
+        self.extract_biomarkers = extract_biomarkers
+        self.limit = limit
+        self.s3_semaphore = asyncio.Semaphore(s3_concurrency)
+        self.storage = get_storage()
+
+    async def run(self) -> BackfillProgress:
+        progress = BackfillProgress.load(self.checkpoint_path)
+        if progress.last_id:
+            logger.info("Resuming OCR backfill after %s (%s)", progress.last_id, progress.report())
+
+        async with worker_session() as db:
+            while True:
+                batch_size = self.batch_size
+                if self.limit is not None:
+                    batch_size = min(batch_size, self.limit - progress.processed_this_run())
+                    if batch_size <= 0:
+                        break
+                batch = await self._next_batch(db, progress.last_id, batch_size)
+                if not batch:
+                    break
+
+                outcomes = await asyncio.gather(*(self._reocr(row) for row in batch))
+                await self._write_batch(db, batch, outcomes, progress)
+
+                progress.last_id = batch[-1].id
+                progress.save(self.checkpoint_path)
+                logger.info("OCR backfill: %s", progress.report())
+
+        logger.info("OCR backfill finished: %s", progress.report())
+        return progress
+
+    async def _next_batch(self, db, last_id: Optional[str], batch_size: int) -> List[Any]:
+        conditions = [needs_reocr()]
+        if self.system_id:
+            conditions.append(LabResult.system_id == self.system_id)
+        if last_id is not None:
+            conditions.append(LabResult.id > last_id)
+
+        result = await db.execute(
+            select(LabResult.id, LabResult.s3_key, LabResult.file_name, LabResult.updated_at)
+            .where(and_(*conditions))
+            .order_by(LabResult.id)
+            .limit(batch_size)
+        )
+        return result.all()
+
+    async def _reocr(self, row) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """(text, error) from OCR, or None if the file could not be fetched"""
+        try:
+            async with self.s3_semaphore:
+                obj = await asyncio.to_thread(self.storage.get_bytes, row.s3_key)
+        except Exception as e:
+            logger.warning("OCR backfill: skipping lab result %s, S3 fetch failed: %s", row.id, e)
+            return None
+
+        file_content = obj["body"]
+        content_type = guess_content_type(row.file_name, obj["content_type"])
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _ocr_file, file_content, content_type)
+
+    async def _write_batch(self, db, batch, outcomes, progress: BackfillProgress) -> None:
+        rows = _result_rows(batch, outcomes)
+        written: Dict[str, str] = {}
+        if rows:
+            data = values(
+                column("id", String),
+                column("seen_updated_at", DateTime(timezone=True)),
+                column("raw_ocr_text", Text),
+                column("processing_status", String),
+                name="ocr_results",
+            ).data(rows)
+
+            result = await db.execute(
+                update(LabResult)
+                .where(
+                    and_(
+                        LabResult.id == data.c.id,
+                        LabResult.updated_at == data.c.seen_updated_at
+                    )
+                )
+                .values(
+                    raw_ocr_text=data.c.raw_ocr_text,
+                    processing_status=data.c.processing_status,
+                    updated_at=func.now()
+                )
+                .returning(LabResult.id, LabResult.processing_status, LabResult.system_id)
+                .execution_options(synchronize_session=False)
+            )
+            written_rows = result.all()
+            written = {r.id: r.processing_status for r in written_rows}
+
+        if self.extract_biomarkers:
+            recovered_ids = [result_id for result_id, status in written.items() if status == "completed"]
+            if recovered_ids:
+                recovered = await db.execute(select(LabResult).where(LabResult.id.in_(recovered_ids)))
+                await LabsService(db).extract_biomarkers(recovered.scalars().all(), replace=True)
+        await db.commit()
+        if rows:
+            await invalidate_after_task_commit(["labs"], (r.system_id for r in written_rows))
+
+        progress.counts["processed"] += len(batch)
+        progress.counts["recovered"] += sum(1 for status in written.values() if status == "completed")
+        progress.counts["failed"] += sum(1 for status in written.values() if status == "failed")
+        progress.counts["skipped"] += len(batch) - len(written)
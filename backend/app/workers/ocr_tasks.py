@@ -0,0 +1,141 @@
+"""
+Celery tasks for lab report processing.
+
+``reprocess_biomarker_backlog`` pages through lab results that have OCR text
+and fans them out in batches to ``extract_biomarkers``, so a large backlog
+is parsed in parallel across the worker pool. ``process_uploaded_lab`` OCRs
+a file the client uploaded directly to storage, and
+``reocr_failed_lab_results`` runs the re-OCR backfill (see
+``app.workers.ocr_backfill``) inside a worker. Each task drops the tenants'
+cached "labs" responses after its commit.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from sqlalchemy import select, and_, exists
+
+from app.core.celery_app import celery_app
+from app.shared.models import LabResult, Biomarker
+from app.domains.labs.services.labs_service import LabsService
+from app.domains.labs.services.ocr import guess_content_type
+from app.infrastructure.storage.s3 import get_storage
+from app.workers.cache_tasks import invalidate_after_task_commit
+from app.workers.ocr_backfill import OCRBackfill
+from app.workers.session import worker_session
+
+BIOMARKER_BATCH_SIZE = 100
+
+
+async def _extract_biomarkers(lab_result_ids: List[str], replace: bool) -> int:
+    async with worker_session() as db:
+        result = await db.execute(
+            select(LabResult).where(
+                and_(
+                    LabResult.id.in_(lab_result_ids),
+                    LabResult.raw_ocr_text.isnot(None)
+                )
+            )
+        )
+        lab_results = result.scalars().all()
+        if not replace:
+            # Skip results that gained biomarkers since the batch was queued
+            existing = await db.execute(
+                select(Biomarker.lab_result_id)
+                .where(Biomarker.lab_result_id.in_(lab_result_ids))
+                .distinct()
+            )
+            done = set(existing.scalars().all())
+            lab_results = [r for r in lab_results if r.id not in done]
+
+        extracted = await LabsService(db).extract_biomarkers(lab_results, replace=replace)
+        await db.commit()
+    await invalidate_after_task_commit(["labs"], (r.system_id for r in lab_results))
+    return sum(len(biomarkers) for biomarkers in extracted.values())
+
+
+async def _process_uploaded_lab(lab_result_id: str) -> str:
+    async with worker_session() as db:
+        result = await db.execute(select(LabResult).where(LabResult.id == lab_result_id))
+        lab_result = result.scalar_one_or_none()
+        if not lab_result or lab_result.processing_status != "processing":
+            return lab_result.processing_status if lab_result else "missing"
+
+        try:
+            obj = await asyncio.to_thread(get_storage().get_bytes, lab_result.s3_key)
+            content_type = guess_content_type(lab_result.file_name, obj["content_type"])
+            await LabsService(db).apply_ocr(lab_result, obj["body"], content_type)
+        except Exception:
+            lab_result.processing_status = "failed"
+        await db.commit()
+    await invalidate_after_task_commit(["labs"], [lab_result.system_id])
+    return lab_result.processing_status
+
+
+async def _pending_result_batches(system_id: Optional[str], replace: bool, batch_size: int) -> List[List[str]]:
+    """Ids of lab results to (re)parse, in keyset-paginated batches"""
+    conditions = [
+        LabResult.processing_status == "completed",
+        LabResult.raw_ocr_text.isnot(None),
+    ]
+    if system_id:
+        conditions.append(LabResult.system_id == system_id)
+    if not replace:
+        conditions.append(~exists().where(Biomarker.lab_result_id == LabResult.id))
+
+    batches = []
+    last_id = None
+    async with worker_session() as db:
+        while True:
+            query = select(LabResult.id).where(and_(*conditions)).order_by(LabResult.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(LabResult.id > last_id)
+            ids = (await db.execute(query)).scalars().all()
+            if not ids:
+                break
+            batches.append(list(ids))
+            last_id = ids[-1]
+    return batches
+
+
+@celery_app.task(name="labs.extract_biomarkers")
+def extract_biomarkers(lab_result_ids: List[str], replace: bool = False) -> int:
+    """Parse and insert biomarkers for a batch of lab results; returns the number inserted"""
+    return asyncio.run(_extract_biomarkers(lab_result_ids, replace))
+
+
+@celery_app.task(name="labs.process_uploaded_lab")
+def process_uploaded_lab(lab_result_id: str) -> str:
+    """OCR a lab report uploaded through a presigned URL; returns the final processing status"""
+    return asyncio.run(_process_uploaded_lab(lab_result_id))
+
+
+@celery_app.task(name="labs.reprocess_biomarker_backlog")
+def reprocess_biomarker_backlog(
+    system_id: Optional[str] = None,
+    replace: bool = False,
+    batch_size: int = BIOMARKER_BATCH_SIZE
+) -> int:
+    """
+    Queue biomarker extraction for every lab result with OCR text (optionally
+    one system's). Without ``replace`` only results with no biomarkers yet are
+    queued. Returns the number of batches queued.
+    """
+    batches = asyncio.run(_pending_result_batches(system_id, replace, batch_size))
+    for batch in batches:
+        extract_biomarkers.delay(batch, replace)
+    return len(batches)
+
+
+@celery_app.task(name="labs.reocr_failed_lab_results")
+def reocr_failed_lab_results(system_id: Optional[str] = None, limit: Optional[int] = None, ocr_threads: int = 2) -> dict:
+    """
+    Re-OCR lab results whose OCR failed. Prefork workers cannot start a
+    process pool, so OCR runs on threads (tesseract and poppler run as
+    subprocesses, so threads still overlap). Returns the run's counters.
+    """
+    async def run():
+        with ThreadPoolExecutor(max_workers=ocr_threads) as executor:
+            return await OCRBackfill(executor, system_id=system_id, limit=limit).run()
+
+    return asyncio.run(run()).counts
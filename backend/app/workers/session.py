@@ -0,0 +1,30 @@
+"""
+Database sessions for Celery tasks.
+
+Tasks run their async code with ``asyncio.run``, i.e. on a fresh event loop
+each time, so they cannot share the API's pooled engine (asyncpg connections
+are bound to the loop that opened them). Each task gets its own unpooled
+engine instead.
+"""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import database_url, engine_kwargs
+
+
+@asynccontextmanager
+async def worker_session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine(
+        database_url,
+        poolclass=NullPool,
+        connect_args=engine_kwargs.get("connect_args", {}),
+    )
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    try:
+        async with session_maker() as session:
+            yield session
+    finally:
+        await engine.dispose()
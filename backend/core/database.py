@@ -1,36 +1,118 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import exc
 from sqlalchemy.engine import make_url
-from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from sqlalchemy.orm import declarative_base, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import AsyncGenerator, Any, Awaitable, Callable, Dict
 import ssl
+import time
 
 from core.config import settings
 
-# Convert database URL to asyncpg format and remove sslmode parameter
-database_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
-# Remove sslmode query parameter as asyncpg handles SSL differently
-if "?sslmode=" in database_url:
-    database_url = database_url.split("?sslmode=")[0]
+def to_async_url(raw_url: str) -> str:
+    # Convert database URL to asyncpg format and remove sslmode parameter
+    async_url = raw_url.replace("postgresql://", "postgresql+asyncpg://")
 
+    # Remove sslmode query parameter as asyncpg handles SSL differently
+    if "?sslmode=" in async_url:
+        async_url = async_url.split("?sslmode=")[0]
+    return async_url
+
+
+database_url = to_async_url(settings.DATABASE_URL)
 url = make_url(database_url)
 
+# Checkouts waiting longer than this count as slow (the pool was saturated)
+SLOW_CHECKOUT_SECONDS = 0.1
+
+
+class PoolMetrics:
+    """Connection checkout counts and wait times, for spotting pool saturation"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.slow_checkouts = 0  # waited more than SLOW_CHECKOUT_SECONDS
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+            return
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if wait > SLOW_CHECKOUT_SECONDS:
+            self.slow_checkouts += 1
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+        checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        return {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "checked_out": checked_out,
+            "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "slow_checkouts": self.slow_checkouts,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record(time.perf_counter() - started)
+        return connection
+
+
 engine_kwargs = {
-    "echo": False,
-    "pool_pre_ping": True,
+    "echo": settings.DB_ECHO,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
 }
 
-# Add SSL context for asyncpg (PostgreSQL connections)
+# Add SSL context, statement cache and timeouts for asyncpg (PostgreSQL connections)
 if url.get_backend_name() == "postgresql":
     ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    engine_kwargs["connect_args"] = {"ssl": ssl_context}
+    if not settings.DB_SSL_VERIFY:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    engine_kwargs["connect_args"] = {
+        "ssl": ssl_context,
+        # asyncpg's own statement cache and SQLAlchemy's prepared statement cache on top of it
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "server_settings": {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            "lock_timeout": str(settings.DB_LOCK_TIMEOUT_MS),
+        },
+    }
 
 if url.get_backend_name() not in {"sqlite", "sqlite+aiosqlite"}:
     engine_kwargs.update({
-        "pool_size": 10,
-        "max_overflow": 20,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
     })
 
 engine = create_async_engine(
@@ -38,6 +120,40 @@ engine = create_async_engine(
     **engine_kwargs,
 )
 
+# Read replica for analytics, lists and trends; the primary when none is configured
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        to_async_url(settings.DATABASE_READ_URL),
+        **engine_kwargs,
+    )
+else:
+    read_engine = engine
+
+
+def _is_plain_select(clause) -> bool:
+    return (
+        clause is not None
+        and getattr(clause, "is_select", False)
+        and getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+class ReadRoutingSession(Session):
+    """
+    Sends plain SELECTs to the read replica until the session writes
+    (flush, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, raw SQL); from then
+    on everything goes to the primary, so a session reads its own writes.
+    """
+
+    wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self.wrote and _is_plain_select(clause):
+            return read_engine.sync_engine
+        self.wrote = True
+        return engine.sync_engine
+
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -46,11 +162,62 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
-Base = declarative_base()
+async_read_session_maker = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=ReadRoutingSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+class _EagerDefaults:
+    # Flushes fetch server-generated values (server defaults such as created_at,
+    # onupdate timestamps) with RETURNING instead of a refresh SELECT afterwards.
+    # SQL expressions assigned to an attribute (e.g. ``= func.now()``) are not
+    # returned and stay expired, so services assign Python values instead.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_EagerDefaults)
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run ``callback`` once the request's transaction has committed (e.g. cache invalidation)"""
+    session.info.setdefault("on_commit", []).append(callback)
+
+
+async def run_commit_hooks(session: AsyncSession) -> None:
+    for callback in session.info.pop("on_commit", []):
+        await callback()
+
+
+def pool_status() -> Dict[str, Any]:
+    """Current pool usage and checkout wait statistics"""
+    return pool_metrics.snapshot(engine.sync_engine.pool)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    One session and one transaction per request (unit of work).
+
+    Services add and flush; the transaction commits once the endpoint returns
+    and rolls back if it raises. A service commits itself only when a write
+    must be durable before a side effect such as queueing a task.
+    """
     async with async_session_maker() as session:
+        try:
+            yield session
+            await session.commit()
+            await run_commit_hooks(session)
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-heavy endpoints: reads from the replica, writes (and reads after them) on the primary"""
+    async with async_read_session_maker() as session:
         try:
             yield session
         finally:
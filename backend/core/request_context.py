@@ -0,0 +1,15 @@
+"""
+Who is making the current request, for audit records.
+
+``get_current_user`` sets the actor and the app's request middleware sets
+the client, so services can record audit events without every signature
+carrying the user, IP address and user agent.
+"""
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+request_actor: ContextVar[Optional[str]] = ContextVar("request_actor", default=None)
+# (IP address, user agent)
+request_client: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "request_client", default=(None, None)
+)
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -29,16 +31,40 @@ def get_password_hash(password: str) -> str:
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
 
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(hours=1)
-
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        expire = now + timedelta(hours=1)
+
+    # jti identifies the token for revocation; iat (to the millisecond, so a token issued
+    # just after a revocation in the same second survives it) lets "revoke everything issued before" work
+    issued_at = round(now.replace(tzinfo=timezone.utc).timestamp(), 3)
+    to_encode.update({"exp": expire, "iat": issued_at, "jti": secrets.token_hex(16), "type": "access"})
+    encoded_jwt = jwt.encode(
+        to_encode,
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+        headers={"kid": settings.JWT_KEY_ID}
+    )
     return encoded_jwt
 
 
+def access_token_claims(user) -> Dict[str, Any]:
+    """
+    Claims identifying and authorizing a user, so requests need no user lookup.
+    "pv" is the user's permissions_version when the token was issued.
+    """
+    return {
+        "sub": user.id,
+        "email": user.email,
+        "username": user.username,
+        "role": user.role,
+        "system_id": user.system_id,
+        "pv": user.permissions_version,
+    }
+
+
 def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
 
@@ -52,9 +78,21 @@ def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta
     return encoded_jwt
 
 
+def access_token_key(kid: Optional[str]) -> Optional[str]:
+    """Secret for a token's "kid": the current key, a retired one, or JWT_SECRET for tokens without a kid"""
+    if kid is None or kid == settings.JWT_KEY_ID:
+        return settings.JWT_SECRET
+    return settings.JWT_RETIRED_KEYS.get(kid)
+
+
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        key = access_token_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            return None
+        payload = jwt.decode(token, key, algorithms=[settings.JWT_ALGORITHM])
+        if payload.get("type", "access") != "access":
+            return None
         return payload
     except JWTError:
         return None
@@ -68,6 +106,11 @@ def decode_refresh_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def hash_token(token: str) -> str:
+    """SHA-256 hex digest stored in place of a refresh token (tokens are random enough to need no salt)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 def parse_expires_in(expires_in: str) -> timedelta:
     if expires_in.endswith('h'):
         hours = int(expires_in[:-1])
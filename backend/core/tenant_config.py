@@ -0,0 +1,226 @@
+"""
+Per-system configuration and feature-flag snapshots.
+
+Each API process keeps an immutable ``TenantSnapshot`` per system: every
+``SystemConfig`` row and ``FeatureFlag`` of that system, loaded with one
+query each the first time the system is asked for. Reads after that are
+dictionary lookups, and ``TenantSnapshot.flag_enabled`` decides a rollout
+with a CRC32 of the flag and subject, so flag checks cost no I/O.
+
+Snapshots are versioned. A change bumps the system's version in Redis and
+broadcasts it on ``TENANT_CONFIG_CHANNEL``; ``run_tenant_config_listener``
+drops every older snapshot, so the next read loads the change. Snapshots
+also expire after ``TENANT_CONFIG_MAX_AGE_SECONDS`` in case a broadcast was
+missed while Redis was unreachable.
+"""
+import asyncio
+import json
+import logging
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.system_config import SystemConfig, FeatureFlag
+
+logger = logging.getLogger(__name__)
+
+VERSION_PREFIX = "config:version:"
+LISTENER_RETRY_SECONDS = 5
+
+
+def rollout_bucket(flag_name: str, subject_id: str) -> int:
+    """Stable bucket 0-99 of a subject (user, patient) for a flag, the same in every process"""
+    return zlib.crc32(f"{flag_name}:{subject_id}".encode()) % 100
+
+
+class FlagState:
+    __slots__ = ("is_enabled", "rollout_percentage")
+
+    def __init__(self, is_enabled: bool, rollout_percentage: int):
+        self.is_enabled = is_enabled
+        self.rollout_percentage = rollout_percentage
+
+    def enabled_for(self, flag_name: str, subject_id: Optional[str]) -> bool:
+        """
+        Whether the flag is on for a subject. The rollout percentage is the
+        share of subjects that get an enabled flag: 0 is nobody, 100 everyone.
+        """
+        if not self.is_enabled or self.rollout_percentage <= 0:
+            return False
+        if self.rollout_percentage >= 100:
+            return True
+        if subject_id is None:
+            return False  # a partial rollout needs someone to bucket
+        return rollout_bucket(flag_name, subject_id) < self.rollout_percentage
+
+
+class TenantSnapshot:
+    def __init__(self, system_id: str, version: int, configs: List[Dict[str, Any]], flags: List[Dict[str, Any]]):
+        self.system_id = system_id
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.configs = {config["config_key"]: config for config in configs}
+        self.flags = {flag["flag_name"]: flag for flag in flags}
+        self._flag_states = {
+            flag["flag_name"]: FlagState(flag["is_enabled"], flag["rollout_percentage"])
+            for flag in flags
+        }
+
+    def config(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        config = self.configs.get(key)
+        return config["config_value"] if config else default
+
+    def flag_enabled(self, flag_name: str, subject_id: Optional[str] = None) -> bool:
+        """Unknown flags are off"""
+        state = self._flag_states.get(flag_name)
+        return state is not None and state.enabled_for(flag_name, subject_id)
+
+
+def _config_row(config: SystemConfig) -> Dict[str, Any]:
+    return {
+        "id": config.id,
+        "system_id": config.system_id,
+        "config_key": config.config_key,
+        "config_value": config.config_value,
+        "data_type": config.data_type,
+        "created_at": config.created_at,
+        "updated_at": config.updated_at,
+    }
+
+
+def _flag_row(flag: FeatureFlag) -> Dict[str, Any]:
+    return {
+        "id": flag.id,
+        "flag_name": flag.flag_name,
+        "is_enabled": flag.is_enabled,
+        "rollout_percentage": flag.rollout_percentage,
+        "created_at": flag.created_at,
+        "updated_at": flag.updated_at,
+    }
+
+
+class TenantConfigCache:
+    def __init__(self, max_age: float):
+        self.max_age = max_age
+        self._snapshots: Dict[str, TenantSnapshot] = {}
+        self._versions: Dict[str, int] = {}  # system id -> newest version announced
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def cached(self, system_id: str) -> Optional[TenantSnapshot]:
+        """The system's snapshot if it is current, without loading"""
+        snapshot = self._snapshots.get(system_id)
+        if snapshot is None:
+            return None
+        if snapshot.version < self._versions.get(system_id, 0) or time.monotonic() - snapshot.loaded_at > self.max_age:
+            self._snapshots.pop(system_id, None)
+            return None
+        return snapshot
+
+    async def get(self, db: AsyncSession, system_id: str) -> TenantSnapshot:
+        snapshot = self.cached(system_id)
+        if snapshot is not None:
+            return snapshot
+        lock = self._locks.setdefault(system_id, asyncio.Lock())
+        async with lock:
+            # Another request may have loaded it while this one waited
+            snapshot = self.cached(system_id)
+            if snapshot is None:
+                snapshot = await self._load(db, system_id)
+                if snapshot.version >= self._versions.get(system_id, 0):
+                    self._snapshots[system_id] = snapshot
+            return snapshot
+
+    def apply(self, system_id: str, version: int) -> None:
+        """Record that the system changed (as announced on the change channel)"""
+        if version > self._versions.get(system_id, 0):
+            self._versions[system_id] = version
+        self.cached(system_id)
+
+    def invalidate(self, system_id: str) -> None:
+        self._snapshots.pop(system_id, None)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    async def _load(self, db: AsyncSession, system_id: str) -> TenantSnapshot:
+        # Read the version first: a change landing during the load then
+        # announces a newer version and the snapshot is replaced
+        version = await _current_version(system_id)
+        if version is None:
+            version = self._versions.get(system_id, 0)
+        configs = await db.scalars(
+            select(SystemConfig)
+            .where(SystemConfig.system_id == system_id)
+            .order_by(SystemConfig.config_key)
+        )
+        flags = await db.scalars(
+            select(FeatureFlag)
+            .where(FeatureFlag.system_id == system_id)
+            .order_by(FeatureFlag.flag_name)
+        )
+        return TenantSnapshot(
+            system_id,
+            version,
+            [_config_row(config) for config in configs],
+            [_flag_row(flag) for flag in flags],
+        )
+
+
+tenant_configs = TenantConfigCache(settings.TENANT_CONFIG_MAX_AGE_SECONDS)
+
+_redis: Optional[redis.Redis] = None
+
+
+def get_tenant_config_redis() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+async def _current_version(system_id: str) -> Optional[int]:
+    try:
+        value = await get_tenant_config_redis().get(VERSION_PREFIX + system_id)
+    except Exception as e:
+        logger.warning("Could not read tenant config version: %s", e)
+        return None
+    return int(value) if value else 0
+
+
+async def publish_tenant_config_change(system_id: str) -> None:
+    """Make every process reload the system's configs and flags (call after committing the change)"""
+    try:
+        client = get_tenant_config_redis()
+        version = await client.incr(VERSION_PREFIX + system_id)
+        event = {"system_id": system_id, "version": version}
+        tenant_configs.apply(system_id, version)
+        await client.publish(settings.TENANT_CONFIG_CHANNEL, json.dumps(event))
+    except Exception as e:
+        # Reloaded here; other processes pick it up when their snapshot expires
+        tenant_configs.invalidate(system_id)
+        logger.warning("Could not broadcast tenant config change: %s", e)
+
+
+async def run_tenant_config_listener() -> None:
+    """Keep this process's snapshots current; run as a task for the app's lifetime"""
+    while True:
+        try:
+            client = get_tenant_config_redis()
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(settings.TENANT_CONFIG_CHANNEL)
+                # Changes broadcast while disconnected were missed
+                tenant_configs.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        event = json.loads(message["data"])
+                        tenant_configs.apply(event["system_id"], int(event["version"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Tenant config listener disconnected: %s", e)
+            await asyncio.sleep(LISTENER_RETRY_SECONDS)
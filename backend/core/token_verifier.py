@@ -0,0 +1,175 @@
+"""
+Access-token verification with a claims cache and immediate revocation.
+
+Verifying a JWT means base64-decoding, an HMAC and JSON parsing on every
+request. ``AccessTokenVerifier`` keeps decoded claims in an LRU keyed by the
+token's hash until the token expires, so repeat requests skip all of it.
+
+Revocation stays stateless per request: every API process holds a small
+in-memory ``RevocationList``: revoked token ids, users whose tokens issued
+before a point in time are void, and users' current permissions versions
+(tokens carrying an older one are stale and must be refreshed). Revocations are written to Redis
+with a TTL of the access-token lifetime and broadcast on
+``TOKEN_REVOCATION_CHANNEL``; ``run_revocation_listener`` applies the
+broadcasts and loads the persisted entries when a process starts.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as redis
+
+from core.config import settings
+from core.security import decode_access_token, hash_token, parse_expires_in
+
+logger = logging.getLogger(__name__)
+
+REVOKED_TOKEN_PREFIX = "auth:revoked:jti:"
+REVOKED_USER_PREFIX = "auth:revoked:user:"
+PERMISSIONS_VERSION_PREFIX = "auth:pv:"
+LISTENER_RETRY_SECONDS = 5
+PRUNE_INTERVAL_SECONDS = 60
+
+
+def access_token_lifetime() -> int:
+    """Longest an access token can live, in seconds (how long revocations must be remembered)"""
+    return int(parse_expires_in(settings.JWT_EXPIRES_IN).total_seconds())
+
+
+class RevocationList:
+    def __init__(self):
+        self.tokens: Dict[str, float] = {}  # jti -> token expiry
+        self.users: Dict[str, float] = {}  # user id -> tokens issued before this are revoked
+        self.versions: Dict[str, Tuple[int, float]] = {}  # user id -> (permissions version, when set)
+        self.pruned_at = time.time()
+
+    def is_revoked(self, claims: Dict[str, Any]) -> bool:
+        if claims.get("jti") in self.tokens:
+            return True
+        revoked_at = self.users.get(claims.get("sub"))
+        return revoked_at is not None and claims.get("iat", 0) <= revoked_at
+
+    def is_stale(self, claims: Dict[str, Any]) -> bool:
+        """Whether the user's role or status changed after the token was issued"""
+        known = self.versions.get(claims.get("sub"))
+        return known is not None and claims.get("pv", 0) < known[0]
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """Record a revocation event (as published on the revocation channel)"""
+        if event.get("jti"):
+            self.tokens[event["jti"]] = float(event["exp"])
+        if event.get("revoked_at"):
+            self.users[event["user_id"]] = max(float(event["revoked_at"]), self.users.get(event["user_id"], 0))
+        if event.get("permissions_version"):
+            current = self.versions.get(event["user_id"], (0, 0.0))[0]
+            self.versions[event["user_id"]] = (max(int(event["permissions_version"]), current), time.time())
+        if time.time() - self.pruned_at > PRUNE_INTERVAL_SECONDS:
+            self.prune()
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """Forget revocations of tokens that have expired anyway"""
+        now = now or time.time()
+        self.pruned_at = now
+        self.tokens = {jti: exp for jti, exp in self.tokens.items() if exp > now}
+        horizon = now - access_token_lifetime()
+        self.users = {user_id: at for user_id, at in self.users.items() if at > horizon}
+        self.versions = {user_id: v for user_id, v in self.versions.items() if v[1] > horizon}
+
+
+class AccessTokenVerifier:
+    def __init__(self, revocations: RevocationList, cache_size: int):
+        self.revocations = revocations
+        self.cache_size = cache_size
+        self._claims: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """Claims of a valid, unexpired, unrevoked access token, else None"""
+        key = hash_token(token)
+        claims = self._claims.get(key)
+        if claims is not None and claims["exp"] > time.time():
+            self._claims.move_to_end(key)
+        else:
+            self._claims.pop(key, None)
+            claims = decode_access_token(token)
+            if claims is None:
+                return None
+            self._claims[key] = claims
+            if len(self._claims) > self.cache_size:
+                self._claims.popitem(last=False)
+
+        if self.revocations.is_revoked(claims):
+            return None
+        return claims
+
+
+revocations = RevocationList()
+token_verifier = AccessTokenVerifier(revocations, settings.ACCESS_TOKEN_CACHE_SIZE)
+
+_redis: Optional[redis.Redis] = None
+
+
+def get_revocation_redis() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+async def _publish(event: Dict[str, Any], key: str, ttl: int) -> None:
+    revocations.apply(event)
+    try:
+        client = get_revocation_redis()
+        await client.set(key, json.dumps(event), ex=max(ttl, 1))
+        await client.publish(settings.TOKEN_REVOCATION_CHANNEL, json.dumps(event))
+    except Exception as e:
+        # Still revoked in this process; other processes miss it until Redis is back
+        logger.warning("Could not broadcast token revocation: %s", e)
+
+
+async def revoke_access_token(claims: Dict[str, Any]) -> None:
+    """Revoke one access token everywhere"""
+    event = {"jti": claims["jti"], "exp": claims["exp"]}
+    await _publish(event, REVOKED_TOKEN_PREFIX + claims["jti"], int(claims["exp"] - time.time()))
+
+
+async def revoke_user_tokens(user_id: str) -> None:
+    """Revoke every access token issued to a user so far (logout, deactivation)"""
+    event = {"user_id": user_id, "revoked_at": round(time.time(), 3)}
+    await _publish(event, REVOKED_USER_PREFIX + user_id, access_token_lifetime())
+
+
+async def publish_permissions_version(user_id: str, permissions_version: int) -> None:
+    """Mark the user's tokens issued with an older permissions version as stale everywhere"""
+    event = {"user_id": user_id, "permissions_version": permissions_version}
+    await _publish(event, PERMISSIONS_VERSION_PREFIX + user_id, access_token_lifetime())
+
+
+async def load_revocations(client: redis.Redis) -> None:
+    for prefix in (REVOKED_TOKEN_PREFIX, REVOKED_USER_PREFIX, PERMISSIONS_VERSION_PREFIX):
+        async for key in client.scan_iter(match=f"{prefix}*", count=500):
+            value = await client.get(key)
+            if value:
+                revocations.apply(json.loads(value))
+    revocations.prune()
+
+
+async def run_revocation_listener() -> None:
+    """Keep this process's revocation list in sync; run as a task for the app's lifetime"""
+    while True:
+        try:
+            client = get_revocation_redis()
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(settings.TOKEN_REVOCATION_CHANNEL)
+                # Load after subscribing so nothing published in between is missed
+                await load_revocations(client)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        revocations.apply(json.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Token revocation listener disconnected: %s", e)
+            await asyncio.sleep(LISTENER_RETRY_SECONDS)
@@ -1,11 +1,18 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from core.config import settings
-from core.database import engine
+from core.database import engine, read_engine, pool_status
 from core.exceptions import EXCEPTION_HANDLERS
+from core.token_verifier import run_revocation_listener
+from core.tenant_config import run_tenant_config_listener
+from core.dependencies import require_admin
+from app.infrastructure.audit.writer import AuditContextMiddleware, audit_log
+from app.infrastructure.cache.backends import init_cache, close_cache
+from app.infrastructure.cache.response_cache import cache_metrics
 from api.v1.router import api_router
 
 # Import all models to ensure they're registered with SQLAlchemy metadata
@@ -31,9 +38,20 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting up application...")
+    revocation_listener = asyncio.create_task(run_revocation_listener())
+    tenant_config_listener = asyncio.create_task(run_tenant_config_listener())
+    await init_cache()
+    audit_log.start(engine)
     yield
     logger.info("Shutting down application...")
+    revocation_listener.cancel()
+    tenant_config_listener.cancel()
+    # Before the engine is disposed: queued audit events are written or spilled
+    await audit_log.stop()
+    await close_cache()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
 
 
 app = FastAPI(
@@ -64,6 +82,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(AuditContextMiddleware)
 
 app.include_router(api_router)
 
@@ -76,3 +95,22 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+# Process metrics expose pool, cache and audit internals: admins only
+@app.get("/health/db-pool", dependencies=[Depends(require_admin)])
+async def db_pool_health():
+    """Connection pool saturation and checkout wait times for this process"""
+    return pool_status()
+
+
+@app.get("/health/cache", dependencies=[Depends(require_admin)])
+async def cache_health():
+    """Response cache hits, misses and errors per namespace for this process"""
+    return cache_metrics.snapshot()
+
+
+@app.get("/health/audit", dependencies=[Depends(require_admin)])
+async def audit_health():
+    """Audit queue depth and batch write, backpressure and spill counts for this process"""
+    return audit_log.snapshot()
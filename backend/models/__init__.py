@@ -1,7 +1,7 @@
 from models.system import System
 from models.user import User, RefreshToken
 from models.system_config import SystemConfig, FeatureFlag
-from models.lab_result import LabResult, Biomarker
+from models.lab_result import LabResult, Biomarker, LabOcrCache
 from models.action_plan import ActionPlan, ActionItem
 from models.consultation import Doctor, AvailabilitySlot, Consultation, ConsultationType, ConsultationStatus
 from models.staff import Staff, Department
@@ -14,7 +14,7 @@ from models.nutrition import (
     MealPlanMeal,
     NutritionFeedback
 )
-from models.lab_order import LabTestOrder
+from models.lab_order import LabTestOrder, LabTestOrderItem, LabOrderStatusCount, LabTurnaroundBucket
 from models.medical_history import MedicalHistory, Medication
 from models.audit_log import AuditLog
 from models.permissions import ModulePermission, ApplicationAccess
@@ -27,6 +27,7 @@ __all__ = [
     "FeatureFlag",
     "LabResult",
     "Biomarker",
+    "LabOcrCache",
     "ActionPlan",
     "ActionItem",
     "Doctor",
@@ -46,6 +47,9 @@ __all__ = [
     "MealPlanMeal",
     "NutritionFeedback",
     "LabTestOrder",
+    "LabTestOrderItem",
+    "LabOrderStatusCount",
+    "LabTurnaroundBucket",
     "MedicalHistory",
     "Medication",
     "AuditLog",
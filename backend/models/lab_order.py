@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum as SQLEnum, Date
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum as SQLEnum, Date, Integer, Index, Float
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -33,6 +33,10 @@ class LabTestOrder(Base):
     collected_by = Column(String, ForeignKey("staff.id", ondelete="SET NULL"), nullable=True)
     
     status = Column(SQLEnum(LabOrderStatus), default=LabOrderStatus.ORDERED, nullable=False, index=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)  # first time the order became completed
+
+    # Set when the order's turnaround stages are sampled, so each is counted once
+    collection_recorded_at = Column(DateTime(timezone=True), nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -42,4 +46,59 @@ class LabTestOrder(Base):
     ordering_physician = relationship("Staff", back_populates="lab_orders", foreign_keys=[ordering_physician_id])
     collector = relationship("Staff", foreign_keys=[collected_by])
     system = relationship("System", back_populates="lab_orders")
+    items = relationship("LabTestOrderItem", back_populates="lab_order", cascade="all, delete-orphan", order_by="LabTestOrderItem.position")
+
+
+class LabTestOrderItem(Base):
+    """One ordered test on a lab order (normalized from LabTestOrder.test_types)"""
+    __tablename__ = "lab_test_order_items"
+    __table_args__ = (
+        Index('ix_lab_test_order_items_system_test_key', 'system_id', 'test_key'),
+        Index('ix_lab_test_order_items_order_test_key', 'lab_order_id', 'test_key', unique=True),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    lab_order_id = Column(String, ForeignKey("lab_test_orders.id", ondelete="CASCADE"), nullable=False, index=True)
+    system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), nullable=False)
+
+    position = Column(Integer, default=0, server_default="0", nullable=False)  # order within test_types
+    test_name = Column(String, nullable=False)  # as ordered, e.g. "HbA1c"
+    test_key = Column(String, nullable=False)   # normalized for lookups, e.g. "hba1c"
+
+    status = Column(SQLEnum(LabOrderStatus), default=LabOrderStatus.ORDERED, nullable=False, index=True)
+    resulted_at = Column(DateTime(timezone=True), nullable=True)
+    lab_result_id = Column(String, ForeignKey("lab_results.id", ondelete="SET NULL"), nullable=True, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    lab_order = relationship("LabTestOrder", back_populates="items")
+    lab_result = relationship("LabResult")
+
+
+class LabOrderStatusCount(Base):
+    """Per-system order counts by status and priority, kept current on every order write"""
+    __tablename__ = "lab_order_status_counts"
+
+    system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(SQLEnum(LabOrderStatus), primary_key=True)
+    priority = Column(SQLEnum(LabOrderPriority), primary_key=True)
+    order_count = Column(Integer, default=0, server_default="0", nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class LabTurnaroundBucket(Base):
+    """Histogram bucket of lab turnaround samples per system, lab, priority and workflow stage"""
+    __tablename__ = "lab_turnaround_buckets"
+
+    system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), primary_key=True)
+    lab_name = Column(String, primary_key=True)  # "" when the order names no external lab
+    priority = Column(String, primary_key=True)  # LabOrderPriority value, or "unknown"
+    stage = Column(String, primary_key=True)     # e.g. "order_to_collection"
+    bucket = Column(Integer, primary_key=True)   # log-spaced minutes bucket
+
+    sample_count = Column(Integer, default=0, server_default="0", nullable=False)
+    total_minutes = Column(Float, default=0, server_default="0", nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
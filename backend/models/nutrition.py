@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Integer, Text, Enum as SQLEnum, Date
+from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, Integer, Text, Enum as SQLEnum, Date, Index, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -10,10 +10,16 @@ from schemas.enums import MealPlanStatus, MealType, ComplianceLevel
 class NutritionAssessment(Base):
     """Nutritional assessments conducted by nutritionists"""
     __tablename__ = "nutrition_assessments"
+    __table_args__ = (
+        # Tenant-scoped list/keyset paging indexes (patient timeline, nutritionist caseload)
+        Index('ix_nutrition_assessments_system_patient_date', 'system_id', 'patient_id', 'assessment_date'),
+        Index('ix_nutrition_assessments_system_nutritionist_date', 'system_id', 'nutritionist_id', 'assessment_date'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     patient_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     nutritionist_id = Column(String, ForeignKey("staff.id", ondelete="CASCADE"), nullable=False, index=True)
+    system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), nullable=False, index=True)
     
     assessment_date = Column(DateTime(timezone=True), nullable=False, index=True)
     
@@ -46,11 +52,20 @@ class NutritionAssessment(Base):
 class MealPlan(Base):
     """Meal plans created by nutritionists"""
     __tablename__ = "meal_plans"
+    __table_args__ = (
+        Index('ix_meal_plans_system_patient_start', 'system_id', 'patient_id', 'start_date'),
+        Index('ix_meal_plans_system_nutritionist_start', 'system_id', 'nutritionist_id', 'start_date'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
-    assessment_id = Column(String, ForeignKey("nutrition_assessments.id", ondelete="CASCADE"), nullable=False, index=True)
-    patient_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    assessment_id = Column(String, ForeignKey("nutrition_assessments.id", ondelete="CASCADE"), nullable=True, index=True)
+    patient_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)  # NULL for templates
     nutritionist_id = Column(String, ForeignKey("staff.id", ondelete="CASCADE"), nullable=False, index=True)
+    system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # Templates are reusable plans with no patient; clones record the plan they were copied from
+    is_template = Column(Boolean, default=False, server_default="false", nullable=False, index=True)
+    source_plan_id = Column(String, ForeignKey("meal_plans.id", ondelete="SET NULL"), nullable=True, index=True)
     
     plan_name = Column(String, nullable=False)  # e.g., "Pregnancy Week 12 Plan"
     description = Column(Text, nullable=True)
@@ -67,6 +82,14 @@ class MealPlan(Base):
     special_instructions = Column(Text, nullable=True)
     status = Column(SQLEnum(MealPlanStatus), default=MealPlanStatus.ACTIVE, nullable=False, index=True)
     
+    # Precomputed rollups across all days (maintained incrementally on meal writes)
+    day_count = Column(Integer, default=0, server_default="0", nullable=False)
+    meal_count = Column(Integer, default=0, server_default="0", nullable=False)
+    total_calories = Column(Integer, default=0, server_default="0", nullable=False)
+    total_protein_grams = Column(Integer, default=0, server_default="0", nullable=False)
+    total_carbs_grams = Column(Integer, default=0, server_default="0", nullable=False)
+    total_fats_grams = Column(Integer, default=0, server_default="0", nullable=False)
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -89,6 +112,13 @@ class MealPlanDay(Base):
     day_of_week = Column(String, nullable=True)   # "Monday", "Tuesday", etc.
     notes = Column(Text, nullable=True)
     
+    # Precomputed rollups of this day's meals (maintained incrementally on meal writes)
+    meal_count = Column(Integer, default=0, server_default="0", nullable=False)
+    total_daily_calories = Column(Integer, default=0, server_default="0", nullable=False)
+    total_daily_protein = Column(Integer, default=0, server_default="0", nullable=False)
+    total_daily_carbs = Column(Integer, default=0, server_default="0", nullable=False)
+    total_daily_fats = Column(Integer, default=0, server_default="0", nullable=False)
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
@@ -127,11 +157,16 @@ class MealPlanMeal(Base):
 class NutritionFeedback(Base):
     """Feedback from nutritionist on patient's progress"""
     __tablename__ = "nutrition_feedback"
+    __table_args__ = (
+        Index('ix_nutrition_feedback_system_patient_date', 'system_id', 'patient_id', 'feedback_date'),
+        Index('ix_nutrition_feedback_system_nutritionist_date', 'system_id', 'nutritionist_id', 'feedback_date'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     patient_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     nutritionist_id = Column(String, ForeignKey("staff.id", ondelete="CASCADE"), nullable=False, index=True)
     meal_plan_id = Column(String, ForeignKey("meal_plans.id", ondelete="SET NULL"), nullable=True, index=True)
+    system_id = Column(String, ForeignKey("systems.id", ondelete="CASCADE"), nullable=False, index=True)
     
     feedback_date = Column(DateTime(timezone=True), nullable=False, index=True)
     
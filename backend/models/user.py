@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Index, Integer
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -14,6 +14,8 @@ class User(Base):
     username = Column(String, unique=True, nullable=False)
     password = Column(String, nullable=False)
     role = Column(String, default="patient", nullable=False, index=True)  # patient, admin, physician, nutritionist, nurse, system_admin
+    # Bumped when role, email, username or active status change; access tokens with an older value must be refreshed
+    permissions_version = Column(Integer, default=1, server_default="1", nullable=False)
     
     # Application access control
     primary_application = Column(String, default="health_platform", nullable=False)  # "health_platform" or "admin_portal"
@@ -53,11 +55,16 @@ class User(Base):
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # A user's live tokens (logout, session listing)
+        Index('ix_refresh_tokens_user_id_expires_at', 'user_id', 'expires_at'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    token = Column(String, unique=True, nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # SHA-256 of the token; the token itself is never stored
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="refresh_tokens")
@@ -15,25 +15,46 @@ from schemas.enums import SOAPNoteStatus, AttachmentType
 class SOAPNoteAttachmentBase(BaseModel):
     """Base schema for SOAP note attachments"""
     file_type: AttachmentType = Field(..., description="Type of attachment")
-    file_url: str = Field(..., description="S3 URL or path to file")
     file_name: str = Field(..., max_length=255, description="Original file name")
     description: Optional[str] = Field(None, max_length=500, description="Description of attachment")
 
 
+class SOAPNoteAttachmentUploadRequest(BaseModel):
+    """Request for a presigned direct-to-storage attachment upload"""
+    file_name: str = Field(..., min_length=1, max_length=255, description="Original file name")
+    content_type: str = Field(..., min_length=1, max_length=100, description="MIME type of the file")
+
+
+class SOAPNoteAttachmentUploadTicket(BaseModel):
+    """Where to upload an attachment; pass ``s3_key`` when creating the attachment"""
+    s3_key: str = Field(..., description="Storage key reserved for the file")
+    upload_url: str = Field(..., description="Presigned POST URL")
+    upload_fields: dict[str, str] = Field(..., description="Form fields to include with the file")
+    expires_in: int = Field(..., description="Seconds until the upload URL expires")
+
+
 class SOAPNoteAttachmentCreate(SOAPNoteAttachmentBase):
-    """Schema for creating an attachment"""
+    """Schema for creating an attachment once its file is uploaded"""
     soap_note_id: str = Field(..., description="SOAP note ID this attachment belongs to")
+    s3_key: str = Field(..., description="Storage key from the upload ticket")
 
 
 class SOAPNoteAttachmentResponse(SOAPNoteAttachmentBase):
     """Schema for attachment response"""
     id: str
     soap_note_id: str
+    file_size: Optional[str] = None
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class AttachmentDownloadUrl(BaseModel):
+    """Short-lived download URL for an attachment"""
+    url: str = Field(..., description="Presigned download URL")
+    expires_in: int = Field(..., description="Seconds until the URL expires")
+
+
 # ============================================================================
 # SOAP Note Schemas
 # ============================================================================
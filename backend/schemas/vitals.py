@@ -230,3 +230,31 @@ class VitalsRange(BaseModel):
     respiratory_rate_min: int = 12
     respiratory_rate_max: int = 20
 
+
+# ============================================================================
+# Anthropometric Series Schemas
+# ============================================================================
+
+class AnthropometricPoint(BaseModel):
+    """One weight/BMI reading, or the average of a bucket of readings"""
+    recorded_at: datetime
+    source: str  # "vitals", "nutrition_assessment", "nutrition_feedback" or "aggregate"
+    weight: Optional[float] = None  # kg
+    bmi: Optional[float] = None
+    weight_delta: Optional[float] = None  # kg since the previous weighed point
+    weight_rate_per_week: Optional[float] = None  # kg/week since the previous weighed point
+    sample_count: int = 1
+
+
+class PatientAnthropometricSeries(BaseModel):
+    """Weight/BMI history merged across vitals, nutrition assessments and nutrition feedback"""
+    patient_id: str
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    total_readings: int
+    downsampled: bool
+    current_weight: Optional[float]
+    current_bmi: Optional[float]
+    weight_change: Optional[float]  # latest minus earliest weight in the range
+    weight_trend_per_week: Optional[float]  # least-squares slope, kg/week
+    points: list[AnthropometricPoint] = []
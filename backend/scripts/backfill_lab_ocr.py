@@ -0,0 +1,55 @@
+"""
+Re-run OCR for lab results whose OCR failed.
+
+Safe to run against a live database and resumable: pass --checkpoint to keep
+the keyset cursor between runs.
+
+    python scripts/backfill_lab_ocr.py --checkpoint /tmp/lab_ocr.json --workers 4
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from app.workers.ocr_backfill import OCRBackfill, DEFAULT_BATCH_SIZE, DEFAULT_S3_CONCURRENCY
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Re-OCR failed lab results")
+    parser.add_argument("--system-id", help="Only backfill this system's results")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="OCR processes (default: CPU count)")
+    parser.add_argument("--s3-concurrency", type=int, default=DEFAULT_S3_CONCURRENCY, help="Concurrent S3 downloads")
+    parser.add_argument("--checkpoint", help="File storing the keyset cursor, for resuming")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many results in this run")
+    parser.add_argument("--no-biomarkers", action="store_true", help="Do not parse biomarkers from recovered text")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        backfill = OCRBackfill(
+            executor,
+            system_id=args.system_id,
+            batch_size=args.batch_size,
+            s3_concurrency=args.s3_concurrency,
+            checkpoint_path=args.checkpoint,
+            extract_biomarkers=not args.no_biomarkers,
+            limit=args.limit,
+        )
+        progress = await backfill.run()
+
+    print(f"✅ OCR backfill complete: {progress.report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
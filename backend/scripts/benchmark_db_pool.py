@@ -0,0 +1,81 @@
+"""
+Benchmark connection pool behaviour under concurrency.
+
+For each concurrency level, that many tasks repeatedly open a session, hold
+a connection for --hold-ms (``pg_sleep``, standing in for a request's
+queries) and release it. Reports throughput and the pool's checkout wait
+times: once concurrency exceeds DB_POOL_SIZE + DB_MAX_OVERFLOW, requests
+queue for connections and the wait dominates latency.
+
+    python scripts/benchmark_db_pool.py --concurrency 5 20 50 100 --hold-ms 20
+    DB_POOL_SIZE=20 DB_MAX_OVERFLOW=0 python scripts/benchmark_db_pool.py
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import exc, text
+
+from core.config import settings
+from core.database import async_session_maker, engine, pool_metrics, pool_status
+
+
+async def worker(deadline: float, hold_seconds: float, peak: dict) -> int:
+    queries = 0
+    while time.perf_counter() < deadline:
+        try:
+            async with async_session_maker() as session:
+                await session.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": hold_seconds})
+                peak["checked_out"] = max(peak["checked_out"], pool_status()["checked_out"])
+        except exc.TimeoutError:
+            continue  # counted by pool_metrics
+        queries += 1
+    return queries
+
+
+async def run_level(concurrency: int, duration: float, hold_seconds: float) -> dict:
+    pool_metrics.reset()
+    peak = {"checked_out": 0}
+    started = time.perf_counter()
+    deadline = started + duration
+    counts = await asyncio.gather(*(worker(deadline, hold_seconds, peak) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    status = pool_status()
+    status["qps"] = sum(counts) / elapsed
+    status["peak_checked_out"] = peak["checked_out"]
+    return status
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure connection pool wait time under concurrency")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[5, 10, 30, 60, 120])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--hold-ms", type=float, default=20.0, help="Time each checkout holds its connection")
+    args = parser.parse_args()
+
+    print(
+        f"pool_size={settings.DB_POOL_SIZE} max_overflow={settings.DB_MAX_OVERFLOW} "
+        f"statement_cache_size={settings.DB_STATEMENT_CACHE_SIZE}"
+    )
+    print(f"{'tasks':>6} {'qps':>8} {'peak':>6} {'avg wait ms':>12} {'max wait ms':>12} {'slow':>6} {'timeouts':>8}")
+    try:
+        for concurrency in args.concurrency:
+            r = await run_level(concurrency, args.duration, args.hold_ms / 1000)
+            print(
+                f"{concurrency:>6} {r['qps']:>8.1f} {r['peak_checked_out']:>6} {r['avg_wait_ms']:>12.2f} "
+                f"{r['max_wait_ms']:>12.2f} {r['slow_checkouts']:>6} {r['timeouts']:>8}"
+            )
+    finally:
+        await engine.dispose()
+
+    print("✅ Pool benchmark complete")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
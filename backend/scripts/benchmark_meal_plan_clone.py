@@ -0,0 +1,111 @@
+"""
+Benchmark cloning a meal plan template to many patients.
+
+Builds a throwaway system, nutritionist, patients and a --days x
+--meals-per-day template inside one transaction, clones the template to
+every patient --repeat times and rolls everything back. Reports the time
+per clone and the statements issued per clone (one multi-row INSERT per
+table, whatever the number of patients).
+
+    python scripts/benchmark_meal_plan_clone.py --patients 50 --days 7 --meals-per-day 5
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import event
+
+from app.core.database import async_session_maker, engine
+from app.domains.nutrition.services.nutrition_service import NutritionService
+from app.shared.models import MealPlan, MealPlanDay, MealPlanMeal, Staff, System, User
+from app.shared.schemas.enums import MealType, StaffType
+from app.shared.schemas.nutrition import MealPlanCloneRequest
+
+
+async def build_template(session, patients: int, days: int, meals_per_day: int):
+    unique_id = uuid.uuid4().hex[:8]
+    system = System(name=f"Benchmark {unique_id}", slug=f"benchmark-{unique_id}")
+    session.add(system)
+    await session.flush()
+
+    users = [
+        User(email=f"bench{unique_id}-{n}@example.com", username=f"bench{unique_id}-{n}",
+             password="-", system_id=system.id, role="patient" if n else "nutritionist")
+        for n in range(patients + 1)
+    ]
+    session.add_all(users)
+    await session.flush()
+    nutritionist = Staff(user_id=users[0].id, system_id=system.id, staff_type=StaffType.NUTRITIONIST)
+    session.add(nutritionist)
+    await session.flush()
+
+    plan = MealPlan(
+        nutritionist_id=nutritionist.id, system_id=system.id, is_template=True,
+        plan_name="Benchmark template", start_date=date.today(),
+        day_count=days, meal_count=days * meals_per_day
+    )
+    session.add(plan)
+    await session.flush()
+    for day_number in range(1, days + 1):
+        day = MealPlanDay(meal_plan_id=plan.id, day_number=day_number, meal_count=meals_per_day)
+        session.add(day)
+        await session.flush()
+        session.add_all(
+            MealPlanMeal(day_id=day.id, meal_type=MealType.SNACK, meal_name=f"Meal {n}", calories=400)
+            for n in range(meals_per_day)
+        )
+    await session.flush()
+    return plan, [user.id for user in users[1:]]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Time bulk meal plan cloning")
+    parser.add_argument("--patients", type=int, default=50)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--meals-per-day", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    statements = Counter()
+
+    def count_statement(orm_execute_state):
+        kind = "insert" if orm_execute_state.is_insert else "select" if orm_execute_state.is_select else "other"
+        statements[kind] += 1
+
+    try:
+        async with async_session_maker() as session:
+            plan, patient_ids = await build_template(session, args.patients, args.days, args.meals_per_day)
+            service = NutritionService(session)
+            request = MealPlanCloneRequest(patient_ids=patient_ids, start_date=date.today())
+
+            event.listen(session.sync_session, "do_orm_execute", count_statement)
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                await service.clone_meal_plan_to_patients(plan.id, request, plan.system_id)
+                timings.append((time.perf_counter() - started) * 1000)
+            event.remove(session.sync_session, "do_orm_execute", count_statement)
+
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+    rows = args.patients * (1 + args.days + args.days * args.meals_per_day)
+    print(f"{args.patients} patients x {args.days} days x {args.meals_per_day} meals = {rows} rows per clone")
+    print(f"median {statistics.median(timings):.1f} ms, min {min(timings):.1f} ms, max {max(timings):.1f} ms")
+    print(", ".join(f"{kind}: {count / args.repeat:g}" for kind, count in sorted(statements.items())) + " statements per clone")
+    print("✅ Clone benchmark complete")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""
+Benchmark lab report OCR: pages/second, peak RSS and biomarker recall per
+preprocessing preset.
+
+Each preset runs in a fresh process, so its peak RSS is not inflated by the
+presets before it. Use a directory of real reports (PDFs and images), or
+generate a synthetic corpus of slightly skewed, noisy scans with known
+biomarker values to also measure recall:
+
+    python scripts/benchmark_ocr.py --generate 10 --corpus /tmp/ocr_corpus
+    python scripts/benchmark_ocr.py --corpus /tmp/ocr_corpus --presets raw-200 full-300
+"""
+import argparse
+import json
+import multiprocessing
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from app.domains.labs.services.biomarker_parser import parse_biomarkers
+from app.domains.labs.services.ocr import OCRError, extract_text, guess_content_type
+from app.domains.labs.services.ocr_preprocess import OCROptions
+
+PRESETS = {
+    "raw-200": OCROptions.raw(dpi=200),
+    "gray-300": OCROptions(dpi=300, binarize=False, deskew=False, crop_margins=False),
+    "full-200": OCROptions(dpi=200),
+    "full-300": OCROptions(dpi=300),
+}
+
+GROUND_TRUTH_FILE = "ground_truth.json"
+
+SYNTHETIC_RESULTS = [
+    ("Hemoglobin", "g/dL", 12.0, 16.0),
+    ("Hematocrit", "%", 36.0, 46.0),
+    ("Glucose", "mg/dL", 70, 99),
+    ("Sodium", "mmol/L", 135, 145),
+    ("Potassium", "mmol/L", 3.5, 5.1),
+    ("Creatinine", "mg/dL", 0.6, 1.2),
+    ("Calcium", "mg/dL", 8.6, 10.3),
+    ("Albumin", "g/dL", 3.5, 5.0),
+    ("Platelets", "K/uL", 150, 400),
+    ("Cholesterol", "mg/dL", 125, 200),
+]
+
+
+def generate_corpus(corpus: Path, documents: int, pages_per_document: int = 2, seed: int = 7) -> None:
+    """Write synthetic multi-page report PDFs (letter size, 300 DPI) and their expected biomarkers"""
+    rng = random.Random(seed)
+    corpus.mkdir(parents=True, exist_ok=True)
+    ground_truth = {}
+
+    for doc_number in range(documents):
+        pages, expected = [], []
+        for page_number in range(pages_per_document):
+            page = Image.new("L", (2550, 3300), color=245)
+            draw = ImageDraw.Draw(page)
+            draw.text((200, 200), f"LAB REPORT    Page {page_number + 1} of {pages_per_document}", fill=0)
+            for row, (name, unit, low, high) in enumerate(rng.sample(SYNTHETIC_RESULTS, 6)):
+                value = round(rng.uniform(low * 0.8, high * 1.2), 1)
+                draw.text((200, 400 + row * 120), f"{name}    {value}    {unit}    {low} - {high}", fill=0)
+                expected.append(name)
+            page = page.rotate(rng.uniform(-2.5, 2.5), resample=Image.BICUBIC, fillcolor=245)
+            page = page.filter(ImageFilter.GaussianBlur(0.6))
+            pages.append(page.convert("RGB"))
+
+        file_name = f"report_{doc_number:03d}.pdf"
+        pages[0].save(corpus / file_name, save_all=True, append_images=pages[1:], resolution=300)
+        ground_truth[file_name] = expected
+
+    (corpus / GROUND_TRUTH_FILE).write_text(json.dumps(ground_truth, indent=2))
+
+
+def _run_preset(corpus: str, options: OCROptions, queue) -> None:
+    """Child process: OCR the corpus once and report throughput and peak RSS"""
+    corpus_path = Path(corpus)
+    truth_path = corpus_path / GROUND_TRUTH_FILE
+    ground_truth = json.loads(truth_path.read_text()) if truth_path.exists() else {}
+
+    pages = found = expected = failures = 0
+    started = time.perf_counter()
+    for path in sorted(corpus_path.iterdir()):
+        content_type = guess_content_type(path.name)
+        if not content_type or not (content_type == "application/pdf" or content_type.startswith("image/")):
+            continue
+        try:
+            text = extract_text(path.read_bytes(), content_type, options)
+        except OCRError:
+            failures += 1
+            continue
+        pages += text.count("\f") or 1
+        names = {b["test_name"].lower() for b in parse_biomarkers(text)}
+        if path.name in ground_truth:
+            expected += len(ground_truth[path.name])
+            found += sum(1 for name in ground_truth[path.name] if name.lower() in names)
+    elapsed = time.perf_counter() - started
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    queue.put({
+        "pages": pages,
+        "seconds": elapsed,
+        "pages_per_second": pages / elapsed if elapsed else 0.0,
+        "peak_rss_mb": peak_mb,
+        "recall": found / expected if expected else None,
+        "failures": failures,
+    })
+
+
+def run_preset(corpus: Path, options: OCROptions) -> dict:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run_preset, args=(str(corpus), options, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark lab OCR preprocessing presets")
+    parser.add_argument("--corpus", required=True, help="Directory of PDFs/images to OCR")
+    parser.add_argument("--generate", type=int, default=0, help="First write this many synthetic reports into --corpus")
+    parser.add_argument("--pages-per-document", type=int, default=2)
+    parser.add_argument(
+        "--presets", nargs="+", default=[*PRESETS, "settings"],
+        help=f"Presets to run: {', '.join(PRESETS)} or settings (current OCR_* settings)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    corpus = Path(args.corpus)
+    if args.generate:
+        print(f"📝 Generating {args.generate} synthetic reports in {corpus}")
+        generate_corpus(corpus, args.generate, args.pages_per_document)
+
+    print(f"{'preset':<10} {'pages':>6} {'pages/s':>8} {'peak MB':>8} {'recall':>7} {'failed':>6}")
+    for name in args.presets:
+        options = OCROptions.from_settings() if name == "settings" else PRESETS[name]
+        r = run_preset(corpus, options)
+        recall = f"{r['recall']:.0%}" if r["recall"] is not None else "-"
+        print(
+            f"{name:<10} {r['pages']:>6} {r['pages_per_second']:>8.2f} "
+            f"{r['peak_rss_mb']:>8.1f} {recall:>7} {r['failures']:>6}"
+        )
+
+    print("✅ OCR benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
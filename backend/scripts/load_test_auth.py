@@ -0,0 +1,116 @@
+"""
+Locust-style load test for login and registration.
+
+Simulated users are spawned at --spawn-rate per second up to --users. Each
+user registers once and then repeatedly picks a weighted task (login or a
+fresh registration) until --duration elapses. Per-endpoint RPS and latency
+percentiles are printed at the end; run it before and after a change against
+the same database to compare.
+
+    python scripts/load_test_auth.py --base-url http://localhost:8000 --system-slug doula-care --users 50
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List
+
+import httpx
+
+PASSWORD = "LoadTest123!"
+TASK_WEIGHTS = {"login": 4, "register": 1}
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    def record(self, name: str, started: float, ok: bool) -> None:
+        if ok:
+            self.latencies[name].append((time.perf_counter() - started) * 1000)
+        else:
+            self.failures[name] += 1
+
+    def report(self, elapsed: float) -> None:
+        print(f"{'endpoint':<10} {'requests':>8} {'failures':>8} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for name in sorted(set(self.latencies) | set(self.failures)):
+            latencies = sorted(self.latencies[name])
+            count = len(latencies)
+            if count >= 2:
+                cuts = statistics.quantiles(latencies, n=100)
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = latencies[0] if latencies else 0.0
+            print(
+                f"{name:<10} {count:>8} {self.failures[name]:>8} {count / elapsed:>8.1f} "
+                f"{p50:>8.1f} {p95:>8.1f} {p99:>8.1f}"
+            )
+
+
+async def register(client: httpx.AsyncClient, stats: Stats, system_slug: str) -> str:
+    suffix = uuid.uuid4().hex[:12]
+    email = f"load-{suffix}@example.com"
+    started = time.perf_counter()
+    response = await client.post("/auth/register", json={
+        "email": email,
+        "username": f"load_{suffix}",
+        "password": PASSWORD,
+        "profileType": "patient",
+        "journeyType": "general",
+        "systemSlug": system_slug,
+    })
+    stats.record("register", started, response.status_code == 201)
+    return email
+
+
+async def login(client: httpx.AsyncClient, stats: Stats, email: str) -> None:
+    started = time.perf_counter()
+    response = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    stats.record("login", started, response.status_code == 200)
+
+
+async def simulated_user(client: httpx.AsyncClient, stats: Stats, system_slug: str, deadline: float) -> None:
+    email = await register(client, stats, system_slug)
+    tasks, weights = zip(*TASK_WEIGHTS.items())
+    while time.perf_counter() < deadline:
+        task = random.choices(tasks, weights)[0]
+        try:
+            if task == "login":
+                await login(client, stats, email)
+            else:
+                await register(client, stats, system_slug)
+        except httpx.HTTPError:
+            stats.failures[task] += 1
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load test /auth/login and /auth/register")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--system-slug", required=True, help="Slug of an existing system to register users in")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent simulated users")
+    parser.add_argument("--spawn-rate", type=float, default=10.0, help="Users started per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    args = parser.parse_args()
+
+    stats = Stats()
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30.0) as client:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        users = []
+        for _ in range(args.users):
+            users.append(asyncio.create_task(simulated_user(client, stats, args.system_slug, deadline)))
+            await asyncio.sleep(1 / args.spawn_rate)
+        await asyncio.gather(*users)
+        elapsed = time.perf_counter() - started
+
+    stats.report(elapsed)
+    print(f"✅ Load test complete: {args.users} users for {elapsed:.0f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,7 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from fastapi import HTTPException, status
 
 from models.action_plan import ActionPlan, ActionItem
@@ -8,6 +9,7 @@ from schemas.action_plan import (
     ActionPlanResponse, ActionItemResponse, CreateActionPlanRequest,
     UpdateActionPlanRequest, CreateActionItemRequest, UpdateActionItemRequest
 )
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 # Constants for error messages
 ACTION_PLAN_NOT_FOUND = "Action plan not found"
@@ -28,8 +30,8 @@ class ActionPlansService:
         )
         
         self.db.add(action_plan)
-        await self.db.commit()
-        await self.db.refresh(action_plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_plan_to_response(action_plan)
 
@@ -82,8 +84,8 @@ class ActionPlansService:
         if data.status is not None:
             action_plan.status = data.status.value
         
-        await self.db.commit()
-        await self.db.refresh(action_plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_plan_to_response(action_plan)
 
@@ -103,7 +105,8 @@ class ActionPlansService:
             )
         
         await self.db.delete(action_plan)
-        await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return {"message": "Action plan deleted successfully"}
 
@@ -120,8 +123,8 @@ class ActionPlansService:
         )
         
         self.db.add(action_item)
-        await self.db.commit()
-        await self.db.refresh(action_item)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_item_to_response(action_item)
 
@@ -184,8 +187,8 @@ class ActionPlansService:
         if data.status is not None:
             action_item.status = data.status
         
-        await self.db.commit()
-        await self.db.refresh(action_item)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_item_to_response(action_item)
 
@@ -207,9 +210,9 @@ class ActionPlansService:
             )
         
         # Mark as completed
-        action_item.completed_at = func.now()
-        await self.db.commit()
-        await self.db.refresh(action_item)
+        action_item.completed_at = datetime.now(timezone.utc)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_item_to_response(action_item)
 
@@ -232,8 +235,8 @@ class ActionPlansService:
         
         # Mark as not completed
         action_item.completed_at = None
-        await self.db.commit()
-        await self.db.refresh(action_item)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return self._action_item_to_response(action_item)
 
@@ -255,7 +258,8 @@ class ActionPlansService:
             )
         
         await self.db.delete(action_item)
-        await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "action_plans", system_id)
         
         return {"message": "Action item deleted successfully"}
 
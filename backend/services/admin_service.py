@@ -23,6 +23,10 @@ from schemas.staff import (
     DepartmentResponse
 )
 from schemas.enums import UserRole, StaffType
+from core.tenant_config import tenant_configs, publish_tenant_config_change
+from core.permissions import clear_permission_cache
+from core.token_verifier import publish_permissions_version, revoke_user_tokens
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 
 class AdminService:
@@ -62,8 +66,8 @@ class AdminService:
         )
 
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "users", system_id)
 
         return self._user_to_admin_response(user)
 
@@ -81,22 +85,49 @@ class AdminService:
                 detail="User not found"
             )
 
+        # Access tokens carry these; a change must reach them
+        claims_changed = any(
+            value is not None and value != getattr(user, field)
+            for field, value in (
+                ("email", data.email),
+                ("username", data.username),
+                ("role", data.role),
+                ("is_active", data.is_active),
+            )
+        )
+        role_changed = data.role is not None and data.role != user.role
         if data.email is not None:
             user.email = data.email
         if data.username is not None:
             user.username = data.username
         if data.role is not None:
             user.role = data.role
-        if data.language is not None:
-            user.language = data.language
-        if data.profileType is not None:
-            user.profile_type = data.profileType
-        if data.journeyType is not None:
-            user.journey_type = data.journeyType
-
+        if data.first_name is not None:
+            user.first_name = data.first_name
+        if data.last_name is not None:
+            user.last_name = data.last_name
+        if data.phone_number is not None:
+            user.phone_number = data.phone_number
+        if data.is_active is not None:
+            user.is_active = data.is_active
+
+        if claims_changed:
+            user.permissions_version = User.permissions_version + 1
+
+        # Committed before broadcasting, so a refresh never reissues the old claims
         await self.db.commit()
         await self.db.refresh(user)
 
+        if claims_changed:
+            # Outstanding access tokens carry the old claims; make clients refresh them
+            await publish_permissions_version(user.id, user.permissions_version)
+        if role_changed:
+            # Permissions are cached per role; read the new role's grants fresh
+            clear_permission_cache()
+        if data.is_active is False:
+            await revoke_user_tokens(user.id)
+        invalidate_on_commit(self.db, "users", system_id)
+
         return self._user_to_admin_response(user)
 
     async def delete_user(self, user_id: str, system_id: str) -> dict:
@@ -114,7 +145,9 @@ class AdminService:
             )
 
         await self.db.delete(user)
-        await self.db.commit()
+        await self.db.commit()  # before revoking, as in update_user
+        await revoke_user_tokens(user_id)
+        invalidate_on_commit(self.db, "users", system_id)
 
         return {"message": "User deleted successfully"}
 
@@ -155,8 +188,7 @@ class AdminService:
         if data.slug is not None:
             system.slug = data.slug
 
-        await self.db.commit()
-        await self.db.refresh(system)
+        await self.db.flush()
 
         return SystemConfigResponse(
             id=system.id,
@@ -346,8 +378,11 @@ class AdminService:
         
         user.is_active = True
         user.updated_at = datetime.now()
+        user.permissions_version = User.permissions_version + 1
         await self.db.commit()
         await self.db.refresh(user)
+        await publish_permissions_version(user.id, user.permissions_version)
+        invalidate_on_commit(self.db, "users", system_id)
         
         return self._user_to_admin_response(user)
 
@@ -371,8 +406,12 @@ class AdminService:
         
         user.is_active = False
         user.updated_at = datetime.now()
+        user.permissions_version = User.permissions_version + 1
         await self.db.commit()
         await self.db.refresh(user)
+        await publish_permissions_version(user.id, user.permissions_version)
+        await revoke_user_tokens(user.id)
+        invalidate_on_commit(self.db, "users", system_id)
         
         return self._user_to_admin_response(user)
 
@@ -405,8 +444,7 @@ class AdminService:
         )
 
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
 
         # Create staff profile
         staff = Staff(
@@ -422,8 +460,8 @@ class AdminService:
         )
 
         self.db.add(staff)
-        await self.db.commit()
-        await self.db.refresh(staff)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "users", registration_data.system_id)
 
         return StaffRegistrationResponse(
             user_id=user.id,
@@ -496,8 +534,7 @@ class AdminService:
             setattr(staff, field, value)
 
         staff.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(staff)
+        await self.db.flush()
 
         # Get updated staff with relationships
         result = await self.db.execute(
@@ -532,7 +569,8 @@ class AdminService:
 
         # Delete staff (user will be deleted via cascade)
         await self.db.delete(staff)
-        await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "users", system_id)
 
         return {"message": "Staff member deleted successfully"}
 
@@ -609,8 +647,7 @@ class AdminService:
         )
 
         self.db.add(department)
-        await self.db.commit()
-        await self.db.refresh(department)
+        await self.db.flush()
 
         return DepartmentResponse.model_validate(department)
 
@@ -667,8 +704,7 @@ class AdminService:
             setattr(department, field, value)
 
         department.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(department)
+        await self.db.flush()
 
         return DepartmentResponse.model_validate(department)
 
@@ -703,7 +739,7 @@ class AdminService:
             )
 
         await self.db.delete(department)
-        await self.db.commit()
+        await self.db.flush()
 
         return {"message": "Department deleted successfully"}
 
@@ -713,25 +749,13 @@ class AdminService:
 
     async def get_system_configs(self, system_id: str) -> List[SystemConfigResponse]:
         """Get all system configurations"""
-        result = await self.db.execute(
-            select(SystemConfig)
-            .where(SystemConfig.system_id == system_id)
-            .order_by(SystemConfig.config_key)
-        )
-        configs = result.scalars().all()
-        return [SystemConfigResponse.model_validate(config) for config in configs]
+        snapshot = await tenant_configs.get(self.db, system_id)
+        return [SystemConfigResponse(**config) for config in snapshot.configs.values()]
 
     async def get_system_config(self, config_key: str, system_id: str) -> SystemConfigResponse:
         """Get a specific system configuration"""
-        result = await self.db.execute(
-            select(SystemConfig).where(
-                and_(
-                    SystemConfig.system_id == system_id,
-                    SystemConfig.config_key == config_key
-                )
-            )
-        )
-        config = result.scalar_one_or_none()
+        snapshot = await tenant_configs.get(self.db, system_id)
+        config = snapshot.configs.get(config_key)
         
         if not config:
             raise HTTPException(
@@ -739,7 +763,7 @@ class AdminService:
                 detail="Configuration not found"
             )
         
-        return SystemConfigResponse.model_validate(config)
+        return SystemConfigResponse(**config)
 
     async def set_system_config(self, config_key: str, config_value: str, data_type: str, system_id: str) -> SystemConfigResponse:
         """Set or update a system configuration"""
@@ -769,7 +793,7 @@ class AdminService:
             self.db.add(config)
         
         await self.db.commit()
-        await self.db.refresh(config)
+        await publish_tenant_config_change(system_id)
         
         return SystemConfigResponse.model_validate(config)
 
@@ -793,6 +817,7 @@ class AdminService:
 
         await self.db.delete(config)
         await self.db.commit()
+        await publish_tenant_config_change(system_id)
 
         return {"message": "Configuration deleted successfully"}
 
@@ -802,24 +827,8 @@ class AdminService:
 
     async def get_feature_flags(self, system_id: str) -> List[Dict[str, Any]]:
         """Get all feature flags for a system"""
-        result = await self.db.execute(
-            select(FeatureFlag)
-            .where(FeatureFlag.system_id == system_id)
-            .order_by(FeatureFlag.flag_name)
-        )
-        flags = result.scalars().all()
-        
-        return [
-            {
-                "id": flag.id,
-                "flag_name": flag.flag_name,
-                "is_enabled": flag.is_enabled,
-                "rollout_percentage": flag.rollout_percentage,
-                "created_at": flag.created_at,
-                "updated_at": flag.updated_at
-            }
-            for flag in flags
-        ]
+        snapshot = await tenant_configs.get(self.db, system_id)
+        return [dict(flag) for flag in snapshot.flags.values()]
 
     async def set_feature_flag(self, flag_name: str, is_enabled: bool, rollout_percentage: int, system_id: str) -> Dict[str, Any]:
         """Set or update a feature flag"""
@@ -849,7 +858,7 @@ class AdminService:
             self.db.add(flag)
         
         await self.db.commit()
-        await self.db.refresh(flag)
+        await publish_tenant_config_change(system_id)
         
         return {
             "id": flag.id,
@@ -67,8 +67,7 @@ class ConsultationsService:
         )
         
         self.db.add(consultation)
-        await self.db.commit()
-        await self.db.refresh(consultation)
+        await self.db.flush()
         
         return self._consultation_to_response(consultation)
 
@@ -114,8 +113,7 @@ class ConsultationsService:
         consultation.duration_minutes = data.durationMinutes
         consultation.status = ConsultationStatus.SCHEDULED
         
-        await self.db.commit()
-        await self.db.refresh(consultation)
+        await self.db.flush()
         
         return self._consultation_to_response(consultation)
 
@@ -141,7 +139,7 @@ class ConsultationsService:
             )
 
         consultation.status = ConsultationStatus.CANCELLED
-        await self.db.commit()
+        await self.db.flush()
         
         return {"message": "Consultation cancelled successfully"}
 
@@ -3,22 +3,36 @@ Lab Orders Service - Complete medical workflow for lab test orders
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy import select, insert, update, and_, or_, func, desc, asc, exists, tuple_, true
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
+from uuid import uuid4
 
-from models.lab_order import LabTestOrder
+from core.config import settings
+from models.lab_order import LabTestOrder, LabTestOrderItem, LabOrderStatusCount
 from models.lab_result import LabResult, Biomarker
 from models.user import User
 from models.staff import Staff
 from models.system import System
 from schemas.lab_order import (
     LabTestOrderCreate, LabTestOrderUpdate, LabTestOrderResponse,
+    LabTestOrderBulkCreate, LabTestOrderBulkItemResult, LabTestOrderBulkResponse,
     LabTestOrderWithDetails, LabTestOrderListFilter, LabTestOrderListResponse,
     LabStats, PatientLabSummary, PhysicianLabWorkload
 )
-from schemas.enums import LabOrderStatus, LabOrderPriority
+from schemas.enums import LabOrderStatus, LabOrderPriority, AuditActionType
+from app.domains.lab_orders.services.lab_turnaround_service import LabTurnaroundService
+from app.domains.lab_orders.services.status_counts import (
+    PENDING_STATUSES,
+    AWAITING_RESULT_STATUSES,
+    status_change_statements,
+    status_count_delta,
+    summarize_status_counts,
+)
+from app.domains.lab_orders.services.test_types import split_test_types, normalize_test_key
+from app.infrastructure.audit.writer import audit_on_commit
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 
 class LabOrdersService:
@@ -71,13 +85,109 @@ class LabOrdersService:
             external_lab_reference=order_data.external_lab_reference,
             status=LabOrderStatus.ORDERED
         )
+        lab_order.items = self._build_order_items(order_data.system_id, order_data.test_types)
 
         self.db.add(lab_order)
-        await self.db.commit()
-        await self.db.refresh(lab_order)
+        for stmt in status_change_statements(lab_order.system_id, None, (lab_order.status, lab_order.priority)):
+            await self.db.execute(stmt)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", lab_order.system_id)
+        audit_on_commit(self.db, AuditActionType.CREATE, "LAB_ORDER", lab_order.id)
 
         return LabTestOrderResponse.model_validate(lab_order)
 
+    async def create_lab_orders_bulk(self, bulk_data: LabTestOrderBulkCreate, system_id: str) -> LabTestOrderBulkResponse:
+        """
+        Create many lab orders at once.
+
+        Patients and physicians are validated with one IN query each and
+        valid orders (and their items) are inserted with one executemany
+        each. Invalid orders are reported per row and do not block the rest
+        of the batch. New orders are ORDERED, which ends no turnaround stage,
+        so there are no turnaround samples to record.
+        """
+        orders = bulk_data.orders
+
+        patient_ids = {order.patient_id for order in orders}
+        known_patients = set((await self.db.execute(
+            select(User.id).where(and_(User.id.in_(patient_ids), User.system_id == system_id))
+        )).scalars().all())
+
+        physician_ids = {order.ordering_physician_id for order in orders}
+        known_physicians = set((await self.db.execute(
+            select(Staff.id).where(and_(Staff.id.in_(physician_ids), Staff.system_id == system_id))
+        )).scalars().all())
+
+        results: List[Optional[LabTestOrderBulkItemResult]] = [None] * len(orders)
+        order_rows = []
+        item_rows = []
+        row_index: Dict[str, int] = {}
+        priority_counts: Dict[LabOrderPriority, int] = {}
+        for index, order_data in enumerate(orders):
+            if order_data.system_id != system_id:
+                error = "System mismatch"
+            elif order_data.patient_id not in known_patients:
+                error = "Patient not found"
+            elif order_data.ordering_physician_id not in known_physicians:
+                error = "Ordering physician not found"
+            else:
+                error = None
+            if error:
+                results[index] = LabTestOrderBulkItemResult(index=index, success=False, error=error)
+                continue
+
+            order_id = str(uuid4())
+            row_index[order_id] = index
+            order_rows.append({
+                "id": order_id,
+                "patient_id": order_data.patient_id,
+                "ordering_physician_id": order_data.ordering_physician_id,
+                "system_id": system_id,
+                "order_date": order_data.order_date,
+                "priority": order_data.priority,
+                "test_types": order_data.test_types,
+                "clinical_indication": order_data.clinical_indication,
+                "special_instructions": order_data.special_instructions,
+                "external_lab_name": order_data.external_lab_name,
+                "external_lab_reference": order_data.external_lab_reference,
+                "status": LabOrderStatus.ORDERED,
+            })
+            item_rows.extend(
+                {
+                    "id": str(uuid4()),
+                    "lab_order_id": order_id,
+                    "system_id": system_id,
+                    "position": item.position,
+                    "test_name": item.test_name,
+                    "test_key": item.test_key,
+                    "status": LabOrderStatus.ORDERED,
+                }
+                for item in self._build_order_items(system_id, order_data.test_types)
+            )
+            priority_counts[order_data.priority] = priority_counts.get(order_data.priority, 0) + 1
+
+        if order_rows:
+            created = await self.db.scalars(insert(LabTestOrder).returning(LabTestOrder), order_rows)
+            for lab_order in created.all():
+                index = row_index[lab_order.id]
+                audit_on_commit(self.db, AuditActionType.CREATE, "LAB_ORDER", lab_order.id)
+                results[index] = LabTestOrderBulkItemResult(
+                    index=index,
+                    success=True,
+                    order=LabTestOrderResponse.model_validate(lab_order)
+                )
+            if item_rows:
+                await self.db.execute(insert(LabTestOrderItem), item_rows)
+            for priority, count in priority_counts.items():
+                await self.db.execute(status_count_delta(system_id, LabOrderStatus.ORDERED, priority, count))
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+
+        return LabTestOrderBulkResponse(
+            created=len(order_rows),
+            failed=len(orders) - len(order_rows),
+            results=results
+        )
+
     async def get_lab_order(self, order_id: str, system_id: str) -> LabTestOrderWithDetails:
         """Get a specific lab order with details"""
         result = await self.db.execute(
@@ -129,13 +239,24 @@ class LabOrdersService:
                 detail="Lab order not found"
             )
 
+        old_status, old_priority = lab_order.status, lab_order.priority
+        changes = update_data.model_dump(exclude_unset=True)
+
         # Update fields
-        for field, value in update_data.model_dump(exclude_unset=True).items():
+        for field, value in changes.items():
             setattr(lab_order, field, value)
 
         lab_order.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(lab_order)
+        for stmt in status_change_statements(lab_order.system_id, (old_status, old_priority), (lab_order.status, lab_order.priority)):
+            await self.db.execute(stmt)
+        if "test_types" in changes:
+            await self._sync_order_items(lab_order)
+        if lab_order.status != old_status:
+            await self._propagate_item_status(lab_order.id, lab_order.status)
+            await LabTurnaroundService(self.db).record_order_transition(lab_order, old_status)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+        audit_on_commit(self.db, AuditActionType.UPDATE, "LAB_ORDER", lab_order.id, changes={"fields": sorted(changes)})
 
         return LabTestOrderResponse.model_validate(lab_order)
 
@@ -164,8 +285,12 @@ class LabOrdersService:
                 detail="Cannot delete completed lab orders"
             )
 
+        for stmt in status_change_statements(lab_order.system_id, (lab_order.status, lab_order.priority), None):
+            await self.db.execute(stmt)
         await self.db.delete(lab_order)
-        await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+        audit_on_commit(self.db, AuditActionType.DELETE, "LAB_ORDER", order_id)
 
     async def list_lab_orders(self, filters: LabTestOrderListFilter, system_id: str) -> LabTestOrderListResponse:
         """List lab orders with filtering and pagination"""
@@ -258,251 +383,287 @@ class LabOrdersService:
         lab_order.collection_date = datetime.now()
         lab_order.collected_by = collected_by
         lab_order.updated_at = datetime.now()
-
-        await self.db.commit()
-        await self.db.refresh(lab_order)
+        for stmt in status_change_statements(
+            lab_order.system_id,
+            (LabOrderStatus.ORDERED, lab_order.priority),
+            (LabOrderStatus.COLLECTED, lab_order.priority)
+        ):
+            await self.db.execute(stmt)
+        await self._propagate_item_status(lab_order.id, LabOrderStatus.COLLECTED)
+        await LabTurnaroundService(self.db).record_order_transition(lab_order, LabOrderStatus.ORDERED)
+
+        await self.db.flush()
+        invalidate_on_commit(self.db, "lab_orders", system_id)
+        audit_on_commit(self.db, AuditActionType.UPDATE, "LAB_ORDER", lab_order.id, description="Sample collected")
 
         return LabTestOrderResponse.model_validate(lab_order)
 
     async def get_lab_stats(self, system_id: str) -> LabStats:
-        """Get lab module statistics"""
-        # Total orders
-        total_orders_result = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(LabTestOrder.system_id == system_id)
-        )
-        total_orders = total_orders_result.scalar()
-
-        # Pending orders
-        pending_orders_result = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(
-                and_(
-                    LabTestOrder.system_id == system_id,
-                    LabTestOrder.status.in_([LabOrderStatus.ORDERED, LabOrderStatus.COLLECTED, LabOrderStatus.PROCESSING])
+        """
+        Get lab statistics for the system in a single round-trip.
+
+        Order counts come from GROUPING SETS ((status), (priority)) over either
+        lab_test_orders or, when LAB_STATS_USE_ROLLUP is set, the per-system
+        lab_order_status_counts rollup. Result counts are one FILTER aggregate.
+        """
+        week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+
+        if settings.LAB_STATS_USE_ROLLUP:
+            order_counts = (
+                select(
+                    LabOrderStatusCount.status,
+                    LabOrderStatusCount.priority,
+                    func.sum(LabOrderStatusCount.order_count).label("order_count"),
                 )
+                .where(LabOrderStatusCount.system_id == system_id)
+                .group_by(func.grouping_sets(tuple_(LabOrderStatusCount.status), tuple_(LabOrderStatusCount.priority)))
+                .subquery()
             )
-        )
-        pending_orders = pending_orders_result.scalar()
-
-        # Completed orders
-        completed_orders_result = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(
-                and_(
-                    LabTestOrder.system_id == system_id,
-                    LabTestOrder.status == LabOrderStatus.COMPLETED
+        else:
+            order_counts = (
+                select(
+                    LabTestOrder.status,
+                    LabTestOrder.priority,
+                    func.count().label("order_count"),
                 )
+                .where(LabTestOrder.system_id == system_id)
+                .group_by(func.grouping_sets(tuple_(LabTestOrder.status), tuple_(LabTestOrder.priority)))
+                .subquery()
             )
-        )
-        completed_orders = completed_orders_result.scalar()
 
-        # Total results
-        total_results_result = await self.db.execute(
-            select(func.count()).select_from(LabResult).where(LabResult.system_id == system_id)
-        )
-        total_results = total_results_result.scalar()
-
-        # Unreviewed results
-        unreviewed_results_result = await self.db.execute(
-            select(func.count()).select_from(LabResult).where(
-                and_(
-                    LabResult.system_id == system_id,
-                    LabResult.is_reviewed == False
-                )
+        has_critical = exists().where(
+            and_(
+                Biomarker.lab_result_id == LabResult.id,
+                Biomarker.is_critical.is_(True)
             )
         )
-        unreviewed_results = unreviewed_results_result.scalar()
-
-        # Results with critical values
-        critical_results_result = await self.db.execute(
-            select(func.count()).select_from(Biomarker).join(LabResult).where(
-                and_(
-                    LabResult.system_id == system_id,
-                    Biomarker.is_critical == True
-                )
-            )
-        )
-        results_with_critical_values = critical_results_result.scalar()
-
-        # Orders this week
-        week_ago = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        week_ago = week_ago.replace(day=week_ago.day - 7)
-        
-        orders_this_week_result = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(
+        orders_this_week = (
+            select(func.count())
+            .select_from(LabTestOrder)
+            .where(
                 and_(
                     LabTestOrder.system_id == system_id,
                     LabTestOrder.order_date >= week_ago
                 )
             )
+            .scalar_subquery()
+        )
+        results = (
+            select(
+                func.count().label("total_results"),
+                func.count().filter(LabResult.is_reviewed.is_(False)).label("unreviewed_results"),
+                func.count().filter(has_critical).label("results_with_critical_values"),
+                orders_this_week.label("orders_this_week"),
+            )
+            .where(LabResult.system_id == system_id)
+            .subquery()
         )
-        orders_this_week = orders_this_week_result.scalar()
+
+        # One row per grouping set (or a single row with NULL counts when there are no orders)
+        rows = (await self.db.execute(
+            select(results, order_counts.c.status, order_counts.c.priority, order_counts.c.order_count)
+            .select_from(results.outerjoin(order_counts, true()))
+        )).all()
+        first = rows[0]
 
         return LabStats(
-            total_orders=total_orders,
-            pending_orders=pending_orders,
-            completed_orders=completed_orders,
-            total_results=total_results,
-            unreviewed_results=unreviewed_results,
-            results_with_critical_values=results_with_critical_values,
-            orders_this_week=orders_this_week
+            **summarize_status_counts(rows),
+            total_results=first.total_results,
+            unreviewed_results=first.unreviewed_results,
+            results_with_critical_values=first.results_with_critical_values,
+            orders_this_week=first.orders_this_week
         )
 
     async def get_patient_lab_summary(self, patient_id: str, system_id: str) -> PatientLabSummary:
-        """Get patient's lab test summary"""
-        # Get patient info
-        patient_result = await self.db.execute(
-            select(User).where(User.id == patient_id)
-        )
-        patient = patient_result.scalar_one_or_none()
-        if not patient:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Patient not found"
+        """Get lab summary for a specific patient from one aggregate query"""
+        results = (
+            select(
+                func.count(func.distinct(LabResult.id)).label("total_results"),
+                func.count(Biomarker.id).filter(Biomarker.is_critical.is_(True)).label("critical_values_count"),
+                func.max(LabResult.uploaded_at).label("last_uploaded_at"),
             )
-
-        # Get total results
-        total_results_result = await self.db.execute(
-            select(func.count()).select_from(LabResult).where(
-                and_(
-                    LabResult.user_id == patient_id,
-                    LabResult.system_id == system_id
-                )
-            )
-        )
-        total_results = total_results_result.scalar()
-
-        # Get recent results (last 5)
-        recent_results_result = await self.db.execute(
-            select(LabResult)
-            .options(selectinload(LabResult.biomarkers))
+            .select_from(LabResult)
+            .outerjoin(Biomarker, Biomarker.lab_result_id == LabResult.id)
             .where(
                 and_(
                     LabResult.user_id == patient_id,
                     LabResult.system_id == system_id
                 )
             )
-            .order_by(desc(LabResult.test_date))
-            .limit(5)
+            .subquery()
         )
-        recent_results = recent_results_result.scalars().all()
-
-        # Get pending orders
-        pending_orders_result = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(
+        orders = (
+            select(
+                func.count().filter(LabTestOrder.status.in_(PENDING_STATUSES)).label("pending_orders"),
+            )
+            .where(
                 and_(
                     LabTestOrder.patient_id == patient_id,
-                    LabTestOrder.system_id == system_id,
-                    LabTestOrder.status.in_([LabOrderStatus.ORDERED, LabOrderStatus.COLLECTED, LabOrderStatus.PROCESSING])
+                    LabTestOrder.system_id == system_id
                 )
             )
+            .subquery()
         )
-        pending_orders = pending_orders_result.scalar()
 
-        # Get last test date
-        last_test_result = await self.db.execute(
-            select(LabResult.test_date)
+        result = await self.db.execute(
+            select(User.username, results, orders)
+            .select_from(User)
+            .join(results, true())
+            .join(orders, true())
             .where(
                 and_(
-                    LabResult.user_id == patient_id,
-                    LabResult.system_id == system_id
+                    User.id == patient_id,
+                    User.system_id == system_id
                 )
             )
-            .order_by(desc(LabResult.test_date))
-            .limit(1)
         )
-        last_test_date = last_test_result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        # Get critical values count
-        critical_count_result = await self.db.execute(
-            select(func.count()).select_from(Biomarker).join(LabResult).where(
-                and_(
-                    LabResult.user_id == patient_id,
-                    LabResult.system_id == system_id,
-                    Biomarker.is_critical == True
-                )
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
             )
-        )
-        critical_values_count = critical_count_result.scalar()
 
         return PatientLabSummary(
             patient_id=patient_id,
-            patient_name=f"{patient.first_name} {patient.last_name}",
-            total_results=total_results,
-            recent_results=[],  # Would need to convert to proper response format
-            pending_orders=pending_orders,
-            last_test_date=last_test_date,
-            critical_values_count=critical_values_count
+            patient_name=row.username,
+            total_results=row.total_results,
+            recent_results=[],
+            pending_orders=row.pending_orders,
+            last_test_date=row.last_uploaded_at.date() if row.last_uploaded_at else None,
+            critical_values_count=row.critical_values_count
         )
 
     async def get_physician_workload(self, physician_id: str, system_id: str) -> PhysicianLabWorkload:
-        """Get physician's lab review workload"""
-        # Get physician info
-        physician_result = await self.db.execute(
-            select(Staff).where(Staff.id == physician_id)
-        )
-        physician = physician_result.scalar_one_or_none()
-        if not physician:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Physician not found"
-            )
+        """Get lab review workload for a specific physician from one aggregate query"""
+        week_ago = datetime.now(timezone.utc) - timedelta(days=7)
 
-        # Get pending reviews (results ordered by this physician but not reviewed)
-        pending_reviews_result = await self.db.execute(
-            select(func.count()).select_from(LabResult).where(
-                and_(
-                    LabResult.system_id == system_id,
-                    LabResult.ordered_by == physician_id,
-                    LabResult.is_reviewed == False
-                )
+        awaiting_review = and_(
+            LabResult.ordered_by == physician_id,
+            LabResult.is_reviewed.is_(False)
+        )
+        has_critical = exists().where(
+            and_(
+                Biomarker.lab_result_id == LabResult.id,
+                Biomarker.is_critical.is_(True)
             )
         )
-        pending_reviews = pending_reviews_result.scalar()
-
-        # Get reviewed this week
-        week_ago = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        week_ago = week_ago.replace(day=week_ago.day - 7)
-        
-        reviewed_this_week_result = await self.db.execute(
-            select(func.count()).select_from(LabResult).where(
+        results = (
+            select(
+                func.count().filter(awaiting_review).label("pending_reviews"),
+                func.count().filter(
+                    and_(
+                        LabResult.reviewed_by == physician_id,
+                        LabResult.reviewed_at >= week_ago
+                    )
+                ).label("reviewed_this_week"),
+                func.count().filter(and_(awaiting_review, has_critical)).label("critical_results_pending"),
+            )
+            .where(
                 and_(
                     LabResult.system_id == system_id,
-                    LabResult.reviewed_by == physician_id,
-                    LabResult.reviewed_at >= week_ago
+                    or_(
+                        LabResult.ordered_by == physician_id,
+                        LabResult.reviewed_by == physician_id
+                    )
                 )
             )
+            .subquery()
         )
-        reviewed_this_week = reviewed_this_week_result.scalar()
-
-        # Get orders pending results
-        orders_pending_results_result = await self.db.execute(
-            select(func.count()).select_from(LabTestOrder).where(
+        orders = (
+            select(
+                func.count().filter(LabTestOrder.status.in_(AWAITING_RESULT_STATUSES)).label("orders_pending_results"),
+            )
+            .where(
                 and_(
-                    LabTestOrder.system_id == system_id,
                     LabTestOrder.ordering_physician_id == physician_id,
-                    LabTestOrder.status.in_([LabOrderStatus.COLLECTED, LabOrderStatus.PROCESSING])
+                    LabTestOrder.system_id == system_id
                 )
             )
+            .subquery()
         )
-        orders_pending_results = orders_pending_results_result.scalar()
 
-        # Get critical results pending review
-        critical_results_pending_result = await self.db.execute(
-            select(func.count()).select_from(LabResult).join(Biomarker).where(
+        result = await self.db.execute(
+            select(User.username, results, orders)
+            .select_from(Staff)
+            .join(User, User.id == Staff.user_id)
+            .join(results, true())
+            .join(orders, true())
+            .where(
                 and_(
-                    LabResult.system_id == system_id,
-                    LabResult.ordered_by == physician_id,
-                    LabResult.is_reviewed == False,
-                    Biomarker.is_critical == True
+                    Staff.id == physician_id,
+                    Staff.system_id == system_id
                 )
             )
         )
-        critical_results_pending = critical_results_pending_result.scalar()
+        row = result.one_or_none()
+
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Physician not found"
+            )
 
         return PhysicianLabWorkload(
             physician_id=physician_id,
-            physician_name=f"{physician.first_name} {physician.last_name}",
-            pending_reviews=pending_reviews,
-            reviewed_this_week=reviewed_this_week,
-            orders_pending_results=orders_pending_results,
-            critical_results_pending=critical_results_pending
+            physician_name=row.username,
+            pending_reviews=row.pending_reviews,
+            reviewed_this_week=row.reviewed_this_week,
+            orders_pending_results=row.orders_pending_results,
+            critical_results_pending=row.critical_results_pending
+        )
+
+    @staticmethod
+    def _build_order_items(system_id: str, test_types: Optional[str]) -> List[LabTestOrderItem]:
+        return [
+            LabTestOrderItem(
+                system_id=system_id,
+                position=position,
+                test_name=name,
+                test_key=normalize_test_key(name)
+            )
+            for position, name in enumerate(split_test_types(test_types))
+        ]
+
+    async def _sync_order_items(self, lab_order: LabTestOrder) -> None:
+        """Match an order's items to its updated test_types, keeping rows for tests still listed"""
+        result = await self.db.execute(
+            select(LabTestOrderItem).where(LabTestOrderItem.lab_order_id == lab_order.id)
+        )
+        existing = {item.test_key: item for item in result.scalars().all()}
+
+        names = split_test_types(lab_order.test_types)
+        wanted_keys = {normalize_test_key(name) for name in names}
+        for key, item in existing.items():
+            if key not in wanted_keys:
+                await self.db.delete(item)
+        for position, name in enumerate(names):
+            key = normalize_test_key(name)
+            if key in existing:
+                existing[key].position = position
+                existing[key].test_name = name
+            else:
+                self.db.add(LabTestOrderItem(
+                    lab_order_id=lab_order.id,
+                    system_id=lab_order.system_id,
+                    position=position,
+                    test_name=name,
+                    test_key=key
+                ))
+
+    async def _propagate_item_status(self, order_id: str, order_status: LabOrderStatus) -> None:
+        """Move items that are not finished yet along with their order's status"""
+        values = {"status": order_status}
+        if order_status == LabOrderStatus.COMPLETED:
+            values["resulted_at"] = func.coalesce(LabTestOrderItem.resulted_at, func.now())
+        await self.db.execute(
+            update(LabTestOrderItem)
+            .where(
+                and_(
+                    LabTestOrderItem.lab_order_id == order_id,
+                    LabTestOrderItem.status.notin_([LabOrderStatus.COMPLETED, LabOrderStatus.CANCELLED])
+                )
+            )
+            .values(**values)
         )
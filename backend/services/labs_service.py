@@ -1,27 +1,35 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy import select, insert, delete, and_, or_, func, desc, asc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status, UploadFile
 import boto3
-import pytesseract
-from PIL import Image
-from pdf2image import convert_from_bytes
-import io
-import os
 from datetime import datetime, date
+from uuid import uuid4
 
-from models.lab_result import LabResult, Biomarker
+from models.lab_result import LabResult, Biomarker, LabOcrCache
 from models.lab_order import LabTestOrder
 from models.user import User
 from models.staff import Staff
-from schemas.lab import LabResultResponse, BiomarkerResponse
+from schemas.lab import (
+    LabResultResponse, BiomarkerResponse, LabUploadRequest, LabUploadTicket,
+    PresignedUpload, DownloadUrlResponse
+)
 from schemas.lab_order import (
     LabResultWithBiomarkers, LabResultWithDetails, LabResultListFilter,
     LabResultListResponse, LabResultReview, BiomarkerCreate, BiomarkerUpdate
 )
-from schemas.enums import LabOrderStatus, ResultStatus
+from schemas.enums import LabOrderStatus, ResultStatus, AuditActionType
 from core.config import settings
+from core.celery_app import celery_app
+from app.domains.lab_orders.services.lab_turnaround_service import LabTurnaroundService
+from app.domains.labs.services.biomarker_parser import parse_biomarkers
+from app.domains.labs.services.content_store import read_upload, content_addressed_key
+from app.domains.labs.services.ocr import OCRError, extract_text, guess_content_type
+from app.infrastructure.storage.s3 import get_storage, upload_key
+from app.infrastructure.audit.writer import audit_on_commit
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 
 class LabsService:
@@ -35,19 +43,38 @@ class LabsService:
         )
 
     async def upload_lab(self, file: UploadFile, user_id: str, system_id: str, ordered_by: Optional[str] = None) -> LabResultResponse:
-        # Generate unique S3 key
-        s3_key = f"lab-results/{user_id}/{file.filename}"
-        
-        # Upload to S3
-        file_content = await file.read()
-        self.s3_client.put_object(
-            Bucket=settings.S3_BUCKET_NAME,
-            Key=s3_key,
-            Body=file_content,
-            ContentType=file.content_type
+        """
+        Store a lab report and OCR it.
+
+        Files are content-addressed: same-named files no longer overwrite each
+        other, and a file this system already uploaded reuses the stored
+        object instead of being written to S3 again.
+        """
+        file_content, content_hash = await read_upload(file)
+
+        # Reuse the object of an identical earlier upload
+        existing = await self.db.execute(
+            select(LabResult.s3_key, LabResult.s3_url)
+            .where(
+                and_(
+                    LabResult.system_id == system_id,
+                    LabResult.content_hash == content_hash
+                )
+            )
+            .limit(1)
         )
-        
-        s3_url = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+        stored = existing.first()
+        if stored:
+            s3_key, s3_url = stored.s3_key, stored.s3_url
+        else:
+            s3_key = content_addressed_key(system_id, content_hash, file.filename)
+            self.s3_client.put_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key,
+                Body=file_content,
+                ContentType=file.content_type
+            )
+            s3_url = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
         
         # Create lab result record
         lab_result = LabResult(
@@ -57,43 +84,159 @@ class LabsService:
             file_name=file.filename,
             s3_key=s3_key,
             s3_url=s3_url,
+            content_hash=content_hash,
             processing_status="pending"
         )
         
         self.db.add(lab_result)
-        await self.db.commit()
-        await self.db.refresh(lab_result)
+        await self.db.flush()
+        audit_on_commit(self.db, AuditActionType.CREATE, "LAB_RESULT", lab_result.id)
         
-        # Process file for OCR (simplified - in real implementation, this would be async)
+        # Process file for OCR, reusing the text of an identical file if cached
         try:
-            raw_ocr_text = self._extract_text_from_file(file_content, file.content_type)
-            lab_result.raw_ocr_text = raw_ocr_text
-            lab_result.processing_status = "completed"
-            await self.db.commit()
-        except Exception:
+            await self.apply_ocr(lab_result, file_content, guess_content_type(file.filename, file.content_type))
+        except OCRError:
+            # Unreadable or unsupported files are failed, not "completed" with an error as their text
             lab_result.processing_status = "failed"
-            await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "labs", system_id)
         
         return LabResultResponse.model_validate(lab_result)
 
+    async def create_upload(self, upload_request: LabUploadRequest, user_id: str, system_id: str) -> LabUploadTicket:
+        """
+        Create a pending lab result and a presigned URL for uploading its file
+        directly to storage. The client calls ``complete_upload`` afterwards.
+        """
+        storage = get_storage()
+        lab_result_id = str(uuid4())
+        s3_key = upload_key(f"lab-results/{system_id}/uploads", lab_result_id, upload_request.fileName)
+
+        lab_result = LabResult(
+            id=lab_result_id,
+            user_id=user_id,
+            system_id=system_id,
+            ordered_by=upload_request.orderedBy,
+            file_name=upload_request.fileName,
+            s3_key=s3_key,
+            s3_url=storage.object_url(s3_key),
+            processing_status="pending"
+        )
+        self.db.add(lab_result)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "labs", system_id)
+        audit_on_commit(self.db, AuditActionType.CREATE, "LAB_RESULT", lab_result.id)
+
+        upload = storage.presigned_upload(s3_key, upload_request.contentType)
+        return LabUploadTicket(
+            lab_result_id=lab_result_id,
+            upload=PresignedUpload(url=upload["url"], fields=upload["fields"], expires_in=storage.expires_in)
+        )
+
+    async def complete_upload(self, lab_result_id: str, user_id: str, system_id: str) -> LabResultResponse:
+        """Confirm a presigned upload landed in storage and queue its OCR"""
+        lab_result = await self._get_user_lab_result(lab_result_id, user_id, system_id)
+
+        if lab_result.processing_status != "pending":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Lab result upload already completed"
+            )
+
+        if get_storage().head(lab_result.s3_key) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File has not been uploaded"
+            )
+
+        lab_result.processing_status = "processing"
+        # The worker must see the status before the task can start
+        await self.db.commit()
+
+        celery_app.send_task("labs.process_uploaded_lab", args=[lab_result.id])
+        invalidate_on_commit(self.db, "labs", system_id)
+        return LabResultResponse.model_validate(lab_result)
+
+    async def get_download_url(self, lab_result_id: str, user_id: str, system_id: str) -> DownloadUrlResponse:
+        """Short-lived presigned URL for downloading a lab result's file"""
+        lab_result = await self._get_user_lab_result(lab_result_id, user_id, system_id)
+        storage = get_storage()
+        return DownloadUrlResponse(
+            url=storage.presigned_download(lab_result.s3_key, lab_result.file_name),
+            expires_in=storage.expires_in
+        )
+
+    async def _get_user_lab_result(self, lab_result_id: str, user_id: str, system_id: str) -> LabResult:
+        result = await self.db.execute(
+            select(LabResult)
+            .where(LabResult.id == lab_result_id)
+            .where(LabResult.user_id == user_id)
+            .where(LabResult.system_id == system_id)
+        )
+        lab_result = result.scalar_one_or_none()
+
+        if not lab_result:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Lab result not found"
+            )
+        return lab_result
+
+    async def apply_ocr(self, lab_result: LabResult, file_content: bytes, content_type: Optional[str]) -> None:
+        """
+        Fill in a lab result's OCR text and biomarkers from its file (caller commits).
+
+        OCR text is reused from the cache when identical content was processed
+        before. Raises OCRError if the file cannot be read.
+        """
+        raw_ocr_text = await self._cached_ocr_text(lab_result.content_hash)
+        if raw_ocr_text is None:
+            raw_ocr_text = self._extract_text_from_file(file_content, content_type)
+            await self.db.execute(
+                pg_insert(LabOcrCache)
+                .values(content_hash=lab_result.content_hash, raw_ocr_text=raw_ocr_text)
+                .on_conflict_do_nothing(index_elements=[LabOcrCache.content_hash])
+            )
+        lab_result.raw_ocr_text = raw_ocr_text
+        lab_result.processing_status = "completed"
+        await self.extract_biomarkers([lab_result])
+
+    async def _cached_ocr_text(self, content_hash: str) -> Optional[str]:
+        result = await self.db.execute(
+            select(LabOcrCache.raw_ocr_text).where(LabOcrCache.content_hash == content_hash)
+        )
+        return result.scalar_one_or_none()
+
+    async def extract_biomarkers(self, lab_results: List[LabResult], replace: bool = False) -> Dict[str, List[Biomarker]]:
+        """
+        Parse biomarkers out of each result's OCR text and insert them (caller commits).
+
+        All biomarkers for the batch go in with a single INSERT; with
+        ``replace`` the results' existing biomarkers are deleted first with a
+        single DELETE. Returns the inserted biomarkers per lab result id.
+        """
+        rows = []
+        for lab_result in lab_results:
+            rows.extend(
+                {**parsed, "lab_result_id": lab_result.id}
+                for parsed in parse_biomarkers(lab_result.raw_ocr_text)
+            )
+
+        if replace and lab_results:
+            await self.db.execute(
+                delete(Biomarker).where(Biomarker.lab_result_id.in_([r.id for r in lab_results]))
+            )
+
+        extracted: Dict[str, List[Biomarker]] = {lab_result.id: [] for lab_result in lab_results}
+        if rows:
+            inserted = await self.db.scalars(insert(Biomarker).returning(Biomarker), rows)
+            for biomarker in inserted.all():
+                extracted[biomarker.lab_result_id].append(biomarker)
+        return extracted
+
     def _extract_text_from_file(self, file_content: bytes, content_type: str) -> str:
-        """Extract text from uploaded file using OCR"""
-        try:
-            if content_type == "application/pdf":
-                # Convert PDF to images
-                images = convert_from_bytes(file_content)
-                text = ""
-                for image in images:
-                    text += pytesseract.image_to_string(image) + "\n"
-                return text
-            elif content_type.startswith("image/"):
-                # Process image directly
-                image = Image.open(io.BytesIO(file_content))
-                return pytesseract.image_to_string(image)
-            else:
-                return "Unsupported file type for OCR"
-        except Exception as e:
-            return f"OCR processing failed: {str(e)}"
+        """Extract text from uploaded file using OCR (raises OCRError on failure)"""
+        return extract_text(file_content, content_type)
 
     async def get_lab_results(self, user_id: str, system_id: str) -> List[LabResultResponse]:
         result = await self.db.execute(
@@ -149,19 +292,29 @@ class LabsService:
                 detail="Lab result not found"
             )
         
+        # Content-addressed objects may be shared with other results
+        shared = await self.db.execute(
+            select(func.count())
+            .select_from(LabResult)
+            .where(and_(LabResult.s3_key == lab_result.s3_key, LabResult.id != lab_result.id))
+        )
+
         # Delete from S3
-        try:
-            self.s3_client.delete_object(
-                Bucket=settings.S3_BUCKET_NAME,
-                Key=lab_result.s3_key
-            )
-        except Exception:
-            # Log error but don't fail the deletion
-            pass
+        if not shared.scalar():
+            try:
+                self.s3_client.delete_object(
+                    Bucket=settings.S3_BUCKET_NAME,
+                    Key=lab_result.s3_key
+                )
+            except Exception:
+                # Log error but don't fail the deletion
+                pass
         
         # Delete from database (cascade will handle biomarkers)
         await self.db.delete(lab_result)
-        await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "labs", system_id)
+        audit_on_commit(self.db, AuditActionType.DELETE, "LAB_RESULT", lab_result_id)
 
     # ============================================================================
     # Enhanced Lab Result Management with Review Workflow
@@ -275,9 +428,11 @@ class LabsService:
         lab_result.reviewed_at = datetime.now()
         lab_result.physician_notes = review_data.physician_notes
         lab_result.updated_at = datetime.now()
+        await LabTurnaroundService(self.db).record_result_review(lab_result)
 
-        await self.db.commit()
-        await self.db.refresh(lab_result)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "labs", system_id)
+        audit_on_commit(self.db, AuditActionType.UPDATE, "LAB_RESULT", lab_result.id, description="Reviewed")
 
         return LabResultResponse.model_validate(lab_result)
 
@@ -315,8 +470,8 @@ class LabsService:
         )
 
         self.db.add(biomarker)
-        await self.db.commit()
-        await self.db.refresh(biomarker)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "labs", system_id)
 
         return BiomarkerResponse.model_validate(biomarker)
 
@@ -352,8 +507,8 @@ class LabsService:
                 setattr(biomarker, field, value)
 
         biomarker.updated_at = datetime.now()
-        await self.db.commit()
-        await self.db.refresh(biomarker)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "labs", system_id)
 
         return BiomarkerResponse.model_validate(biomarker)
 
@@ -1,11 +1,12 @@
 """
 Service layer for Nutrition Management (Nutritionist data capture)
 """
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any
 from datetime import datetime, timedelta, date
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, insert, update, and_, or_, func
+from sqlalchemy.orm import joinedload, aliased
 from decimal import Decimal
 
 from models.nutrition import (
@@ -31,18 +32,32 @@ from schemas.nutrition import (
     MealPlanDayWithMeals,
     MealPlanMealCreate,
     MealPlanMealResponse,
+    MealPlanTemplateCreate,
+    MealPlanCloneRequest,
+    MealPlanCloneResponse,
+    ClonedMealPlan,
     NutritionFeedbackCreate,
     NutritionFeedbackUpdate,
     NutritionFeedbackResponse,
     NutritionFeedbackWithDetails,
     NutritionAssessmentListFilter,
+    NutritionAssessmentListResponse,
     MealPlanListFilter,
+    MealPlanListResponse,
     NutritionFeedbackListFilter,
+    NutritionFeedbackListResponse,
     NutritionStats,
     PatientNutritionProgress
 )
-from schemas.enums import MealPlanStatus
+from schemas.enums import MealPlanStatus, UserRole
 from core.exceptions import NotFoundError, AuthorizationError, ValidationError
+from app.domains.nutrition.services.macro_rollup import whole, meal_macros, build_rollup_updates
+from app.shared.pagination import encode_cursor, keyset_before
+from app.infrastructure.cache.response_cache import invalidate_on_commit
+
+
+# Roles of accounts that can be assigned a meal plan (staff and admins cannot)
+PATIENT_ROLES = (UserRole.PATIENT.value, UserRole.USER.value)
 
 
 class NutritionService:
@@ -82,6 +97,7 @@ class NutritionService:
         assessment = NutritionAssessment(
             patient_id=assessment_data.patient_id,
             nutritionist_id=assessment_data.nutritionist_id or nutritionist.id,
+            system_id=patient.system_id,
             assessment_date=assessment_data.assessment_date,
             current_weight=assessment_data.current_weight,
             height=assessment_data.height,
@@ -97,8 +113,8 @@ class NutritionService:
         )
         
         self.db.add(assessment)
-        await self.db.commit()
-        await self.db.refresh(assessment)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", patient.system_id)
         
         return NutritionAssessmentResponse.model_validate(assessment)
     
@@ -134,55 +150,51 @@ class NutritionService:
         filters: NutritionAssessmentListFilter,
         current_user_id: str,
         is_staff: bool = True
-    ) -> Tuple[List[NutritionAssessmentWithDetails], int]:
-        """List assessments with filters"""
-        
-        query = select(NutritionAssessment)
-        count_query = select(func.count(NutritionAssessment.id))
-        
+    ) -> NutritionAssessmentListResponse:
+        """List assessments with patient/nutritionist names resolved in the same query"""
         conditions = []
-        
         if filters.patient_id:
             conditions.append(NutritionAssessment.patient_id == filters.patient_id)
-        
         if filters.nutritionist_id:
             conditions.append(NutritionAssessment.nutritionist_id == filters.nutritionist_id)
-        
         if filters.status:
             conditions.append(NutritionAssessment.status == filters.status)
-        
         if not is_staff:
             conditions.append(NutritionAssessment.patient_id == current_user_id)
-        
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        query = query.offset(filters.skip).limit(filters.limit)
-        query = query.order_by(NutritionAssessment.assessment_date.desc())
-        
-        result = await self.db.execute(query)
-        assessments = result.scalars().all()
-        
-        # Enrich with details
-        enriched = []
-        for assessment in assessments:
-            patient = await self._get_user(assessment.patient_id)
-            nutritionist = await self._get_staff(assessment.nutritionist_id)
-            
-            assessment_dict = {
+
+        patient = aliased(User)
+        nutritionist_user = aliased(User)
+        query = (
+            select(NutritionAssessment, patient.username, nutritionist_user.username, Staff.credentials)
+            .outerjoin(patient, patient.id == NutritionAssessment.patient_id)
+            .outerjoin(Staff, Staff.id == NutritionAssessment.nutritionist_id)
+            .outerjoin(nutritionist_user, nutritionist_user.id == Staff.user_id)
+            .where(*conditions)
+        )
+        count_query = select(func.count()).select_from(NutritionAssessment).where(*conditions)
+
+        rows, total, has_more = await self._fetch_page(
+            query, count_query, NutritionAssessment.assessment_date, NutritionAssessment.id, filters
+        )
+
+        items = [
+            NutritionAssessmentWithDetails(
                 **assessment.__dict__,
-                "patient_name": patient.username if patient else "Unknown",
-                "nutritionist_name": nutritionist.user.username if nutritionist and nutritionist.user else "Unknown",
-                "nutritionist_credentials": nutritionist.credentials if nutritionist else None
-            }
-            
-            enriched.append(NutritionAssessmentWithDetails(**assessment_dict))
-        
-        return enriched, total
+                patient_name=patient_name or "Unknown",
+                nutritionist_name=nutritionist_name or "Unknown",
+                nutritionist_credentials=credentials
+            )
+            for assessment, patient_name, nutritionist_name, credentials in rows
+        ]
+
+        return NutritionAssessmentListResponse(
+            items=items,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=self._next_cursor(rows, "assessment_date") if has_more else None
+        )
     
     async def update_assessment(
         self,
@@ -209,8 +221,8 @@ class NutritionService:
         
         assessment.updated_at = datetime.utcnow()
         
-        await self.db.commit()
-        await self.db.refresh(assessment)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", assessment.system_id)
         
         return NutritionAssessmentResponse.model_validate(assessment)
     
@@ -239,6 +251,7 @@ class NutritionService:
         meal_plan = MealPlan(
             patient_id=plan_data.patient_id,
             nutritionist_id=plan_data.nutritionist_id or nutritionist.id,
+            system_id=patient.system_id,
             assessment_id=plan_data.assessment_id,
             plan_name=plan_data.plan_name,
             start_date=plan_data.start_date,
@@ -252,8 +265,8 @@ class NutritionService:
         )
         
         self.db.add(meal_plan)
-        await self.db.commit()
-        await self.db.refresh(meal_plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", meal_plan.system_id)
         
         return MealPlanResponse.model_validate(meal_plan)
     
@@ -283,19 +296,10 @@ class NutritionService:
             for day in sorted(plan.days, key=lambda d: d.day_number):
                 meals_list = [MealPlanMealResponse.model_validate(m) for m in day.meals]
                 
-                # Calculate daily totals
-                total_calories = sum(m.calories or 0 for m in day.meals)
-                total_protein = sum(m.protein_grams or 0 for m in day.meals)
-                total_carbs = sum(m.carbs_grams or 0 for m in day.meals)
-                total_fats = sum(m.fats_grams or 0 for m in day.meals)
-                
+                # Daily totals are precomputed on the day row
                 day_dict = {
                     **day.__dict__,
-                    "meals": meals_list,
-                    "total_daily_calories": total_calories,
-                    "total_daily_protein": Decimal(str(total_protein)),
-                    "total_daily_carbs": Decimal(str(total_carbs)),
-                    "total_daily_fats": Decimal(str(total_fats))
+                    "meals": meals_list
                 }
                 days_list.append(MealPlanDayWithMeals(**day_dict))
         
@@ -311,63 +315,53 @@ class NutritionService:
         filters: MealPlanListFilter,
         current_user_id: str,
         is_staff: bool = True
-    ) -> Tuple[List[MealPlanWithDetails], int]:
-        """List meal plans with filters"""
-        
-        query = select(MealPlan)
-        count_query = select(func.count(MealPlan.id))
-        
-        conditions = []
-        
+    ) -> MealPlanListResponse:
+        """List meal plans with names resolved in the same query; day counts come from the rollup column"""
+        conditions = [MealPlan.is_template.is_(False)]
         if filters.patient_id:
             conditions.append(MealPlan.patient_id == filters.patient_id)
-        
         if filters.nutritionist_id:
             conditions.append(MealPlan.nutritionist_id == filters.nutritionist_id)
-        
         if filters.status:
             conditions.append(MealPlan.status == filters.status)
-        
         if not is_staff:
             conditions.append(MealPlan.patient_id == current_user_id)
-        
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        query = query.offset(filters.skip).limit(filters.limit)
-        query = query.order_by(MealPlan.start_date.desc())
-        
-        result = await self.db.execute(query)
-        plans = result.scalars().all()
-        
-        # Enrich with details
-        enriched = []
-        for plan in plans:
-            patient = await self._get_user(plan.patient_id)
-            nutritionist = await self._get_staff(plan.nutritionist_id)
-            
-            # Get days count
-            days_result = await self.db.execute(
-                select(func.count(MealPlanDay.id)).where(MealPlanDay.meal_plan_id == plan.id)
-            )
-            total_days = days_result.scalar()
-            
-            plan_dict = {
+
+        patient = aliased(User)
+        nutritionist_user = aliased(User)
+        query = (
+            select(MealPlan, patient.username, nutritionist_user.username, Staff.credentials)
+            .outerjoin(patient, patient.id == MealPlan.patient_id)
+            .outerjoin(Staff, Staff.id == MealPlan.nutritionist_id)
+            .outerjoin(nutritionist_user, nutritionist_user.id == Staff.user_id)
+            .where(and_(*conditions))
+        )
+        count_query = select(func.count()).select_from(MealPlan).where(and_(*conditions))
+
+        rows, total, has_more = await self._fetch_page(
+            query, count_query, MealPlan.start_date, MealPlan.id, filters
+        )
+
+        items = [
+            MealPlanWithDetails(
                 **plan.__dict__,
-                "patient_name": patient.username if patient else "Unknown",
-                "nutritionist_name": nutritionist.user.username if nutritionist and nutritionist.user else "Unknown",
-                "nutritionist_credentials": nutritionist.credentials if nutritionist else None,
-                "total_days": total_days,
-                "days": []
-            }
-            
-            enriched.append(MealPlanWithDetails(**plan_dict))
-        
-        return enriched, total
+                patient_name=patient_name or "Unknown",
+                nutritionist_name=nutritionist_name or "Unknown",
+                nutritionist_credentials=credentials,
+                total_days=plan.day_count,
+                days=[]
+            )
+            for plan, patient_name, nutritionist_name, credentials in rows
+        ]
+
+        return MealPlanListResponse(
+            items=items,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=self._next_cursor(rows, "start_date") if has_more else None
+        )
     
     async def update_meal_plan(
         self,
@@ -388,8 +382,8 @@ class NutritionService:
         
         plan.updated_at = datetime.utcnow()
         
-        await self.db.commit()
-        await self.db.refresh(plan)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", plan.system_id)
         
         return MealPlanResponse.model_validate(plan)
     
@@ -412,16 +406,17 @@ class NutritionService:
         )
         
         self.db.add(day)
-        await self.db.commit()
-        await self.db.refresh(day)
+        await self.db.execute(
+            update(MealPlan)
+            .where(MealPlan.id == plan_id)
+            .values(day_count=MealPlan.day_count + 1)
+        )
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", plan.system_id)
         
         day_dict = {
             **day.__dict__,
-            "meals": [],
-            "total_daily_calories": 0,
-            "total_daily_protein": Decimal("0.0"),
-            "total_daily_carbs": Decimal("0.0"),
-            "total_daily_fats": Decimal("0.0")
+            "meals": []
         }
         
         return MealPlanDayWithMeals(**day_dict)
@@ -435,11 +430,14 @@ class NutritionService:
         
         # Verify day exists
         day_result = await self.db.execute(
-            select(MealPlanDay).where(MealPlanDay.id == day_id)
+            select(MealPlanDay, MealPlan.system_id)
+            .join(MealPlan, MealPlan.id == MealPlanDay.meal_plan_id)
+            .where(MealPlanDay.id == day_id)
         )
-        day = day_result.scalar_one_or_none()
-        if not day:
+        row = day_result.one_or_none()
+        if not row:
             raise NotFoundError("Meal Plan Day", day_id)
+        day, system_id = row
         
         meal = MealPlanMeal(
             day_id=day_id,
@@ -448,18 +446,138 @@ class NutritionService:
             meal_description=meal_data.meal_description,
             ingredients=meal_data.ingredients,
             preparation_notes=meal_data.preparation_notes,
-            calories=meal_data.calories,
-            protein_grams=meal_data.protein_grams,
-            carbs_grams=meal_data.carbs_grams,
-            fats_grams=meal_data.fats_grams
+            calories=whole(meal_data.calories),
+            protein_grams=whole(meal_data.protein_grams),
+            carbs_grams=whole(meal_data.carbs_grams),
+            fats_grams=whole(meal_data.fats_grams)
         )
         
         self.db.add(meal)
-        await self.db.commit()
-        await self.db.refresh(meal)
+        
+        # Keep the day and plan macro rollups in step with the new meal
+        for stmt in build_rollup_updates(MealPlanDay, MealPlan, day_id, day.meal_plan_id, meal_macros(meal_data), meal_count_delta=1):
+            await self.db.execute(stmt)
+        
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", system_id)
         
         return MealPlanMealResponse.model_validate(meal)
     
+    async def create_template_from_plan(
+        self,
+        plan_id: str,
+        template_data: MealPlanTemplateCreate,
+        system_id: str
+    ) -> MealPlanResponse:
+        """Save a copy of a plan's days and meals as a reusable template"""
+        source = await self._get_system_meal_plan(plan_id, system_id)
+
+        template_row = self._copy_row(source, MealPlan)
+        template_row.update(
+            id=str(uuid4()),
+            patient_id=None,
+            assessment_id=None,
+            plan_name=template_data.plan_name,
+            status=MealPlanStatus.ACTIVE,
+            is_template=True,
+            source_plan_id=source.id,
+        )
+        await self._insert_plan_tree(source.id, [template_row])
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+        template = await self._get_system_meal_plan(template_row["id"], system_id)
+        return MealPlanResponse.model_validate(template)
+    
+    async def list_meal_plan_templates(self, system_id: str) -> List[MealPlanResponse]:
+        """List the meal plan templates of a system"""
+        result = await self.db.execute(
+            select(MealPlan)
+            .where(
+                and_(
+                    MealPlan.system_id == system_id,
+                    MealPlan.is_template.is_(True)
+                )
+            )
+            .order_by(MealPlan.plan_name)
+        )
+        return [MealPlanResponse.model_validate(template) for template in result.scalars().all()]
+    
+    async def clone_meal_plan_to_patients(
+        self,
+        plan_id: str,
+        clone_data: MealPlanCloneRequest,
+        system_id: str
+    ) -> MealPlanCloneResponse:
+        """
+        Copy a plan (or template) with all of its days and meals to many patients.
+
+        Patients are validated with a single IN query, and the whole tree is
+        written with one multi-row INSERT per table.
+        """
+        source = await self._get_system_meal_plan(plan_id, system_id)
+
+        patient_ids = list(dict.fromkeys(clone_data.patient_ids))
+        result = await self.db.execute(
+            select(User.id).where(
+                and_(
+                    User.id.in_(patient_ids),
+                    User.system_id == system_id,
+                    User.role.in_(PATIENT_ROLES)
+                )
+            )
+        )
+        found = set(result.scalars().all())
+        missing = [patient_id for patient_id in patient_ids if patient_id not in found]
+        if missing:
+            raise ValidationError("Some patients were not found", {"patient_ids": missing})
+
+        nutritionist_id = clone_data.nutritionist_id or source.nutritionist_id
+        if clone_data.nutritionist_id:
+            result = await self.db.execute(
+                select(Staff.id).where(
+                    and_(
+                        Staff.id == clone_data.nutritionist_id,
+                        Staff.system_id == system_id
+                    )
+                )
+            )
+            if result.scalar_one_or_none() is None:
+                raise NotFoundError("Nutritionist", clone_data.nutritionist_id)
+
+        # Keep the source plan's duration
+        end_date = None
+        if source.end_date:
+            end_date = clone_data.start_date + (source.end_date - source.start_date)
+
+        base_row = self._copy_row(source, MealPlan)
+        base_row.update(
+            assessment_id=None,
+            nutritionist_id=nutritionist_id,
+            plan_name=clone_data.plan_name or source.plan_name,
+            start_date=clone_data.start_date,
+            end_date=end_date,
+            status=MealPlanStatus.ACTIVE,
+            is_template=False,
+            source_plan_id=source.id,
+        )
+        plan_rows = [
+            {**base_row, "id": str(uuid4()), "patient_id": patient_id}
+            for patient_id in patient_ids
+        ]
+        await self._insert_plan_tree(source.id, plan_rows)
+        invalidate_on_commit(self.db, "nutrition", system_id)
+
+        return MealPlanCloneResponse(
+            source_plan_id=source.id,
+            plans_created=len(plan_rows),
+            days_per_plan=source.day_count,
+            meals_per_plan=source.meal_count,
+            plans=[
+                ClonedMealPlan(patient_id=row["patient_id"], meal_plan_id=row["id"])
+                for row in plan_rows
+            ]
+        )
+    
     # ========================================================================
     # Nutrition Feedback Methods
     # ========================================================================
@@ -482,6 +600,7 @@ class NutritionService:
         feedback = NutritionFeedback(
             patient_id=feedback_data.patient_id,
             nutritionist_id=feedback_data.nutritionist_id or nutritionist.id,
+            system_id=patient.system_id,
             meal_plan_id=feedback_data.meal_plan_id,
             feedback_date=feedback_data.feedback_date,
             compliance_level=feedback_data.compliance_level,
@@ -494,8 +613,8 @@ class NutritionService:
         )
         
         self.db.add(feedback)
-        await self.db.commit()
-        await self.db.refresh(feedback)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", patient.system_id)
         
         return NutritionFeedbackResponse.model_validate(feedback)
     
@@ -536,63 +655,54 @@ class NutritionService:
         filters: NutritionFeedbackListFilter,
         current_user_id: str,
         is_staff: bool = True
-    ) -> Tuple[List[NutritionFeedbackWithDetails], int]:
-        """List feedback with filters"""
-        
-        query = select(NutritionFeedback)
-        count_query = select(func.count(NutritionFeedback.id))
-        
+    ) -> NutritionFeedbackListResponse:
+        """List feedback with names and meal plan resolved in the same query"""
         conditions = []
-        
         if filters.patient_id:
             conditions.append(NutritionFeedback.patient_id == filters.patient_id)
-        
         if filters.nutritionist_id:
             conditions.append(NutritionFeedback.nutritionist_id == filters.nutritionist_id)
-        
         if filters.meal_plan_id:
             conditions.append(NutritionFeedback.meal_plan_id == filters.meal_plan_id)
-        
         if filters.compliance_level:
             conditions.append(NutritionFeedback.compliance_level == filters.compliance_level)
-        
         if not is_staff:
             conditions.append(NutritionFeedback.patient_id == current_user_id)
-        
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        query = query.offset(filters.skip).limit(filters.limit)
-        query = query.order_by(NutritionFeedback.feedback_date.desc())
-        
-        result = await self.db.execute(query)
-        feedbacks = result.scalars().all()
-        
-        # Enrich
-        enriched = []
-        for feedback in feedbacks:
-            patient = await self._get_user(feedback.patient_id)
-            nutritionist = await self._get_staff(feedback.nutritionist_id)
-            
-            meal_plan_name = None
-            if feedback.meal_plan_id:
-                plan = await self._get_meal_plan(feedback.meal_plan_id)
-                meal_plan_name = plan.plan_name if plan else None
-            
-            feedback_dict = {
+
+        patient = aliased(User)
+        nutritionist_user = aliased(User)
+        query = (
+            select(NutritionFeedback, patient.username, nutritionist_user.username, MealPlan.plan_name)
+            .outerjoin(patient, patient.id == NutritionFeedback.patient_id)
+            .outerjoin(Staff, Staff.id == NutritionFeedback.nutritionist_id)
+            .outerjoin(nutritionist_user, nutritionist_user.id == Staff.user_id)
+            .outerjoin(MealPlan, MealPlan.id == NutritionFeedback.meal_plan_id)
+            .where(*conditions)
+        )
+        count_query = select(func.count()).select_from(NutritionFeedback).where(*conditions)
+
+        rows, total, has_more = await self._fetch_page(
+            query, count_query, NutritionFeedback.feedback_date, NutritionFeedback.id, filters
+        )
+
+        items = [
+            NutritionFeedbackWithDetails(
                 **feedback.__dict__,
-                "patient_name": patient.username if patient else "Unknown",
-                "nutritionist_name": nutritionist.user.username if nutritionist and nutritionist.user else "Unknown",
-                "meal_plan_name": meal_plan_name
-            }
-            
-            enriched.append(NutritionFeedbackWithDetails(**feedback_dict))
-        
-        return enriched, total
+                patient_name=patient_name or "Unknown",
+                nutritionist_name=nutritionist_name or "Unknown",
+                meal_plan_name=meal_plan_name
+            )
+            for feedback, patient_name, nutritionist_name, meal_plan_name in rows
+        ]
+
+        return NutritionFeedbackListResponse(
+            items=items,
+            total=total,
+            skip=filters.skip,
+            limit=filters.limit,
+            has_more=has_more,
+            next_cursor=self._next_cursor(rows, "feedback_date") if has_more else None
+        )
     
     async def update_feedback(
         self,
@@ -611,8 +721,8 @@ class NutritionService:
         
         feedback.updated_at = datetime.utcnow()
         
-        await self.db.commit()
-        await self.db.refresh(feedback)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "nutrition", feedback.system_id)
         
         return NutritionFeedbackResponse.model_validate(feedback)
     
@@ -732,6 +842,33 @@ class NutritionService:
     
     # Helper methods
     
+    async def _fetch_page(self, query, count_query, sort_column, id_column, filters) -> Tuple[list, int, bool]:
+        """
+        Run the count and page queries for a list endpoint.
+
+        Pages are ordered newest first on (sort_column, id). When a cursor is
+        supplied the page seeks past it (keyset paging) instead of using OFFSET.
+        """
+        total = (await self.db.execute(count_query)).scalar()
+
+        query = query.order_by(sort_column.desc(), id_column.desc())
+        if filters.cursor:
+            query = query.where(keyset_before(sort_column, id_column, filters.cursor))
+        else:
+            query = query.offset(filters.skip)
+
+        # Fetch one extra row to know whether another page exists
+        rows = (await self.db.execute(query.limit(filters.limit + 1))).all()
+        has_more = len(rows) > filters.limit
+        return rows[:filters.limit], total, has_more
+
+    @staticmethod
+    def _next_cursor(rows: list, sort_attr: str) -> Optional[str]:
+        if not rows:
+            return None
+        last = rows[-1][0]
+        return encode_cursor(getattr(last, sort_attr), last.id)
+    
     async def _get_assessment(self, assessment_id: str) -> Optional[NutritionAssessment]:
         result = await self.db.execute(
             select(NutritionAssessment).where(NutritionAssessment.id == assessment_id)
@@ -744,6 +881,69 @@ class NutritionService:
         )
         return result.scalar_one_or_none()
     
+    async def _get_system_meal_plan(self, plan_id: str, system_id: str) -> MealPlan:
+        result = await self.db.execute(
+            select(MealPlan).where(
+                and_(
+                    MealPlan.id == plan_id,
+                    MealPlan.system_id == system_id
+                )
+            )
+        )
+        plan = result.scalar_one_or_none()
+        if not plan:
+            raise NotFoundError("Meal Plan", plan_id)
+        return plan
+    
+    @staticmethod
+    def _copy_row(obj, model) -> Dict[str, Any]:
+        """Column values of ``obj`` without its id and timestamps, ready for a bulk insert"""
+        return {
+            column.key: getattr(obj, column.key)
+            for column in model.__table__.columns
+            if column.key not in ("id", "created_at", "updated_at")
+        }
+    
+    async def _insert_plan_tree(self, source_plan_id: str, plan_rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert ``plan_rows`` plus a copy of the source plan's days and meals under each.
+
+        The source tree is read with two queries; rollup columns are copied as-is
+        since the copied days and meals are identical. Does not commit.
+        """
+        days = (await self.db.execute(
+            select(MealPlanDay)
+            .where(MealPlanDay.meal_plan_id == source_plan_id)
+            .order_by(MealPlanDay.day_number)
+        )).scalars().all()
+        meals = (await self.db.execute(
+            select(MealPlanMeal)
+            .join(MealPlanDay, MealPlanDay.id == MealPlanMeal.day_id)
+            .where(MealPlanDay.meal_plan_id == source_plan_id)
+        )).scalars().all()
+
+        day_templates = [self._copy_row(day, MealPlanDay) for day in days]
+        meals_by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for meal in meals:
+            meals_by_day.setdefault(meal.day_id, []).append(self._copy_row(meal, MealPlanMeal))
+
+        day_rows = []
+        meal_rows = []
+        for plan_row in plan_rows:
+            for day, day_template in zip(days, day_templates):
+                day_id = str(uuid4())
+                day_rows.append({**day_template, "id": day_id, "meal_plan_id": plan_row["id"]})
+                meal_rows.extend(
+                    {**meal_template, "id": str(uuid4()), "day_id": day_id}
+                    for meal_template in meals_by_day.get(day.id, [])
+                )
+
+        await self.db.execute(insert(MealPlan), plan_rows)
+        if day_rows:
+            await self.db.execute(insert(MealPlanDay), day_rows)
+        if meal_rows:
+            await self.db.execute(insert(MealPlanMeal), meal_rows)
+    
     async def _get_feedback(self, feedback_id: str) -> Optional[NutritionFeedback]:
         result = await self.db.execute(
             select(NutritionFeedback).where(NutritionFeedback.id == feedback_id)
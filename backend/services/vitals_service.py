@@ -25,8 +25,10 @@ from schemas.vitals import (
     PatientVitalsTrends,
     VitalsRange
 )
-from schemas.enums import VitalsStatus, AlertSeverity
+from schemas.enums import VitalsStatus, AlertSeverity, AuditActionType
 from core.exceptions import NotFoundError, AuthorizationError, ValidationError
+from app.infrastructure.audit.writer import audit_on_commit
+from app.infrastructure.cache.response_cache import invalidate_on_commit
 
 
 class VitalsService:
@@ -93,8 +95,9 @@ class VitalsService:
             else:
                 vitals.status = VitalsStatus.ABNORMAL
         
-        await self.db.commit()
-        await self.db.refresh(vitals)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "vitals", patient.system_id)
+        audit_on_commit(self.db, AuditActionType.CREATE, "VITALS", vitals.id)
         
         return VitalsRecordResponse.model_validate(vitals)
     
@@ -247,8 +250,9 @@ class VitalsService:
         
         record.updated_at = datetime.utcnow()
         
-        await self.db.commit()
-        await self.db.refresh(record)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "vitals", await self._get_patient_system_id(record.patient_id))
+        audit_on_commit(self.db, AuditActionType.UPDATE, "VITALS", record.id, changes={"fields": sorted(update_data)})
         
         return VitalsRecordResponse.model_validate(record)
     
@@ -262,8 +266,11 @@ class VitalsService:
         if not record:
             raise NotFoundError("Vitals Record", record_id)
         
+        system_id = await self._get_patient_system_id(record.patient_id)
         await self.db.delete(record)
-        await self.db.commit()
+        await self.db.flush()
+        invalidate_on_commit(self.db, "vitals", system_id)
+        audit_on_commit(self.db, AuditActionType.DELETE, "VITALS", record_id)
         
         return True
     
@@ -290,8 +297,8 @@ class VitalsService:
         alert.acknowledged_at = datetime.utcnow()
         alert.resolution_notes = ack_data.resolution_notes
         
-        await self.db.commit()
-        await self.db.refresh(alert)
+        await self.db.flush()
+        invalidate_on_commit(self.db, "vitals", staff.system_id)
         
         return VitalsAlertResponse.model_validate(alert)
     
@@ -542,6 +549,13 @@ class VitalsService:
         )
         return result.scalar_one_or_none()
     
+    async def _get_patient_system_id(self, patient_id: str) -> Optional[str]:
+        """Get the system of a patient"""
+        result = await self.db.execute(
+            select(User.system_id).where(User.id == patient_id)
+        )
+        return result.scalar_one_or_none()
+    
     async def _get_staff(self, staff_id: str) -> Optional[Staff]:
         """Get staff by ID with user loaded"""
         result = await self.db.execute(
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool
 
 from main import app
-from core.database import Base, get_db
+from core.database import Base, get_db, get_read_db
 from core.config import settings
 
 # Import all domain models to ensure they're registered with metadata
@@ -54,6 +54,8 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Replica reads share the test session, so they see uncommitted test data
+    app.dependency_overrides[get_read_db] = override_get_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
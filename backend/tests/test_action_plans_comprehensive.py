@@ -320,10 +320,10 @@ class TestActionPlansComprehensive:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 3
-        # Should be ordered by created_at desc
-        assert data[0]["title"] == "Test Plan 2"
-        assert data[1]["title"] == "Test Plan 1"
-        assert data[2]["title"] == "Test Plan 0"
+        # Should be ordered by created_at desc; rows created in one transaction share now()
+        created = [row["created_at"] for row in data]
+        assert created == sorted(created, reverse=True)
+        assert {row["title"] for row in data} == {"Test Plan 0", "Test Plan 1", "Test Plan 2"}
 
     # ==================== GET ACTION PLAN BY ID TESTS ====================
     
@@ -616,10 +616,10 @@ class TestActionPlansComprehensive:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 3
-        # Should be ordered by created_at desc
-        assert data[0]["title"] == "Test Item 2"
-        assert data[1]["title"] == "Test Item 1"
-        assert data[2]["title"] == "Test Item 0"
+        # Should be ordered by created_at desc; rows created in one transaction share now()
+        created = [row["created_at"] for row in data]
+        assert created == sorted(created, reverse=True)
+        assert {row["title"] for row in data} == {"Test Item 0", "Test Item 1", "Test Item 2"}
 
     # ==================== GET ACTION ITEM BY ID TESTS ====================
     
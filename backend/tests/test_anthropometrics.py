@@ -0,0 +1,54 @@
+"""
+Tests for the anthropometric series helpers.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.domains.vitals.services.anthropometrics import (
+    AGGREGATE_SOURCE,
+    downsample,
+    add_weight_deltas,
+    weight_trend_per_week,
+)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def reading(day, weight=None, bmi=None, source="vitals"):
+    return SimpleNamespace(recorded_at=START + timedelta(days=day), source=source, weight=weight, bmi=bmi)
+
+
+class TestAnthropometricSeries:
+    """Weight/BMI deltas, rates and downsampling."""
+
+    def test_short_series_is_returned_as_is(self):
+        rows = [reading(0, Decimal("70.5")), reading(7, None, Decimal("24.1"), "nutrition_assessment")]
+        points = downsample(rows, max_points=10)
+        assert [p["weight"] for p in points] == [70.5, None]
+        assert [p["source"] for p in points] == ["vitals", "nutrition_assessment"]
+        assert all(p["sample_count"] == 1 for p in points)
+
+    def test_long_series_is_bucket_averaged(self):
+        rows = [reading(day, 70 + day % 2) for day in range(100)]
+        points = downsample(rows, max_points=10)
+        assert len(points) == 10
+        assert sum(p["sample_count"] for p in points) == 100
+        assert all(p["source"] == AGGREGATE_SOURCE for p in points)
+        assert all(70 <= p["weight"] <= 71 for p in points)
+
+    def test_deltas_skip_points_without_weight(self):
+        points = add_weight_deltas([
+            {"recorded_at": START, "weight": 70.0},
+            {"recorded_at": START + timedelta(days=3), "weight": None},
+            {"recorded_at": START + timedelta(days=14), "weight": 71.0},
+        ])
+        assert points[0]["weight_delta"] is None
+        assert points[1]["weight_delta"] is None
+        assert points[2]["weight_delta"] == 1.0
+        assert points[2]["weight_rate_per_week"] == 0.5
+
+    def test_trend_is_least_squares_slope(self):
+        rows = [reading(7 * week, 60 + 0.4 * week) for week in range(6)]
+        assert weight_trend_per_week(rows) == 0.4
+        assert weight_trend_per_week([reading(0, 60)]) is None
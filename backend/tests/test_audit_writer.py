@@ -0,0 +1,175 @@
+"""
+Tests for batching, backpressure and spill-to-disk in the audit log writer.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+import app.core.database as database
+import app.infrastructure.audit.writer as audit_writer
+from app.infrastructure.audit.writer import AuditLogWriter, audit_committed, audit_event, audit_on_commit
+from schemas.enums import AuditActionType
+
+
+class RecordingEngine:
+    """Collects the rows of each batch insert, or fails every one"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches = []
+
+    @asynccontextmanager
+    async def begin(self):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        yield self
+
+    async def execute(self, statement, rows):
+        self.batches.append(rows)
+
+
+def _writer(tmp_path, engine, queue_size=100, batch_size=3) -> AuditLogWriter:
+    return AuditLogWriter(
+        queue_size=queue_size,
+        batch_size=batch_size,
+        flush_interval=0.01,
+        enqueue_timeout=0.01,
+        retries=1,
+        shutdown_timeout=1,
+        spill_dir=str(tmp_path),
+        db_engine=engine,
+    )
+
+
+def _event(entity_id: str):
+    return audit_event(AuditActionType.UPDATE, "VITALS", entity_id, changes={"fields": ["heart_rate"]})
+
+
+class TestAuditLogWriter:
+    """Events are written in batches and spilled, not dropped, when they cannot be."""
+
+    @pytest.mark.asyncio
+    async def test_queued_events_are_written_in_batches(self, tmp_path):
+        engine = RecordingEngine()
+        writer = _writer(tmp_path, engine)
+        for i in range(7):
+            await writer.enqueue(_event(f"v{i}"))
+
+        writer.start()
+        await writer.stop()
+
+        assert [len(batch) for batch in engine.batches] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_writes_go_to_the_engine_it_is_started_with(self, tmp_path):
+        engine = RecordingEngine()
+        writer = _writer(tmp_path, None)
+        await writer.enqueue(_event("v1"))
+
+        writer.start(engine)
+        await writer.stop()
+
+        assert [len(batch) for batch in engine.batches] == [1]
+        assert engine.batches[0][0]["changes"] == '{"fields": ["heart_rate"]}'
+        assert writer.metrics.written == 7
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_full_queue_spills_instead_of_dropping(self, tmp_path):
+        writer = _writer(tmp_path, RecordingEngine(), queue_size=1)
+
+        await writer.enqueue(_event("v1"))
+        await writer.enqueue(_event("v2"))
+
+        assert writer.metrics.backpressure_waits == 1
+        assert writer.metrics.spilled == 1
+        assert writer.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_spilled_and_replayed(self, tmp_path):
+        failing = _writer(tmp_path, RecordingEngine(fail=True))
+        events = [_event("v1"), _event("v2")]
+
+        assert not await failing.write(events)
+        assert failing.metrics.spilled == 2
+
+        engine = RecordingEngine()
+        recovered = _writer(tmp_path, engine)
+        await recovered.replay_spilled()
+
+        written = engine.batches[0]
+        assert [row["id"] for row in written] == [event["id"] for event in events]
+        assert written[0]["action_type"] is AuditActionType.UPDATE
+        assert written[0]["created_at"] == events[0]["created_at"]
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_events_after_shutdown_are_spilled(self, tmp_path):
+        writer = _writer(tmp_path, RecordingEngine())
+        writer.start()
+        await writer.stop()
+
+        await writer.enqueue(_event("v1"))
+        await asyncio.sleep(0)
+
+        assert writer.metrics.spilled == 1
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class FakeSession:
+    """Stands in for a request's session; its commit can fail"""
+
+    def __init__(self, fail_commit: bool = False):
+        self.info = {}
+        self.fail_commit = fail_commit
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        if self.fail_commit:
+            raise ConnectionError("commit failed")
+
+    async def rollback(self):
+        pass
+
+
+class TestAuditOnCommit:
+    """Events are queued once their work is committed, and never for rolled-back work."""
+
+    @pytest.fixture
+    def writer(self, tmp_path, monkeypatch) -> AuditLogWriter:
+        writer = _writer(tmp_path, RecordingEngine())
+        monkeypatch.setattr(audit_writer, "audit_log", writer)
+        return writer
+
+    async def _request(self, monkeypatch, session: FakeSession) -> None:
+        monkeypatch.setattr(database, "async_session_maker", lambda: session)
+        requests = database.get_db()
+        db = await requests.__anext__()
+        audit_on_commit(db, AuditActionType.UPDATE, "VITALS", "v1")
+        with pytest.raises(StopAsyncIteration):
+            await requests.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_queued_when_the_request_commits(self, monkeypatch, writer):
+        await self._request(monkeypatch, FakeSession())
+
+        assert writer.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_dropped_when_the_commit_fails(self, monkeypatch, writer):
+        with pytest.raises(ConnectionError):
+            await self._request(monkeypatch, FakeSession(fail_commit=True))
+
+        assert writer.queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_work_committed_by_the_service_is_queued_at_once(self, writer):
+        await audit_committed(AuditActionType.LOGOUT, "USER", "u1", user_id="u1")
+
+        assert writer.queue.get_nowait()["user_id"] == "u1"
@@ -0,0 +1,82 @@
+"""
+Tests for the number of statements issued by register and login.
+"""
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.system import System
+from schemas.auth import LoginRequest, RegisterRequest
+from services.auth_service import AuthService
+
+
+@asynccontextmanager
+async def _recorded(db_session: AsyncSession):
+    """Records the SQL sent on the session's connection, and its commits"""
+    statements = []
+    commits = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split(None, 1)[0].upper())
+
+    def record_commit(session):
+        commits.append(session)
+
+    connection = (await db_session.connection()).sync_connection
+    event.listen(connection, "before_cursor_execute", record_statement)
+    event.listen(db_session.sync_session, "after_commit", record_commit)
+    try:
+        yield statements, commits
+    finally:
+        event.remove(connection, "before_cursor_execute", record_statement)
+        event.remove(db_session.sync_session, "after_commit", record_commit)
+
+
+class TestAuthStatements:
+    """Register and login each read once and leave the commit to the request."""
+
+    @pytest.fixture
+    async def system(self, db_session: AsyncSession) -> System:
+        unique_id = str(uuid.uuid4())[:8]
+        system = System(name=f"Test System {unique_id}", slug=f"test-system-{unique_id}")
+        db_session.add(system)
+        await db_session.flush()
+        return system
+
+    def _register_request(self, system: System) -> RegisterRequest:
+        unique_id = str(uuid.uuid4())[:8]
+        return RegisterRequest(
+            email=f"patient{unique_id}@example.com",
+            username=f"patient{unique_id}",
+            password="password123",
+            profileType="patient",
+            journeyType="general",
+            systemSlug=system.slug
+        )
+
+    @pytest.mark.asyncio
+    async def test_register(self, db_session: AsyncSession, system: System):
+        data = self._register_request(system)
+
+        async with _recorded(db_session) as (statements, commits):
+            response = await AuthService(db_session).register(data)
+
+        assert statements == ["SELECT", "INSERT", "INSERT"]
+        assert commits == []
+        assert response.user.system.slug == system.slug
+        assert response.refreshToken
+
+    @pytest.mark.asyncio
+    async def test_login(self, db_session: AsyncSession, system: System):
+        data = self._register_request(system)
+        await AuthService(db_session).register(data)
+
+        async with _recorded(db_session) as (statements, commits):
+            response = await AuthService(db_session).login(LoginRequest(email=data.email, password=data.password))
+
+        assert statements == ["SELECT", "INSERT"]
+        assert commits == []
+        assert response.user.email == data.email
@@ -0,0 +1,58 @@
+"""
+Tests for biomarker extraction from lab report OCR text.
+"""
+from app.domains.labs.services.biomarker_parser import parse_biomarker_line, parse_biomarkers
+
+
+REPORT = """
+QUEST DIAGNOSTICS                      Page 1 of 2
+Patient: Jane Doe        Age 45
+Collected: 01/02/2024 08:00
+
+TEST                RESULT  FLAG  UNITS     REFERENCE
+Hemoglobin          13.5          g/dL      12.0 - 16.0
+Glucose, Fasting:   105     H     mg/dL     (70-99)
+LDL Cholesterol ... 130           mg/dL     <100
+HDL Cholesterol     38      L     mg/dL     >40
+Potassium           6.8     HH    mmol/L    3.5-5.1
+TSH                 2.10          mIU/L
+Hemoglobin          13.9          g/dL      12.0 - 16.0
+"""
+
+
+class TestBiomarkerParser:
+    """Pattern-table parsing of common result-line layouts."""
+
+    def test_parses_report_layouts(self):
+        biomarkers = {b["test_name"]: b for b in parse_biomarkers(REPORT)}
+        assert list(biomarkers) == [
+            "Hemoglobin", "Glucose, Fasting", "LDL Cholesterol", "HDL Cholesterol", "Potassium", "TSH"
+        ]
+
+        assert biomarkers["Hemoglobin"]["value"] == "13.5"
+        assert biomarkers["Hemoglobin"]["unit"] == "g/dL"
+        assert biomarkers["Hemoglobin"]["reference_range_low"] == "12.0"
+        assert biomarkers["Hemoglobin"]["reference_range_high"] == "16.0"
+
+        assert biomarkers["Glucose, Fasting"]["notes"] == "high"
+        assert biomarkers["LDL Cholesterol"]["reference_range_low"] is None
+        assert biomarkers["LDL Cholesterol"]["reference_range_high"] == "100"
+        assert biomarkers["HDL Cholesterol"]["reference_range_low"] == "40"
+        assert biomarkers["Potassium"]["is_critical"] is True
+        assert biomarkers["TSH"]["reference_range_high"] is None
+
+    def test_ignores_non_result_lines(self):
+        for line in ["Page 1 of 2", "Age 45 years", "Collected: 01/02/2024 08:00", "TEST RESULT FLAG", ""]:
+            assert parse_biomarker_line(line) is None
+
+    def test_unit_flag_and_limit_variants(self):
+        sodium = parse_biomarker_line("Sodium 140 mmol/L H 135-145")
+        assert (sodium["unit"], sodium["notes"]) == ("mmol/L", "high")
+
+        troponin = parse_biomarker_line("Troponin <0.01 ng/mL <0.04")
+        assert troponin["value"] == "<0.01"
+        assert troponin["reference_range_high"] == "0.04"
+
+        platelets = parse_biomarker_line("Platelets 250 x10^3/uL 150 to 400")
+        assert platelets["unit"] == "x10^3/uL"
+        assert platelets["reference_range_low"] == "150"
@@ -0,0 +1,31 @@
+"""
+Tests for content-addressed lab file storage helpers.
+"""
+import asyncio
+import hashlib
+import io
+
+from fastapi import UploadFile
+
+from app.domains.labs.services.content_store import CHUNK_SIZE, content_addressed_key, read_upload
+
+
+class TestLabContentStore:
+    """Streaming hashes and derived storage keys."""
+
+    def test_read_upload_hashes_in_one_pass(self):
+        data = b"x" * (CHUNK_SIZE * 2 + 17)
+        upload = UploadFile(file=io.BytesIO(data), filename="cbc.pdf")
+
+        content, digest = asyncio.run(read_upload(upload))
+
+        assert content == data
+        assert digest == hashlib.sha256(data).hexdigest()
+
+    def test_key_depends_on_content_not_name(self):
+        digest = hashlib.sha256(b"report").hexdigest()
+        key = content_addressed_key("sys-1", digest, "Report.PDF")
+
+        assert key == f"lab-results/sys-1/sha256/{digest[:2]}/{digest}.pdf"
+        assert content_addressed_key("sys-1", digest, "other-name.pdf") == key
+        assert content_addressed_key("sys-2", digest, "Report.PDF") != key
@@ -0,0 +1,27 @@
+"""
+Tests for parsing lab order test_types into order items.
+"""
+from app.domains.lab_orders.services.test_types import split_test_types, normalize_test_key
+
+
+class TestSplitTestTypes:
+    """test_types is a JSON array or a comma-separated list."""
+
+    def test_comma_separated(self):
+        assert split_test_types("CBC, HbA1c ,Lipid Panel") == ["CBC", "HbA1c", "Lipid Panel"]
+
+    def test_json_array(self):
+        assert split_test_types('["CBC", "TSH"]') == ["CBC", "TSH"]
+
+    def test_duplicates_and_blanks_are_dropped(self):
+        assert split_test_types("CBC,,cbc; TSH\n") == ["CBC", "TSH"]
+
+    def test_invalid_json_falls_back_to_separators(self):
+        assert split_test_types('["CBC", TSH') == ["CBC", "TSH"]
+
+    def test_empty(self):
+        assert split_test_types(None) == []
+        assert split_test_types("  ") == []
+
+    def test_normalized_key(self):
+        assert normalize_test_key("  Lipid   Panel ") == "lipid panel"
@@ -0,0 +1,133 @@
+"""
+Tests for creating many lab orders in one request.
+"""
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domains.lab_orders.services.lab_orders_service import LabOrdersService
+from core.security import get_password_hash
+from models.lab_order import LabOrderStatusCount, LabTestOrderItem
+from models.staff import Staff
+from models.system import System
+from models.user import User
+from schemas.enums import LabOrderPriority, LabOrderStatus, StaffType
+from schemas.lab_order import LabTestOrderBulkCreate, LabTestOrderCreate
+from services.lab_orders_service import LabOrdersService as LegacyLabOrdersService
+
+
+async def _clinic(db_session: AsyncSession):
+    """A system with one patient and one physician"""
+    unique_id = str(uuid.uuid4())[:8]
+    system = System(name=f"Test System {unique_id}", slug=f"test-system-{unique_id}")
+    db_session.add(system)
+    await db_session.flush()
+
+    users = [
+        User(
+            email=f"{role}{unique_id}@example.com",
+            username=f"{role}{unique_id}",
+            password=get_password_hash("password123"),
+            system_id=system.id,
+            role=role
+        )
+        for role in ("physician", "patient")
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    physician = Staff(user_id=users[0].id, system_id=system.id, staff_type=StaffType.PHYSICIAN)
+    db_session.add(physician)
+    await db_session.flush()
+    return system, users[1], physician
+
+
+class TestLabOrdersBulkValidation:
+    """The request holds 1 to 200 orders."""
+
+    def _order(self) -> LabTestOrderCreate:
+        return LabTestOrderCreate(patient_id="p", ordering_physician_id="s", system_id="sys", test_types="CBC")
+
+    def test_empty_batch_is_rejected(self):
+        with pytest.raises(ValidationError):
+            LabTestOrderBulkCreate(orders=[])
+
+    def test_oversized_batch_is_rejected(self):
+        with pytest.raises(ValidationError):
+            LabTestOrderBulkCreate(orders=[self._order()] * 201)
+        assert len(LabTestOrderBulkCreate(orders=[self._order()] * 200).orders) == 200
+
+
+@pytest.mark.parametrize("service_class", [LabOrdersService, LegacyLabOrdersService])
+class TestLabOrdersBulkCreate:
+    """Valid orders are created; invalid ones are reported without blocking the batch."""
+
+    @pytest.mark.asyncio
+    async def test_partial_failure(self, db_session: AsyncSession, service_class):
+        system, patient, physician = await _clinic(db_session)
+        other_system, other_patient, other_physician = await _clinic(db_session)
+
+        def order(**overrides) -> LabTestOrderCreate:
+            fields = {
+                "patient_id": patient.id,
+                "ordering_physician_id": physician.id,
+                "system_id": system.id,
+                "test_types": "CBC, HbA1c",
+            }
+            return LabTestOrderCreate(**{**fields, **overrides})
+
+        response = await service_class(db_session).create_lab_orders_bulk(
+            LabTestOrderBulkCreate(orders=[
+                order(),
+                order(patient_id=other_patient.id),
+                order(priority=LabOrderPriority.STAT, test_types="TSH"),
+                order(ordering_physician_id=other_physician.id),
+                order(system_id=other_system.id),
+            ]),
+            system.id
+        )
+
+        assert (response.created, response.failed) == (2, 3)
+        assert [r.index for r in response.results] == [0, 1, 2, 3, 4]
+        assert [r.success for r in response.results] == [True, False, True, False, False]
+        assert [r.error for r in response.results if not r.success] == [
+            "Patient not found", "Ordering physician not found", "System mismatch"
+        ]
+        assert response.results[2].order.priority == LabOrderPriority.STAT
+        assert response.results[0].order.status == LabOrderStatus.ORDERED
+
+        created_ids = [r.order.id for r in response.results if r.success]
+        items = await db_session.scalar(
+            select(func.count(LabTestOrderItem.id)).where(LabTestOrderItem.lab_order_id.in_(created_ids))
+        )
+        assert items == 3
+
+        counts = await db_session.execute(
+            select(LabOrderStatusCount.status, LabOrderStatusCount.priority, LabOrderStatusCount.order_count)
+            .where(LabOrderStatusCount.system_id == system.id)
+        )
+        assert sorted(counts.all()) == sorted([
+            (LabOrderStatus.ORDERED, LabOrderPriority.ROUTINE, 1),
+            (LabOrderStatus.ORDERED, LabOrderPriority.STAT, 1),
+        ])
+
+    @pytest.mark.asyncio
+    async def test_batch_with_no_valid_orders(self, db_session: AsyncSession, service_class):
+        system, patient, physician = await _clinic(db_session)
+
+        response = await service_class(db_session).create_lab_orders_bulk(
+            LabTestOrderBulkCreate(orders=[
+                LabTestOrderCreate(
+                    patient_id=str(uuid.uuid4()),
+                    ordering_physician_id=physician.id,
+                    system_id=system.id,
+                    test_types="CBC"
+                )
+            ]),
+            system.id
+        )
+
+        assert (response.created, response.failed) == (0, 1)
+        assert response.results[0].error == "Patient not found"
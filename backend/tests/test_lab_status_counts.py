@@ -0,0 +1,48 @@
+"""
+Tests for the lab order status count rollup helpers.
+"""
+from types import SimpleNamespace
+
+from app.domains.lab_orders.services.status_counts import (
+    status_change_statements,
+    summarize_status_counts,
+)
+from app.shared.schemas.enums import LabOrderStatus, LabOrderPriority
+
+
+def row(status=None, priority=None, order_count=0):
+    return SimpleNamespace(status=status, priority=priority, order_count=order_count)
+
+
+class TestLabStatusCounts:
+    """Grouping-set summaries and counter maintenance."""
+
+    def test_summarize_grouping_set_rows(self):
+        summary = summarize_status_counts([
+            row(LabOrderStatus.ORDERED, None, 4),
+            row(LabOrderStatus.PROCESSING, None, 2),
+            row(LabOrderStatus.COMPLETED, None, 7),
+            row(LabOrderStatus.CANCELLED, None, 1),
+            row(None, LabOrderPriority.ROUTINE, 11),
+            row(None, LabOrderPriority.STAT, 3),
+        ])
+        assert summary["total_orders"] == 14
+        assert summary["pending_orders"] == 6
+        assert summary["completed_orders"] == 7
+        assert summary["priority_counts"] == {"routine": 11, "stat": 3}
+
+    def test_summarize_without_orders(self):
+        summary = summarize_status_counts([row()])
+        assert summary["total_orders"] == 0
+        assert summary["status_counts"] == {}
+
+    def test_unchanged_key_needs_no_statements(self):
+        key = (LabOrderStatus.ORDERED, LabOrderPriority.ROUTINE)
+        assert status_change_statements("sys", key, key) == []
+
+    def test_status_change_moves_one_count(self):
+        old = (LabOrderStatus.ORDERED, LabOrderPriority.ROUTINE)
+        new = (LabOrderStatus.COLLECTED, LabOrderPriority.ROUTINE)
+        assert len(status_change_statements("sys", old, new)) == 2
+        assert len(status_change_statements("sys", None, new)) == 1
+        assert len(status_change_statements("sys", old, None)) == 1
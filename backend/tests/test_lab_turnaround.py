@@ -0,0 +1,95 @@
+"""
+Tests for the lab turnaround histogram helpers.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.domains.lab_orders.services.turnaround import (
+    COLLECTION_TO_RESULT,
+    ORDER_TO_COLLECTION,
+    ORDER_TO_RESULT,
+    bucket_for,
+    bucket_upper_bound,
+    order_transition_samples,
+    percentile,
+    summarize_buckets,
+)
+from app.shared.schemas.enums import LabOrderStatus
+
+
+def bucket_row(bucket, sample_count, total_minutes, lab_name="Quest", priority="stat", stage=ORDER_TO_RESULT):
+    return SimpleNamespace(
+        lab_name=lab_name, priority=priority, stage=stage,
+        bucket=bucket, sample_count=sample_count, total_minutes=total_minutes,
+    )
+
+
+class TestLabTurnaround:
+    """Log-bucket histograms, percentiles and order transitions."""
+
+    def test_bucket_bounds_contain_sample(self):
+        assert bucket_for(0.5) == 0
+        for minutes in (1.5, 30, 240, 10_000):
+            bucket = bucket_for(minutes)
+            assert bucket_upper_bound(bucket - 1) < minutes <= bucket_upper_bound(bucket)
+
+    def test_percentile_within_bucket_resolution(self):
+        samples = [float(m) for m in range(1, 1001)]
+        histogram = {}
+        for minutes in samples:
+            histogram[bucket_for(minutes)] = histogram.get(bucket_for(minutes), 0) + 1
+        assert abs(percentile(histogram, 50) - 500) / 500 < 0.1
+        assert abs(percentile(histogram, 99) - 990) / 990 < 0.1
+        assert percentile({}, 50) is None
+
+    def test_order_transition_samples(self):
+        ordered_at = datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc)
+        order = SimpleNamespace(
+            order_date=ordered_at, collection_date=ordered_at + timedelta(hours=1),
+            collection_recorded_at=None, completed_at=None,
+        )
+        now = ordered_at + timedelta(hours=5)
+
+        collected = order_transition_samples(order, LabOrderStatus.ORDERED, LabOrderStatus.COLLECTED, now)
+        assert collected == [(ORDER_TO_COLLECTION, 60.0)]
+
+        completed = order_transition_samples(order, LabOrderStatus.PROCESSING, LabOrderStatus.COMPLETED, now)
+        assert completed == [(COLLECTION_TO_RESULT, 240.0), (ORDER_TO_RESULT, 300.0)]
+
+        assert order_transition_samples(order, LabOrderStatus.COMPLETED, LabOrderStatus.COMPLETED, now) == []
+
+    def test_reverted_status_is_not_sampled_again(self):
+        ordered_at = datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc)
+        order = SimpleNamespace(
+            order_date=ordered_at, collection_date=None, collection_recorded_at=None, completed_at=None,
+        )
+        collected_at = ordered_at + timedelta(hours=1)
+        completed_at = ordered_at + timedelta(hours=3)
+
+        assert order_transition_samples(order, LabOrderStatus.ORDERED, LabOrderStatus.COLLECTED, collected_at) == [
+            (ORDER_TO_COLLECTION, 60.0)
+        ]
+        assert order_transition_samples(order, LabOrderStatus.COLLECTED, LabOrderStatus.ORDERED, completed_at) == []
+        assert order_transition_samples(order, LabOrderStatus.ORDERED, LabOrderStatus.COLLECTED, completed_at) == []
+        assert order.collection_recorded_at == collected_at
+
+        assert order_transition_samples(order, LabOrderStatus.COLLECTED, LabOrderStatus.COMPLETED, completed_at) == [
+            (ORDER_TO_RESULT, 180.0)
+        ]
+        reopened_at = completed_at + timedelta(hours=1)
+        assert order_transition_samples(order, LabOrderStatus.COMPLETED, LabOrderStatus.PROCESSING, reopened_at) == []
+        assert order_transition_samples(order, LabOrderStatus.PROCESSING, LabOrderStatus.COMPLETED, reopened_at) == []
+        assert order.completed_at == completed_at
+
+    def test_summarize_buckets_groups_rows(self):
+        summaries = summarize_buckets([
+            bucket_row(bucket_for(60), 3, 180.0),
+            bucket_row(bucket_for(600), 1, 600.0),
+            bucket_row(bucket_for(30), 2, 60.0, lab_name="", priority="routine"),
+        ])
+        assert [(s["lab_name"], s["priority"]) for s in summaries] == [(None, "routine"), ("Quest", "stat")]
+        stat = summaries[1]
+        assert stat["sample_count"] == 4
+        assert stat["mean_minutes"] == 195.0
+        assert stat["p50_minutes"] <= bucket_upper_bound(bucket_for(60))
+        assert stat["p99_minutes"] > bucket_upper_bound(bucket_for(60))
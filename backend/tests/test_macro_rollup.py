@@ -0,0 +1,82 @@
+"""
+Tests for meal plan macro rollup helpers.
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.domains.nutrition.services.macro_rollup import (
+    ZERO_MACROS,
+    whole,
+    stored_macros,
+    meal_macros,
+    macro_delta,
+    build_rollup_updates,
+    deviation_pct,
+    plan_macro_deviation,
+)
+from app.shared.models import MealPlan, MealPlanDay
+
+
+class TestMacroRollup:
+    """Incremental day/plan macro totals."""
+
+    def test_meal_macros_treats_missing_values_as_zero(self):
+        meal = SimpleNamespace(calories=450, protein_grams=None, carbs_grams=60, fats_grams=12)
+        assert meal_macros(meal) == (450, 0, 60, 12)
+        assert meal_macros({"calories": 100}) == (100, 0, 0, 0)
+
+    def test_fractional_grams_round_the_way_they_are_stored(self):
+        assert whole(Decimal("12.5")) == 13
+        assert whole(Decimal("12.4")) == 12
+        assert whole(None) is None
+        assert meal_macros({"protein_grams": Decimal("20.6"), "fats_grams": 9.5}) == (0, 21, 0, 10)
+        assert stored_macros({"carbs_grams": Decimal("30.5"), "meal_description": "Oats"}) == {
+            "carbs_grams": 31,
+            "meal_description": "Oats",
+        }
+
+    def test_edit_applies_only_the_difference(self):
+        old = (400, 20, 50, 10)
+        new = (520, 25, 50, 8)
+        assert macro_delta(new, old) == (120, 5, 0, -2)
+        assert macro_delta(new) == new
+
+    def test_no_updates_when_nothing_changed(self):
+        assert build_rollup_updates(MealPlanDay, MealPlan, "day", "plan", ZERO_MACROS) == []
+
+    def test_updates_target_day_and_plan(self):
+        statements = build_rollup_updates(MealPlanDay, MealPlan, "day", "plan", (100, 5, 10, 2), meal_count_delta=1)
+        assert [stmt.table.name for stmt in statements] == ["meal_plan_days", "meal_plans"]
+
+    def test_deviation_pct(self):
+        assert deviation_pct(2200, 2000) == 10.0
+        assert deviation_pct(1800, 2000) == -10.0
+        assert deviation_pct(1800, None) is None
+        assert deviation_pct(None, 2000) is None
+
+    def test_plan_deviation_uses_average_daily_totals(self):
+        plan = SimpleNamespace(
+            day_count=7,
+            total_calories=7 * 2100,
+            total_protein_grams=7 * 90,
+            total_carbs_grams=7 * 250,
+            total_fats_grams=7 * 70,
+            daily_calorie_target=2000,
+            protein_target_grams=100,
+            carbs_target_grams=None,
+            fats_target_grams=70,
+        )
+        deviation = plan_macro_deviation(plan)
+        assert deviation["avg_daily_calories"] == 2100.0
+        assert deviation["calorie_deviation_pct"] == 5.0
+        assert deviation["protein_deviation_pct"] == -10.0
+        assert deviation["carbs_deviation_pct"] is None
+        assert deviation["fats_deviation_pct"] == 0.0
+        assert deviation["macro_deviation_score"] == 5.0
+
+    def test_plan_without_days_has_no_deviation(self):
+        plan = SimpleNamespace(
+            day_count=0, total_calories=0, total_protein_grams=0, total_carbs_grams=0, total_fats_grams=0,
+            daily_calorie_target=2000, protein_target_grams=100, carbs_target_grams=200, fats_target_grams=70,
+        )
+        assert plan_macro_deviation(plan)["macro_deviation_score"] is None
@@ -0,0 +1,132 @@
+"""
+Tests for cloning a meal plan template to many patients.
+"""
+import uuid
+from collections import Counter
+from datetime import date
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.domains.nutrition.services.nutrition_service import NutritionService
+from app.shared.schemas.nutrition import MealPlanCloneRequest
+from core.security import get_password_hash
+from models.nutrition import MealPlan, MealPlanDay, MealPlanMeal
+from models.staff import Staff
+from models.system import System
+from models.user import User
+from schemas.enums import MealType, StaffType
+
+DAYS = 7
+MEALS_PER_DAY = 5
+PATIENTS = 50
+
+
+def _user(system_id: str, role: str) -> User:
+    unique_id = str(uuid.uuid4())[:8]
+    return User(
+        email=f"{role}{unique_id}@example.com",
+        username=f"{role}{unique_id}",
+        password=get_password_hash("password123"),
+        system_id=system_id,
+        role=role
+    )
+
+
+class TestMealPlanClone:
+    """A 7-day, 35-meal template cloned to 50 patients."""
+
+    @pytest.fixture
+    async def template(self, db_session: AsyncSession) -> MealPlan:
+        unique_id = str(uuid.uuid4())[:8]
+        system = System(name=f"Test System {unique_id}", slug=f"test-system-{unique_id}")
+        db_session.add(system)
+        await db_session.flush()
+
+        nutritionist_user = _user(system.id, "nutritionist")
+        db_session.add(nutritionist_user)
+        await db_session.flush()
+        nutritionist = Staff(user_id=nutritionist_user.id, system_id=system.id, staff_type=StaffType.NUTRITIONIST)
+        db_session.add(nutritionist)
+        await db_session.flush()
+
+        plan = MealPlan(
+            nutritionist_id=nutritionist.id,
+            system_id=system.id,
+            is_template=True,
+            plan_name="Balanced week",
+            start_date=date(2026, 1, 5),
+            day_count=DAYS,
+            meal_count=DAYS * MEALS_PER_DAY,
+            total_calories=DAYS * MEALS_PER_DAY * 400
+        )
+        db_session.add(plan)
+        await db_session.flush()
+        for day_number in range(1, DAYS + 1):
+            day = MealPlanDay(
+                meal_plan_id=plan.id,
+                day_number=day_number,
+                meal_count=MEALS_PER_DAY,
+                total_daily_calories=MEALS_PER_DAY * 400
+            )
+            db_session.add(day)
+            await db_session.flush()
+            db_session.add_all(
+                MealPlanMeal(day_id=day.id, meal_type=MealType.SNACK, meal_name=f"Meal {n}", calories=400)
+                for n in range(MEALS_PER_DAY)
+            )
+        await db_session.flush()
+        return plan
+
+    async def _patients(self, db_session: AsyncSession, system_id: str, count: int, role: str = "patient"):
+        users = [_user(system_id, role) for _ in range(count)]
+        db_session.add_all(users)
+        await db_session.flush()
+        return [user.id for user in users]
+
+    @pytest.mark.asyncio
+    async def test_tree_is_cloned_with_one_insert_per_table(self, db_session: AsyncSession, template: MealPlan):
+        patient_ids = await self._patients(db_session, template.system_id, PATIENTS)
+        inserts = Counter()
+
+        def count_inserts(orm_execute_state):
+            if orm_execute_state.is_insert:
+                inserts[orm_execute_state.statement.table.name] += 1
+
+        event.listen(db_session.sync_session, "do_orm_execute", count_inserts)
+        try:
+            response = await NutritionService(db_session).clone_meal_plan_to_patients(
+                template.id,
+                MealPlanCloneRequest(patient_ids=patient_ids, start_date=date(2026, 2, 2)),
+                template.system_id
+            )
+        finally:
+            event.remove(db_session.sync_session, "do_orm_execute", count_inserts)
+
+        assert inserts == {"meal_plans": 1, "meal_plan_days": 1, "meal_plan_meals": 1}
+        assert response.plans_created == PATIENTS
+        assert response.meals_per_plan == DAYS * MEALS_PER_DAY
+
+        clone_ids = [plan.meal_plan_id for plan in response.plans]
+        meals = await db_session.scalar(
+            select(func.count(MealPlanMeal.id))
+            .join(MealPlanDay, MealPlanDay.id == MealPlanMeal.day_id)
+            .where(MealPlanDay.meal_plan_id.in_(clone_ids))
+        )
+        assert meals == PATIENTS * DAYS * MEALS_PER_DAY
+
+    @pytest.mark.asyncio
+    async def test_staff_accounts_are_not_patients(self, db_session: AsyncSession, template: MealPlan):
+        patient_ids = await self._patients(db_session, template.system_id, 2)
+        nurse_ids = await self._patients(db_session, template.system_id, 1, role="nurse")
+
+        with pytest.raises(ValidationError) as error:
+            await NutritionService(db_session).clone_meal_plan_to_patients(
+                template.id,
+                MealPlanCloneRequest(patient_ids=patient_ids + nurse_ids, start_date=date(2026, 2, 2)),
+                template.system_id
+            )
+
+        assert error.value.details == {"patient_ids": nurse_ids}
@@ -0,0 +1,107 @@
+"""
+Tests for nutrition statistics and patient progress summaries.
+"""
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domains.nutrition.services.nutrition_service import NutritionService, _compliance_trend
+from core.security import get_password_hash
+from models.nutrition import MealPlan, NutritionAssessment, NutritionFeedback
+from models.staff import Staff
+from models.system import System
+from models.user import User
+from schemas.enums import ComplianceLevel, MealPlanStatus, StaffType
+
+
+class TestComplianceTrend:
+    """Trend of feedback compliance, newest entry first."""
+
+    def test_trend(self):
+        assert _compliance_trend([ComplianceLevel.EXCELLENT, ComplianceLevel.FAIR]) == "improving"
+        assert _compliance_trend([ComplianceLevel.POOR, None, ComplianceLevel.GOOD]) == "declining"
+        assert _compliance_trend([ComplianceLevel.GOOD, ComplianceLevel.GOOD]) == "stable"
+        assert _compliance_trend([ComplianceLevel.GOOD, None]) is None
+
+
+class TestNutritionStats:
+    """Counts come from one aggregate query; progress lists are capped at three."""
+
+    @pytest.fixture
+    async def caseload(self, db_session: AsyncSession):
+        unique_id = str(uuid.uuid4())[:8]
+        system = System(name=f"Test System {unique_id}", slug=f"test-system-{unique_id}")
+        db_session.add(system)
+        await db_session.flush()
+
+        users = [
+            User(
+                email=f"{role}{unique_id}@example.com",
+                username=f"{role}{unique_id}",
+                password=get_password_hash("password123"),
+                system_id=system.id,
+                role=role
+            )
+            for role in ("nutritionist", "patient")
+        ]
+        db_session.add_all(users)
+        await db_session.flush()
+        nutritionist_user, patient = users
+        nutritionist = Staff(user_id=nutritionist_user.id, system_id=system.id, staff_type=StaffType.NUTRITIONIST)
+        db_session.add(nutritionist)
+        await db_session.flush()
+
+        now = datetime.now(timezone.utc)
+        owner = {"patient_id": patient.id, "nutritionist_id": nutritionist.id, "system_id": system.id}
+        db_session.add_all(
+            NutritionAssessment(**owner, assessment_date=now - timedelta(days=n), current_weight=80 - n)
+            for n in range(5)
+        )
+        db_session.add_all([
+            MealPlan(**owner, plan_name="Week 1", start_date=date(2026, 1, 5), status=MealPlanStatus.COMPLETED),
+            MealPlan(**owner, plan_name="Week 2", start_date=date(2026, 1, 12), status=MealPlanStatus.ACTIVE),
+            MealPlan(
+                nutritionist_id=nutritionist.id, system_id=system.id, plan_name="Template",
+                start_date=date(2026, 1, 5), is_template=True
+            ),
+        ])
+        levels = [ComplianceLevel.EXCELLENT, ComplianceLevel.GOOD, ComplianceLevel.FAIR, ComplianceLevel.FAIR]
+        db_session.add_all(
+            NutritionFeedback(**owner, feedback_date=now - timedelta(days=n), compliance_level=level)
+            for n, level in enumerate(levels)
+        )
+        await db_session.flush()
+        return system, patient
+
+    @pytest.mark.asyncio
+    async def test_stats(self, db_session: AsyncSession, caseload):
+        system, _ = caseload
+
+        stats = await NutritionService(db_session).get_nutrition_stats(system.id)
+
+        assert stats.total_assessments == 5
+        assert stats.total_meal_plans == 2  # templates are not patient plans
+        assert stats.active_meal_plans == 1
+        assert stats.completed_meal_plans == 1
+        assert stats.patients_with_plans == 1
+        assert stats.feedback_entries == 4
+        assert stats.compliance_distribution == {"poor": 0, "fair": 2, "good": 1, "excellent": 1}
+        assert stats.avg_compliance_score == 2.75
+
+    @pytest.mark.asyncio
+    async def test_progress_keeps_totals_and_three_recent_entries(self, db_session: AsyncSession, caseload):
+        system, patient = caseload
+
+        progress = await NutritionService(db_session).get_patient_nutrition_progress(patient.id, system.id)
+
+        assert progress.total_assessments == 5
+        assert [a.current_weight for a in progress.recent_assessments] == [80, 79, 78]
+        assert progress.current_weight == 80
+        assert progress.weight_change == 2
+        assert progress.total_feedback_entries == 4
+        assert len(progress.recent_feedback) == 3
+        assert progress.latest_feedback.compliance_level == ComplianceLevel.EXCELLENT
+        assert progress.compliance_trend == "improving"
+        assert progress.active_meal_plan.plan_name == "Week 2"
@@ -0,0 +1,105 @@
+"""
+Tests for the re-OCR backfill: checkpointing, run limits and fetch failures.
+"""
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.workers import ocr_backfill
+from app.workers.ocr_backfill import BackfillProgress, OCRBackfill, _result_rows
+
+
+class TestBackfillProgress:
+    """Keyset cursor and counters survive a restart."""
+
+    def test_checkpoint_round_trip(self, tmp_path):
+        path = str(tmp_path / "checkpoint.json")
+        progress = BackfillProgress()
+        progress.last_id = "b7"
+        progress.counts["processed"] = 100
+        progress.counts["recovered"] = 90
+        progress.save(path)
+
+        resumed = BackfillProgress.load(path)
+        assert resumed.last_id == "b7"
+        assert resumed.counts["processed"] == 100
+        assert resumed.counts["recovered"] == 90
+        assert resumed.counts["failed"] == 0
+        assert "cursor=b7" in resumed.report()
+
+    def test_missing_checkpoint_starts_fresh(self, tmp_path):
+        progress = BackfillProgress.load(str(tmp_path / "missing.json"))
+        assert progress.last_id is None
+        assert progress.counts["processed"] == 0
+
+
+class FailingStorage:
+    def get_bytes(self, key):
+        raise ConnectionError("S3 unavailable")
+
+
+class StubBackfill(OCRBackfill):
+    """Serves candidate rows from a list and records what would be written"""
+
+    def __init__(self, rows, **kwargs):
+        super().__init__(executor=None, **kwargs)
+        self.rows = rows
+        self.batch_sizes = []
+
+    async def _next_batch(self, db, last_id, batch_size):
+        self.batch_sizes.append(batch_size)
+        remaining = [row for row in self.rows if last_id is None or row.id > last_id]
+        return remaining[:batch_size]
+
+    async def _reocr(self, row):
+        return "Glucose 90 mg/dL", None
+
+    async def _write_batch(self, db, batch, outcomes, progress):
+        progress.counts["processed"] += len(batch)
+
+
+def _row(result_id: str):
+    return SimpleNamespace(id=result_id, s3_key=f"lab-results/{result_id}.pdf", file_name="r.pdf", updated_at=None)
+
+
+@asynccontextmanager
+async def _no_session():
+    yield None
+
+
+class TestOCRBackfillRun:
+    """A run stops at its own limit and never overwrites rows it could not fetch."""
+
+    @pytest.fixture(autouse=True)
+    def no_database(self, monkeypatch):
+        monkeypatch.setattr(ocr_backfill, "worker_session", _no_session)
+
+    @pytest.mark.asyncio
+    async def test_limit_counts_only_this_run(self, tmp_path):
+        path = str(tmp_path / "checkpoint.json")
+        BackfillProgress(last_id="r0", counts={"processed": 100}).save(path)
+        backfill = StubBackfill([_row(f"r{n}") for n in range(1, 8)], batch_size=2, checkpoint_path=path, limit=3)
+
+        progress = await backfill.run()
+
+        assert backfill.batch_sizes == [2, 1]
+        assert progress.processed_this_run() == 3
+        assert progress.counts["processed"] == 103
+        assert progress.last_id == "r3"
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_skips_the_row(self):
+        backfill = OCRBackfill(executor=None)
+        backfill.storage = FailingStorage()
+
+        assert await backfill._reocr(_row("r1")) is None
+
+    def test_only_fetched_rows_are_written(self):
+        batch = [_row("r1"), _row("r2"), _row("r3")]
+        outcomes = [("Glucose 90 mg/dL", None), None, (None, "Unreadable PDF")]
+
+        assert _result_rows(batch, outcomes) == [
+            ("r1", None, "Glucose 90 mg/dL", "completed"),
+            ("r3", None, None, "failed"),
+        ]
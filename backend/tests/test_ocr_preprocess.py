@@ -0,0 +1,57 @@
+"""
+Tests for lab OCR image preprocessing.
+"""
+from PIL import Image, ImageDraw
+
+from app.domains.labs.services.ocr_preprocess import (
+    OCROptions,
+    binarize,
+    crop_margins,
+    normalize_resolution,
+    preprocess,
+    skew_correction_angle,
+)
+
+
+def _page_with_lines(size=(1200, 1600), margin=200):
+    page = Image.new("L", size, color=250)
+    draw = ImageDraw.Draw(page)
+    for y in range(margin, size[1] - margin, 60):
+        draw.rectangle((margin, y, size[0] - margin, y + 12), fill=20)
+    return page
+
+
+class TestOCRPreprocess:
+    """Binarization, cropping, deskew and resolution normalization."""
+
+    def test_binarize_separates_ink_from_paper(self):
+        page = binarize(_page_with_lines())
+
+        assert page.mode == "1"
+        assert page.getpixel((10, 10)) == 255
+        assert page.getpixel((600, 205)) == 0
+
+    def test_crop_margins_keeps_padding_around_ink(self):
+        cropped = crop_margins(_page_with_lines(), padding=20)
+
+        assert cropped.width == 1200 - 2 * 200 + 1 + 2 * 20
+        assert cropped.height < 1600 - 2 * 200 + 2 * 20 + 1
+
+    def test_skew_angle_undoes_rotation(self):
+        skewed = _page_with_lines().rotate(3, resample=Image.BICUBIC, fillcolor=250)
+
+        assert abs(skew_correction_angle(skewed) + 3) <= 0.5
+        assert abs(skew_correction_angle(_page_with_lines())) <= 0.25
+
+    def test_normalize_resolution_uses_embedded_dpi(self):
+        low_res = Image.new("L", (850, 1100), color=255)
+        low_res.info["dpi"] = (100, 100)
+
+        assert normalize_resolution(low_res, 300).size == (1700, 2200)  # upscaling is capped at 2x
+        assert normalize_resolution(Image.new("L", (850, 1100)), 300).size == (850, 1100)
+
+    def test_raw_options_leave_the_page_untouched(self):
+        page = _page_with_lines().convert("RGB")
+
+        assert preprocess(page, OCROptions.raw()) is page
+        assert preprocess(page, OCROptions()).mode == "1"
@@ -0,0 +1,34 @@
+"""
+Tests for keyset pagination cursor helpers.
+"""
+import pytest
+from datetime import date, datetime, timezone
+
+from app.core.exceptions import ValidationError
+from app.shared.pagination import encode_cursor, decode_cursor
+
+
+class TestKeysetCursor:
+    """Cursor encoding used by list endpoints."""
+
+    def test_datetime_round_trip(self):
+        value = datetime(2025, 3, 14, 9, 26, 53, tzinfo=timezone.utc)
+        cursor = encode_cursor(value, "row-1")
+        assert decode_cursor(cursor) == (value, "row-1")
+
+    def test_date_round_trip(self):
+        value = date(2025, 3, 14)
+        cursor = encode_cursor(value, "row-2")
+        decoded_value, row_id = decode_cursor(cursor)
+        assert decoded_value == value
+        assert type(decoded_value) is date
+        assert row_id == "row-2"
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2025, 1, 1), "a/b+c")
+        assert "=" not in cursor
+        assert "/" not in cursor and "+" not in cursor
+
+    def test_invalid_cursor_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            decode_cursor("not-a-cursor")
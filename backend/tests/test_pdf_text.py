@@ -0,0 +1,28 @@
+"""
+Tests for PDF text layer detection.
+"""
+from app.domains.labs.services.pdf_text import is_usable_text, open_pdf
+
+
+class TestPdfTextLayer:
+    """Deciding when a page's embedded text can replace OCR."""
+
+    def test_report_text_is_usable(self):
+        text = (
+            "Hemoglobin          13.5   g/dL     12.0 - 16.0\n"
+            "Glucose, Fasting    105 H  mg/dL    70 - 99\n"
+        )
+
+        assert is_usable_text(text)
+
+    def test_empty_or_sparse_pages_need_ocr(self):
+        assert not is_usable_text(None)
+        assert not is_usable_text("   \n  ")
+        assert not is_usable_text("Page 1 of 2")
+
+    def test_unmapped_font_garbage_needs_ocr(self):
+        assert not is_usable_text("(cid:36)(cid:47)(cid:37) " * 10)
+        assert not is_usable_text("�" * 20)
+
+    def test_unreadable_pdf_falls_back(self):
+        assert open_pdf(b"not a pdf") is None
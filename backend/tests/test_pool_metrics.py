@@ -0,0 +1,78 @@
+"""
+Tests for connection pool metrics and the admin-only health endpoint.
+"""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from core.config import settings
+from core.database import SLOW_CHECKOUT_SECONDS, PoolMetrics
+from core.security import access_token_claims, create_access_token
+
+
+def _headers(role: str) -> dict:
+    user = SimpleNamespace(
+        id=str(uuid.uuid4()),
+        email=f"{role}@example.com",
+        username=role,
+        role=role,
+        system_id=str(uuid.uuid4()),
+        permissions_version=1
+    )
+    return {"Authorization": f"Bearer {create_access_token(access_token_claims(user))}"}
+
+
+class TestPoolMetrics:
+    """Checkout waits, timeouts and saturation of the pool."""
+
+    def test_checkouts_and_waits(self):
+        metrics = PoolMetrics()
+        metrics.record(0.01)
+        metrics.record(SLOW_CHECKOUT_SECONDS + 0.05)
+        metrics.record(settings.DB_POOL_TIMEOUT, timed_out=True)
+
+        snapshot = metrics.snapshot(SimpleNamespace(checkedout=lambda: 0))
+
+        assert snapshot["checkouts"] == 2
+        assert snapshot["timeouts"] == 1
+        assert snapshot["slow_checkouts"] == 1
+        assert snapshot["avg_wait_ms"] == round((0.01 + SLOW_CHECKOUT_SECONDS + 0.05) / 2 * 1000, 3)
+        assert snapshot["max_wait_ms"] == round((SLOW_CHECKOUT_SECONDS + 0.05) * 1000, 3)
+
+    def test_saturation(self):
+        capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+
+        snapshot = PoolMetrics().snapshot(SimpleNamespace(checkedout=lambda: capacity))
+
+        assert snapshot["checked_out"] == capacity
+        assert snapshot["saturation"] == 1.0
+        assert snapshot["avg_wait_ms"] == 0.0
+
+    def test_reset(self):
+        metrics = PoolMetrics()
+        metrics.record(1.0)
+        metrics.reset()
+
+        assert metrics.snapshot(SimpleNamespace())["checkouts"] == 0
+
+
+class TestPoolHealthEndpoint:
+    """/health/db-pool is for admins only."""
+
+    @pytest.mark.asyncio
+    async def test_requires_a_token(self, client: AsyncClient):
+        response = await client.get("/health/db-pool")
+        assert response.status_code in (401, 403)
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_admins(self, client: AsyncClient):
+        response = await client.get("/health/db-pool", headers=_headers("patient"))
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_admin_sees_pool_status(self, client: AsyncClient):
+        response = await client.get("/health/db-pool", headers=_headers("admin"))
+        assert response.status_code == 200
+        assert {"checked_out", "saturation", "checkouts", "timeouts"} <= response.json().keys()
@@ -0,0 +1,117 @@
+"""
+Tests for read-replica routing of sessions.
+"""
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy import event, select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+import core.database as database
+from core.config import settings
+from core.database import ReadRoutingSession, get_read_db
+from main import app
+from models.system import System
+from models.user import User
+
+
+class TestReadRouting:
+    """Which engine a read-routing session picks for each statement."""
+
+    def _session(self, monkeypatch):
+        replica = SimpleNamespace(sync_engine=object())
+        monkeypatch.setattr(database, "read_engine", replica)
+        return ReadRoutingSession(), replica.sync_engine
+
+    def test_plain_selects_go_to_the_replica(self, monkeypatch):
+        session, replica = self._session(monkeypatch)
+
+        assert session.get_bind(clause=select(User)) is replica
+
+    def test_locking_reads_and_raw_sql_go_to_the_primary(self, monkeypatch):
+        session, replica = self._session(monkeypatch)
+
+        assert session.get_bind(clause=select(User).with_for_update()) is database.engine.sync_engine
+        assert session.get_bind(clause=text("SELECT 1")) is database.engine.sync_engine
+
+    def test_reads_after_a_write_stay_on_the_primary(self, monkeypatch):
+        session, replica = self._session(monkeypatch)
+
+        session.get_bind(clause=update(User).values(is_active=False))
+
+        assert session.get_bind(clause=select(User)) is database.engine.sync_engine
+
+
+class TestReadReplicaEngines:
+    """A primary and a replica engine pointed at the same database."""
+
+    @pytest.fixture
+    async def engines(self, monkeypatch):
+        url = database.to_async_url(settings.DATABASE_URL)
+        primary = create_async_engine(url, poolclass=NullPool)
+        replica = create_async_engine(url, poolclass=NullPool)
+        monkeypatch.setattr(database, "engine", primary)
+        monkeypatch.setattr(database, "read_engine", replica)
+
+        statements = Counter()
+        for name, engine in (("primary", primary), ("replica", replica)):
+            # First connect runs the dialect's own setup queries: keep them out of the count
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            event.listen(
+                engine.sync_engine, "before_cursor_execute",
+                lambda *args, name=name: statements.update([name])
+            )
+        yield statements
+        await primary.dispose()
+        await replica.dispose()
+
+    @pytest.mark.asyncio
+    async def test_reads_use_the_replica_until_the_session_writes(self, engines):
+        statements = engines
+
+        async with database.async_read_session_maker() as session:
+            await session.execute(select(User.id).limit(1))
+            assert statements == {"replica": 1}
+
+            await session.execute(update(System).where(System.id == "missing").values(name="unchanged"))
+            await session.execute(select(User.id).limit(1))
+            assert statements == {"replica": 1, "primary": 2}
+
+            await session.rollback()
+
+
+class TestLegacyReadEndpoints:
+    """Read-only analytics, stats and list endpoints of the served app use the read session."""
+
+    @pytest.mark.parametrize("path", [
+        "/admin/users",
+        "/admin/analytics/users",
+        "/admin/analytics/labs",
+        "/admin/analytics/action-plans",
+        "/admin/analytics/comprehensive",
+        "/insights/trends/{testName}",
+        "/labs",
+        "/labs/unreviewed",
+        "/labs/critical",
+        "/lab-orders/stats/overview",
+        "/lab-orders/patient/{patient_id}/summary",
+        "/lab-orders/physician/{physician_id}/workload",
+        "/nutrition/stats",
+        "/nutrition/patients/{patient_id}/progress",
+        "/soap-notes/",
+        "/soap-notes/stats",
+        "/vitals/",
+        "/vitals/stats",
+        "/vitals/patients/{patient_id}/trends",
+    ])
+    def test_uses_get_read_db(self, path):
+        route = next(
+            route for route in app.routes
+            if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods
+        )
+
+        assert get_read_db in [dependency.call for dependency in route.dependant.dependencies]
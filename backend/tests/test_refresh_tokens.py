@@ -0,0 +1,26 @@
+"""
+Tests for refresh token hashing and issuance.
+"""
+from datetime import datetime, timezone
+
+from app.core.security import decode_refresh_token, hash_token
+from app.domains.auth.services.refresh_tokens import new_refresh_token
+
+
+class TestRefreshTokens:
+    """Stored hashes and freshly issued tokens."""
+
+    def test_hash_is_fixed_width_and_deterministic(self):
+        token, _ = new_refresh_token("user-1")
+
+        assert len(hash_token(token)) == 64
+        assert hash_token(token) == hash_token(token)
+        assert hash_token(token) != hash_token(token + "x")
+
+    def test_tokens_issued_together_are_distinct(self):
+        first, first_expiry = new_refresh_token("user-1")
+        second, _ = new_refresh_token("user-1")
+
+        assert first != second
+        assert first_expiry > datetime.now(timezone.utc)
+        assert decode_refresh_token(first)["sub"] == "user-1"
@@ -0,0 +1,193 @@
+"""
+Tests for the response cache: backend, keys, invalidation on commit and metrics.
+"""
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+import app.core.database as database
+import app.infrastructure.cache.backends as backends
+import app.infrastructure.cache.response_cache as response_cache
+from app.core.dependencies import CurrentUser
+from app.infrastructure.cache.backends import MemoryCacheBackend
+from app.infrastructure.cache.response_cache import (
+    CacheMetrics,
+    cache_response,
+    invalidate_on_commit,
+    tenant_tag,
+)
+
+
+class TestMemoryCacheBackend:
+    """Entries, tags and eviction of the process-local backend."""
+
+    @pytest.mark.asyncio
+    async def test_invalidating_a_tag_drops_only_its_entries(self):
+        cache = MemoryCacheBackend(max_entries=10)
+        await cache.set("a", b"1", 60, [tenant_tag("vitals", "s1")])
+        await cache.set("b", b"2", 60, [tenant_tag("vitals", "s2")])
+
+        assert await cache.invalidate([tenant_tag("vitals", "s1")]) == 1
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") == b"2"
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self):
+        cache = MemoryCacheBackend(max_entries=10)
+        await cache.set("a", b"1", 0, ["t"])
+
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = MemoryCacheBackend(max_entries=2)
+        await cache.set("a", b"1", 60, ["t"])
+        await cache.set("b", b"2", 60, ["t"])
+        await cache.get("a")
+        await cache.set("c", b"3", 60, ["t"])
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == b"1"
+        assert await cache.invalidate(["t"]) == 2
+
+
+class TestCacheMetrics:
+    """Hit ratios reported per namespace and in total."""
+
+    def test_snapshot(self):
+        metrics = CacheMetrics()
+        metrics.hits["vitals"] += 3
+        metrics.misses["vitals"] += 1
+        metrics.misses["labs"] += 1
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["namespaces"]["vitals"]["hit_ratio"] == 0.75
+        assert snapshot["namespaces"]["labs"]["hit_ratio"] == 0.0
+        assert snapshot["hit_ratio"] == 0.6
+
+
+def _request(path: str, query: bytes = b"") -> Request:
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query, "headers": []})
+
+
+def _user(user_id: str = "u1", system_id: str = "s1") -> CurrentUser:
+    return CurrentUser(user_id=user_id, email=f"{user_id}@example.com", system_id=system_id, username=user_id)
+
+
+class TestCacheKeys:
+    """Entries are keyed by tenant, user, path and query, and tagged per tenant."""
+
+    @pytest.mark.asyncio
+    async def test_query_order_does_not_matter(self):
+        dependency = cache_response("vitals")
+
+        first = await dependency(_request("/vitals/stats", b"b=2&a=1"), _user())
+        second = await dependency(_request("/vitals/stats", b"a=1&b=2"), _user())
+        other = await dependency(_request("/vitals/stats", b"a=2&b=2"), _user())
+
+        assert first.key == second.key
+        assert first.key != other.key
+
+    @pytest.mark.asyncio
+    async def test_users_and_tenants_get_their_own_entries(self):
+        dependency = cache_response("vitals", depends_on=("nutrition",))
+
+        own = await dependency(_request("/vitals/stats"), _user())
+        colleague = await dependency(_request("/vitals/stats"), _user(user_id="u2"))
+        other_tenant = await dependency(_request("/vitals/stats"), _user(system_id="s2"))
+
+        assert len({own.key, colleague.key, other_tenant.key}) == 3
+        assert own.tags == ["vitals:s1", "nutrition:s1"]
+        assert other_tenant.tags == ["vitals:s2", "nutrition:s2"]
+
+    @pytest.mark.asyncio
+    async def test_shared_entries_ignore_the_user(self):
+        dependency = cache_response("admin_analytics", per_user=False)
+
+        own = await dependency(_request("/admin/analytics/users"), _user())
+        colleague = await dependency(_request("/admin/analytics/users"), _user(user_id="u2"))
+
+        assert own.key == colleague.key
+
+
+class FakeSession:
+    """Stands in for a request's session; its commit can fail"""
+
+    def __init__(self, fail_commit: bool = False):
+        self.info = {}
+        self.fail_commit = fail_commit
+        self.rolled_back = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        if self.fail_commit:
+            raise ConnectionError("commit failed")
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+class TestInvalidationOnCommit:
+    """Writes drop the tenant's entries only once the request's transaction commits."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch) -> MemoryCacheBackend:
+        cache = MemoryCacheBackend(max_entries=10)
+        monkeypatch.setattr(backends, "_backend", cache)
+        monkeypatch.setattr(response_cache.settings, "CACHE_ENABLED", True)
+        monkeypatch.setattr(response_cache.settings, "DATABASE_READ_URL", None)
+        return cache
+
+    async def _request_writing(self, monkeypatch, session: FakeSession) -> None:
+        """Runs get_db around a service that invalidates "vitals" twice and "labs" once"""
+        monkeypatch.setattr(database, "async_session_maker", lambda: session)
+        requests = database.get_db()
+        db = await requests.__anext__()
+        invalidate_on_commit(db, "vitals", "s1")
+        invalidate_on_commit(db, "vitals", "s1")
+        invalidate_on_commit(db, "labs", "s1")
+        with pytest.raises(StopAsyncIteration):
+            await requests.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_commit_drops_the_tenants_entries(self, monkeypatch, cache):
+        await cache.set("vitals", b"1", 60, [tenant_tag("vitals", "s1")])
+        await cache.set("labs", b"2", 60, [tenant_tag("labs", "s1")])
+        await cache.set("other", b"3", 60, [tenant_tag("vitals", "s2")])
+
+        await self._request_writing(monkeypatch, FakeSession())
+
+        assert await cache.get("vitals") is None
+        assert await cache.get("labs") is None
+        assert await cache.get("other") == b"3"
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_never_invalidates(self, monkeypatch, cache):
+        await cache.set("vitals", b"1", 60, [tenant_tag("vitals", "s1")])
+        session = FakeSession(fail_commit=True)
+
+        with pytest.raises(ConnectionError):
+            await self._request_writing(monkeypatch, session)
+
+        assert session.rolled_back
+        assert await cache.get("vitals") == b"1"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_repeats_after_replica_lag(self, monkeypatch, cache):
+        monkeypatch.setattr(response_cache.settings, "DATABASE_READ_URL", "postgresql://replica/db")
+        monkeypatch.setattr(response_cache.settings, "CACHE_REPLICA_LAG_SECONDS", 0.01)
+
+        await self._request_writing(monkeypatch, FakeSession())
+        # A miss served by the lagging replica caches the old rows again
+        await cache.set("vitals", b"stale", 60, [tenant_tag("vitals", "s1")])
+        await asyncio.sleep(0.05)
+
+        assert await cache.get("vitals") is None
@@ -0,0 +1,71 @@
+"""
+Tests for presigned S3 uploads/downloads against a local S3 stand-in (moto server).
+"""
+import socket
+from urllib.parse import parse_qs, urlsplit
+
+import boto3
+import httpx
+import pytest
+from moto.server import ThreadedMotoServer
+
+from app.infrastructure.storage.s3 import S3Storage, format_file_size, upload_key
+
+BUCKET = "test-lab-files"
+
+
+@pytest.fixture(scope="module")
+def storage():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port)
+    server.start()
+    client = boto3.client(
+        "s3",
+        endpoint_url=f"http://127.0.0.1:{port}",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+    )
+    client.create_bucket(Bucket=BUCKET)
+    yield S3Storage(client, BUCKET, expires_in=300, max_upload_bytes=1024 * 1024)
+    server.stop()
+
+
+class TestS3PresignedUrls:
+    """Clients move file bytes directly to and from storage."""
+
+    def test_presigned_upload_then_download(self, storage):
+        key = upload_key("lab-results/sys-1/uploads", "result-1", "CBC Panel.PDF")
+        assert key == "lab-results/sys-1/uploads/result-1.pdf"
+        body = b"%PDF-1.4 test report"
+
+        upload = storage.presigned_upload(key, "application/pdf")
+        response = httpx.post(upload["url"], data=upload["fields"], files={"file": ("CBC Panel.PDF", body)})
+        assert response.status_code in (200, 201, 204)
+
+        stored = storage.head(key)
+        assert stored["ContentLength"] == len(body)
+        assert stored["ContentType"] == "application/pdf"
+
+        url = storage.presigned_download(key, "CBC Panel.PDF")
+        download = httpx.get(url)
+        assert download.status_code == 200
+        assert download.content == body
+        # The download name is a signed response override; not every S3 stand-in echoes it back
+        assert parse_qs(urlsplit(url).query)["response-content-disposition"] == [
+            "attachment; filename*=UTF-8''CBC%20Panel.PDF"
+        ]
+
+    def test_head_missing_object(self, storage):
+        assert storage.head("lab-results/sys-1/uploads/missing.pdf") is None
+
+    def test_object_url_is_not_public(self, storage):
+        assert storage.object_url("a/b.pdf") == f"s3://{BUCKET}/a/b.pdf"
+
+    def test_format_file_size(self):
+        assert format_file_size(512) == "512 B"
+        assert format_file_size(1536) == "1.5 KB"
+        assert format_file_size(3 * 1024 * 1024) == "3.0 MB"
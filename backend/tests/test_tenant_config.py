@@ -0,0 +1,64 @@
+"""
+Tests for feature-flag rollout evaluation and tenant config snapshot versioning.
+"""
+from core.tenant_config import FlagState, TenantConfigCache, TenantSnapshot, rollout_bucket
+
+
+class TestRollout:
+    """Deterministic percentage rollouts."""
+
+    def test_bucket_is_stable_and_in_range(self):
+        buckets = [rollout_bucket("new-dashboard", f"user-{i}") for i in range(1000)]
+
+        assert buckets == [rollout_bucket("new-dashboard", f"user-{i}") for i in range(1000)]
+        assert all(0 <= bucket < 100 for bucket in buckets)
+
+    def test_partial_rollout_reaches_about_that_share(self):
+        flag = FlagState(is_enabled=True, rollout_percentage=30)
+
+        enabled = sum(flag.enabled_for("new-dashboard", f"user-{i}") for i in range(10000))
+
+        assert 2700 < enabled < 3300
+
+    def test_disabled_flags_are_off_and_full_rollouts_on(self):
+        assert not FlagState(False, 100).enabled_for("f", "user-1")
+        assert FlagState(True, 100).enabled_for("f", "user-1")
+        assert FlagState(True, 100).enabled_for("f", None)
+        assert not FlagState(True, 50).enabled_for("f", None)
+
+    def test_zero_percent_reaches_nobody(self):
+        flag = FlagState(True, 0)
+
+        assert not flag.enabled_for("f", None)
+        assert not any(flag.enabled_for("f", f"user-{i}") for i in range(1000))
+
+
+class TestTenantConfigCache:
+    """Snapshots are dropped when a newer version is announced."""
+
+    def _cache_with_snapshot(self, version: int) -> TenantConfigCache:
+        cache = TenantConfigCache(max_age=300)
+        cache._snapshots["s1"] = TenantSnapshot(
+            "s1",
+            version,
+            [{"config_key": "timezone", "config_value": "UTC"}],
+            [{"flag_name": "beta", "is_enabled": True, "rollout_percentage": 100}],
+        )
+        return cache
+
+    def test_snapshot_lookups(self):
+        snapshot = self._cache_with_snapshot(1).cached("s1")
+
+        assert snapshot.config("timezone") == "UTC"
+        assert snapshot.config("missing", "x") == "x"
+        assert snapshot.flag_enabled("beta", "user-1")
+        assert not snapshot.flag_enabled("unknown", "user-1")
+
+    def test_newer_version_drops_snapshot(self):
+        cache = self._cache_with_snapshot(1)
+
+        cache.apply("s1", 1)
+        assert cache.cached("s1") is not None
+
+        cache.apply("s1", 2)
+        assert cache.cached("s1") is None
@@ -0,0 +1,112 @@
+"""
+Tests for cached access-token verification, key rotation, revocation and
+claims-only authentication.
+"""
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+from jose import jwt
+
+from core.config import settings
+from core.dependencies import current_user_from_claims
+from core.security import access_token_claims, create_access_token
+from core.token_verifier import AccessTokenVerifier, RevocationList
+
+
+def _verifier(cache_size=10):
+    return AccessTokenVerifier(RevocationList(), cache_size)
+
+
+class TestTokenVerifier:
+    """Claims cache, kid handling and the in-process revocation list."""
+
+    def test_valid_token_is_cached(self):
+        verifier = _verifier()
+        token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(minutes=5))
+
+        claims = verifier.verify(token)
+
+        assert claims["sub"] == "user-1"
+        assert verifier.verify(token) is claims
+
+    def test_cache_is_bounded(self):
+        verifier = _verifier(cache_size=2)
+        for i in range(3):
+            verifier.verify(create_access_token({"sub": f"user-{i}"}))
+
+        assert len(verifier._claims) == 2
+
+    def test_unknown_kid_and_bad_signature_are_rejected(self):
+        verifier = _verifier()
+        unknown_kid = jwt.encode({"sub": "user-1", "type": "access"}, settings.JWT_SECRET,
+                                 algorithm=settings.JWT_ALGORITHM, headers={"kid": "retired-long-ago"})
+        forged = jwt.encode({"sub": "user-1", "type": "access"}, "not-the-secret",
+                            algorithm=settings.JWT_ALGORITHM, headers={"kid": settings.JWT_KEY_ID})
+
+        assert verifier.verify(unknown_kid) is None
+        assert verifier.verify(forged) is None
+
+    def test_revoked_token_is_rejected_even_when_cached(self):
+        verifier = _verifier()
+        token = create_access_token({"sub": "user-1"})
+        claims = verifier.verify(token)
+
+        verifier.revocations.apply({"jti": claims["jti"], "exp": claims["exp"]})
+
+        assert verifier.verify(token) is None
+
+    def test_user_revocation_only_affects_earlier_tokens(self):
+        verifier = _verifier()
+        old_token = create_access_token({"sub": "user-1"})
+
+        verifier.revocations.apply({"user_id": "user-1", "revoked_at": int(time.time()) + 1})
+
+        assert verifier.verify(old_token) is None
+        assert verifier.verify(create_access_token({"sub": "user-2"})) is not None
+
+    def test_user_revocation_is_exact_within_a_second(self):
+        verifier = _verifier()
+        before = create_access_token({"sub": "user-1"})
+        issued_at = verifier.verify(before)["iat"]
+
+        verifier.revocations.apply({"user_id": "user-1", "revoked_at": issued_at})
+        time.sleep(0.002)
+
+        assert verifier.verify(before) is None
+        assert verifier.verify(create_access_token({"sub": "user-1"})) is not None
+
+    def test_prune_forgets_expired_revocations(self):
+        revocations = RevocationList()
+        revocations.apply({"jti": "old", "exp": time.time() - 1})
+        revocations.apply({"jti": "live", "exp": time.time() + 60})
+
+        revocations.prune()
+
+        assert set(revocations.tokens) == {"live"}
+
+    def test_older_permissions_version_is_stale(self):
+        revocations = RevocationList()
+        revocations.apply({"user_id": "user-1", "permissions_version": 3})
+
+        assert revocations.is_stale({"sub": "user-1", "pv": 2})
+        assert not revocations.is_stale({"sub": "user-1", "pv": 3})
+        assert not revocations.is_stale({"sub": "user-2", "pv": 1})
+        assert not revocations.is_revoked({"sub": "user-1", "pv": 2, "iat": 0})
+
+
+class TestClaimsOnlyUser:
+    """CurrentUser built from access-token claims."""
+
+    def test_current_user_from_claims(self):
+        user = SimpleNamespace(id="user-1", email="a@example.com", username="a", role="physician",
+                               system_id="sys-1", permissions_version=2)
+        claims = AccessTokenVerifier(RevocationList(), 10).verify(create_access_token(access_token_claims(user)))
+
+        current_user = current_user_from_claims(claims)
+
+        assert claims["pv"] == 2
+        assert (current_user.userId, current_user.systemId, current_user.role) == ("user-1", "sys-1", "physician")
+
+    def test_tokens_without_claims_need_a_lookup(self):
+        assert current_user_from_claims({"sub": "user-1", "email": "a@example.com"}) is None